@@ -9,6 +9,7 @@ from .models import (
     ScanRequest,
     ScanResponse,
     ScanStatusResponse,
+    ScanResultsResponse,
     FilterTemplateResponse,
     FilterTemplateListResponse,
 )
@@ -17,6 +18,7 @@ __all__ = [
     'ScanRequest',
     'ScanResponse',
     'ScanStatusResponse',
+    'ScanResultsResponse',
     'FilterTemplateResponse',
     'FilterTemplateListResponse',
 ]
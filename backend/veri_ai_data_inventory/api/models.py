@@ -82,6 +82,16 @@ class ScanRequest(BaseModel):
         description="Vietnamese business context for culturally-aware scanning"
     )
     
+    incremental: bool = Field(
+        default=False,
+        description="Process only assets added or changed since the previous scan of this source"
+    )
+    
+    priority: Optional[str] = Field(
+        default=None,
+        description="Scheduling priority: 'on_demand' (default) | 'scheduled' (starts after waiting on-demand scans)"
+    )
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -108,11 +118,44 @@ class ScanRequest(BaseModel):
                     "veri_regional_location": "south",
                     "veri_industry_type": "finance",
                     "veri_company_size": "medium"
+                },
+                "incremental": True
+            }
+        }
+
+
+class ScanResumeRequest(BaseModel):
+    """Request to resume an interrupted scan job from its checkpoint"""
+    
+    connection_config: Dict[str, Any] = Field(
+        ...,
+        description="Connection configuration of the original source (checkpoints do not store credentials)"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "connection_config": {
+                    "scanner_type": "postgresql",
+                    "host": "localhost",
+                    "port": 5432,
+                    "database": "customer_db",
+                    "username": "scanner",
+                    "password": "********",
+                    "schema": "public"
                 }
             }
         }
 
 
+class ResumableScan(BaseModel):
+    """Scan job with a saved checkpoint"""
+    
+    scan_job_id: UUID = Field(..., description="Scan job identifier")
+    items_emitted: int = Field(..., description="Assets published before the checkpoint", ge=0)
+    updated_at: datetime = Field(..., description="Checkpoint timestamp")
+
+
 class ScanResponse(BaseModel):
     """Response after initiating scan job"""
     
@@ -147,6 +190,26 @@ class DiscoveredAsset(BaseModel):
     size_bytes: Optional[int] = Field(default=None, description="Size in bytes")
     has_vietnamese_data: bool = Field(default=False, description="Contains Vietnamese text")
     pdpl_sensitive: bool = Field(default=False, description="Potentially PDPL-sensitive")
+    pii_counts: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="PII matches per category found in the file content (content-scanned files)"
+    )
+    pii_offsets: Optional[Dict[str, List[int]]] = Field(
+        default=None,
+        description="Sampled byte offsets of PII matches per category (large text files scanned in full)"
+    )
+    content_scan: Optional[str] = Field(
+        default=None,
+        description="Content scan outcome: 'scanned' | 'truncated' | 'timeout' | 'unsupported' | 'error'"
+    )
+    duplicate_of: Optional[str] = Field(
+        default=None,
+        description="First path seen with identical content (copies reuse its content scan findings)"
+    )
+    column_profiles: Optional[Dict[str, Dict[str, Any]]] = Field(
+        default=None,
+        description="Sampled column quality per column name: completeness, uniqueness, suggested type (tables)"
+    )
     
     class Config:
         json_schema_extra = {
@@ -186,6 +249,155 @@ class FilterStatistics(BaseModel):
         }
 
 
+class ScanDeltaReport(BaseModel):
+    """Asset changes found by an incremental scan"""
+    
+    baseline: bool = Field(..., description="First incremental scan of the source (all assets added)")
+    added: int = Field(..., description="New assets (processed)")
+    changed: int = Field(..., description="Assets whose watermark changed (reprocessed)")
+    unchanged: int = Field(..., description="Assets carried forward from the previous scan")
+    removed: int = Field(..., description="Assets no longer present in the source")
+    removed_assets: List[str] = Field(default=[], description="Paths of removed assets (capped)")
+    partial: bool = Field(default=False, description="Scan stopped early; removals were not computed")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "baseline": False,
+                "added": 12,
+                "changed": 3,
+                "unchanged": 4210,
+                "removed": 1,
+                "removed_assets": ["public.khach_hang_cu"],
+                "partial": False
+            }
+        }
+
+
+class ScanResultSummary(BaseModel):
+    """Summary statistics of a scan's result file"""
+    
+    total_assets: int = Field(..., description="Assets in the result file")
+    total_bytes: int = Field(..., description="Total size of the assets in bytes")
+    asset_types: Dict[str, int] = Field(default={}, description="Assets per asset type")
+    extensions: Dict[str, int] = Field(default={}, description="Most frequent file extensions")
+    pii_categories: Dict[str, int] = Field(default={}, description="Assets per PII category")
+    vietnamese_data: int = Field(default=0, description="Assets containing Vietnamese text")
+    vietnamese_names: int = Field(default=0, description="Assets with a Vietnamese (diacritic) name")
+    pdpl_sensitive: int = Field(default=0, description="Potentially PDPL-sensitive assets")
+    complete: bool = Field(default=True, description="False if a resumed scan lost assets beyond its checkpoint preview")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total_assets": 182340,
+                "total_bytes": 96468992000,
+                "asset_types": {"file": 182340},
+                "extensions": {".pdf": 80211, ".xlsx": 41002, ".docx": 30870},
+                "pii_categories": {"cccd": 1204, "phone": 3380},
+                "vietnamese_data": 0,
+                "vietnamese_names": 61250,
+                "pdpl_sensitive": 0,
+                "complete": True
+            }
+        }
+
+
+class ContentScanStatistics(BaseModel):
+    """Content PII scan totals of a scan job"""
+    
+    files_scanned: int = Field(..., description="Files whose content was scanned")
+    bytes_scanned: int = Field(..., description="Content bytes read")
+    files_with_pii: int = Field(..., description="Files with at least one PII match")
+    files_deduplicated: int = Field(default=0, description="Copies whose findings were reused instead of scanned")
+    seconds: float = Field(..., description="Time spent scanning content")
+    statuses: Dict[str, int] = Field(default={}, description="Files per content scan outcome")
+    pii_counts: Dict[str, int] = Field(default={}, description="PII matches per category")
+    mb_per_second: Optional[float] = Field(default=None, description="Content throughput in MB/s")
+    files_per_second: Optional[float] = Field(default=None, description="Content throughput in files/s")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "files_scanned": 4210,
+                "bytes_scanned": 3355443200,
+                "files_with_pii": 318,
+                "seconds": 41.7,
+                "statuses": {"scanned": 4172, "truncated": 31, "error": 7},
+                "pii_counts": {"phone": 5120, "cccd": 884, "email": 2301},
+                "mb_per_second": 76.74,
+                "files_per_second": 101.0
+            }
+        }
+
+
+class DuplicateCluster(BaseModel):
+    """Paths holding identical content"""
+    
+    fingerprint: Optional[str] = Field(default=None, description="Full content hash or provider checksum")
+    size_bytes: int = Field(..., description="Size of one copy in bytes")
+    copies: int = Field(..., description="Paths with this content", ge=2)
+    wasted_bytes: int = Field(..., description="Bytes held by the extra copies")
+    paths: List[str] = Field(default=[], description="Paths with this content (capped)")
+
+
+class DuplicateReport(BaseModel):
+    """Duplicate content found by a scan (PDPL data minimisation)"""
+    
+    algorithm: str = Field(..., description="Full content hash algorithm")
+    indexed: int = Field(..., description="Files and objects fingerprinted")
+    unique: int = Field(..., description="Unique contents")
+    clusters: int = Field(..., description="Contents held by more than one path")
+    duplicate_files: int = Field(..., description="Extra copies")
+    duplicate_bytes: int = Field(..., description="Bytes held by extra copies")
+    head_tail_hashes: int = Field(default=0, description="Files whose first and last blocks were hashed")
+    full_hashes: int = Field(default=0, description="Files hashed in full")
+    bytes_hashed: int = Field(default=0, description="Bytes read for fingerprints")
+    top_clusters: List[DuplicateCluster] = Field(default=[], description="Clusters with the most wasted bytes")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "algorithm": "xxh3_128",
+                "indexed": 182340,
+                "unique": 150112,
+                "clusters": 2041,
+                "duplicate_files": 32228,
+                "duplicate_bytes": 8589934592,
+                "head_tail_hashes": 40210,
+                "full_hashes": 34502,
+                "bytes_hashed": 9126805504,
+                "top_clusters": [{
+                    "fingerprint": "xxh3_128:9f2c4e01b7d35a6e8c01f4d2a9b7e310",
+                    "size_bytes": 268435456,
+                    "copies": 24,
+                    "wasted_bytes": 6174015488,
+                    "paths": ["/hr/xuat_du_lieu/nhan_vien_2024.csv", "/ke_toan/tam/nhan_vien_2024.csv"]
+                }]
+            }
+        }
+
+
+class ResultAsset(DiscoveredAsset):
+    """Discovered asset read from a scan's results"""
+    
+    extension: str = Field(default='', description="Lower-case file extension ('' for tables)")
+    vietnamese_name: bool = Field(default=False, description="Name contains Vietnamese diacritics")
+    pii_categories: List[str] = Field(default=[], description="PII categories found in the asset")
+
+
+class ScanResultsResponse(BaseModel):
+    """One page of a scan's discovered assets"""
+    
+    scan_job_id: UUID = Field(..., description="Scan job identifier")
+    status: str = Field(..., description="Current job status")
+    total_assets: int = Field(..., description="Assets discovered by the scan (before filters)", ge=0)
+    source: str = Field(..., description="'result_file' (all assets) or 'preview' (running scan, capped)")
+    assets: List[ResultAsset] = Field(default=[], description="Assets of this page matching the filters")
+    next_cursor: Optional[int] = Field(default=None, description="Cursor of the next page (None on the last page)")
+    result_summary: Optional[ScanResultSummary] = Field(default=None, description="Result file summary (finished scans)")
+
+
 class ScanStatusResponse(BaseModel):
     """Detailed scan job status response"""
     
@@ -196,7 +408,13 @@ class ScanStatusResponse(BaseModel):
     
     discovered_assets: List[DiscoveredAsset] = Field(
         default=[],
-        description="List of discovered data assets"
+        description="List of discovered data assets (streamed while running, capped)"
+    )
+    
+    total_assets: int = Field(
+        default=0,
+        description="Total assets discovered so far (may exceed discovered_assets)",
+        ge=0
     )
     
     filter_statistics: Optional[FilterStatistics] = Field(
@@ -209,6 +427,52 @@ class ScanStatusResponse(BaseModel):
         description="Error messages if any"
     )
     
+    partial: bool = Field(
+        default=False,
+        description="True if the scan was cancelled or timed out and results are incomplete"
+    )
+    
+    cancel_reason: Optional[str] = Field(
+        default=None,
+        description="Why a partial scan stopped ('cancelled' or 'timeout')"
+    )
+    
+    delta: Optional[ScanDeltaReport] = Field(
+        default=None,
+        description="Changes since the previous scan (incremental scans only)"
+    )
+    
+    result_summary: Optional[ScanResultSummary] = Field(
+        default=None,
+        description="Summary of all discovered assets (finished scans; page through them at /results)"
+    )
+    
+    content_statistics: Optional[ContentScanStatistics] = Field(
+        default=None,
+        description="Content PII scan totals and throughput (file scans with content scanning enabled)"
+    )
+    
+    duplicate_report: Optional[DuplicateReport] = Field(
+        default=None,
+        description="Duplicate content clusters (file and cloud object scans)"
+    )
+    
+    queue_position: Optional[int] = Field(
+        default=None,
+        description="Position in the scan scheduler queue while waiting to start (1 = next)",
+        ge=1
+    )
+    
+    estimated_start: Optional[datetime] = Field(
+        default=None,
+        description="Estimated start time while waiting in the scan scheduler queue"
+    )
+    
+    priority: Optional[str] = Field(
+        default=None,
+        description="Scheduling priority of a waiting scan"
+    )
+    
     started_at: Optional[datetime] = Field(
         default=None,
         description="Scan start timestamp"
@@ -242,6 +506,7 @@ class ScanStatusResponse(BaseModel):
                         "pdpl_sensitive": True
                     }
                 ],
+                "total_assets": 1,
                 "filter_statistics": {
                     "filter_applied": True,
                     "filter_mode": "include",
@@ -251,6 +516,17 @@ class ScanStatusResponse(BaseModel):
                     "reduction_percentage": 82.22
                 },
                 "errors": [],
+                "partial": False,
+                "cancel_reason": None,
+                "delta": {
+                    "baseline": False,
+                    "added": 1,
+                    "changed": 0,
+                    "unchanged": 0,
+                    "removed": 0,
+                    "removed_assets": [],
+                    "partial": False
+                },
                 "started_at": "2025-11-04T10:30:05Z",
                 "completed_at": "2025-11-04T10:35:20Z",
                 "duration_seconds": 315
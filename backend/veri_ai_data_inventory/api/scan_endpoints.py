@@ -7,33 +7,45 @@ All endpoints use dynamic configuration - zero hard-coded values.
 Endpoints:
 - POST /api/v1/data-inventory/scan - Start new scan job
 - GET /api/v1/data-inventory/scans/{scan_job_id} - Get scan status
+- GET /api/v1/data-inventory/scans/{scan_job_id}/events - Stream scan progress (server-sent events)
+- GET /api/v1/data-inventory/scans/{scan_job_id}/results - Page through discovered assets with filters
 - DELETE /api/v1/data-inventory/scans/{scan_job_id} - Cancel scan
+- POST /api/v1/data-inventory/scans/{scan_job_id}/resume - Resume interrupted scan from its checkpoint
+- GET /api/v1/data-inventory/resumable-scans - List scans with a saved checkpoint
 - GET /api/v1/data-inventory/filter-templates - List filter templates
 """
 
+import json
 import logging
 from uuid import UUID, uuid4
 from datetime import datetime
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Path, status
-from typing import List
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 
 # Import dynamic configuration
 try:
-    from ..config.constants import APIConfig, ScanConfig
+    from ..config.constants import APIConfig, ResultStoreConfig, ScanConfig, ScanManagerConfig, WorkQueueConfig
     from ..api.models import (
         ScanRequest,
+        ScanResumeRequest,
+        ResumableScan,
         ScanResponse,
         ScanStatusResponse,
+        ScanResultsResponse,
         FilterTemplateResponse,
         FilterTemplateListResponse,
     )
     from ..services.scan_service import get_scan_service
 except ImportError:
-    from config.constants import APIConfig, ScanConfig
+    from config.constants import APIConfig, ResultStoreConfig, ScanConfig, ScanManagerConfig, WorkQueueConfig
     from api.models import (
         ScanRequest,
+        ScanResumeRequest,
+        ResumableScan,
         ScanResponse,
         ScanStatusResponse,
+        ScanResultsResponse,
         FilterTemplateResponse,
         FilterTemplateListResponse,
     )
@@ -69,9 +81,16 @@ async def start_data_scan(
     - UTF-8 encoding for Vietnamese text
     - Optional column filtering for cost and performance optimization
     - Asynchronous job processing with status tracking
+    - Fair scheduling between tenants; on-demand scans start before scheduled ones
     - Vietnamese regional business context awareness
     """
     try:
+        if request.priority is not None and request.priority not in ScanManagerConfig.SCAN_PRIORITIES:
+            raise ValueError(
+                f"Unknown scan priority: {request.priority} "
+                f"(supported: {', '.join(ScanManagerConfig.SCAN_PRIORITIES)})"
+            )
+        
         # Generate unique job ID
         scan_job_id = uuid4()
         
@@ -89,16 +108,29 @@ async def start_data_scan(
             veri_business_context=request.veri_business_context.dict() if request.veri_business_context else None
         )
         
-        # Add scan job to background tasks
-        background_tasks.add_task(
-            scan_service.execute_scan,
-            scan_job_id=scan_job_id,
-            tenant_id=request.tenant_id,
-            source_type=request.source_type,
-            connection_config=request.connection_config,
-            column_filter=request.column_filter.dict() if request.column_filter else None,
-            veri_business_context=request.veri_business_context.dict() if request.veri_business_context else None
-        )
+        if WorkQueueConfig.EXECUTION_MODE == 'queue' and not request.incremental:
+            # Scan workers pick the job up; it survives API restarts
+            await scan_service.enqueue_scan(
+                scan_job_id=scan_job_id,
+                tenant_id=request.tenant_id,
+                source_type=request.source_type,
+                connection_config=request.connection_config,
+                column_filter=request.column_filter.dict() if request.column_filter else None,
+                veri_business_context=request.veri_business_context.dict() if request.veri_business_context else None
+            )
+        else:
+            # Add scan job to background tasks
+            background_tasks.add_task(
+                scan_service.execute_scan,
+                scan_job_id=scan_job_id,
+                tenant_id=request.tenant_id,
+                source_type=request.source_type,
+                connection_config=request.connection_config,
+                column_filter=request.column_filter.dict() if request.column_filter else None,
+                veri_business_context=request.veri_business_context.dict() if request.veri_business_context else None,
+                incremental=request.incremental,
+                priority=request.priority
+            )
         
         # Return response with dynamic status - NOT hard-coded "pending"
         return ScanResponse(
@@ -163,6 +195,117 @@ async def get_scan_status(
         )
 
 
+@router.get(
+    "/scans/{scan_job_id}/events",
+    summary="Stream scan progress",
+    description="Server-sent events with the progress of a scan job until it finishes"
+)
+async def stream_scan_progress(
+    scan_job_id: UUID = Path(..., description="Unique scan job identifier")
+):
+    """
+    Stream Vietnamese data scan job progress
+    
+    - text/event-stream: one 'progress' event per update, starting with the current state
+    - Each event carries status, progress (0-100%), asset count and errors
+    - Updates are rate-limited per scan (ProgressStreamConfig.MAX_UPDATES_PER_SECOND)
+    - Keepalive comments while the scan reports nothing
+    - The stream ends after the completed/failed/cancelled event
+    - Returns 404 if job not found
+    """
+    try:
+        events = await scan_service.open_progress_stream(scan_job_id)
+    except Exception as e:
+        logger.error(f"[ERROR] Failed to open progress stream: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)[:APIConfig.MAX_ERROR_MESSAGE_LENGTH]  # Use config limit
+        )
+    
+    if events is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scan job {scan_job_id} not found"
+        )
+    
+    async def event_source():
+        async for event in events:
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: progress\ndata: {json.dumps(event, default=str)}\n\n"
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@router.get(
+    "/scans/{scan_job_id}/results",
+    response_model=ScanResultsResponse,
+    summary="Get scan results",
+    description="Page through the assets discovered by a scan job, optionally filtered"
+)
+async def get_scan_results(
+    scan_job_id: UUID = Path(..., description="Unique scan job identifier"),
+    extension: Optional[List[str]] = Query(default=None, description="File extensions (e.g. '.pdf'; repeatable)"),
+    vietnamese_name: Optional[bool] = Query(default=None, description="Only assets with (or without) a Vietnamese name"),
+    min_size: Optional[int] = Query(default=None, ge=0, description="Minimum size in bytes"),
+    max_size: Optional[int] = Query(default=None, ge=0, description="Maximum size in bytes"),
+    pii_category: Optional[str] = Query(default=None, description="PII category found in the asset"),
+    asset_type: Optional[str] = Query(default=None, description="'table' | 'collection' | 'file' | 'object'"),
+    cursor: int = Query(default=0, ge=0, description="next_cursor of the previous page"),
+    limit: int = Query(
+        default=ResultStoreConfig.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=ResultStoreConfig.MAX_PAGE_SIZE,
+        description="Maximum assets per page"
+    )
+):
+    """
+    Get Vietnamese data scan results
+    
+    - Finished scans page through every discovered asset (result file)
+    - Running scans page through the streamed asset preview
+    - Filters: extension, Vietnamese file name, size range, PII category, asset type
+    - Pass next_cursor as cursor to get the next page (None on the last page)
+    - Returns 404 if job not found
+    """
+    try:
+        results = await scan_service.get_scan_results(
+            scan_job_id,
+            filters={
+                'extensions': extension,
+                'vietnamese_name': vietnamese_name,
+                'min_size': min_size,
+                'max_size': max_size,
+                'pii_category': pii_category,
+                'asset_type': asset_type
+            },
+            cursor=cursor,
+            limit=limit
+        )
+        
+        if results is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Scan job {scan_job_id} not found"
+            )
+        
+        return ScanResultsResponse(**results)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[ERROR] Failed to get scan results: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)[:APIConfig.MAX_ERROR_MESSAGE_LENGTH]  # Use config limit
+        )
+
+
 @router.delete(
     "/scans/{scan_job_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -210,6 +353,84 @@ async def cancel_scan(
         )
 
 
+@router.post(
+    "/scans/{scan_job_id}/resume",
+    response_model=ScanResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Resume scan job",
+    description="Resume an interrupted scan job from its last checkpoint"
+)
+async def resume_scan(
+    request: ScanResumeRequest,
+    background_tasks: BackgroundTasks,
+    scan_job_id: UUID = Path(..., description="Unique scan job identifier")
+):
+    """
+    Resume Vietnamese data scan job after a worker restart
+    
+    - Continues after the last checkpointed directory, key, page or table
+    - Assets published before the checkpoint are not emitted again
+    - connection_config must identify the same source (credentials may be rotated)
+    - Returns 404 if the job has no checkpoint
+    - Returns 400 if the job is still running or the source differs
+    """
+    try:
+        scan_args = await scan_service.resume_scan(scan_job_id, request.connection_config)
+        
+        if scan_args is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No checkpoint for scan job {scan_job_id}"
+            )
+        
+        background_tasks.add_task(scan_service.execute_scan, **scan_args)
+        
+        return ScanResponse(
+            scan_job_id=scan_job_id,
+            tenant_id=scan_args['tenant_id'],
+            status=APIConfig.STATUS_PENDING,  # Use config
+            estimated_time=ScanConfig.ESTIMATED_SCAN_TIME_SECONDS,  # Use config
+            created_at=datetime.utcnow(),
+            message="Scan job resumed from checkpoint"
+        )
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.error(f"[ERROR] Cannot resume scan: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)[:APIConfig.MAX_ERROR_MESSAGE_LENGTH]  # Use config limit
+        )
+    except Exception as e:
+        logger.error(f"[ERROR] Failed to resume scan: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)[:APIConfig.MAX_ERROR_MESSAGE_LENGTH]  # Use config limit
+        )
+
+
+@router.get(
+    "/resumable-scans",
+    response_model=List[ResumableScan],
+    summary="List resumable scans",
+    description="List interrupted scan jobs that have a saved checkpoint"
+)
+async def list_resumable_scans():
+    """
+    List scan jobs that can be resumed (oldest checkpoint first)
+    """
+    try:
+        return [ResumableScan(**entry) for entry in await scan_service.list_resumable_scans()]
+        
+    except Exception as e:
+        logger.error(f"[ERROR] Failed to list resumable scans: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)[:APIConfig.MAX_ERROR_MESSAGE_LENGTH]  # Use config limit
+        )
+
+
 @router.get(
     "/filter-templates",
     response_model=FilterTemplateListResponse,
@@ -274,6 +495,10 @@ async def health_check():
     Returns:
     - API version
     - Job statistics
+    - Connection pool statistics
+    - Scan scheduler statistics (running/waiting scans per tenant)
+    - Progress stream statistics (published/coalesced events)
+    - Content scan statistics (files scanned, throughput)
     - Configuration summary
     """
     try:
@@ -286,6 +511,10 @@ async def health_check():
             'status': 'healthy',
             'api_version': APIConfig.API_VERSION,
             'job_statistics': stats,
+            'connection_pool': scan_service.get_connection_pool_statistics(),
+            'scan_scheduler': scan_service.scheduler.get_statistics(),
+            'progress_stream': scan_service.progress_publisher.get_statistics(),
+            'content_scan': scan_service.get_content_scan_statistics(),
             'config': {
                 'max_concurrent_requests': APIConfig.MAX_CONCURRENT_REQUESTS,
                 'max_background_tasks': APIConfig.MAX_BACKGROUND_TASKS,
@@ -7,13 +7,16 @@ Date: 2025-11-05
 Status: Phase 2 Section 9 Implementation
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from datetime import datetime
 from pydantic import BaseModel, Field
+import codecs
+import json
 import logging
-import re
 
 # CRITICAL: Import from Section 7 configuration (zero hard-coding)
 from config import (
@@ -28,6 +31,9 @@ from config import (
 # Import from Phase 2 Section 8
 from services.lineage_graph_service import DataLineageGraphService
 
+# Shared compiled redaction engine (single-text, streaming and CLI)
+from services.redaction_service import get_redaction_engine, StreamingRedactor, redact_batch
+
 # Import from Phase 1/Core (placeholders for now)
 # from app.core.database import get_db
 # from app.core.vietnamese_cultural_intelligence import get_cultural_engine
@@ -152,6 +158,42 @@ class RedactionRequest(BaseModel):
     )
 
 
+class BatchRedactionRecord(BaseModel):
+    """Single record in a batch redaction request"""
+    record_id: Optional[str] = Field(
+        None,
+        description="Caller-supplied record identifier (echoed in results)"
+    )
+    text: str = Field(
+        ...,
+        description="Record text to redact Vietnamese PII from"
+    )
+
+
+class BatchRedactionRequest(BaseModel):
+    """
+    Request model for batch PII redaction
+    CONFIG-DRIVEN - Uses ReportingConfig patterns and batch limits
+    """
+    records: List[BatchRedactionRecord] = Field(
+        ...,
+        description="Records to redact with the same redaction profile"
+    )
+    redaction_strategy: str = Field(
+        default="full_mask",
+        description="Redaction strategy (full_mask, partial_mask, hash, etc.)"
+    )
+    # ZERO HARD-CODING: PII types from ReportingConfig
+    data_types_to_redact: Optional[List[str]] = Field(
+        None,
+        description="PII types to redact (uses ReportingConfig.REDACTION_PATTERNS keys)"
+    )
+    include_details: bool = Field(
+        False,
+        description="Include per-match redaction details for each record"
+    )
+
+
 # ============================================================================
 # Data Lineage Endpoints - Uses Section 8 Service
 # ============================================================================
@@ -528,42 +570,15 @@ async def redact_sensitive_data(request: RedactionRequest) -> Dict[str, Any]:
     try:
         logger.info("[OK] Redacting Vietnamese PII from text")
         
-        # ZERO HARD-CODING: Use patterns from ReportingConfig
-        redaction_patterns = ReportingConfig.REDACTION_PATTERNS
-        redaction_masks = ReportingConfig.REDACTION_MASKS
-        
+        # ZERO HARD-CODING: Shared engine compiled from ReportingConfig patterns
         # Determine which PII types to redact
-        pii_types = request.data_types_to_redact or list(redaction_patterns.keys())
+        pii_types = request.data_types_to_redact or list(ReportingConfig.REDACTION_PATTERNS.keys())
+        engine = get_redaction_engine(pii_types)
         
-        redacted_text = request.text
-        redactions_made = []
-        
-        for pii_type in pii_types:
-            if pii_type in redaction_patterns:
-                pattern = redaction_patterns[pii_type]
-                mask = redaction_masks.get(pii_type, "[REDACTED]")
-                
-                # Find matches
-                matches = list(re.finditer(pattern, redacted_text))
-                
-                for match in matches:
-                    original_value = match.group()
-                    
-                    # Determine if we should show original value (preview mode)
-                    show_original = request.redaction_strategy in ["preview", "partial_mask"]
-                    
-                    redactions_made.append({
-                        "pii_type": pii_type,
-                        "pii_type_vi": mask,  # Vietnamese label from config
-                        "original_value": original_value if show_original else "[HIDDEN]",
-                        "masked_value": mask,
-                        "position": match.start(),
-                        "length": len(original_value)
-                    })
-                
-                # Apply redaction (unless preview mode)
-                if request.redaction_strategy != "preview":
-                    redacted_text = re.sub(pattern, mask, redacted_text)
+        redacted_text, redactions_made = engine.redact(
+            request.text,
+            redaction_strategy=request.redaction_strategy
+        )
         
         logger.info(f"[OK] Redacted {len(redactions_made)} PII instances")
         
@@ -581,6 +596,234 @@ async def redact_sensitive_data(request: RedactionRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _read_body_blocks(request: Request) -> AsyncIterator[bytes]:
+    """Raw request body in blocks of at most ReportingConfig.REDACTION_STREAM_READ_BYTES"""
+    read_bytes = ReportingConfig.REDACTION_STREAM_READ_BYTES
+    async for received in request.stream():
+        for start in range(0, len(received), read_bytes):
+            yield received[start:start + read_bytes]
+
+
+@router.post("/redact-stream")
+async def redact_stream(
+    request: Request,
+    redaction_strategy: str = Query(
+        "full_mask",
+        description="Redaction strategy (full_mask, partial_mask, hash, preview)"
+    ),
+    data_types_to_redact: Optional[str] = Query(
+        None,
+        description="Comma-separated PII types (uses ReportingConfig.REDACTION_PATTERNS keys)"
+    ),
+    encoding: str = Query("utf-8", description="Text encoding of the uploaded body")
+) -> StreamingResponse:
+    """
+    Stream-redact a large uploaded document (CSV dumps, log files)
+    
+    The raw request body is read in ReportingConfig.REDACTION_STREAM_READ_BYTES
+    blocks (chunked transfer encoding supported) and redacted in
+    ReportingConfig.REDACTION_STREAM_CHUNK_SIZE chunks with carry-over across
+    chunk boundaries. Memory use is constant regardless of upload size.
+    
+    Response (application/x-ndjson, one JSON object per line):
+        {"event": "chunk", "redacted_text": "..."}
+        ...
+        {"event": "summary", "redaction_counts": {"cccd": 12, ...}, ...}
+    
+    Example:
+        curl -X POST --data-binary @khach_hang.csv
+            "/veriportal/visualization/redact-stream?data_types_to_redact=cccd,email"
+    """
+    pii_types = None
+    if data_types_to_redact:
+        pii_types = [t.strip() for t in data_types_to_redact.split(",") if t.strip()]
+    
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        raise HTTPException(status_code=400, detail=f"Unsupported encoding: {encoding}")
+    
+    redactor = StreamingRedactor(
+        engine=get_redaction_engine(pii_types),
+        redaction_strategy=redaction_strategy
+    )
+    
+    logger.info(f"[OK] Streaming redaction started (strategy: {redaction_strategy})")
+    
+    async def event_stream() -> AsyncIterator[str]:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        
+        try:
+            async for block in _read_body_blocks(request):
+                text = decoder.decode(block)
+                if not text:
+                    continue
+                # Regex work runs off the event loop
+                output = await run_in_threadpool(redactor.feed, text)
+                if output:
+                    yield json.dumps({"event": "chunk", "redacted_text": output}, ensure_ascii=False) + "\n"
+            
+            tail = decoder.decode(b"", final=True)
+            output = await run_in_threadpool(redactor.feed, tail) if tail else ""
+            output += await run_in_threadpool(redactor.flush)
+            if output:
+                yield json.dumps({"event": "chunk", "redacted_text": output}, ensure_ascii=False) + "\n"
+            
+            summary = redactor.get_summary()
+            logger.info(
+                f"[OK] Streaming redaction complete: {summary['redaction_count']} PII instances "
+                f"in {summary['chars_processed']} characters"
+            )
+            yield json.dumps({"event": "summary", **summary}, ensure_ascii=False) + "\n"
+        
+        except Exception as e:
+            logger.error(f"[ERROR] Streaming redaction failed: {str(e)}")
+            yield json.dumps({"event": "error", "detail": str(e)}, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+def _run_batch_redaction(
+    records: List[BatchRedactionRecord],
+    redaction_strategy: str,
+    pii_types: List[str],
+    include_details: bool
+) -> Dict[str, Any]:
+    """Run batch redaction and shape per-record results (blocking)"""
+    batch = redact_batch(
+        [record.text for record in records],
+        pii_types=pii_types,
+        redaction_strategy=redaction_strategy
+    )
+
+    results = []
+    for index, (record, (redacted_text, redactions_made)) in enumerate(zip(records, batch["results"])):
+        counts: Dict[str, int] = {}
+        for redaction in redactions_made:
+            counts[redaction["pii_type"]] = counts.get(redaction["pii_type"], 0) + 1
+
+        result = {
+            "index": index,
+            "record_id": record.record_id,
+            "redacted_text": redacted_text,
+            "redaction_count": len(redactions_made),
+            "redaction_counts": counts
+        }
+        if include_details:
+            result["redactions_made"] = redactions_made
+        results.append(result)
+
+    return {"results": results, "statistics": batch["statistics"]}
+
+
+@router.post("/redact-batch")
+async def redact_batch_records(request: BatchRedactionRequest) -> Dict[str, Any]:
+    """
+    Redact Vietnamese PII from many records with one redaction profile
+
+    Used for data subject request fulfilment. Records are fanned out across a
+    worker process pool sharing the compiled engine; results are returned in
+    input order with aggregate statistics.
+
+    Example request:
+        {"records": [{"record_id": "kh-001", "text": "SĐT: 0912345678"}],
+         "data_types_to_redact": ["vietnamese_phone"]}
+    """
+    max_records = ReportingConfig.REDACTION_BATCH_MAX_RECORDS
+    if len(request.records) > max_records:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {max_records} records"
+        )
+
+    try:
+        # ZERO HARD-CODING: PII types from ReportingConfig
+        pii_types = request.data_types_to_redact or list(ReportingConfig.REDACTION_PATTERNS.keys())
+        logger.info(f"[OK] Batch redacting {len(request.records)} records")
+
+        return await run_in_threadpool(
+            _run_batch_redaction,
+            request.records,
+            request.redaction_strategy,
+            pii_types,
+            request.include_details
+        )
+
+    except Exception as e:
+        logger.error(f"[ERROR] Batch redaction failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/redact-batch-jsonl")
+async def redact_batch_jsonl(
+    request: Request,
+    redaction_strategy: str = Query(
+        "full_mask",
+        description="Redaction strategy (full_mask, partial_mask, hash, etc.)"
+    ),
+    data_types_to_redact: Optional[str] = Query(
+        None,
+        description="Comma-separated PII types (uses ReportingConfig.REDACTION_PATTERNS keys)"
+    ),
+    include_details: bool = Query(False, description="Include per-match redaction details")
+) -> Dict[str, Any]:
+    """
+    Redact Vietnamese PII from a JSONL upload of records
+
+    Each line is either a JSON string or an object {"record_id": ..., "text": ...}.
+    Blank lines are skipped. Response shape matches /redact-batch.
+    
+    The body is read in ReportingConfig.REDACTION_STREAM_READ_BYTES blocks
+    (as /redact-stream) and parsed line by line; the upload is rejected as
+    soon as it exceeds ReportingConfig.REDACTION_BATCH_MAX_RECORDS records.
+    """
+    max_records = ReportingConfig.REDACTION_BATCH_MAX_RECORDS
+    records: List[BatchRedactionRecord] = []
+    
+    def add_record(line: str, line_number: int) -> None:
+        if not line.strip():
+            return
+        if len(records) >= max_records:
+            raise HTTPException(status_code=413, detail=f"Batch exceeds {max_records} records")
+        try:
+            item = json.loads(line)
+            records.append(
+                BatchRedactionRecord(text=item) if isinstance(item, str)
+                else BatchRedactionRecord(**item)
+            )
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSONL record on line {line_number}: {str(e)}")
+    
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
+    # Pieces of the line not yet ended by a newline
+    pending: List[str] = []
+    line_number = 0
+    try:
+        async for block in _read_body_blocks(request):
+            pieces = decoder.decode(block).split("\n")
+            for piece in pieces[:-1]:
+                pending.append(piece)
+                line_number += 1
+                add_record("".join(pending), line_number)
+                pending = []
+            pending.append(pieces[-1])
+        pending.append(decoder.decode(b"", final=True))
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"JSONL upload is not valid UTF-8: {str(e)}")
+    add_record("".join(pending), line_number + 1)
+    
+    batch_request = BatchRedactionRequest(
+        records=records,
+        redaction_strategy=redaction_strategy,
+        data_types_to_redact=(
+            [t.strip() for t in data_types_to_redact.split(",") if t.strip()]
+            if data_types_to_redact else None
+        ),
+        include_details=include_details
+    )
+    return await redact_batch_records(batch_request)
+
+
 @router.get("/redaction-patterns")
 async def get_redaction_patterns() -> Dict[str, Any]:
     """
@@ -705,7 +948,9 @@ async def health_check() -> Dict[str, Any]:
                 "lineage_graph": True,
                 "report_generation": "placeholder",  # Section 10 pending
                 "third_party_dashboard": True,
-                "pii_redaction": True
+                "pii_redaction": True,
+                "pii_redaction_streaming": True,
+                "pii_redaction_batch": True
             },
             "configuration": {
                 "report_types_count": len(list(ReportType)),
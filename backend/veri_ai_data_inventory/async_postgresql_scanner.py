@@ -0,0 +1,206 @@
+"""
+AsyncPostgreSQLScanner implementation for veri-ai-data-inventory
+Native asyncpg scanner used by ScanService; PostgreSQLScanner stays available for CLI use
+Uses dynamic configuration from ScanConfig, DatabaseConfig, EncodingConfig
+Vietnamese UTF-8 support and PDPL compliance
+"""
+try:
+    from .config import ScanConfig, DatabaseConfig, EncodingConfig
+except ImportError:
+    from config.constants import ScanConfig, DatabaseConfig, EncodingConfig
+
+try:
+    from .services.column_filter_service import ColumnFilterService
+    from .models.column_filter import ColumnFilterConfig
+    from .utils.catalog_discovery import build_catalog_table
+    from .postgresql_scanner import CATALOG_DISCOVERY_QUERY, TABLESAMPLE_QUERY, plan_sampling
+    from .scanner_manager.async_scanner import sample_tables_concurrently
+    from .utils.cancellation import CancellationToken
+except ImportError:
+    from services.column_filter_service import ColumnFilterService
+    from models.column_filter import ColumnFilterConfig
+    from utils.catalog_discovery import build_catalog_table
+    from postgresql_scanner import CATALOG_DISCOVERY_QUERY, TABLESAMPLE_QUERY, plan_sampling
+    from scanner_manager.async_scanner import sample_tables_concurrently
+    from utils.cancellation import CancellationToken
+
+import logging
+import asyncpg
+from typing import Dict, AsyncIterator, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPostgreSQLScanner:
+    def __init__(self, connection_config: Dict[str, Any], concurrency: int = ScanConfig.ASYNC_SAMPLE_CONCURRENCY):
+        """Stores connection settings; the asyncpg pool is created by connect()."""
+        self.connection_config = connection_config
+        self.schema = connection_config.get('schema', DatabaseConfig.DEFAULT_SCHEMA)
+        self.concurrency = max(1, concurrency)
+        self.pool: Optional[asyncpg.Pool] = None
+
+    async def connect(self) -> bool:
+        """Creates a pool sized for the sampling fan-out plus the discovery cursor."""
+        config = self.connection_config
+        self.pool = await asyncpg.create_pool(
+            host=config.get('host'),
+            user=config.get('username', config.get('user')),
+            password=config.get('password'),
+            database=config.get('database'),
+            port=config.get('port', DatabaseConfig.POSTGRESQL_DEFAULT_PORT),
+            min_size=1,
+            max_size=self.concurrency + 1,
+            server_settings={'client_encoding': EncodingConfig.POSTGRESQL_CLIENT_ENCODING}
+        )
+        return True
+
+    async def iter_table_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_TABLE_BATCH_SIZE,
+        fetch_size: int = ScanConfig.DISCOVERY_FETCH_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        after_table: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Streams discovered tables from the bulk catalog query through a server-side cursor.
+
+        Args:
+            batch_size: Tables per yielded batch (from ScanConfig)
+            fetch_size: Catalog rows fetched per round trip (from ScanConfig)
+            cancel_token: Stops the stream between fetches once cancelled or past its deadline
+            after_table: Resume after this table name (tables stream in name order)
+
+        Returns:
+            Async iterator of table-dict lists (see utils.catalog_discovery.build_catalog_table)
+        """
+        query = CATALOG_DISCOVERY_QUERY.format(schema='$1', after='$2')
+        async with self.pool.acquire() as connection:
+            # asyncpg cursors only exist inside a transaction
+            async with connection.transaction():
+                cursor = await connection.cursor(query, self.schema, after_table or '')
+                table_name, table_rows, batch = None, [], []
+                while True:
+                    if cancel_token is not None and cancel_token.is_cancelled:
+                        # Drop the incomplete table; the transaction closes the cursor
+                        logger.info(f"[OK] Discovery of schema {self.schema} stopped ({cancel_token.reason})")
+                        table_rows = []
+                        break
+                    records = await cursor.fetch(fetch_size)
+                    if not records:
+                        break
+                    for record in records:
+                        if record[0] != table_name and table_rows:
+                            batch.append(build_catalog_table(table_name, table_rows, self.schema))
+                            table_rows = []
+                            if len(batch) >= batch_size:
+                                yield batch
+                                batch = []
+                        table_name = record[0]
+                        table_rows.append(record)
+
+                if table_rows:
+                    batch.append(build_catalog_table(table_name, table_rows, self.schema))
+                if batch:
+                    yield batch
+
+    async def estimate_row_count(self, table_name: str) -> int:
+        """Estimated row count from pg_class catalog statistics (-1 if never analyzed)."""
+        query = (
+            "SELECT c.reltuples::bigint FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = $1 AND c.relname = $2"
+        )
+        row_estimate = await self.pool.fetchval(query, self.schema, table_name)
+        return int(row_estimate) if row_estimate is not None else -1
+
+    async def extract_table_sample(
+        self,
+        table_name: str,
+        column_names: List[str],
+        limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE,
+        filter_config: Optional[ColumnFilterConfig] = None,
+        sampling_strategy: str = ScanConfig.DEFAULT_SAMPLING_STRATEGY,
+        row_estimate: Optional[int] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts row-aligned samples for many columns of a table in one query.
+
+        Args:
+            table_name: Table to sample
+            column_names: Columns to sample (duplicates ignored)
+            limit: Rows to sample (from ScanConfig)
+            filter_config: Optional ColumnFilterService filter applied before querying
+            sampling_strategy: 'auto', 'limit', 'random', 'bernoulli' or 'system' (from ScanConfig)
+            row_estimate: Catalog estimate from discovery (queried when None)
+
+        Returns:
+            Columnar sample: {column_name: [values...]}
+        """
+        if filter_config is not None:
+            column_names = ColumnFilterService.filter_columns(column_names, filter_config)
+        column_names = list(dict.fromkeys(column_names))
+        if not column_names:
+            return {}
+
+        if row_estimate is None:
+            row_estimate = await self.estimate_row_count(table_name)
+        plan = plan_sampling(row_estimate, limit)
+        if sampling_strategy != 'auto':
+            plan['strategy'] = sampling_strategy
+
+        rows = await self._fetch_sample_rows(table_name, column_names, limit, plan)
+        logger.debug(
+            f"[OK] Sampled {len(rows)} rows from {self.schema}.{table_name} "
+            f"using '{plan['strategy']}' (estimated rows: {plan['row_estimate']})"
+        )
+
+        columns = list(zip(*rows)) if rows else [()] * len(column_names)
+        return {name: list(values) for name, values in zip(column_names, columns)}
+
+    async def _fetch_sample_rows(self, table_name: str, column_names: List[str], limit: int, plan: Dict[str, Any]) -> List[Any]:
+        """Runs the sampling query for a plan, widening TABLESAMPLE when it returns too few rows."""
+        select = f"SELECT {', '.join(column_names)} FROM {self.schema}.{table_name}"
+        strategy = plan['strategy']
+
+        if strategy == 'limit':
+            return await self.pool.fetch(f"{select} LIMIT $1", limit)
+
+        if strategy == 'random':
+            return await self.pool.fetch(f"{select} ORDER BY random() LIMIT $1", limit)
+
+        if strategy not in ('bernoulli', 'system'):
+            raise ValueError(f"Unsupported PostgreSQL sampling strategy: {strategy}")
+
+        query = TABLESAMPLE_QUERY.format(select=select, method=strategy.upper(), percent='$1', limit='$2')
+        percent = plan['sample_percent']
+        for _ in range(ScanConfig.TABLESAMPLE_MAX_RETRIES + 1):
+            rows = await self.pool.fetch(query, float(percent), limit)
+            if len(rows) >= limit or percent >= 100.0:
+                break
+            # Stale estimate or unlucky block draw - widen the sample
+            percent = min(100.0, percent * 2)
+        plan['sample_percent'] = percent
+        return rows
+
+    async def sample_table(self, table: Dict[str, Any], limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE) -> Dict[str, List[Any]]:
+        """Samples a discovered table, reusing its catalog row estimate (no extra metadata query)."""
+        return await self.extract_table_sample(
+            table['table_name'],
+            [col['column_name'] for col in table.get('columns', [])],
+            limit,
+            row_estimate=table.get('row_estimate')
+        )
+
+    async def sample_tables(
+        self,
+        tables: List[Dict[str, Any]],
+        limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Dict[str, List[Any]]]:
+        """Samples tables concurrently, at most self.concurrency queries in flight (skipped once cancelled)."""
+        return await sample_tables_concurrently(self, tables, limit, self.concurrency, cancel_token)
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
@@ -4,7 +4,7 @@ Uses dynamic configuration from CloudConfig
 Zero hard-coding - all operational values from centralized config
 Vietnamese UTF-8 filename support
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 import logging
 
@@ -12,9 +12,13 @@ import logging
 try:
     from ..config import CloudConfig, ScanConfig
     from ..utils import UTF8Validator
+    from ..utils.cancellation import CancellationToken
+    from ..utils.catalog_discovery import iter_batches, summarize_discovered_items
 except ImportError:
     from config import CloudConfig, ScanConfig
     from utils import UTF8Validator
+    from utils.cancellation import CancellationToken
+    from utils.catalog_discovery import iter_batches, summarize_discovered_items
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +40,7 @@ class AzureBlobScanner:
         self.blob_service_client = None
         self.container_client = None
         self.utf8_validator = UTF8Validator()
+        self._checkpoint_cursor = None  # Cursor after the last yielded blob
     
     def connect(self) -> bool:
         """
@@ -68,33 +73,36 @@ class AzureBlobScanner:
             logger.error(f"[ERROR] Azure Blob connection failed: {str(e)}")
             return False
     
-    def discover_blobs(
+    # Result key of discovered items (streaming protocol, see ScannerInterface)
+    ITEM_KEY = 'blobs'
+    
+    def iter_blobs(
         self,
         name_starts_with: str = '',
-        max_blobs: int = None  # Will use CloudConfig.AZURE_DEFAULT_MAX_BLOBS if None
-    ) -> Dict[str, Any]:
+        max_blobs: int = None,  # Will use CloudConfig.AZURE_DEFAULT_MAX_BLOBS if None
+        cancel_token: Optional[CancellationToken] = None,
+        resume_from: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Discover Azure blobs with Vietnamese filename support
+        Stream Azure blobs with Vietnamese filename support
+        
+        The checkpoint cursor holds the continuation token of the page being
+        read, so a resumed scan re-reads at most that one page.
         
         Args:
             name_starts_with: Filter blobs by name prefix
             max_blobs: Maximum blobs to scan (uses CloudConfig.AZURE_DEFAULT_MAX_BLOBS if None)
+            cancel_token: Stops listing between pages once cancelled or past its deadline
+            resume_from: Checkpoint cursor of an interrupted scan (see get_checkpoint_cursor)
             
         Returns:
-            {
-                'blobs': [
-                    {
-                        'name': str,  # Blob name (UTF-8 Vietnamese filenames)
-                        'size': int,
-                        'last_modified': datetime,
-                        'content_type': str,
-                        'file_extension': str,
-                        'is_vietnamese_filename': bool
-                    }
-                ],
-                'total_size': int,
-                'total_count': int,
-                'vietnamese_filename_count': int
+            Iterator of {
+                'name': str,  # Blob name (UTF-8 Vietnamese filenames)
+                'size': int,
+                'last_modified': datetime,
+                'content_type': str,
+                'file_extension': str,
+                'is_vietnamese_filename': bool
             }
         """
         if not self.container_client:
@@ -104,69 +112,124 @@ class AzureBlobScanner:
         if max_blobs is None:
             max_blobs = CloudConfig.AZURE_DEFAULT_MAX_BLOBS
         
-        blobs_info = {
-            'blobs': [],
-            'total_size': 0,
-            'total_count': 0,
-            'vietnamese_filename_count': 0
-        }
+        resume_from = resume_from or {}
+        resume_name = resume_from.get('name')
+        page_token = resume_from.get('continuation_token')
+        self._checkpoint_cursor = dict(resume_from) if resume_from else None
         
         try:
-            # List blobs with name filter
-            blob_list = self.container_client.list_blobs(
+            # List blobs with name filter page by page (pages are fetched lazily)
+            pages = self.container_client.list_blobs(
                 name_starts_with=name_starts_with
-            )
+            ).by_page(continuation_token=page_token)
             
-            for blob in blob_list:
-                # Limit to max_blobs
-                if blobs_info['total_count'] >= max_blobs:
-                    break
-                
-                name = blob.name
-                size = blob.size
-                
-                # Skip directories (blobs with name ending in /)
-                if name.endswith('/'):
-                    continue
-                
-                # Validate UTF-8 in blob name (Vietnamese filenames)
-                validation = self.utf8_validator.validate(name)
-                if not validation['is_valid']:
-                    logger.warning(f"[WARNING] Invalid UTF-8 in blob name: {name}")
-                    continue
-                
-                # Check for Vietnamese characters in filename
-                is_vietnamese = validation['has_vietnamese']
-                if is_vietnamese:
-                    blobs_info['vietnamese_filename_count'] += 1
-                
-                # Extract file extension
-                file_extension = name.split('.')[-1] if '.' in name else ''
-                
-                blobs_info['blobs'].append({
-                    'name': name,
-                    'size': size,
-                    'last_modified': blob.last_modified,
-                    'content_type': blob.content_settings.content_type if blob.content_settings else None,
-                    'file_extension': file_extension,
-                    'is_vietnamese_filename': is_vietnamese
-                })
+            count = resume_from.get('count', 0)
+            for page in pages:
+                for blob in page:
+                    # Stop before requesting more pages once cancelled
+                    if cancel_token is not None and cancel_token.is_cancelled:
+                        logger.warning(f"[WARNING] Azure Blob listing stopped early ({cancel_token.reason})")
+                        return
+                    
+                    # Limit to max_blobs
+                    if count >= max_blobs:
+                        return
+                    
+                    name = blob.name
+                    
+                    # Blobs of the resumed page up to the cursor were already emitted
+                    if resume_name is not None and name <= resume_name:
+                        continue
+                    
+                    # Skip directories (blobs with name ending in /)
+                    if name.endswith('/'):
+                        continue
+                    
+                    # Validate UTF-8 in blob name (Vietnamese filenames)
+                    if not self.utf8_validator.validate(name):
+                        logger.warning(f"[WARNING] Invalid UTF-8 in blob name: {name}")
+                        continue
+                    
+                    # Extract file extension
+                    file_extension = name.split('.')[-1] if '.' in name else ''
+                    
+                    count += 1
+                    self._checkpoint_cursor = {'continuation_token': page_token, 'name': name, 'count': count}
+                    yield {
+                        'name': name,
+                        'size': blob.size,
+                        'last_modified': blob.last_modified,
+                        'etag': blob.etag,
+                        'content_type': blob.content_settings.content_type if blob.content_settings else None,
+                        # MD5 of the content when the uploader set it (the ETag is a version tag, not a hash)
+                        'content_checksum': (
+                            bytes(blob.content_settings.content_md5).hex()
+                            if blob.content_settings and blob.content_settings.content_md5 else None
+                        ),
+                        'file_extension': file_extension,
+                        'is_vietnamese_filename': UTF8Validator.contains_vietnamese(name)
+                    }
                 
-                blobs_info['total_size'] += size
-                blobs_info['total_count'] += 1
-            
-            logger.info(
-                f"[OK] Discovered {blobs_info['total_count']} blobs "
-                f"({blobs_info['total_size'] / (1024**2):.2f} MB), "
-                f"{blobs_info['vietnamese_filename_count']} with Vietnamese names"
-            )
-            
-            return blobs_info
+                # Token of the next page (None after the last page)
+                page_token = pages.continuation_token
             
         except Exception as e:
             logger.error(f"[ERROR] Azure Blob discovery failed: {str(e)}")
             raise
     
+    def iter_discovery_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_ITEM_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        **options
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream discovered blobs in lists of at most batch_size (options as for iter_blobs)"""
+        return iter_batches(self.iter_blobs(cancel_token=cancel_token, **options), batch_size)
+    
+    def get_checkpoint_cursor(self) -> Optional[Dict[str, Any]]:
+        """Cursor after the last yielded blob (pass as resume_from to continue)"""
+        return self._checkpoint_cursor
+    
+    def discover_blobs(
+        self,
+        name_starts_with: str = '',
+        max_blobs: int = None,  # Will use CloudConfig.AZURE_DEFAULT_MAX_BLOBS if None
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Discover Azure blobs with Vietnamese filename support
+        
+        Materializes iter_blobs(); prefer iter_discovery_batches() for large containers.
+        
+        Args:
+            name_starts_with: Filter blobs by name prefix
+            max_blobs: Maximum blobs to scan (uses CloudConfig.AZURE_DEFAULT_MAX_BLOBS if None)
+            cancel_token: Stops listing between pages once cancelled or past its deadline
+            
+        Returns:
+            {
+                'blobs': [...],  # see iter_blobs()
+                'total_size': int,
+                'total_count': int,
+                'vietnamese_filename_count': int,
+                'partial': bool,  # True if stopped by cancel_token
+                'cancel_reason': Optional[str]
+            }
+        """
+        blobs_info = summarize_discovered_items(
+            self.ITEM_KEY,
+            self.iter_blobs(name_starts_with, max_blobs, cancel_token),
+            cancel_token
+        )
+        
+        logger.info(
+            f"[OK] Discovered {blobs_info['total_count']} blobs "
+            f"({blobs_info['total_size'] / (1024**2):.2f} MB), "
+            f"{blobs_info['vietnamese_filename_count']} with Vietnamese names"
+        )
+        
+        return blobs_info
+    
     def get_blob_metadata(self, blob_name: str) -> Dict[str, Any]:
         """
         Get Azure blob metadata with Vietnamese filename validation
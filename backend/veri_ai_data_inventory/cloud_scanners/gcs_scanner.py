@@ -4,7 +4,7 @@ Uses dynamic configuration from CloudConfig
 Zero hard-coding - all operational values from centralized config
 Vietnamese UTF-8 filename support
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 import logging
 
@@ -12,9 +12,13 @@ import logging
 try:
     from ..config import CloudConfig, ScanConfig
     from ..utils import UTF8Validator
+    from ..utils.cancellation import CancellationToken
+    from ..utils.catalog_discovery import iter_batches, summarize_discovered_items
 except ImportError:
     from config import CloudConfig, ScanConfig
     from utils import UTF8Validator
+    from utils.cancellation import CancellationToken
+    from utils.catalog_discovery import iter_batches, summarize_discovered_items
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +41,7 @@ class GCSScanner:
         self.storage_client = None
         self.bucket = None
         self.utf8_validator = UTF8Validator()
+        self._checkpoint_cursor = None  # Cursor after the last yielded object
     
     def connect(self) -> bool:
         """
@@ -77,33 +82,36 @@ class GCSScanner:
             logger.error(f"[ERROR] GCS connection failed: {str(e)}")
             return False
     
-    def discover_objects(
+    # Result key of discovered items (streaming protocol, see ScannerInterface)
+    ITEM_KEY = 'objects'
+    
+    def iter_objects(
         self,
         prefix: str = '',
-        max_objects: int = None  # Will use CloudConfig.GCS_DEFAULT_MAX_OBJECTS if None
-    ) -> Dict[str, Any]:
+        max_objects: int = None,  # Will use CloudConfig.GCS_DEFAULT_MAX_OBJECTS if None
+        cancel_token: Optional[CancellationToken] = None,
+        resume_from: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Discover GCS objects (files) with Vietnamese filename support
+        Stream GCS objects (files) with Vietnamese filename support
+        
+        GCS lists names in lexicographic order, so a resumed scan lists from
+        start_offset=<last yielded name> and never re-lists completed prefixes.
         
         Args:
             prefix: GCS prefix (folder path)
             max_objects: Maximum objects to scan (uses CloudConfig.GCS_DEFAULT_MAX_OBJECTS if None)
+            cancel_token: Stops listing between pages once cancelled or past its deadline
+            resume_from: Checkpoint cursor of an interrupted scan (see get_checkpoint_cursor)
             
         Returns:
-            {
-                'objects': [
-                    {
-                        'name': str,  # Object name (UTF-8 Vietnamese filenames)
-                        'size': int,
-                        'updated': datetime,
-                        'content_type': str,
-                        'file_extension': str,
-                        'is_vietnamese_filename': bool
-                    }
-                ],
-                'total_size': int,
-                'total_count': int,
-                'vietnamese_filename_count': int
+            Iterator of {
+                'name': str,  # Object name (UTF-8 Vietnamese filenames)
+                'size': int,
+                'updated': datetime,
+                'content_type': str,
+                'file_extension': str,
+                'is_vietnamese_filename': bool
             }
         """
         if not self.bucket:
@@ -113,63 +121,115 @@ class GCSScanner:
         if max_objects is None:
             max_objects = CloudConfig.GCS_DEFAULT_MAX_OBJECTS
         
-        objects_info = {
-            'objects': [],
-            'total_size': 0,
-            'total_count': 0,
-            'vietnamese_filename_count': 0
-        }
+        resume_from = resume_from or {}
+        listed = resume_from.get('listed', 0)
+        self._checkpoint_cursor = dict(resume_from) if resume_from else None
+        if listed >= max_objects:
+            return
         
         try:
-            # List blobs with prefix
-            blobs = self.bucket.list_blobs(prefix=prefix, max_results=max_objects)
+            # List blobs with prefix (pages are fetched lazily while iterating);
+            # start_offset is inclusive, so the cursor object itself is skipped below
+            blobs = self.bucket.list_blobs(
+                prefix=prefix,
+                max_results=max_objects - listed,
+                start_offset=resume_from.get('name')
+            )
             
             for blob in blobs:
+                # Stop before requesting more pages once cancelled
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    logger.warning(f"[WARNING] GCS listing stopped early ({cancel_token.reason})")
+                    return
+                
                 name = blob.name
-                size = blob.size
+                if name == resume_from.get('name'):
+                    continue
+                listed += 1
                 
                 # Skip directories (blobs with name ending in /)
                 if name.endswith('/'):
                     continue
                 
                 # Validate UTF-8 in object name (Vietnamese filenames)
-                validation = self.utf8_validator.validate(name)
-                if not validation['is_valid']:
+                if not self.utf8_validator.validate(name):
                     logger.warning(f"[WARNING] Invalid UTF-8 in GCS object name: {name}")
                     continue
                 
-                # Check for Vietnamese characters in filename
-                is_vietnamese = validation['has_vietnamese']
-                if is_vietnamese:
-                    objects_info['vietnamese_filename_count'] += 1
-                
                 # Extract file extension
                 file_extension = name.split('.')[-1] if '.' in name else ''
                 
-                objects_info['objects'].append({
+                self._checkpoint_cursor = {'name': name, 'listed': listed}
+                yield {
                     'name': name,
-                    'size': size,
+                    'size': blob.size,
                     'updated': blob.updated,
+                    'generation': blob.generation,
+                    'metageneration': blob.metageneration,
                     'content_type': blob.content_type,
+                    # Base64 MD5 of the content (absent for composite objects)
+                    'content_checksum': blob.md5_hash,
                     'file_extension': file_extension,
-                    'is_vietnamese_filename': is_vietnamese
-                })
-                
-                objects_info['total_size'] += size
-                objects_info['total_count'] += 1
-            
-            logger.info(
-                f"[OK] Discovered {objects_info['total_count']} objects "
-                f"({objects_info['total_size'] / (1024**2):.2f} MB), "
-                f"{objects_info['vietnamese_filename_count']} with Vietnamese names"
-            )
-            
-            return objects_info
+                    'is_vietnamese_filename': UTF8Validator.contains_vietnamese(name)
+                }
             
         except Exception as e:
             logger.error(f"[ERROR] GCS object discovery failed: {str(e)}")
             raise
     
+    def iter_discovery_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_ITEM_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        **options
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream discovered objects in lists of at most batch_size (options as for iter_objects)"""
+        return iter_batches(self.iter_objects(cancel_token=cancel_token, **options), batch_size)
+    
+    def get_checkpoint_cursor(self) -> Optional[Dict[str, Any]]:
+        """Cursor after the last yielded object (pass as resume_from to continue)"""
+        return self._checkpoint_cursor
+    
+    def discover_objects(
+        self,
+        prefix: str = '',
+        max_objects: int = None,  # Will use CloudConfig.GCS_DEFAULT_MAX_OBJECTS if None
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Discover GCS objects (files) with Vietnamese filename support
+        
+        Materializes iter_objects(); prefer iter_discovery_batches() for large buckets.
+        
+        Args:
+            prefix: GCS prefix (folder path)
+            max_objects: Maximum objects to scan (uses CloudConfig.GCS_DEFAULT_MAX_OBJECTS if None)
+            cancel_token: Stops listing between pages once cancelled or past its deadline
+            
+        Returns:
+            {
+                'objects': [...],  # see iter_objects()
+                'total_size': int,
+                'total_count': int,
+                'vietnamese_filename_count': int,
+                'partial': bool,  # True if stopped by cancel_token
+                'cancel_reason': Optional[str]
+            }
+        """
+        objects_info = summarize_discovered_items(
+            self.ITEM_KEY,
+            self.iter_objects(prefix, max_objects, cancel_token),
+            cancel_token
+        )
+        
+        logger.info(
+            f"[OK] Discovered {objects_info['total_count']} objects "
+            f"({objects_info['total_size'] / (1024**2):.2f} MB), "
+            f"{objects_info['vietnamese_filename_count']} with Vietnamese names"
+        )
+        
+        return objects_info
+    
     def get_object_metadata(self, object_name: str) -> Dict[str, Any]:
         """
         Get GCS object metadata with Vietnamese filename validation
@@ -4,7 +4,7 @@ Uses dynamic configuration from CloudConfig
 Zero hard-coding - all operational values from centralized config
 Vietnamese UTF-8 filename support
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 import logging
 
@@ -12,9 +12,13 @@ import logging
 try:
     from ..config import CloudConfig, ScanConfig
     from ..utils import UTF8Validator
+    from ..utils.cancellation import CancellationToken
+    from ..utils.catalog_discovery import iter_batches, summarize_discovered_items
 except ImportError:
     from config import CloudConfig, ScanConfig
     from utils import UTF8Validator
+    from utils.cancellation import CancellationToken
+    from utils.catalog_discovery import iter_batches, summarize_discovered_items
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +42,7 @@ class S3Scanner:
         self.s3_client = None
         self.s3_resource = None
         self.utf8_validator = UTF8Validator()
+        self._checkpoint_cursor = None  # Cursor after the last yielded object
     
     def connect(self) -> bool:
         """
@@ -79,33 +84,36 @@ class S3Scanner:
             logger.error(f"[ERROR] S3 connection failed: {str(e)}")
             return False
     
-    def discover_objects(
+    # Result key of discovered items (streaming protocol, see ScannerInterface)
+    ITEM_KEY = 'objects'
+    
+    def iter_objects(
         self,
         prefix: str = '',
-        max_keys: int = None  # Will use CloudConfig.DEFAULT_MAX_KEYS if None
-    ) -> Dict[str, Any]:
+        max_keys: int = None,  # Will use CloudConfig.DEFAULT_MAX_KEYS if None
+        cancel_token: Optional[CancellationToken] = None,
+        resume_from: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Discover S3 objects (files) with Vietnamese filename support
+        Stream S3 objects (files) page by page with Vietnamese filename support
+        
+        S3 lists keys in lexicographic order, so a resumed scan lists from
+        StartAfter=<last yielded key> and never re-lists completed prefixes.
         
         Args:
             prefix: S3 prefix (folder path)
             max_keys: Maximum objects to scan (uses CloudConfig.DEFAULT_MAX_KEYS if None)
+            cancel_token: Stops listing between pages once cancelled or past its deadline
+            resume_from: Checkpoint cursor of an interrupted scan (see get_checkpoint_cursor)
             
         Returns:
-            {
-                'objects': [
-                    {
-                        'key': str,  # Full path (UTF-8 Vietnamese filenames)
-                        'size': int,
-                        'last_modified': datetime,
-                        'storage_class': str,
-                        'file_extension': str,
-                        'is_vietnamese_filename': bool
-                    }
-                ],
-                'total_size': int,
-                'total_count': int,
-                'vietnamese_filename_count': int
+            Iterator of {
+                'key': str,  # Full path (UTF-8 Vietnamese filenames)
+                'size': int,
+                'last_modified': datetime,
+                'storage_class': str,
+                'file_extension': str,
+                'is_vietnamese_filename': bool
             }
         """
         if not self.s3_client:
@@ -116,75 +124,118 @@ class S3Scanner:
             max_keys = CloudConfig.DEFAULT_MAX_KEYS
         
         bucket_name = self.config['bucket_name']
-        objects_info = {
-            'objects': [],
-            'total_size': 0,
-            'total_count': 0,
-            'vietnamese_filename_count': 0
-        }
+        
+        resume_from = resume_from or {}
+        listed = resume_from.get('listed', 0)
+        self._checkpoint_cursor = dict(resume_from) if resume_from else None
+        list_params = {'Bucket': bucket_name, 'Prefix': prefix}
+        if resume_from.get('key'):
+            list_params['StartAfter'] = resume_from['key']
+        if listed >= max_keys:
+            return
         
         try:
-            # Import here to avoid circular import and allow mocking
-            import boto3
-            from botocore.exceptions import ClientError
-            
             paginator = self.s3_client.get_paginator('list_objects_v2')
             pages = paginator.paginate(
-                Bucket=bucket_name,
-                Prefix=prefix,
-                PaginationConfig={'MaxItems': max_keys}
+                **list_params,
+                PaginationConfig={'MaxItems': max_keys - listed}
             )
             
             for page in pages:
+                # Stop before requesting more pages once cancelled
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    logger.warning(f"[WARNING] S3 listing stopped early ({cancel_token.reason})")
+                    return
+                
                 if 'Contents' not in page:
                     continue
                 
                 for obj in page['Contents']:
                     key = obj['Key']
-                    size = obj['Size']
+                    listed += 1
                     
                     # Skip folders (keys ending with /)
                     if key.endswith('/'):
                         continue
                     
                     # Validate UTF-8 in key (Vietnamese filenames)
-                    validation = self.utf8_validator.validate(key)
-                    if not validation['is_valid']:
+                    if not self.utf8_validator.validate(key):
                         logger.warning(f"[WARNING] Invalid UTF-8 in S3 key: {key}")
                         continue
                     
-                    # Check for Vietnamese characters in filename
-                    is_vietnamese = validation['has_vietnamese']
-                    if is_vietnamese:
-                        objects_info['vietnamese_filename_count'] += 1
-                    
                     # Extract file extension
                     file_extension = key.split('.')[-1] if '.' in key else ''
                     
-                    objects_info['objects'].append({
+                    self._checkpoint_cursor = {'key': key, 'listed': listed}
+                    yield {
                         'key': key,
-                        'size': size,
+                        'size': obj['Size'],
                         'last_modified': obj['LastModified'],
+                        'etag': obj.get('ETag', '').strip('"'),
+                        # Equal ETags mean equal content (MD5, or MD5 of part MD5s for multipart uploads)
+                        'content_checksum': obj.get('ETag', '').strip('"') or None,
                         'storage_class': obj.get('StorageClass', 'STANDARD'),
                         'file_extension': file_extension,
-                        'is_vietnamese_filename': is_vietnamese
-                    })
-                    
-                    objects_info['total_size'] += size
-                    objects_info['total_count'] += 1
-            
-            logger.info(
-                f"[OK] Discovered {objects_info['total_count']} objects "
-                f"({objects_info['total_size'] / (1024**2):.2f} MB), "
-                f"{objects_info['vietnamese_filename_count']} with Vietnamese names"
-            )
-            
-            return objects_info
+                        'is_vietnamese_filename': UTF8Validator.contains_vietnamese(key)
+                    }
             
         except Exception as e:
             logger.error(f"[ERROR] S3 object discovery failed: {str(e)}")
             raise
     
+    def iter_discovery_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_ITEM_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        **options
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream discovered objects in lists of at most batch_size (options as for iter_objects)"""
+        return iter_batches(self.iter_objects(cancel_token=cancel_token, **options), batch_size)
+    
+    def get_checkpoint_cursor(self) -> Optional[Dict[str, Any]]:
+        """Cursor after the last yielded object (pass as resume_from to continue)"""
+        return self._checkpoint_cursor
+    
+    def discover_objects(
+        self,
+        prefix: str = '',
+        max_keys: int = None,  # Will use CloudConfig.DEFAULT_MAX_KEYS if None
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Discover S3 objects (files) with Vietnamese filename support
+        
+        Materializes iter_objects(); prefer iter_discovery_batches() for large buckets.
+        
+        Args:
+            prefix: S3 prefix (folder path)
+            max_keys: Maximum objects to scan (uses CloudConfig.DEFAULT_MAX_KEYS if None)
+            cancel_token: Stops listing between pages once cancelled or past its deadline
+            
+        Returns:
+            {
+                'objects': [...],  # see iter_objects()
+                'total_size': int,
+                'total_count': int,
+                'vietnamese_filename_count': int,
+                'partial': bool,  # True if stopped by cancel_token
+                'cancel_reason': Optional[str]
+            }
+        """
+        objects_info = summarize_discovered_items(
+            self.ITEM_KEY,
+            self.iter_objects(prefix, max_keys, cancel_token),
+            cancel_token
+        )
+        
+        logger.info(
+            f"[OK] Discovered {objects_info['total_count']} objects "
+            f"({objects_info['total_size'] / (1024**2):.2f} MB), "
+            f"{objects_info['vietnamese_filename_count']} with Vietnamese names"
+        )
+        
+        return objects_info
+    
     def get_object_metadata(self, key: str) -> Dict[str, Any]:
         """
         Get S3 object metadata with Vietnamese filename validation
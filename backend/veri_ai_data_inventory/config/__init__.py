@@ -6,14 +6,22 @@ Follows dynamic coding principles with single source of truth.
 """
 
 from .constants import (
+    StorageConfig,
     ScanConfig,
     DatabaseConfig,
     EncodingConfig,
     CloudConfig,
     FilesystemConfig,
     ScanManagerConfig,
+    WorkQueueConfig,
+    JobStoreConfig,
+    ProgressStreamConfig,
+    ResultStoreConfig,
+    ContentScanConfig,
+    ContentDedupConfig,
     VietnameseRegionalConfig,
     APIConfig,
+    resolve_data_path,
     validate_config,
 )
 
@@ -32,14 +40,22 @@ from .ropa_translations import (
 )
 
 __all__ = [
+    'StorageConfig',
     'ScanConfig',
     'DatabaseConfig',
     'EncodingConfig',
     'CloudConfig',
     'FilesystemConfig',
     'ScanManagerConfig',
+    'WorkQueueConfig',
+    'JobStoreConfig',
+    'ProgressStreamConfig',
+    'ResultStoreConfig',
+    'ContentScanConfig',
+    'ContentDedupConfig',
     'VietnameseRegionalConfig',
     'APIConfig',
+    'resolve_data_path',
     'validate_config',
     'ReportType',
     'NodeType',
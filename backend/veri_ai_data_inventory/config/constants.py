@@ -15,9 +15,23 @@ Usage:
     port = DatabaseConfig.POSTGRESQL_DEFAULT_PORT
 """
 
+import os
 from typing import Dict, List
 
 
+class StorageConfig:
+    """Local data files of the service (SQLite stores, result files)"""
+
+    DATA_DIRECTORY_ENV: str = 'VERISYNTRA_DATA_DIR'
+    """Environment variable overriding DATA_DIRECTORY"""
+
+    DATA_DIRECTORY: str = os.getenv(
+        DATA_DIRECTORY_ENV,
+        os.path.join(os.path.expanduser('~'), '.verisyntra', 'data_inventory')
+    )
+    """Directory that relative store paths (watermarks, checkpoints, work queue, results) resolve against"""
+
+
 class ScanConfig:
     """Data scanning operation configuration"""
     
@@ -42,6 +56,78 @@ class ScanConfig:
     TOP_VALUES_COUNT: int = 10
     """Number of top values to include in distribution statistics"""
     
+    # Server-side sampling strategies (database scanners)
+    DEFAULT_SAMPLING_STRATEGY: str = 'auto'
+    """Sampling strategy: 'auto' chooses from catalog row estimates"""
+    
+    SAMPLING_STRATEGIES: List[str] = ['auto', 'limit', 'random', 'bernoulli', 'system', 'pk_range']
+    """Supported strategies (limit = first rows, random = ORDER BY random() / MongoDB $sample, bernoulli/system = PostgreSQL TABLESAMPLE, pk_range = MySQL primary-key ranges)"""
+    
+    SMALL_TABLE_ROW_THRESHOLD: int = 10000
+    """Tables up to this many estimated rows are sampled with ORDER BY random()"""
+    
+    BERNOULLI_MAX_ROWS: int = 1000000
+    """Above this estimated row count PostgreSQL switches to block-level TABLESAMPLE SYSTEM"""
+    
+    TABLESAMPLE_OVERSAMPLE_FACTOR: float = 3.0
+    """TABLESAMPLE percentage targets this multiple of the requested rows"""
+    
+    TABLESAMPLE_MAX_RETRIES: int = 2
+    """Retries with doubled percentage when TABLESAMPLE returns too few rows"""
+    
+    PK_RANGE_SAMPLE_SEGMENTS: int = 10
+    """Random primary-key ranges read per MySQL sample (one UNION ALL query)"""
+    
+    # Top-value profiling (catalog statistics fast path)
+    TOP_VALUES_SAMPLE_ROWS: int = 100000
+    """Rows aggregated by the sampled GROUP BY fallback when catalog statistics are stale"""
+    
+    STATS_MAX_MODIFIED_RATIO: float = 0.1
+    """PostgreSQL statistics are fresh while rows modified since ANALYZE stay below this ratio (10%)"""
+    
+    STATS_MAX_AGE_HOURS: int = 168
+    """Catalog statistics (MySQL histograms, PostgreSQL ANALYZE) older than this are treated as stale (7 days)"""
+    
+    # Streaming sketch sampling (columns too large to materialize)
+    HLL_PRECISION: int = 14
+    """HyperLogLog register index bits (2^14 registers, ~0.8% distinct-count error)"""
+    
+    TOP_K_SKETCH_CAPACITY: int = 1000
+    """Counters kept by the Space-Saving top-k sketch (must be >= DEFAULT_SAMPLE_SIZE)"""
+    
+    STREAM_FETCH_BATCH_SIZE: int = 10000
+    """Rows fetched per cursor.fetchmany() call when streaming column values"""
+    
+    # Bulk catalog discovery (databases with 10k+ tables)
+    DISCOVERY_FETCH_BATCH_SIZE: int = 5000
+    """information_schema column rows fetched per round trip from the server-side cursor"""
+    
+    DISCOVERY_TABLE_BATCH_SIZE: int = 500
+    """Discovered tables handed to the filter/profiling stages per batch"""
+    
+    DISCOVERY_ITEM_BATCH_SIZE: int = 1000
+    """Discovered files/objects yielded per batch by streaming cloud and filesystem scanners"""
+    
+    # Async database scanning
+    ASYNC_SAMPLE_CONCURRENCY: int = 8
+    """Tables sampled concurrently per database scan (semaphore-bounded fan-out)"""
+    
+    SAMPLE_TABLES_DURING_SCAN: bool = True
+    """Sample discovered tables during scan jobs to detect Vietnamese data"""
+
+    # Incremental (delta) scanning
+    WATERMARK_DB_PATH: str = 'scan_watermarks.sqlite'
+    """SQLite database holding per-source asset watermarks (relative: under StorageConfig.DATA_DIRECTORY)"""
+
+    WATERMARK_SOURCE_IGNORED_KEYS: List[str] = [
+        'username', 'user', 'password',
+        'aws_access_key_id', 'aws_secret_access_key', 'credentials_path'
+    ]
+    """connection_config keys left out of the source identity (credential rotation keeps watermarks)"""
+
+    MAX_REMOVED_ASSETS_REPORTED: int = 1000
+    """Removed asset keys listed in a delta report (the count is always complete)"""
+
     # Job estimation
     ESTIMATED_SCAN_TIME_SECONDS: int = 300
     """Default estimated time for scan job completion (5 minutes)"""
@@ -139,6 +225,15 @@ class FilesystemConfig:
     
     EXCLUDED_EXTENSIONS: List[str] = ['.tmp', '.log', '.cache', '.bak', '.swp']
     """File extensions to exclude from scanning"""
+    
+    WALK_WORKERS: int = 4
+    """Threads listing directories ahead of a local filesystem walk"""
+    
+    NETWORK_SHARE_WALK_WORKERS: int = 16
+    """Threads listing directories ahead of a network share walk (listings wait on SMB round trips)"""
+    
+    WALK_PREFETCH_DIRECTORIES: int = 64
+    """Directory listings held ahead of the walk (bounds memory of prefetched listings)"""
 
 
 class ScanManagerConfig:
@@ -151,7 +246,35 @@ class ScanManagerConfig:
     """Number of retry attempts for failed scanner connections"""
     
     RETRY_DELAY_SECONDS: int = 5
-    """Delay in seconds between retry attempts"""
+    """Delay in seconds before the first retry (later retries back off exponentially)"""
+    
+    RETRY_BACKOFF_MULTIPLIER: float = 2.0
+    """Retry delay multiplier per further attempt"""
+    
+    RETRY_MAX_DELAY_SECONDS: float = 60.0
+    """Upper bound on the delay between two attempts"""
+    
+    RETRY_JITTER_RATIO: float = 0.5
+    """Random fraction taken off each delay so scans failing together do not retry together (0 = none)"""
+    
+    RETRYABLE_ERROR_TYPES: List[str] = [
+        'OperationalError', 'InterfaceError',  # DB-API drivers (psycopg2, pymysql, pyodbc)
+        'ConnectionDoesNotExistError', 'CannotConnectNowError', 'TooManyConnectionsError',  # asyncpg
+        'AutoReconnect', 'NetworkTimeout', 'ServerSelectionTimeoutError',  # pymongo
+        'EndpointConnectionError', 'ConnectTimeoutError', 'ReadTimeoutError',  # botocore
+        'ServiceRequestError', 'ServiceResponseError',  # azure-core
+        'ServiceUnavailable', 'TooManyRequests', 'InternalServerError', 'GatewayTimeout',  # google-api-core
+    ]
+    """Transient driver error class names (matched on the error's class hierarchy); ConnectionError/TimeoutError always retry"""
+    
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    """Consecutive connection failures of a source that open its circuit (scans then fail fast)"""
+    
+    CIRCUIT_BREAKER_RESET_SECONDS: float = 60.0
+    """Time an open circuit rejects scans before one trial connection is let through"""
+    
+    ERROR_LOG_SIZE: int = 200
+    """Most recent errors kept by an error handler (older entries are dropped)"""
     
     SCANNER_TIMEOUT_SECONDS: int = 600
     """Maximum time in seconds for single scanner operation (10 minutes)"""
@@ -164,6 +287,295 @@ class ScanManagerConfig:
     
     PROGRESS_UPDATE_INTERVAL_SECONDS: int = 10
     """Interval for progress updates during long-running scans"""
+    
+    # Connection pooling (reuse connections across scans of the same source)
+    ENABLE_CONNECTION_POOLING: bool = True
+    """Lease database connections from the shared pool instead of connecting per scan"""
+    
+    POOL_MAX_CONNECTIONS_PER_SOURCE: int = 4
+    """Maximum open (idle + leased) connections per source fingerprint"""
+    
+    POOL_IDLE_TIMEOUT_SECONDS: int = 300
+    """Idle pooled connections older than this are closed (5 minutes)"""
+    
+    POOL_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
+    """Idle connections unused for longer than this are health-checked before reuse"""
+    
+    POOL_ACQUIRE_TIMEOUT_SECONDS: int = 30
+    """Maximum wait for a connection when a source is at its connection limit"""
+    
+    POOL_FINGERPRINT_IGNORED_KEYS: List[str] = ['schema', 'scanner_type']
+    """connection_config keys that do not change the physical connection"""
+
+    # Cancellation (scanners check a CancellationToken between tables, pages or directories)
+    CANCEL_GRACE_SECONDS: int = 30
+    """Time a timed-out scan gets to stop and return partial results before it is abandoned"""
+
+    # Result deduplication (ResultAggregator seen-item store)
+    DEDUP_BACKEND: str = 'exact'
+    """Seen-item store: 'exact' (in-memory set), 'bloom' (scalable Bloom filter) or 'sqlite' (disk-backed, exact)"""
+
+    DEDUP_BACKENDS: List[str] = ['exact', 'bloom', 'sqlite']
+    """Supported dedup store backends"""
+
+    DEDUP_BLOOM_INITIAL_CAPACITY: int = 1000000
+    """Items held by the first Bloom filter before a larger one is added"""
+
+    DEDUP_BLOOM_ERROR_RATE: float = 0.001
+    """Upper bound on the Bloom false-positive rate (unique items wrongly dropped as duplicates)"""
+
+    DEDUP_BLOOM_GROWTH_FACTOR: int = 2
+    """Capacity multiplier for each additional Bloom filter"""
+
+    DEDUP_BLOOM_TIGHTENING_RATIO: float = 0.5
+    """Error-rate multiplier for each additional Bloom filter (keeps the total under the bound)"""
+
+    DEDUP_SQLITE_DIRECTORY: str = ''
+    """Directory for SQLite dedup databases (empty: system temp directory)"""
+
+    DEDUP_SQLITE_CACHE_KIB: int = 16384
+    """SQLite page cache limit per dedup store in KiB (bounds its memory use)"""
+
+    ENABLE_SCAN_CHECKPOINTS: bool = True
+    """Persist scan cursors so an interrupted scan resumes instead of restarting"""
+
+    CHECKPOINT_DB_PATH: str = 'scan_checkpoints.sqlite'
+    """SQLite database holding the checkpoint of each unfinished scan job (relative: under StorageConfig.DATA_DIRECTORY)"""
+
+    CHECKPOINT_INTERVAL_SECONDS: float = 30.0
+    """Save a checkpoint at least this often while a scan is emitting items"""
+
+    CHECKPOINT_INTERVAL_ITEMS: int = 10000
+    """Save a checkpoint after this many items since the last one (whichever interval comes first)"""
+
+    CHECKPOINT_MAX_ASSETS: int = 1000
+    """Discovered assets kept in a checkpoint to restore the job view on resume"""
+    
+    # Scan scheduling (fair admission of scans run by the API process)
+    MAX_CONCURRENT_SCANS_PER_TENANT: int = 2
+    """Scans of one tenant running at the same time (others wait in the scheduler queue)"""
+    
+    MAX_CONCURRENT_SCANS_PER_SOURCE: int = 1
+    """Scans of one physical source (connection fingerprint) running at the same time"""
+    
+    TENANT_SCAN_QUOTAS: Dict[str, int] = {}
+    """Per-tenant overrides of MAX_CONCURRENT_SCANS_PER_TENANT (tenant ID -> limit)"""
+    
+    TENANT_SCHEDULING_WEIGHTS: Dict[str, float] = {}
+    """Fair-share weights by tenant ID (default 1.0; weight 2 gets twice the scan starts)"""
+    
+    SCAN_PRIORITIES: List[str] = ['on_demand', 'scheduled']
+    """Scan priority levels, highest first (a waiting higher-priority scan always starts first)"""
+    
+    DEFAULT_SCAN_PRIORITY: str = 'on_demand'
+    """Priority of scans that do not set one"""
+    
+    SCAN_DURATION_SMOOTHING: float = 0.2
+    """Weight of the latest scan duration in the moving average used for start estimates"""
+
+
+class WorkQueueConfig:
+    """Distributed scan work queue and scan worker configuration"""
+
+    EXECUTION_MODE: str = 'local'
+    """'local': scans run in the API process; 'queue': scans are enqueued for scan worker processes"""
+
+    BACKEND: str = 'sqlite'
+    """Queue backend: 'redis' (multi-node) or 'sqlite' (single node, tests)"""
+
+    BACKENDS: List[str] = ['sqlite', 'redis']
+    """Supported work queue backends"""
+
+    SQLITE_PATH: str = 'scan_work_queue.sqlite'
+    """SQLite queue database shared by worker processes on one node (relative: under StorageConfig.DATA_DIRECTORY)"""
+
+    REDIS_URL: str = 'redis://localhost:6379/0'
+    """Redis server holding the queue"""
+
+    REDIS_KEY_PREFIX: str = 'verisyntra:scan_queue'
+    """Prefix of all queue keys in Redis"""
+
+    VISIBILITY_TIMEOUT_SECONDS: float = 300.0
+    """A leased unit not acked or extended within this time is handed to another worker"""
+
+    HEARTBEAT_INTERVAL_SECONDS: float = 60.0
+    """Workers extend the lease of a running unit this often (well below the visibility timeout)"""
+
+    MAX_ATTEMPTS: int = 3
+    """Leases per unit (failures and expired leases) before it is dead-lettered"""
+
+    RETRY_DELAY_SECONDS: float = 5.0
+    """Delay before the first retry of a failed unit"""
+
+    RETRY_BACKOFF_MULTIPLIER: float = 2.0
+    """Retry delay multiplier per further attempt"""
+
+    TABLES_PER_UNIT: int = 200
+    """Database tables profiled per work unit"""
+
+    WORKER_CONCURRENCY: int = 4
+    """Units processed at the same time by one worker process"""
+
+    POLL_INTERVAL_SECONDS: float = 1.0
+    """Idle workers poll the queue this often"""
+
+    JOB_RETENTION_SECONDS: int = 86400
+    """Finished job records and results are kept this long (24 hours)"""
+
+
+class JobStoreConfig:
+    """Scan job state store configuration (retention: APIConfig.TASK_RETENTION_HOURS)"""
+
+    BACKEND: str = 'memory'
+    """Job store: 'memory' (single API process) or 'redis' (job state shared by all API workers)"""
+
+    BACKENDS: List[str] = ['memory', 'redis']
+    """Supported job store backends"""
+
+    REDIS_URL: str = 'redis://localhost:6379/0'
+    """Redis server holding job state"""
+
+    REDIS_KEY_PREFIX: str = 'verisyntra:jobs'
+    """Prefix of job hashes and index sorted sets in Redis"""
+
+    PERSIST_INTERVAL_SECONDS: float = 1.0
+    """Progress of a running job is written to the store at most this often (status changes at once)"""
+
+
+class ProgressStreamConfig:
+    """Push-based scan progress stream (server-sent events) configuration"""
+
+    BACKEND: str = 'local'
+    """Pub/sub backend: 'local' (single API process) or 'redis' (events reach every API worker)"""
+
+    BACKENDS: List[str] = ['local', 'redis']
+    """Supported progress bus backends"""
+
+    REDIS_URL: str = 'redis://localhost:6379/0'
+    """Redis server used for progress pub/sub"""
+
+    REDIS_CHANNEL_PREFIX: str = 'verisyntra:scan_progress'
+    """Prefix of per-scan progress channels (and latest-snapshot keys) in Redis"""
+
+    SNAPSHOT_TTL_SECONDS: int = 3600
+    """Latest progress snapshot kept in Redis for subscribers on other API workers"""
+
+    MAX_UPDATES_PER_SECOND: float = 2.0
+    """Progress updates published per scan per second (newer updates replace pending ones)"""
+
+    KEEPALIVE_SECONDS: float = 15.0
+    """Idle streams send a comment line this often so proxies keep the connection open"""
+
+    SUBSCRIBER_QUEUE_SIZE: int = 16
+    """Undelivered events buffered per stream (oldest dropped; events are full snapshots)"""
+
+
+class ContentScanConfig:
+    """Content-level PII scanning of discovered files"""
+
+    ENABLED: bool = True
+    """Scan the content of discovered files for PII during scan jobs"""
+
+    SUPPORTED_EXTENSIONS: List[str] = ['.txt', '.log', '.csv', '.json', '.docx', '.xlsx', '.pdf']
+    """File types whose text is extracted and scanned"""
+
+    PII_TYPES: List[str] = []
+    """PII types detected (ReportingConfig.REDACTION_PATTERNS keys; empty = all)"""
+
+    MAX_BYTES_PER_FILE: int = 16 * 1024 * 1024
+    """Content scanned per file: bytes read for plain text, characters extracted for documents"""
+
+    MAX_SECONDS_PER_FILE: float = 30.0
+    """Time budget per file; extraction stops at the next piece and the file is reported as timed out"""
+
+    READ_BYTES: int = 64 * 1024
+    """Bytes per read of plain text files"""
+
+    MAX_WORKERS: int = 0
+    """Worker processes scanning file content (0 = one per CPU core)"""
+
+    PARALLEL_THRESHOLD: int = 4
+    """Batches with fewer scannable files are scanned in-process"""
+
+    LARGE_FILE_ENABLED: bool = True
+    """Scan text files larger than MAX_BYTES_PER_FILE in full (memory-mapped, chunk-parallel)"""
+
+    LARGE_FILE_EXTENSIONS: List[str] = ['.txt', '.log', '.csv', '.json']
+    """Plain text types eligible for large-file scanning (JSON is scanned as raw text)"""
+
+    LARGE_FILE_CHUNK_BYTES: int = 64 * 1024 * 1024
+    """Target size of the line-aligned chunks scanned by one worker task"""
+
+    LARGE_FILE_WINDOW_BYTES: int = 1024 * 1024
+    """Bytes decoded at a time inside a chunk (bounds worker memory)"""
+
+    LARGE_FILE_SAMPLE_OFFSETS: int = 20
+    """Match byte offsets sampled per PII category and file"""
+
+    LARGE_FILE_MAX_SECONDS: float = 3600.0
+    """Time budget per large file; unfinished chunks are skipped and the file reported as timed out"""
+
+
+class ContentDedupConfig:
+    """Content-hash deduplication of discovered files and objects (per scan job)"""
+
+    ENABLED: bool = True
+    """Fingerprint discovered files/objects, scan each unique content once and report duplicate clusters"""
+
+    ITEM_KEYS: List[str] = ['files', 'objects', 'blobs']
+    """Scanner item keys deduplicated (filesystem files, cloud objects and blobs)"""
+
+    MIN_BYTES: int = 1
+    """Smaller files are not fingerprinted (empty files are all identical)"""
+
+    BLOCK_BYTES: int = 64 * 1024
+    """Size of the first and last blocks hashed for files of equal size"""
+
+    READ_BYTES: int = 1024 * 1024
+    """Bytes per read of full-content hashes"""
+
+    HASH_ALGORITHM: str = 'auto'
+    """Full-content hash: 'xxhash' (xxh3-128), 'blake3', 'blake2b' or 'auto' (first installed, blake2b last)"""
+
+    HASH_ALGORITHMS: List[str] = ['auto', 'xxhash', 'blake3', 'blake2b']
+    """Supported full-content hash algorithms"""
+
+    REPORT_CLUSTERS: int = 50
+    """Duplicate clusters listed in the job report (most wasted bytes first)"""
+
+    REPORT_PATHS: int = 10
+    """Paths listed per duplicate cluster"""
+
+
+class ResultStoreConfig:
+    """Per-job scan result files (retention: APIConfig.TASK_RETENTION_HOURS)"""
+
+    ENABLED: bool = True
+    """Write every discovered asset to a result file; job state keeps a preview and summary"""
+
+    FORMAT: str = 'parquet'
+    """Result file format: 'parquet' or 'arrow' (columnar, need pyarrow) or 'sqlite'"""
+
+    FORMATS: List[str] = ['parquet', 'arrow', 'sqlite']
+    """Supported result file formats"""
+
+    DIRECTORY: str = 'scan_results'
+    """Directory holding result files, one per scan job (relative: under StorageConfig.DATA_DIRECTORY)"""
+
+    ROW_GROUP_SIZE: int = 50000
+    """Assets buffered before a row group is written (bounds writer memory)"""
+
+    PARQUET_COMPRESSION: str = 'zstd'
+    """Parquet column compression codec"""
+
+    SUMMARY_TOP_EXTENSIONS: int = 20
+    """Most frequent file extensions counted in a job's result summary"""
+
+    DEFAULT_PAGE_SIZE: int = 100
+    """Assets per results page when no limit is given"""
+
+    MAX_PAGE_SIZE: int = 1000
+    """Largest results page a client may request"""
 
 
 class VietnameseRegionalConfig:
@@ -293,6 +705,27 @@ __all__ = [
 ]
 
 
+# Data path resolution for local stores
+def resolve_data_path(path: str) -> str:
+    """
+    Resolve a configured store path against StorageConfig.DATA_DIRECTORY
+    
+    Absolute paths and SQLite ':memory:' are returned unchanged. The data
+    directory is created when needed, so stores never land in the current
+    working directory of whichever process opened them.
+    
+    Args:
+        path: Configured file or directory path
+    
+    Returns:
+        Absolute path (or ':memory:')
+    """
+    if path == ':memory:' or os.path.isabs(path):
+        return path
+    os.makedirs(StorageConfig.DATA_DIRECTORY, exist_ok=True)
+    return os.path.join(StorageConfig.DATA_DIRECTORY, path)
+
+
 # Validation function for configuration integrity
 def validate_config() -> Dict[str, bool]:
     """
@@ -315,6 +748,27 @@ def validate_config() -> Dict[str, bool]:
             1024 <= DatabaseConfig.MONGODB_DEFAULT_PORT <= 65535,
         ]),
         'max_depth_positive': FilesystemConfig.DEFAULT_MAX_DEPTH > 0,
+        'top_k_sketch_covers_sample': (
+            ScanConfig.TOP_K_SKETCH_CAPACITY >= ScanConfig.DEFAULT_SAMPLE_SIZE
+        ),
+        'default_scan_priority_known': (
+            ScanManagerConfig.DEFAULT_SCAN_PRIORITY in ScanManagerConfig.SCAN_PRIORITIES
+        ),
+        'tenant_scan_limit_within_global_limit': (
+            ScanManagerConfig.MAX_CONCURRENT_SCANS_PER_TENANT <= ScanManagerConfig.MAX_CONCURRENT_SCANS
+        ),
+        'retry_jitter_ratio_in_range': 0.0 <= ScanManagerConfig.RETRY_JITTER_RATIO <= 1.0,
+        'progress_updates_rate_positive': ProgressStreamConfig.MAX_UPDATES_PER_SECOND > 0,
+        'large_file_window_within_chunk': (
+            0 < ContentScanConfig.LARGE_FILE_WINDOW_BYTES <= ContentScanConfig.LARGE_FILE_CHUNK_BYTES
+        ),
+        'dedup_hash_algorithm_known': ContentDedupConfig.HASH_ALGORITHM in ContentDedupConfig.HASH_ALGORITHMS,
+        'result_page_size_within_max': (
+            0 < ResultStoreConfig.DEFAULT_PAGE_SIZE <= ResultStoreConfig.MAX_PAGE_SIZE
+        ),
+        'heartbeat_within_visibility_timeout': (
+            WorkQueueConfig.HEARTBEAT_INTERVAL_SECONDS < WorkQueueConfig.VISIBILITY_TIMEOUT_SECONDS
+        ),
     }
     
     return validations
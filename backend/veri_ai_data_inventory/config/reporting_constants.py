@@ -93,6 +93,8 @@ class ReportingConfig:
     ]
     
     # Vietnamese Redaction Patterns (compiled regex)
+    # Repetitions are bounded so no match is longer than REDACTION_STREAM_CARRY_OVER
+    # (streaming redaction holds that many characters back at chunk boundaries)
     REDACTION_PATTERNS: Dict[str, str] = {
         # Vietnamese phone numbers
         "vietnamese_phone": r"\b(0|\+84)[1-9]\d{8,9}\b",
@@ -101,13 +103,13 @@ class ReportingConfig:
         "cccd": r"\b\d{12}\b",
         
         # Vietnamese email addresses
-        "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+        "email": r"\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Z|a-z]{2,63}\b",
         
         # Vietnamese addresses (keywords-based)
-        "address": r"(?i)(số|đường|phường|quận|thành phố|tỉnh)\s+[\w\s,.-]+",
+        "address": r"(?i)(số|đường|phường|quận|thành phố|tỉnh)\s[\w\s,.-]{1,200}",
         
         # Vietnamese full names (Họ tên - pattern detection)
-        "full_name": r"\b[A-ZÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ][a-zàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]+(?:\s+[A-ZÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ][a-zàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]+){1,3}\b",
+        "full_name": r"\b[A-ZÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ][a-zàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]{1,30}(?:\s{1,4}[A-ZÀÁẠẢÃÂẦẤẬẨẪĂẰẮẶẲẴÈÉẸẺẼÊỀẾỆỂỄÌÍỊỈĨÒÓỌỎÕÔỒỐỘỔỖƠỜỚỢỞỠÙÚỤỦŨƯỪỨỰỬỮỲÝỴỶỸĐ][a-zàáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]{1,30}){1,3}\b",
         
         # Bank account numbers (Vietnamese format)
         "bank_account": r"\b\d{10,16}\b"
@@ -122,7 +124,21 @@ class ReportingConfig:
         "full_name": "[HỌ TÊN]",  # Ho ten
         "bank_account": "[TÀI KHOẢN]"  # Tai khoan
     }
-    
+
+    # Fallback mask for PII types without a configured Vietnamese label
+    DEFAULT_REDACTION_MASK: str = "[REDACTED]"
+
+    # Streaming Redaction (large uploaded documents)
+    REDACTION_STREAM_CHUNK_SIZE: int = 1024 * 1024  # Characters redacted per chunk (1M)
+    REDACTION_STREAM_CARRY_OVER: int = 1024  # Characters held back at chunk boundaries (> longest PII match)
+    REDACTION_STREAM_READ_BYTES: int = 64 * 1024  # Bytes read per upload/file read (64KB)
+
+    # Batch Redaction (data subject request fulfilment over many small records)
+    REDACTION_BATCH_MAX_RECORDS: int = 50000  # Max records accepted per batch request
+    REDACTION_BATCH_MAX_WORKERS: int = 0  # Worker processes (0 = one per CPU core)
+    REDACTION_BATCH_RECORDS_PER_TASK: int = 200  # Records sent to a worker per task
+    REDACTION_BATCH_PARALLEL_THRESHOLD: int = 500  # Smaller batches are redacted in-process
+
     # System Name Translations (Vietnamese)
     SYSTEM_TRANSLATIONS_VI: Dict[str, str] = {
         "web_forms": "Biểu mẫu Web",
@@ -4,7 +4,7 @@ Uses dynamic configuration from FilesystemConfig
 Zero hard-coding - all operational values from centralized config
 Vietnamese UTF-8 filename support
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from pathlib import Path
 from datetime import datetime
 import os
@@ -14,9 +14,15 @@ import logging
 try:
     from ..config import FilesystemConfig, EncodingConfig, ScanConfig
     from ..utils import UTF8Validator
+    from ..utils.cancellation import CancellationToken
+    from ..utils.catalog_discovery import iter_batches, summarize_discovered_items
+    from ..utils.resumable_walk import scandir_walk
 except ImportError:
     from config import FilesystemConfig, EncodingConfig, ScanConfig
     from utils import UTF8Validator
+    from utils.cancellation import CancellationToken
+    from utils.catalog_discovery import iter_batches, summarize_discovered_items
+    from utils.resumable_walk import scandir_walk
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +39,7 @@ class LocalFilesystemScanner:
         """
         self.root_path = Path(root_path)
         self.utf8_validator = UTF8Validator()
+        self._checkpoint_cursor = None  # Cursor after the last yielded file
         
         # Set UTF-8 encoding for filesystem operations using dynamic config
         os.environ['PYTHONIOENCODING'] = EncodingConfig.PYTHON_IO_ENCODING
@@ -60,16 +67,25 @@ class LocalFilesystemScanner:
             logger.error(f"[ERROR] Filesystem initialization failed: {str(e)}")
             return False
     
-    def discover_files(
+    # Result key of discovered items (streaming protocol, see ScannerInterface)
+    ITEM_KEY = 'files'
+    
+    def iter_files(
         self,
         max_depth: int = None,  # Uses FilesystemConfig.DEFAULT_MAX_DEPTH if None
         max_files: int = None,  # Uses FilesystemConfig.DEFAULT_MAX_FILES if None
         min_file_size: int = None,  # Uses FilesystemConfig.DEFAULT_MIN_FILE_SIZE if None
         follow_symlinks: bool = None,  # Uses FilesystemConfig.DEFAULT_FOLLOW_SYMLINKS if None
-        file_extensions: List[str] = None  # Optional filter
-    ) -> Dict[str, Any]:
+        file_extensions: List[str] = None,  # Optional filter
+        cancel_token: Optional[CancellationToken] = None,
+        resume_from: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Discover files with Vietnamese filename support
+        Stream files directory by directory with Vietnamese filename support
+        
+        The walk order is deterministic (sorted), so a scan can resume after the
+        cursor returned by get_checkpoint_cursor() without re-listing completed
+        directories.
         
         Args:
             max_depth: Maximum directory depth (uses FilesystemConfig.DEFAULT_MAX_DEPTH if None)
@@ -77,23 +93,18 @@ class LocalFilesystemScanner:
             min_file_size: Minimum file size in bytes (uses FilesystemConfig.DEFAULT_MIN_FILE_SIZE if None)
             follow_symlinks: Follow symbolic links (uses FilesystemConfig.DEFAULT_FOLLOW_SYMLINKS if None)
             file_extensions: Filter by extensions (e.g., ['.pdf', '.docx'])
+            cancel_token: Stops the walk between directories once cancelled or past its deadline
+            resume_from: Checkpoint cursor of an interrupted scan (files up to it are skipped)
             
         Returns:
-            {
-                'files': [
-                    {
-                        'path': str,  # Full path (UTF-8 Vietnamese filenames)
-                        'name': str,  # Filename
-                        'size': int,
-                        'created': datetime,
-                        'modified': datetime,
-                        'extension': str,
-                        'is_vietnamese_filename': bool
-                    }
-                ],
-                'total_size': int,
-                'total_count': int,
-                'vietnamese_filename_count': int
+            Iterator of {
+                'path': str,  # Full path (UTF-8 Vietnamese filenames)
+                'name': str,  # Filename
+                'size': int,
+                'created': datetime,
+                'modified': datetime,
+                'extension': str,
+                'is_vietnamese_filename': bool
             }
         """
         # Use dynamic config for defaults
@@ -106,52 +117,37 @@ class LocalFilesystemScanner:
         if follow_symlinks is None:
             follow_symlinks = FilesystemConfig.DEFAULT_FOLLOW_SYMLINKS
         
-        files_info = {
-            'files': [],
-            'total_size': 0,
-            'total_count': 0,
-            'vietnamese_filename_count': 0
-        }
-        
+        resume_from = resume_from or {}
+        count = resume_from.get('count', 0)
+        self._checkpoint_cursor = dict(resume_from) if resume_from else None
         try:
-            for root, dirs, files in os.walk(
+            for root, parts, entries in scandir_walk(
                 self.root_path,
-                followlinks=follow_symlinks
+                resume_from.get('path'),
+                max_depth=max_depth,
+                follow_symlinks=follow_symlinks,
+                workers=FilesystemConfig.WALK_WORKERS
             ):
-                # Stop if max files reached
-                if files_info['total_count'] >= max_files:
-                    break
+                # Stop between directories once cancelled
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    logger.warning(f"[WARNING] Filesystem walk stopped early ({cancel_token.reason})")
+                    return
                 
-                # Calculate depth
-                try:
-                    depth = len(Path(root).relative_to(self.root_path).parts)
-                except ValueError:
-                    depth = 0
-                
-                if depth > max_depth:
-                    continue
-                
-                for filename in files:
+                for entry in entries:
                     # Stop if max files reached
-                    if files_info['total_count'] >= max_files:
-                        break
+                    if count >= max_files:
+                        return
                     
-                    file_path = Path(root) / filename
+                    filename = entry.name
                     
                     # Validate UTF-8 in filename
-                    validation = self.utf8_validator.validate(filename)
-                    if not validation['is_valid']:
+                    if not self.utf8_validator.validate(filename):
                         logger.warning(f"[WARNING] Invalid UTF-8 in filename: {filename}")
                         continue
                     
-                    # Check for Vietnamese characters
-                    is_vietnamese = validation['has_vietnamese']
-                    if is_vietnamese:
-                        files_info['vietnamese_filename_count'] += 1
-                    
-                    # Get file stats
+                    # Get file stats (cached by the walk's directory listing)
                     try:
-                        stat = file_path.stat()
+                        stat = entry.stat()
                         file_size = stat.st_size
                         
                         # Filter by size
@@ -159,7 +155,7 @@ class LocalFilesystemScanner:
                             continue
                         
                         # Get extension
-                        extension = file_path.suffix.lower()
+                        extension = os.path.splitext(filename)[1].lower()
                         
                         # Filter by extension
                         if file_extensions and extension not in file_extensions:
@@ -169,35 +165,88 @@ class LocalFilesystemScanner:
                         if extension in FilesystemConfig.EXCLUDED_EXTENSIONS:
                             continue
                         
-                        files_info['files'].append({
-                            'path': str(file_path),
-                            'name': filename,
-                            'size': file_size,
-                            'created': datetime.fromtimestamp(stat.st_ctime),
-                            'modified': datetime.fromtimestamp(stat.st_mtime),
-                            'extension': extension,
-                            'is_vietnamese_filename': is_vietnamese
-                        })
-                        
-                        files_info['total_size'] += file_size
-                        files_info['total_count'] += 1
-                        
                     except (OSError, PermissionError) as e:
-                        logger.warning(f"[WARNING] Cannot access {file_path}: {str(e)}")
+                        logger.warning(f"[WARNING] Cannot access {entry.path}: {str(e)}")
                         continue
-            
-            logger.info(
-                f"[OK] Discovered {files_info['total_count']} files "
-                f"({files_info['total_size'] / (1024**2):.2f} MB), "
-                f"{files_info['vietnamese_filename_count']} with Vietnamese names"
-            )
-            
-            return files_info
+                    
+                    count += 1
+                    self._checkpoint_cursor = {
+                        'path': parts + [filename],
+                        'count': count
+                    }
+                    yield {
+                        'path': entry.path,
+                        'name': filename,
+                        'size': file_size,
+                        'created': datetime.fromtimestamp(stat.st_ctime),
+                        'modified': datetime.fromtimestamp(stat.st_mtime),
+                        'extension': extension,
+                        'is_vietnamese_filename': UTF8Validator.contains_vietnamese(filename)
+                    }
             
         except Exception as e:
             logger.error(f"[ERROR] Filesystem discovery failed: {str(e)}")
             raise
     
+    def iter_discovery_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_ITEM_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        **options
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream discovered files in lists of at most batch_size (options as for iter_files)"""
+        return iter_batches(self.iter_files(cancel_token=cancel_token, **options), batch_size)
+    
+    def get_checkpoint_cursor(self) -> Optional[Dict[str, Any]]:
+        """Cursor after the last yielded file (pass as resume_from to continue)"""
+        return self._checkpoint_cursor
+    
+    def discover_files(
+        self,
+        max_depth: int = None,  # Uses FilesystemConfig.DEFAULT_MAX_DEPTH if None
+        max_files: int = None,  # Uses FilesystemConfig.DEFAULT_MAX_FILES if None
+        min_file_size: int = None,  # Uses FilesystemConfig.DEFAULT_MIN_FILE_SIZE if None
+        follow_symlinks: bool = None,  # Uses FilesystemConfig.DEFAULT_FOLLOW_SYMLINKS if None
+        file_extensions: List[str] = None,  # Optional filter
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Discover files with Vietnamese filename support
+        
+        Materializes iter_files(); prefer iter_discovery_batches() for large trees.
+        
+        Args:
+            max_depth: Maximum directory depth (uses FilesystemConfig.DEFAULT_MAX_DEPTH if None)
+            max_files: Maximum files to discover (uses FilesystemConfig.DEFAULT_MAX_FILES if None)
+            min_file_size: Minimum file size in bytes (uses FilesystemConfig.DEFAULT_MIN_FILE_SIZE if None)
+            follow_symlinks: Follow symbolic links (uses FilesystemConfig.DEFAULT_FOLLOW_SYMLINKS if None)
+            file_extensions: Filter by extensions (e.g., ['.pdf', '.docx'])
+            cancel_token: Stops the walk between directories once cancelled or past its deadline
+            
+        Returns:
+            {
+                'files': [...],  # see iter_files()
+                'total_size': int,
+                'total_count': int,
+                'vietnamese_filename_count': int,
+                'partial': bool,  # True if stopped by cancel_token
+                'cancel_reason': Optional[str]
+            }
+        """
+        files_info = summarize_discovered_items(
+            self.ITEM_KEY,
+            self.iter_files(max_depth, max_files, min_file_size, follow_symlinks, file_extensions, cancel_token),
+            cancel_token
+        )
+        
+        logger.info(
+            f"[OK] Discovered {files_info['total_count']} files "
+            f"({files_info['total_size'] / (1024**2):.2f} MB), "
+            f"{files_info['vietnamese_filename_count']} with Vietnamese names"
+        )
+        
+        return files_info
+    
     def read_sample_content(
         self,
         file_path: str,
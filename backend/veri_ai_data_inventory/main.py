@@ -22,10 +22,12 @@ try:
     from .config.constants import APIConfig
     from .api.scan_endpoints import router as scan_router
     from .services.job_state_manager import get_job_state_manager
+    from .scanner_manager.connection_pool import get_connection_pool
 except ImportError:
     from config.constants import APIConfig
     from api.scan_endpoints import router as scan_router
     from services.job_state_manager import get_job_state_manager
+    from scanner_manager.connection_pool import get_connection_pool
 
 # Configure logging
 logging.basicConfig(
@@ -46,6 +48,7 @@ async def lifespan(app: FastAPI):
     
     Shutdown:
     - Cleanup expired jobs
+    - Close pooled scanner connections
     - Log shutdown status
     """
     # Startup
@@ -68,6 +71,9 @@ async def lifespan(app: FastAPI):
     # Cleanup expired jobs
     cleaned_count = job_manager.cleanup_expired_jobs()
     logger.info(f"[OK] Cleaned up {cleaned_count} expired jobs")
+    
+    # Stop the idle reaper and close pooled scanner connections
+    get_connection_pool().close_all()
     logger.info("[OK] Shutdown complete")
 
 
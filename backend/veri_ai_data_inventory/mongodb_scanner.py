@@ -8,12 +8,24 @@ try:
 except ImportError:
     from config.constants import DatabaseConfig, EncodingConfig, ScanConfig
 
+try:
+    from .services.column_filter_service import ColumnFilterService
+    from .models.column_filter import ColumnFilterConfig
+except ImportError:
+    from services.column_filter_service import ColumnFilterService
+    from models.column_filter import ColumnFilterConfig
+
+import logging
 from pymongo import MongoClient
-from typing import List, Any
+from pymongo.errors import PyMongoError
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
 
 class MongoDBScanner:
-    def __init__(self, host: str, user: str, password: str, database: str, port: int = DatabaseConfig.MONGODB_DEFAULT_PORT, auth_source: str = DatabaseConfig.MONGODB_DEFAULT_AUTH_SOURCE):
-        self.client = MongoClient(
+    def __init__(self, host: str, user: str, password: str, database: str, port: int = DatabaseConfig.MONGODB_DEFAULT_PORT, auth_source: str = DatabaseConfig.MONGODB_DEFAULT_AUTH_SOURCE, client: Optional[Any] = None):
+        """Connects using dynamic configuration unless an existing (e.g. pooled) client is given."""
+        self.client = client or MongoClient(
             host=host,
             port=port,
             username=user,
@@ -22,11 +34,108 @@ class MongoDBScanner:
             unicode_decode_error_handler=EncodingConfig.MONGODB_UNICODE_ERROR_HANDLER
         )
         self.db = self.client[database]
+        self.last_sampling_plan: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def open_connection(connection_config: Dict[str, Any]) -> Any:
+        """Creates a MongoClient from an API connection_config (used by the connection pool)."""
+        return MongoClient(
+            host=connection_config.get('host'),
+            port=connection_config.get('port', DatabaseConfig.MONGODB_DEFAULT_PORT),
+            username=connection_config.get('username', connection_config.get('user')),
+            password=connection_config.get('password'),
+            authSource=connection_config.get('auth_source', DatabaseConfig.MONGODB_DEFAULT_AUTH_SOURCE),
+            unicode_decode_error_handler=EncodingConfig.MONGODB_UNICODE_ERROR_HANDLER
+        )
+
+    @staticmethod
+    def check_connection(client: Any) -> bool:
+        """Health check for pooled clients: server answers a ping."""
+        try:
+            client.admin.command('ping')
+            return True
+        except PyMongoError:
+            return False
+
+    @classmethod
+    def from_connection(cls, client: Any, connection_config: Dict[str, Any]) -> 'MongoDBScanner':
+        """Creates a scanner on an existing client."""
+        return cls(
+            host=connection_config.get('host'),
+            user=connection_config.get('username', connection_config.get('user')),
+            password=connection_config.get('password'),
+            database=connection_config.get('database'),
+            client=client
+        )
+
+    def connect(self) -> bool:
+        """Client is created (or leased) in __init__ and connects lazily."""
+        return True
+
+    def choose_sampling_strategy(self, collection_name: str) -> Dict[str, Any]:
+        """
+        Chooses a sampling strategy from collection metadata using dynamic config.
+
+        Returns:
+            {'strategy': str, 'row_estimate': int}
+        """
+        row_estimate = self.db[collection_name].estimated_document_count()
+        # $sample uses a random cursor when the sample is < 5% of the collection
+        strategy = 'random' if row_estimate > 0 else 'limit'
+        return {'strategy': strategy, 'row_estimate': row_estimate}
+
+    def extract_collection_sample(
+        self,
+        collection_name: str,
+        field_names: List[str],
+        limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE,
+        filter_config: Optional[ColumnFilterConfig] = None,
+        sampling_strategy: str = ScanConfig.DEFAULT_SAMPLING_STRATEGY
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts document-aligned samples for many fields of a collection in one query.
+
+        Args:
+            collection_name: Collection to sample
+            field_names: Fields to sample (duplicates ignored)
+            limit: Documents to sample (from ScanConfig)
+            filter_config: Optional ColumnFilterService filter applied before querying
+            sampling_strategy: 'auto', 'limit' or 'random' ($sample) (from ScanConfig)
+
+        Returns:
+            Columnar sample: {field_name: [values...]}, missing fields are None.
+            The plan used is kept in self.last_sampling_plan.
+        """
+        if filter_config is not None:
+            field_names = ColumnFilterService.filter_columns(field_names, filter_config)
+        field_names = list(dict.fromkeys(field_names))
+        if not field_names:
+            return {}
+
+        plan = self.choose_sampling_strategy(collection_name)
+        if sampling_strategy != 'auto':
+            plan['strategy'] = sampling_strategy
+
+        projection = {name: 1 for name in field_names}
+        collection = self.db[collection_name]
+        if plan['strategy'] == 'limit':
+            documents = list(collection.find({}, projection).limit(limit))
+        elif plan['strategy'] == 'random':
+            documents = list(collection.aggregate([{"$sample": {"size": limit}}, {"$project": projection}]))
+        else:
+            raise ValueError(f"Unsupported MongoDB sampling strategy: {plan['strategy']}")
+
+        self.last_sampling_plan = plan
+        logger.info(
+            f"[OK] Sampled {len(documents)} documents from {collection_name} "
+            f"using '{plan['strategy']}' (estimated documents: {plan['row_estimate']})"
+        )
+
+        return {name: [doc.get(name) for doc in documents] for name in field_names}
 
     def extract_sample_data(self, collection_name: str, field_name: str, limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE) -> List[Any]:
         """Extracts sample data from a collection field using dynamic config."""
-        cursor = self.db[collection_name].find({}, {field_name: 1}).limit(limit)
-        return [doc.get(field_name) for doc in cursor]
+        return self.extract_collection_sample(collection_name, [field_name], limit)[field_name]
 
     def get_top_values(self, collection_name: str, field_name: str, top_n: int = ScanConfig.TOP_VALUES_COUNT) -> List[Any]:
         """Gets top N values from a field using dynamic config."""
@@ -8,12 +8,43 @@ try:
 except ImportError:
     from config.constants import ScanConfig, DatabaseConfig, EncodingConfig
 
+try:
+    from .services.column_filter_service import ColumnFilterService
+    from .models.column_filter import ColumnFilterConfig
+except ImportError:
+    from services.column_filter_service import ColumnFilterService
+    from models.column_filter import ColumnFilterConfig
+
+try:
+    from .utils.catalog_discovery import group_catalog_rows, iter_batches
+    from .utils.cancellation import CancellationToken
+    from .utils.vietnamese_text_analyzer import VietnameseTextAnalyzer
+except ImportError:
+    from utils.catalog_discovery import group_catalog_rows, iter_batches
+    from utils.cancellation import CancellationToken
+    from utils.vietnamese_text_analyzer import VietnameseTextAnalyzer
+
+import base64
+import json
+import logging
+import math
+import random
+from datetime import datetime
 import pymysql
-from typing import List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# MySQL integer column types usable for primary-key range sampling
+INTEGER_KEY_TYPES = ('tinyint', 'smallint', 'mediumint', 'int', 'bigint')
 
 class MySQLScanner:
-    def __init__(self, host: str, user: str, password: str, database: str, port: int = DatabaseConfig.MYSQL_DEFAULT_PORT):
-        self.connection = pymysql.connect(
+    # Result key of discovered items (streaming protocol, see ScannerInterface)
+    ITEM_KEY = 'tables'
+
+    def __init__(self, host: str, user: str, password: str, database: str, port: int = DatabaseConfig.MYSQL_DEFAULT_PORT, connection: Optional[Any] = None):
+        """Connects using dynamic configuration unless an existing (e.g. pooled) connection is given."""
+        self.connection = connection or pymysql.connect(
             host=host,
             user=user,
             password=password,
@@ -21,20 +52,450 @@ class MySQLScanner:
             port=port,
             charset=EncodingConfig.MYSQL_CHARSET
         )
+        self.database = database
+        self.last_sampling_plan: Optional[Dict[str, Any]] = None
+        self._checkpoint_cursor: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def open_connection(connection_config: Dict[str, Any]) -> Any:
+        """Opens a utf8mb4 connection from an API connection_config (used by the connection pool)."""
+        return pymysql.connect(
+            host=connection_config.get('host'),
+            user=connection_config.get('username', connection_config.get('user')),
+            password=connection_config.get('password'),
+            database=connection_config.get('database'),
+            port=connection_config.get('port', DatabaseConfig.MYSQL_DEFAULT_PORT),
+            charset=EncodingConfig.MYSQL_CHARSET
+        )
+
+    @staticmethod
+    def check_connection(connection: Any) -> bool:
+        """Health check for pooled connections: server answers a ping without reconnecting."""
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except pymysql.MySQLError:
+            return False
+
+    @staticmethod
+    def reset_connection(connection: Any) -> None:
+        """Ends the open transaction before a connection returns to the pool."""
+        connection.rollback()
+
+    @classmethod
+    def from_connection(cls, connection: Any, connection_config: Dict[str, Any]) -> 'MySQLScanner':
+        """Creates a scanner on an existing connection."""
+        return cls(
+            host=connection_config.get('host'),
+            user=connection_config.get('username', connection_config.get('user')),
+            password=connection_config.get('password'),
+            database=connection_config.get('database'),
+            connection=connection
+        )
+
+    def connect(self) -> bool:
+        """Connection is opened (or leased) in __init__; reports whether it is usable."""
+        return bool(self.connection.open)
+
+    def iter_discovered_tables(
+        self,
+        fetch_size: int = ScanConfig.DISCOVERY_FETCH_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        after_table: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streams every table of the database with its columns from one bulk catalog query.
+
+        information_schema.COLUMNS is joined with TABLES row/size estimates (COLUMN_KEY marks
+        primary keys), read through an unbuffered SSCursor and grouped into tables on the fly,
+        so no per-table metadata queries are issued and only fetch_size rows are held at a time.
+        The connection cannot run other queries until the iterator is exhausted or closed.
+
+        Args:
+            fetch_size: Catalog rows fetched per round trip (from ScanConfig)
+            cancel_token: Stops the stream between tables once cancelled or past its deadline
+            after_table: Resume after this table name (tables stream in name order)
+
+        Returns:
+            Iterator of table dicts (see utils.catalog_discovery.group_catalog_rows)
+        """
+        query = (
+            "SELECT c.TABLE_NAME, c.COLUMN_NAME, c.DATA_TYPE, c.IS_NULLABLE = 'YES', c.ORDINAL_POSITION, "
+            "t.TABLE_ROWS, t.DATA_LENGTH + t.INDEX_LENGTH, c.COLUMN_KEY = 'PRI' "
+            "FROM information_schema.COLUMNS c "
+            "JOIN information_schema.TABLES t ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME "
+            "WHERE c.TABLE_SCHEMA = DATABASE() AND c.TABLE_NAME > %s "
+            "ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION"
+        )
+        with self.connection.cursor(pymysql.cursors.SSCursor) as cursor:
+            # Every table name sorts after '', so a fresh scan matches all tables
+            cursor.execute(query, (after_table or '',))
+            for table in group_catalog_rows(self._iter_cursor_rows(cursor, fetch_size), self.database):
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    logger.info(f"[OK] Discovery of database {self.database} stopped ({cancel_token.reason})")
+                    return
+                self._checkpoint_cursor = {'table_name': table['table_name']}
+                yield table
+
+    @staticmethod
+    def _iter_cursor_rows(cursor: Any, fetch_size: int) -> Iterator[tuple]:
+        """Yields rows from an unbuffered cursor fetch_size rows at a time."""
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                return
+            yield from rows
+
+    def iter_table_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_TABLE_BATCH_SIZE,
+        fetch_size: int = ScanConfig.DISCOVERY_FETCH_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        after_table: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Streams discovered tables in lists of at most batch_size tables (from ScanConfig)."""
+        return iter_batches(self.iter_discovered_tables(fetch_size, cancel_token, after_table), batch_size)
+
+    def iter_discovery_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_TABLE_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        **options
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Streaming scanner protocol (see ScannerInterface): table batches as from iter_table_batches()."""
+        resume_from = options.get('resume_from') or {}
+        self._checkpoint_cursor = dict(resume_from) if resume_from else None
+        return self.iter_table_batches(
+            batch_size,
+            options.get('fetch_size', ScanConfig.DISCOVERY_FETCH_BATCH_SIZE),
+            cancel_token,
+            resume_from.get('table_name')
+        )
+
+    def get_checkpoint_cursor(self) -> Optional[Dict[str, Any]]:
+        """Name of the last streamed table (pass as resume_from to continue after it)."""
+        return self._checkpoint_cursor
+
+    def discover(self, **kwargs) -> Dict[str, Any]:
+        """
+        Discovers all tables and columns of the database (materialized; prefer iter_table_batches for large databases).
+
+        Args:
+            fetch_size: Catalog rows fetched per round trip (optional)
+            cancel_token: CancellationToken checked between tables (optional)
+
+        Returns:
+            {'status': 'success', 'schema': str, 'tables': [...], 'count': int,
+             'partial': bool, 'cancel_reason': Optional[str]}
+        """
+        cancel_token = kwargs.get('cancel_token')
+        tables = list(self.iter_discovered_tables(kwargs.get('fetch_size', ScanConfig.DISCOVERY_FETCH_BATCH_SIZE), cancel_token))
+        partial = cancel_token is not None and cancel_token.is_cancelled
+        logger.info(f"[OK] Discovered {len(tables)} tables in database {self.database}" + (" (partial)" if partial else ""))
+        return {
+            'status': 'success',
+            'schema': self.database,
+            'tables': tables,
+            'count': len(tables),
+            'partial': partial,
+            'cancel_reason': cancel_token.reason if partial else None
+        }
+
+    def estimate_row_count(self, table_name: str) -> int:
+        """Estimated row count from information_schema.TABLES (-1 if unknown)."""
+        query = "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s"
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, (table_name,))
+            row = cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else -1
+
+    def get_integer_primary_key(self, table_name: str) -> Optional[str]:
+        """Returns the primary key column if it is a single integer column, else None."""
+        query = (
+            "SELECT k.COLUMN_NAME, c.DATA_TYPE FROM information_schema.KEY_COLUMN_USAGE k "
+            "JOIN information_schema.COLUMNS c ON c.TABLE_SCHEMA = k.TABLE_SCHEMA "
+            "AND c.TABLE_NAME = k.TABLE_NAME AND c.COLUMN_NAME = k.COLUMN_NAME "
+            "WHERE k.TABLE_SCHEMA = DATABASE() AND k.TABLE_NAME = %s AND k.CONSTRAINT_NAME = 'PRIMARY'"
+        )
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, (table_name,))
+            rows = cursor.fetchall()
+        if len(rows) == 1 and str(rows[0][1]).lower() in INTEGER_KEY_TYPES:
+            return rows[0][0]
+        return None
+
+    def choose_sampling_strategy(self, table_name: str) -> Dict[str, Any]:
+        """
+        Chooses a sampling strategy from the catalog row estimate using dynamic config.
+
+        Returns:
+            {'strategy': str, 'row_estimate': int, 'primary_key': Optional[str]}
+        """
+        row_estimate = self.estimate_row_count(table_name)
+        primary_key = None
+
+        if row_estimate <= 0:
+            # InnoDB reports 0/NULL before statistics exist - avoid ORDER BY RAND() on unknown sizes
+            strategy = 'limit'
+        elif row_estimate <= ScanConfig.SMALL_TABLE_ROW_THRESHOLD:
+            strategy = 'random'
+        else:
+            primary_key = self.get_integer_primary_key(table_name)
+            strategy = 'pk_range' if primary_key else 'limit'
+
+        return {'strategy': strategy, 'row_estimate': row_estimate, 'primary_key': primary_key}
+
+    def extract_table_sample(
+        self,
+        table_name: str,
+        column_names: List[str],
+        limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE,
+        filter_config: Optional[ColumnFilterConfig] = None,
+        sampling_strategy: str = ScanConfig.DEFAULT_SAMPLING_STRATEGY
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts row-aligned samples for many columns of a table in one query.
+
+        Args:
+            table_name: Table to sample
+            column_names: Columns to sample (duplicates ignored)
+            limit: Rows to sample (from ScanConfig)
+            filter_config: Optional ColumnFilterService filter applied before querying
+            sampling_strategy: 'auto', 'limit', 'random' or 'pk_range' (from ScanConfig)
+
+        Returns:
+            Columnar sample: {column_name: [values...]}, values at the same index come from the same row.
+            The plan used is kept in self.last_sampling_plan.
+        """
+        if filter_config is not None:
+            column_names = ColumnFilterService.filter_columns(column_names, filter_config)
+        column_names = list(dict.fromkeys(column_names))
+        if not column_names:
+            return {}
+
+        plan = self.choose_sampling_strategy(table_name)
+        if sampling_strategy != 'auto':
+            plan['strategy'] = sampling_strategy
+            if sampling_strategy == 'pk_range' and not plan['primary_key']:
+                plan['primary_key'] = self.get_integer_primary_key(table_name)
+                if not plan['primary_key']:
+                    raise ValueError(f"Table {table_name} has no single integer primary key for pk_range sampling")
+
+        rows = self._fetch_sample_rows(table_name, column_names, limit, plan)
+        self.last_sampling_plan = plan
+        logger.info(
+            f"[OK] Sampled {len(rows)} rows from {table_name} "
+            f"using '{plan['strategy']}' (estimated rows: {plan['row_estimate']})"
+        )
+
+        columns = list(zip(*rows)) if rows else [()] * len(column_names)
+        return {name: list(values) for name, values in zip(column_names, columns)}
+
+    def _fetch_sample_rows(self, table_name: str, column_names: List[str], limit: int, plan: Dict[str, Any]) -> List[tuple]:
+        """Runs the sampling query for a plan."""
+        with self.connection.cursor() as cursor:
+            subset = self._sample_subset_query(cursor, table_name, column_names, limit, plan)
+            if subset is None:
+                return []
+            cursor.execute(*subset)
+            if plan['strategy'] != 'pk_range':
+                return list(cursor.fetchall())
+
+            # Overlapping ranges may return a row twice - keep the first, drop the key column
+            rows_by_key = {}
+            for row in cursor.fetchall():
+                rows_by_key.setdefault(row[0], row[1:])
+            return list(rows_by_key.values())[:limit]
+
+    def _sample_subset_query(
+        self,
+        cursor: Any,
+        table_name: str,
+        column_names: List[str],
+        limit: int,
+        plan: Dict[str, Any],
+        distinct: bool = False
+    ) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Builds the query selecting a plan's sample rows.
+
+        pk_range subsets select the key first (as sample_key); overlapping ranges
+        repeat rows unless distinct is set (UNION instead of UNION ALL).
+
+        Returns:
+            (query, params), or None when the table is empty
+        """
+        select = f"SELECT {', '.join(column_names)} FROM {table_name}"
+        strategy = plan['strategy']
+
+        if strategy == 'limit':
+            return f"{select} LIMIT %s", [limit]
+
+        if strategy == 'random':
+            return f"{select} ORDER BY RAND() LIMIT %s", [limit]
+
+        if strategy != 'pk_range':
+            raise ValueError(f"Unsupported MySQL sampling strategy: {strategy}")
+
+        primary_key = plan['primary_key']
+        cursor.execute(f"SELECT MIN({primary_key}), MAX({primary_key}) FROM {table_name}")
+        low, high = cursor.fetchone()
+        if low is None:
+            return None
+
+        # Index range scans from random key positions, one round trip via UNION ALL
+        segments = max(1, min(ScanConfig.PK_RANGE_SAMPLE_SEGMENTS, limit))
+        rows_per_segment = math.ceil(limit / segments)
+        starts = sorted(random.randint(low, high) for _ in range(segments))
+        keyed_select = f"SELECT {primary_key} AS sample_key, {', '.join(column_names)} FROM {table_name}"
+        query = (" UNION " if distinct else " UNION ALL ").join(
+            [f"({keyed_select} WHERE {primary_key} >= %s ORDER BY {primary_key} LIMIT %s)"] * segments
+        )
+        params: List[Any] = []
+        for start in starts:
+            params.extend([start, rows_per_segment])
+        return query, params
 
     def extract_sample_data(self, table_name: str, column_name: str, limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE):
         """Extracts sample data from a table column using dynamic config."""
-        query = f"SELECT {column_name} FROM {table_name} LIMIT %s"
-        with self.connection.cursor() as cursor:
-            cursor.execute(query, (limit,))
-            return [row[0] for row in cursor.fetchall()]
+        return self.extract_table_sample(table_name, [column_name], limit)[column_name]
+
+    def iter_column_values(
+        self,
+        table_name: str,
+        column_name: str,
+        fetch_size: int = ScanConfig.STREAM_FETCH_BATCH_SIZE
+    ) -> Iterator[Any]:
+        """Streams every value of a column through a unbuffered SSCursor, fetch_size rows per round trip."""
+        with self.connection.cursor(pymysql.cursors.SSCursor) as cursor:
+            cursor.execute(f"SELECT {column_name} FROM {table_name}")
+            for row in self._iter_cursor_rows(cursor, fetch_size):
+                yield row[0]
+
+    def extract_column_sample(self, table_name: str, column_name: str, limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE) -> Dict[str, Any]:
+        """
+        Extracts a diversity-aware sample of one column (see VietnameseTextAnalyzer.extract_sample_for_estimate).
+
+        Small tables are sampled exactly; tables above ScanConfig.SMALL_TABLE_ROW_THRESHOLD estimated
+        rows stream the column from iter_column_values() into the sketch-based sampler in bounded memory.
+
+        Returns:
+            {'samples', 'total_count', 'unique_count', 'null_count', 'diversity_score', 'sampling_strategy', ...}
+            with 'row_estimate' added
+        """
+        row_estimate = self.estimate_row_count(table_name)
+        values = self.iter_column_values(table_name, column_name)
+        try:
+            result = VietnameseTextAnalyzer().extract_sample_for_estimate(values, row_estimate, limit)
+        finally:
+            values.close()
+        result['row_estimate'] = row_estimate
+        return result
+
+    def get_top_value_statistics(self, table_name: str, column_name: str, top_n: int = ScanConfig.TOP_VALUES_COUNT) -> Dict[str, Any]:
+        """
+        Gets top N values from a column, preferring fresh singleton histograms over table scans.
+
+        Returns:
+            {
+                'top_values': [(value, count)],  # count estimated unless method is 'full_group_by'
+                'method': 'histogram' | 'sampled_group_by' | 'full_group_by',
+                'estimated': bool,
+                'row_estimate': int
+            }
+        """
+        statistics = self._top_values_from_histogram(table_name, column_name, top_n)
+        if statistics is None:
+            statistics = self._top_values_from_group_by(table_name, column_name, top_n)
+
+        logger.info(
+            f"[OK] Top values for {table_name}.{column_name} via '{statistics['method']}' "
+            f"({len(statistics['top_values'])} values)"
+        )
+        return statistics
 
     def get_top_values(self, table_name: str, column_name: str, top_n: int = ScanConfig.TOP_VALUES_COUNT):
         """Gets top N values from a column using dynamic config."""
-        query = f"SELECT {column_name}, COUNT(*) as freq FROM {table_name} GROUP BY {column_name} ORDER BY freq DESC LIMIT %s"
+        return self.get_top_value_statistics(table_name, column_name, top_n)['top_values']
+
+    def _top_values_from_histogram(self, table_name: str, column_name: str, top_n: int) -> Optional[Dict[str, Any]]:
+        """Reads a fresh singleton histogram (MySQL 8.0 ANALYZE TABLE ... UPDATE HISTOGRAM), else None."""
+        query = (
+            "SELECT HISTOGRAM FROM information_schema.COLUMN_STATISTICS "
+            "WHERE SCHEMA_NAME = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s"
+        )
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(query, (table_name, column_name))
+                row = cursor.fetchone()
+        except pymysql.MySQLError:
+            return None  # COLUMN_STATISTICS unavailable (MySQL < 8.0 / MariaDB)
+
+        if not row or not row[0]:
+            return None
+
+        histogram = json.loads(row[0]) if isinstance(row[0], (str, bytes)) else row[0]
+        # Equi-height buckets do not identify individual values
+        if histogram.get('histogram-type') != 'singleton':
+            return None
+
+        last_updated = datetime.strptime(histogram['last-updated'][:19], '%Y-%m-%d %H:%M:%S')
+        if (datetime.utcnow() - last_updated).total_seconds() > ScanConfig.STATS_MAX_AGE_HOURS * 3600:
+            return None
+
+        row_estimate = self.estimate_row_count(table_name)
+        if row_estimate <= 0:
+            return None
+
+        # Singleton buckets hold [value, cumulative_frequency]
+        frequencies = []
+        previous = 0.0
+        for value, cumulative in histogram.get('buckets', []):
+            frequencies.append((self._decode_histogram_value(value), cumulative - previous))
+            previous = cumulative
+        frequencies.sort(key=lambda item: item[1], reverse=True)
+
+        top_values = [(value, int(round(frequency * row_estimate))) for value, frequency in frequencies[:top_n]]
+        return {'top_values': top_values, 'method': 'histogram', 'estimated': True, 'row_estimate': row_estimate}
+
+    @staticmethod
+    def _decode_histogram_value(value: Any) -> Any:
+        """Decodes 'base64:typeNNN:...' string values stored in histogram JSON."""
+        if isinstance(value, str) and value.startswith('base64:'):
+            encoded = value.split(':', 2)[2]
+            return base64.b64decode(encoded).decode(EncodingConfig.PYTHON_IO_ENCODING, errors='replace')
+        return value
+
+    def _top_values_from_group_by(self, table_name: str, column_name: str, top_n: int) -> Dict[str, Any]:
+        """GROUP BY over the whole table when small, else over a bounded primary-key range subset scaled to the table."""
+        sample_rows = ScanConfig.TOP_VALUES_SAMPLE_ROWS
+        plan = self.choose_sampling_strategy(table_name)
+        row_estimate = plan['row_estimate']
+
+        if 0 < row_estimate <= sample_rows:
+            query = f"SELECT {column_name}, COUNT(*) as freq FROM {table_name} GROUP BY {column_name} ORDER BY freq DESC LIMIT %s"
+            with self.connection.cursor() as cursor:
+                cursor.execute(query, (top_n,))
+                top_values = list(cursor.fetchall())
+            return {'top_values': top_values, 'method': 'full_group_by', 'estimated': False, 'row_estimate': row_estimate}
+
+        # pk_range when the table has an integer key, otherwise a bounded LIMIT subset;
+        # counted on the server (window function: MySQL 8.0+) so only the top values cross the network
         with self.connection.cursor() as cursor:
-            cursor.execute(query, (top_n,))
-            return cursor.fetchall()
+            subset = self._sample_subset_query(cursor, table_name, [column_name], sample_rows, plan, distinct=True)
+            if subset is None:
+                return {'top_values': [], 'method': 'sampled_group_by', 'estimated': True, 'row_estimate': row_estimate}
+            subset_query, params = subset
+            query = (
+                f"SELECT {column_name}, COUNT(*) as freq, SUM(COUNT(*)) OVER () as sampled "
+                f"FROM ({subset_query}) sample_subset GROUP BY {column_name} ORDER BY freq DESC LIMIT %s"
+            )
+            cursor.execute(query, params + [top_n])
+            rows = cursor.fetchall()
+
+        scale = row_estimate / rows[0][2] if rows and row_estimate > 0 else 1.0
+        top_values = [(value, int(round(freq * scale))) for value, freq, _ in rows]
+        return {'top_values': top_values, 'method': 'sampled_group_by', 'estimated': True, 'row_estimate': row_estimate}
 
     def close(self):
         self.connection.close()
@@ -8,12 +8,87 @@ try:
 except ImportError:
     from config.constants import ScanConfig, DatabaseConfig, EncodingConfig
 
+try:
+    from .services.column_filter_service import ColumnFilterService
+    from .models.column_filter import ColumnFilterConfig
+except ImportError:
+    from services.column_filter_service import ColumnFilterService
+    from models.column_filter import ColumnFilterConfig
+
+try:
+    from .utils.catalog_discovery import group_catalog_rows, iter_batches
+    from .utils.cancellation import CancellationToken
+    from .utils.vietnamese_text_analyzer import VietnameseTextAnalyzer
+except ImportError:
+    from utils.catalog_discovery import group_catalog_rows, iter_batches
+    from utils.cancellation import CancellationToken
+    from utils.vietnamese_text_analyzer import VietnameseTextAnalyzer
+
+import logging
 import psycopg2
-from typing import List, Any
+from typing import Dict, Iterator, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bulk catalog query shared with AsyncPostgreSQLScanner; {schema} is the driver's parameter placeholder
+CATALOG_DISCOVERY_QUERY = (
+    "SELECT c.table_name, c.column_name, c.data_type, c.is_nullable = 'YES', c.ordinal_position, "
+    "cls.reltuples::bigint, cls.relpages::bigint * current_setting('block_size')::bigint, "
+    "pk.column_name IS NOT NULL "
+    "FROM information_schema.columns c "
+    "JOIN pg_namespace n ON n.nspname = c.table_schema "
+    "JOIN pg_class cls ON cls.relnamespace = n.oid AND cls.relname = c.table_name "
+    "LEFT JOIN ("
+    "SELECT kcu.table_name, kcu.column_name FROM information_schema.table_constraints tc "
+    "JOIN information_schema.key_column_usage kcu ON kcu.constraint_schema = tc.constraint_schema "
+    "AND kcu.constraint_name = tc.constraint_name "
+    "WHERE tc.table_schema = {schema} AND tc.constraint_type = 'PRIMARY KEY'"
+    ") pk ON pk.table_name = c.table_name AND pk.column_name = c.column_name "
+    "WHERE c.table_schema = {schema} AND c.table_name > {after} "
+    "ORDER BY c.table_name, c.ordinal_position"
+)
+
+# TABLESAMPLE returns sampled rows in physical order and the percentage oversamples the limit
+# (TABLESAMPLE_OVERSAMPLE_FACTOR), so the sample is shuffled before LIMIT - a bare LIMIT would keep
+# only rows from the start of the heap. Shared with AsyncPostgreSQLScanner; {percent}/{limit} are
+# the driver's parameter placeholders
+TABLESAMPLE_QUERY = (
+    "SELECT * FROM ({select} TABLESAMPLE {method} ({percent})) sample_rows "
+    "ORDER BY random() LIMIT {limit}"
+)
+
+
+def plan_sampling(row_estimate: int, limit: int) -> Dict[str, Any]:
+    """
+    Chooses a sampling strategy for a catalog row estimate using dynamic config.
+
+    Returns:
+        {'strategy': str, 'row_estimate': int, 'sample_percent': float}
+    """
+    if row_estimate <= 0:
+        # Never analyzed (or empty) - avoid full-table random sorts on unknown sizes
+        strategy = 'limit'
+    elif row_estimate <= ScanConfig.SMALL_TABLE_ROW_THRESHOLD:
+        strategy = 'random'
+    elif row_estimate <= ScanConfig.BERNOULLI_MAX_ROWS:
+        strategy = 'bernoulli'
+    else:
+        strategy = 'system'
+
+    sample_percent = 100.0
+    if row_estimate > 0:
+        sample_percent = min(100.0, limit * ScanConfig.TABLESAMPLE_OVERSAMPLE_FACTOR * 100.0 / row_estimate)
+
+    return {'strategy': strategy, 'row_estimate': row_estimate, 'sample_percent': sample_percent}
+
 
 class PostgreSQLScanner:
-    def __init__(self, host: str, user: str, password: str, database: str, port: int = DatabaseConfig.POSTGRESQL_DEFAULT_PORT):
-        self.connection = psycopg2.connect(
+    # Result key of discovered items (streaming protocol, see ScannerInterface)
+    ITEM_KEY = 'tables'
+
+    def __init__(self, host: str, user: str, password: str, database: str, port: int = DatabaseConfig.POSTGRESQL_DEFAULT_PORT, connection: Optional[Any] = None):
+        """Connects using dynamic configuration unless an existing (e.g. pooled) connection is given."""
+        self.connection = connection or psycopg2.connect(
             host=host,
             user=user,
             password=password,
@@ -22,20 +97,376 @@ class PostgreSQLScanner:
             options=EncodingConfig.POSTGRESQL_OPTIONS
         )
         self.schema = DatabaseConfig.DEFAULT_SCHEMA
+        self.last_sampling_plan: Optional[Dict[str, Any]] = None
+        self._checkpoint_cursor: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def open_connection(connection_config: Dict[str, Any]) -> Any:
+        """Opens a UTF-8 connection from an API connection_config (used by the connection pool)."""
+        return psycopg2.connect(
+            host=connection_config.get('host'),
+            user=connection_config.get('username', connection_config.get('user')),
+            password=connection_config.get('password'),
+            database=connection_config.get('database'),
+            port=connection_config.get('port', DatabaseConfig.POSTGRESQL_DEFAULT_PORT),
+            options=EncodingConfig.POSTGRESQL_OPTIONS
+        )
+
+    @staticmethod
+    def check_connection(connection: Any) -> bool:
+        """Health check for pooled connections: open and answering queries."""
+        if connection.closed:
+            return False
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    @staticmethod
+    def reset_connection(connection: Any) -> None:
+        """Ends the open transaction before a connection returns to the pool."""
+        connection.rollback()
+
+    @classmethod
+    def from_connection(cls, connection: Any, connection_config: Dict[str, Any]) -> 'PostgreSQLScanner':
+        """Creates a scanner on an existing connection using schema from connection_config."""
+        scanner = cls(
+            host=connection_config.get('host'),
+            user=connection_config.get('username', connection_config.get('user')),
+            password=connection_config.get('password'),
+            database=connection_config.get('database'),
+            connection=connection
+        )
+        scanner.schema = connection_config.get('schema', DatabaseConfig.DEFAULT_SCHEMA)
+        return scanner
+
+    def connect(self) -> bool:
+        """Connection is opened (or leased) in __init__; reports whether it is usable."""
+        return not self.connection.closed
+
+    def interrupt(self) -> None:
+        """Aborts the query running on this connection (thread-safe; used on scan cancellation)."""
+        self.connection.cancel()
+
+    def iter_discovered_tables(
+        self,
+        fetch_size: int = ScanConfig.DISCOVERY_FETCH_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        after_table: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streams every table of the schema with its columns from one bulk catalog query.
+
+        information_schema.columns is joined with pg_class row/size estimates and primary-key
+        constraints, read through a server-side (named) cursor and grouped into tables on the fly,
+        so no per-table metadata queries are issued and only fetch_size rows are held at a time.
+
+        Args:
+            fetch_size: Catalog rows fetched per round trip (from ScanConfig)
+            cancel_token: Stops the stream between tables once cancelled or past its deadline
+            after_table: Resume after this table name (tables stream in name order)
+
+        Returns:
+            Iterator of table dicts (see utils.catalog_discovery.group_catalog_rows)
+        """
+        query = CATALOG_DISCOVERY_QUERY.format(schema='%s', after='%s')
+        with self.connection.cursor(name='veri_catalog_discovery') as cursor:
+            cursor.itersize = fetch_size
+            # Every table name sorts after '', so a fresh scan matches all tables
+            cursor.execute(query, (self.schema, self.schema, after_table or ''))
+            for table in group_catalog_rows(cursor, self.schema):
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    logger.info(f"[OK] Discovery of schema {self.schema} stopped ({cancel_token.reason})")
+                    return
+                self._checkpoint_cursor = {'table_name': table['table_name']}
+                yield table
+
+    def iter_table_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_TABLE_BATCH_SIZE,
+        fetch_size: int = ScanConfig.DISCOVERY_FETCH_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        after_table: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Streams discovered tables in lists of at most batch_size tables (from ScanConfig)."""
+        return iter_batches(self.iter_discovered_tables(fetch_size, cancel_token, after_table), batch_size)
+
+    def iter_discovery_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_TABLE_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        **options
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Streaming scanner protocol (see ScannerInterface): table batches as from iter_table_batches()."""
+        resume_from = options.get('resume_from') or {}
+        self._checkpoint_cursor = dict(resume_from) if resume_from else None
+        return self.iter_table_batches(
+            batch_size,
+            options.get('fetch_size', ScanConfig.DISCOVERY_FETCH_BATCH_SIZE),
+            cancel_token,
+            resume_from.get('table_name')
+        )
+
+    def get_checkpoint_cursor(self) -> Optional[Dict[str, Any]]:
+        """Name of the last streamed table (pass as resume_from to continue after it)."""
+        return self._checkpoint_cursor
+
+    def discover(self, **kwargs) -> Dict[str, Any]:
+        """
+        Discovers all tables and columns of the schema (materialized; prefer iter_table_batches for large databases).
+
+        Args:
+            fetch_size: Catalog rows fetched per round trip (optional)
+            cancel_token: CancellationToken checked between tables (optional)
+
+        Returns:
+            {'status': 'success', 'schema': str, 'tables': [...], 'count': int,
+             'partial': bool, 'cancel_reason': Optional[str]}
+        """
+        cancel_token = kwargs.get('cancel_token')
+        tables = list(self.iter_discovered_tables(kwargs.get('fetch_size', ScanConfig.DISCOVERY_FETCH_BATCH_SIZE), cancel_token))
+        partial = cancel_token is not None and cancel_token.is_cancelled
+        logger.info(f"[OK] Discovered {len(tables)} tables in schema {self.schema}" + (" (partial)" if partial else ""))
+        return {
+            'status': 'success',
+            'schema': self.schema,
+            'tables': tables,
+            'count': len(tables),
+            'partial': partial,
+            'cancel_reason': cancel_token.reason if partial else None
+        }
+
+    def estimate_row_count(self, table_name: str) -> int:
+        """Estimated row count from pg_class catalog statistics (-1 if never analyzed)."""
+        query = (
+            "SELECT c.reltuples::bigint FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = %s AND c.relname = %s"
+        )
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, (self.schema, table_name))
+            row = cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else -1
+
+    def choose_sampling_strategy(self, table_name: str, limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE) -> Dict[str, Any]:
+        """
+        Chooses a sampling strategy from the catalog row estimate using dynamic config.
+
+        Returns:
+            {'strategy': str, 'row_estimate': int, 'sample_percent': float}
+        """
+        return plan_sampling(self.estimate_row_count(table_name), limit)
+
+    def extract_table_sample(
+        self,
+        table_name: str,
+        column_names: List[str],
+        limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE,
+        filter_config: Optional[ColumnFilterConfig] = None,
+        sampling_strategy: str = ScanConfig.DEFAULT_SAMPLING_STRATEGY
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts row-aligned samples for many columns of a table in one query.
+
+        Args:
+            table_name: Table to sample
+            column_names: Columns to sample (duplicates ignored)
+            limit: Rows to sample (from ScanConfig)
+            filter_config: Optional ColumnFilterService filter applied before querying
+            sampling_strategy: 'auto', 'limit', 'random', 'bernoulli' or 'system' (from ScanConfig)
+
+        Returns:
+            Columnar sample: {column_name: [values...]}, values at the same index come from the same row.
+            The plan used is kept in self.last_sampling_plan.
+        """
+        if filter_config is not None:
+            column_names = ColumnFilterService.filter_columns(column_names, filter_config)
+        column_names = list(dict.fromkeys(column_names))
+        if not column_names:
+            return {}
+
+        plan = self.choose_sampling_strategy(table_name, limit)
+        if sampling_strategy != 'auto':
+            plan['strategy'] = sampling_strategy
+
+        rows = self._fetch_sample_rows(table_name, column_names, limit, plan)
+        self.last_sampling_plan = plan
+        logger.info(
+            f"[OK] Sampled {len(rows)} rows from {self.schema}.{table_name} "
+            f"using '{plan['strategy']}' (estimated rows: {plan['row_estimate']})"
+        )
+
+        columns = list(zip(*rows)) if rows else [()] * len(column_names)
+        return {name: list(values) for name, values in zip(column_names, columns)}
+
+    def _fetch_sample_rows(self, table_name: str, column_names: List[str], limit: int, plan: Dict[str, Any]) -> List[tuple]:
+        """Runs the sampling query for a plan, widening TABLESAMPLE when it returns too few rows."""
+        select = f"SELECT {', '.join(column_names)} FROM {self.schema}.{table_name}"
+        strategy = plan['strategy']
+
+        with self.connection.cursor() as cursor:
+            if strategy == 'limit':
+                cursor.execute(f"{select} LIMIT %s", (limit,))
+                return cursor.fetchall()
+
+            if strategy == 'random':
+                cursor.execute(f"{select} ORDER BY random() LIMIT %s", (limit,))
+                return cursor.fetchall()
+
+            if strategy not in ('bernoulli', 'system'):
+                raise ValueError(f"Unsupported PostgreSQL sampling strategy: {strategy}")
+
+            query = TABLESAMPLE_QUERY.format(select=select, method=strategy.upper(), percent='%s', limit='%s')
+            percent = plan['sample_percent']
+            for _ in range(ScanConfig.TABLESAMPLE_MAX_RETRIES + 1):
+                cursor.execute(query, (percent, limit))
+                rows = cursor.fetchall()
+                if len(rows) >= limit or percent >= 100.0:
+                    break
+                # Stale estimate or unlucky block draw - widen the sample
+                percent = min(100.0, percent * 2)
+            plan['sample_percent'] = percent
+            return rows
 
     def extract_sample_data(self, table_name: str, column_name: str, limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE) -> List[Any]:
         """Extracts sample data from a table column using dynamic config."""
-        query = f"SELECT {column_name} FROM {self.schema}.{table_name} LIMIT %s"
-        with self.connection.cursor() as cursor:
-            cursor.execute(query, (limit,))
-            return [row[0] for row in cursor.fetchall()]
+        return self.extract_table_sample(table_name, [column_name], limit)[column_name]
+
+    def iter_column_values(
+        self,
+        table_name: str,
+        column_name: str,
+        fetch_size: int = ScanConfig.STREAM_FETCH_BATCH_SIZE
+    ) -> Iterator[Any]:
+        """Streams every value of a column through a server-side (named) cursor, fetch_size rows per round trip."""
+        with self.connection.cursor(name='veri_column_values') as cursor:
+            cursor.itersize = fetch_size
+            cursor.execute(f"SELECT {column_name} FROM {self.schema}.{table_name}")
+            for row in cursor:
+                yield row[0]
+
+    def extract_column_sample(self, table_name: str, column_name: str, limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE) -> Dict[str, Any]:
+        """
+        Extracts a diversity-aware sample of one column (see VietnameseTextAnalyzer.extract_sample_for_estimate).
+
+        Small tables are sampled exactly; tables above ScanConfig.SMALL_TABLE_ROW_THRESHOLD estimated
+        rows stream the column from iter_column_values() into the sketch-based sampler in bounded memory.
+
+        Returns:
+            {'samples', 'total_count', 'unique_count', 'null_count', 'diversity_score', 'sampling_strategy', ...}
+            with 'row_estimate' added
+        """
+        row_estimate = self.estimate_row_count(table_name)
+        values = self.iter_column_values(table_name, column_name)
+        try:
+            result = VietnameseTextAnalyzer().extract_sample_for_estimate(values, row_estimate, limit)
+        finally:
+            values.close()
+        result['row_estimate'] = row_estimate
+        return result
+
+    def get_top_value_statistics(self, table_name: str, column_name: str, top_n: int = ScanConfig.TOP_VALUES_COUNT) -> Dict[str, Any]:
+        """
+        Gets top N values from a column, preferring fresh pg_stats over table scans.
+
+        Values are returned as text by every method (pg_stats stores most_common_vals
+        as anyarray, readable only through a text cast; the GROUP BY paths cast to match).
+
+        Returns:
+            {
+                'top_values': [(value, count)],  # value is str (None for NULL); count estimated unless method is 'full_group_by'
+                'method': 'pg_stats' | 'sampled_group_by' | 'full_group_by',
+                'estimated': bool,
+                'row_estimate': int
+            }
+        """
+        statistics = self._top_values_from_pg_stats(table_name, column_name, top_n)
+        if statistics is None:
+            statistics = self._top_values_from_group_by(table_name, column_name, top_n)
+
+        logger.info(
+            f"[OK] Top values for {table_name}.{column_name} via '{statistics['method']}' "
+            f"({len(statistics['top_values'])} values)"
+        )
+        return statistics
 
     def get_top_values(self, table_name: str, column_name: str, top_n: int = ScanConfig.TOP_VALUES_COUNT) -> List[Any]:
         """Gets top N values from a column using dynamic config."""
-        query = f"SELECT {column_name}, COUNT(*) as freq FROM {self.schema}.{table_name} GROUP BY {column_name} ORDER BY freq DESC LIMIT %s"
+        return self.get_top_value_statistics(table_name, column_name, top_n)['top_values']
+
+    def _top_values_from_pg_stats(self, table_name: str, column_name: str, top_n: int) -> Optional[Dict[str, Any]]:
+        """Reads most_common_vals/freqs when ANALYZE statistics are fresh (few changes, recent), else None."""
+        query = (
+            "SELECT s.most_common_vals::text::text[], s.most_common_freqs, c.reltuples::bigint, "
+            "t.n_mod_since_analyze, t.n_live_tup, "
+            "EXTRACT(EPOCH FROM now() - GREATEST(t.last_analyze, t.last_autoanalyze)) "
+            "FROM pg_stats s "
+            "JOIN pg_namespace n ON n.nspname = s.schemaname "
+            "JOIN pg_class c ON c.relnamespace = n.oid AND c.relname = s.tablename "
+            "LEFT JOIN pg_stat_user_tables t ON t.relid = c.oid "
+            "WHERE s.schemaname = %s AND s.tablename = %s AND s.attname = %s"
+        )
         with self.connection.cursor() as cursor:
-            cursor.execute(query, (top_n,))
-            return cursor.fetchall()
+            cursor.execute(query, (self.schema, table_name, column_name))
+            row = cursor.fetchone()
+
+        if row is None:
+            return None  # Never analyzed
+
+        values, frequencies, row_estimate, modified, live_rows, analyzed_seconds_ago = row
+        if row_estimate is None or row_estimate <= 0:
+            return None
+        if modified is not None and modified > ScanConfig.STATS_MAX_MODIFIED_RATIO * max(live_rows or 0, row_estimate):
+            return None  # Too many changes since ANALYZE
+        if analyzed_seconds_ago is not None and analyzed_seconds_ago > ScanConfig.STATS_MAX_AGE_HOURS * 3600:
+            return None  # ANALYZE too long ago
+
+        # No most-common values means no value repeats often enough to matter
+        top_values = [
+            (value, int(round(frequency * row_estimate)))
+            for value, frequency in zip(values or [], frequencies or [])
+        ][:top_n]
+
+        return {'top_values': top_values, 'method': 'pg_stats', 'estimated': True, 'row_estimate': int(row_estimate)}
+
+    def _top_values_from_group_by(self, table_name: str, column_name: str, top_n: int) -> Dict[str, Any]:
+        """GROUP BY over the whole table when small, else over a bounded TABLESAMPLE subset scaled to the table."""
+        sample_rows = ScanConfig.TOP_VALUES_SAMPLE_ROWS
+        plan = self.choose_sampling_strategy(table_name, sample_rows)
+        row_estimate = plan['row_estimate']
+        source = f"{self.schema}.{table_name}"
+
+        if 0 < row_estimate <= sample_rows:
+            query = f"SELECT {column_name}::text, COUNT(*) as freq FROM {source} GROUP BY {column_name} ORDER BY freq DESC LIMIT %s"
+            with self.connection.cursor() as cursor:
+                cursor.execute(query, (top_n,))
+                top_values = cursor.fetchall()
+            return {'top_values': top_values, 'method': 'full_group_by', 'estimated': False, 'row_estimate': row_estimate}
+
+        if plan['strategy'] in ('bernoulli', 'system'):
+            subset = TABLESAMPLE_QUERY.format(
+                select=f"SELECT {column_name} FROM {source}", method=plan['strategy'].upper(), percent='%s', limit='%s'
+            )
+            params = (plan['sample_percent'], sample_rows, top_n)
+        else:
+            subset = f"SELECT {column_name} FROM {source} LIMIT %s"
+            params = (sample_rows, top_n)
+
+        query = (
+            f"SELECT {column_name}::text, COUNT(*) as freq, SUM(COUNT(*)) OVER () as sampled "
+            f"FROM ({subset}) sample_subset GROUP BY {column_name} ORDER BY freq DESC LIMIT %s"
+        )
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+
+        scale = row_estimate / rows[0][2] if rows and row_estimate > 0 else 1.0
+        top_values = [(value, int(round(freq * scale))) for value, freq, _ in rows]
+        return {'top_values': top_values, 'method': 'sampled_group_by', 'estimated': True, 'row_estimate': row_estimate}
 
     def close(self):
         self.connection.close()
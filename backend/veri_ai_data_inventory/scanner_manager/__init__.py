@@ -5,18 +5,59 @@ Unified scanner lifecycle orchestration for database, cloud, and filesystem scan
 Provides centralized management with Vietnamese UTF-8 support and dynamic configuration.
 """
 
-from .scanner_interface import ScannerInterface
+from .scanner_interface import ScannerInterface, StreamingScannerInterface
 from .scanner_registry import ScannerRegistry
 from .scanner_manager import ScannerManager
-from .error_handler import ScanErrorHandler
+from .error_handler import ScanErrorHandler, CircuitBreaker, CircuitOpenError, get_circuit_breaker
 from .progress_tracker import ScanProgressTracker
 from .result_aggregator import ResultAggregator
+from .dedup_store import DedupStore, create_dedup_store
+from .watermark_store import WatermarkStore, get_watermark_store
+from .checkpoint_store import CheckpointStore, get_checkpoint_store
+from .work_queue import WorkQueue, create_work_queue, get_work_queue
+from .scan_scheduler import ScanScheduler, get_scan_scheduler
+from .progress_stream import ProgressBus, ProgressPublisher, create_progress_bus, get_progress_publisher
+from .result_store import ResultWriter, open_result_writer, read_results
+from .content_scanner import ContentScanner, get_content_scanner
+from .content_dedup import ContentDedupIndex
+from .large_file_scanner import plan_chunks, scan_large_file
+from .connection_pool import ScannerConnectionPool, get_connection_pool, source_fingerprint
 
 __all__ = [
     'ScannerInterface',
+    'StreamingScannerInterface',
     'ScannerRegistry',
     'ScannerManager',
     'ScanErrorHandler',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'get_circuit_breaker',
     'ScanProgressTracker',
     'ResultAggregator',
+    'DedupStore',
+    'create_dedup_store',
+    'WatermarkStore',
+    'get_watermark_store',
+    'CheckpointStore',
+    'get_checkpoint_store',
+    'WorkQueue',
+    'create_work_queue',
+    'get_work_queue',
+    'ScanScheduler',
+    'get_scan_scheduler',
+    'ProgressBus',
+    'ProgressPublisher',
+    'create_progress_bus',
+    'get_progress_publisher',
+    'ResultWriter',
+    'open_result_writer',
+    'read_results',
+    'ContentScanner',
+    'get_content_scanner',
+    'ContentDedupIndex',
+    'plan_chunks',
+    'scan_large_file',
+    'ScannerConnectionPool',
+    'get_connection_pool',
+    'source_fingerprint',
 ]
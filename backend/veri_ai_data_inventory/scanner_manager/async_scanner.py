@@ -0,0 +1,188 @@
+"""
+VeriSyntra Async Database Scanning
+
+Async scanner support used natively by ScanService:
+- sample_tables_concurrently: semaphore-bounded per-table sampling fan-out
+- ThreadedAsyncScanner: async facade over the sync database scanners for drivers
+  without a native async scanner; every blocking call runs in a worker thread on
+  its own pooled connection, so the event loop keeps serving status polling
+
+Async scanners expose: connect(), iter_table_batches(), sample_table(),
+sample_tables() and close(), all awaitable (iter_table_batches is an async iterator).
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+# Flexible import pattern
+try:
+    from ..config import ScanConfig
+    from ..utils.catalog_discovery import iter_batches
+    from ..utils.cancellation import CancellationToken
+except ImportError:
+    from config.constants import ScanConfig
+    from utils.catalog_discovery import iter_batches
+    from utils.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+
+async def sample_tables_concurrently(
+    scanner: Any,
+    tables: List[Dict[str, Any]],
+    limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE,
+    concurrency: int = ScanConfig.ASYNC_SAMPLE_CONCURRENCY,
+    cancel_token: Optional[CancellationToken] = None
+) -> Dict[str, Dict[str, List[Any]]]:
+    """
+    Sample many tables with at most `concurrency` queries in flight.
+
+    A failing table is logged and returns an empty sample; it never fails the batch.
+    Once cancel_token is cancelled, tables still waiting for a slot are skipped (empty sample).
+
+    Args:
+        scanner: Async scanner providing sample_table(table, limit)
+        tables: Discovered table dicts (with filtered 'columns')
+        limit: Rows sampled per table (from ScanConfig)
+        concurrency: Maximum concurrent sampling queries (from ScanConfig)
+        cancel_token: Optional token checked before each sampling query
+
+    Returns:
+        {table_name: {column_name: [values...]}}
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def sample(table: Dict[str, Any]) -> Dict[str, List[Any]]:
+        async with semaphore:
+            if cancel_token is not None and cancel_token.is_cancelled:
+                return {}
+            try:
+                return await scanner.sample_table(table, limit)
+            except Exception as e:
+                logger.warning(f"[WARNING] Sampling failed for {table.get('full_name', table.get('table_name'))}: {str(e)}")
+                return {}
+
+    samples = await asyncio.gather(*(sample(table) for table in tables))
+    return {table['table_name']: table_sample for table, table_sample in zip(tables, samples)}
+
+
+class ThreadedAsyncScanner:
+    """
+    Async facade over a sync database scanner created by ScannerManager.
+
+    Discovery streams on one leased scanner; each sampling call leases its own
+    scanner (connection) from the pool, so concurrent samples overlap network waits.
+    Concurrency is capped to leave the discovery connection within the per-source limit.
+    """
+
+    def __init__(
+        self,
+        scanner_manager: Any,
+        scanner_type: str,
+        connection_config: Dict[str, Any],
+        concurrency: int = ScanConfig.ASYNC_SAMPLE_CONCURRENCY
+    ):
+        """
+        Initialize facade (no I/O until connect()).
+
+        Args:
+            scanner_manager: ScannerManager used to create (pooled) sync scanners
+            scanner_type: Scanner type identifier (mysql, mongodb, ...)
+            connection_config: Connection configuration
+            concurrency: Maximum concurrent sampling calls (from ScanConfig)
+        """
+        self.scanner_manager = scanner_manager
+        self.scanner_type = scanner_type
+        self.connection_config = connection_config
+
+        pool = getattr(scanner_manager, 'connection_pool', None)
+        if pool is not None:
+            concurrency = min(concurrency, max(1, pool.max_per_source - 1))
+        self.concurrency = max(1, concurrency)
+
+        self._scanner: Optional[Any] = None
+
+    def _create_scanner(self) -> Any:
+        """Create a sync scanner (blocking; call from a worker thread)"""
+        scanner = self.scanner_manager.create_scanner(self.scanner_type, self.connection_config)
+        if scanner is None:
+            raise RuntimeError(f"Failed to create scanner: {self.scanner_type}")
+        return scanner
+
+    async def connect(self) -> bool:
+        """Create the discovery scanner in a worker thread"""
+        self._scanner = await asyncio.to_thread(self._create_scanner)
+        return bool(await asyncio.to_thread(self._scanner.connect))
+
+    def interrupt(self) -> None:
+        """Abort the discovery scanner's in-flight query (if the driver supports it)"""
+        interrupt = getattr(self._scanner, 'interrupt', None)
+        if interrupt is not None:
+            interrupt()
+
+    async def iter_table_batches(
+        self,
+        batch_size: int = ScanConfig.DISCOVERY_TABLE_BATCH_SIZE,
+        cancel_token: Optional[CancellationToken] = None,
+        after_table: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream discovered tables in batches, fetching each batch in a worker thread.
+
+        Scanners without iter_table_batches() fall back to a single discover() call.
+        cancel_token is passed to the scanner, which stops between tables; after_table
+        resumes after that table name.
+        """
+        if hasattr(self._scanner, 'iter_table_batches'):
+            # Scanners without resume support keep their original signature
+            resume = {'after_table': after_table} if after_table is not None else {}
+            batches = self._scanner.iter_table_batches(batch_size, cancel_token=cancel_token, **resume)
+        else:
+            schema_info = await asyncio.to_thread(self._scanner.discover, cancel_token=cancel_token)
+            tables = schema_info.get('tables', [])
+            if after_table is not None:
+                tables = [table for table in tables if table['table_name'] > after_table]
+            batches = iter_batches(tables, batch_size)
+
+        try:
+            while True:
+                batch = await asyncio.to_thread(next, batches, None)
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            # Release the server-side cursor if the consumer stops early
+            await asyncio.to_thread(batches.close)
+
+    async def sample_table(
+        self,
+        table: Dict[str, Any],
+        limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE
+    ) -> Dict[str, List[Any]]:
+        """Sample one table's columns on a separately leased scanner"""
+        column_names = [col['column_name'] for col in table.get('columns', [])]
+        if not column_names:
+            return {}
+
+        scanner = await asyncio.to_thread(self._create_scanner)
+        try:
+            extract = getattr(scanner, 'extract_table_sample', None) or scanner.extract_collection_sample
+            return await asyncio.to_thread(extract, table['table_name'], column_names, limit)
+        finally:
+            await asyncio.to_thread(scanner.close)
+
+    async def sample_tables(
+        self,
+        tables: List[Dict[str, Any]],
+        limit: int = ScanConfig.DEFAULT_SAMPLE_SIZE,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Dict[str, List[Any]]]:
+        """Sample tables with semaphore-bounded fan-out (see sample_tables_concurrently)"""
+        return await sample_tables_concurrently(self, tables, limit, self.concurrency, cancel_token)
+
+    async def close(self) -> None:
+        """Close (or return to the pool) the discovery scanner"""
+        if self._scanner is not None:
+            await asyncio.to_thread(self._scanner.close)
+            self._scanner = None
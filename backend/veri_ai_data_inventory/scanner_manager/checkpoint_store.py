@@ -0,0 +1,193 @@
+"""
+VeriSyntra Scan Checkpoint Store
+
+Persists the cursor of long-running scans so a restarted worker resumes
+instead of starting over. A checkpoint is written after a batch has been
+published to the job state, so its cursor never points past unpublished items:
+
+- filesystems: relative path of the last emitted file (completed directories are pruned)
+- S3 / GCS:    last listed key (listing restarts after it)
+- Azure:       continuation token of the current page plus the last blob name
+- databases:   last discovered table name (catalog query restarts after it)
+
+Checkpoints are saved at most every ScanManagerConfig.CHECKPOINT_INTERVAL_SECONDS
+or CHECKPOINT_INTERVAL_ITEMS items, and deleted when the scan finishes.
+Connection credentials are never written; a resumed scan is given its
+connection_config again.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+# Flexible import pattern
+try:
+    from ..config import ScanManagerConfig, resolve_data_path
+except ImportError:
+    from config.constants import ScanManagerConfig, resolve_data_path
+
+logger = logging.getLogger(__name__)
+
+
+class ScanCheckpoint:
+    """
+    Checkpoint of one scan job.
+
+    resumed/cursor/state describe the checkpoint found when the job started;
+    update() records progress and writes it once an interval has elapsed.
+    job_info (scan request without credentials) is saved with every checkpoint.
+    """
+
+    def __init__(
+        self,
+        store: 'CheckpointStore',
+        scan_job_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        job_info: Optional[Dict[str, Any]] = None
+    ):
+        self.store = store
+        self.scan_job_id = scan_job_id
+        self.state = state or {}
+        self.resumed = state is not None
+        self.job_info = job_info or self.state.get('job', {})
+        self.cursor: Optional[Dict[str, Any]] = self.state.get('cursor')
+        self.items_emitted: int = self.state.get('items_emitted', 0)
+        self.saves = 0
+        self._saved_at = time.monotonic()
+        self._saved_items = self.items_emitted
+
+    def update(
+        self,
+        cursor: Optional[Dict[str, Any]],
+        items_emitted: int,
+        snapshot: Callable[[], Dict[str, Any]],
+        force: bool = False
+    ) -> bool:
+        """
+        Record scan progress after a published batch.
+
+        Args:
+            cursor: Scanner position after the last published item
+            items_emitted: Items published so far (including before a resume)
+            snapshot: Builds the job state to restore on resume (only called when saving)
+            force: Save regardless of the configured intervals
+
+        Returns:
+            True if the checkpoint was written
+        """
+        self.cursor = cursor
+        self.items_emitted = items_emitted
+        due = (
+            force
+            or time.monotonic() - self._saved_at >= ScanManagerConfig.CHECKPOINT_INTERVAL_SECONDS
+            or items_emitted - self._saved_items >= ScanManagerConfig.CHECKPOINT_INTERVAL_ITEMS
+        )
+        if not due or cursor is None:
+            return False
+
+        self.state = dict(snapshot(), job=self.job_info, cursor=cursor, items_emitted=items_emitted)
+        self.store.save(self.scan_job_id, self.state)
+        self.saves += 1
+        self._saved_at = time.monotonic()
+        self._saved_items = items_emitted
+        return True
+
+    def clear(self) -> None:
+        """Delete the checkpoint (scan finished or cancelled)"""
+        self.store.delete(self.scan_job_id)
+
+
+class CheckpointStore:
+    """SQLite-backed checkpoint store shared by scan jobs (thread-safe)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = resolve_data_path(path or ScanManagerConfig.CHECKPOINT_DB_PATH)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS scan_checkpoints ("
+                "scan_job_id TEXT PRIMARY KEY, state TEXT, items_emitted INTEGER, updated_at TEXT)"
+            )
+
+    def open(self, scan_job_id: UUID, job_info: Optional[Dict[str, Any]] = None) -> ScanCheckpoint:
+        """
+        Checkpoint of a scan job, resumed if one was saved by an earlier run.
+
+        Args:
+            scan_job_id: Scan job identifier
+            job_info: Scan request to save with checkpoints (must not hold credentials)
+
+        Returns:
+            ScanCheckpoint (resumed=True when a saved cursor exists)
+        """
+        state = self.load(scan_job_id)
+        if state is not None:
+            logger.info(
+                f"[OK] Resuming scan job {scan_job_id} from checkpoint "
+                f"({state.get('items_emitted', 0)} items already emitted)"
+            )
+        return ScanCheckpoint(self, str(scan_job_id), state, job_info)
+
+    def load(self, scan_job_id: UUID) -> Optional[Dict[str, Any]]:
+        """Saved state of a scan job, or None"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state FROM scan_checkpoints WHERE scan_job_id = ?",
+                (str(scan_job_id),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, scan_job_id: str, state: Dict[str, Any]) -> None:
+        """Write the state of a scan job (replaces the previous checkpoint)"""
+        payload = json.dumps(state, default=str)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO scan_checkpoints (scan_job_id, state, items_emitted, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (scan_job_id, payload, state.get('items_emitted', 0), datetime.utcnow().isoformat())
+            )
+
+    def delete(self, scan_job_id: str) -> None:
+        """Remove the checkpoint of a scan job"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM scan_checkpoints WHERE scan_job_id = ?",
+                (str(scan_job_id),)
+            )
+
+    def list_checkpoints(self) -> List[Dict[str, Any]]:
+        """Unfinished scan jobs: [{'scan_job_id', 'items_emitted', 'updated_at'}]"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT scan_job_id, items_emitted, updated_at FROM scan_checkpoints ORDER BY updated_at"
+            ).fetchall()
+        return [
+            {'scan_job_id': job_id, 'items_emitted': items, 'updated_at': updated_at}
+            for job_id, items, updated_at in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+
+# Global store instance (opened on first checkpointed scan)
+_checkpoint_store_instance: Optional[CheckpointStore] = None
+_checkpoint_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Get the shared checkpoint store (ScanManagerConfig.CHECKPOINT_DB_PATH)"""
+    global _checkpoint_store_instance
+    with _checkpoint_store_lock:
+        if _checkpoint_store_instance is None:
+            _checkpoint_store_instance = CheckpointStore()
+            logger.info(f"[OK] Checkpoint store opened: {_checkpoint_store_instance.path}")
+        return _checkpoint_store_instance
@@ -0,0 +1,406 @@
+"""
+VeriSyntra Scanner Connection Pool
+
+Reuses database connections across scan jobs that target the same source.
+Connections are keyed by a source fingerprint (scanner type + connection settings),
+limited per source, health-checked before reuse and closed after an idle timeout
+(by a background reaper thread, so sources that are not scanned again are closed too).
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+# Flexible import pattern
+try:
+    from ..config import ScanManagerConfig
+except ImportError:
+    from config.constants import ScanManagerConfig
+
+logger = logging.getLogger(__name__)
+
+# Lower bound of the reaper sweep interval (guards against a zero health-check interval)
+REAPER_MIN_INTERVAL_SECONDS = 0.01
+
+
+def source_fingerprint(scanner_type: str, connection_config: Dict[str, Any]) -> str:
+    """
+    Stable key identifying the physical source behind a connection config.
+
+    Keys listed in ScanManagerConfig.POOL_FINGERPRINT_IGNORED_KEYS (e.g. schema)
+    are excluded so scans of different schemas on one server share connections.
+    Credentials are part of the hash, so they never appear in pool statistics.
+
+    Args:
+        scanner_type: Scanner type identifier (postgresql, mysql, ...)
+        connection_config: Connection configuration dictionary
+
+    Returns:
+        Hex SHA-256 fingerprint
+    """
+    settings = {
+        key: value for key, value in connection_config.items()
+        if key not in ScanManagerConfig.POOL_FINGERPRINT_IGNORED_KEYS
+    }
+    payload = json.dumps([scanner_type, settings], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class PooledConnection:
+    """
+    Proxy for a leased connection.
+
+    Attribute access is delegated to the driver connection, so scanners use it
+    unchanged; close() returns the connection to the pool instead of closing it.
+    """
+
+    def __init__(self, pool: 'ScannerConnectionPool', key: str, connection: Any):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._released = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def __getitem__(self, name: str) -> Any:
+        return self._connection[name]
+
+    @property
+    def raw_connection(self) -> Any:
+        """Underlying driver connection"""
+        return self._connection
+
+    def close(self) -> None:
+        """Return the connection to the pool (idempotent)"""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._key, self._connection)
+
+    def invalidate(self) -> None:
+        """Close the underlying connection instead of returning it to the pool"""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._key, self._connection, discard=True)
+
+
+class _SourcePool:
+    """Idle connections, lease count and counters for one source fingerprint"""
+
+    def __init__(self, scanner_type: str):
+        self.scanner_type = scanner_type
+        self.idle: Deque[Tuple[Any, float]] = deque()
+        self.in_use = 0
+        self.reset: Optional[Callable[[Any], None]] = None
+        self.stats = {
+            'created': 0,
+            'reused': 0,
+            'health_check_failures': 0,
+            'closed_idle': 0,
+            'discarded': 0,
+            'waits': 0
+        }
+
+
+class ScannerConnectionPool:
+    """
+    Thread-safe connection pool keyed by source fingerprint.
+
+    Each source holds at most max_per_source connections (idle + leased).
+    Idle connections are reused most-recently-used first, health-checked when they
+    have been idle longer than health_check_interval, and closed after idle_timeout.
+    A daemon reaper thread, started when the first connection goes idle, sweeps
+    every source each health_check_interval until close_all().
+    """
+
+    def __init__(
+        self,
+        max_per_source: int = ScanManagerConfig.POOL_MAX_CONNECTIONS_PER_SOURCE,
+        idle_timeout: float = ScanManagerConfig.POOL_IDLE_TIMEOUT_SECONDS,
+        health_check_interval: float = ScanManagerConfig.POOL_HEALTH_CHECK_INTERVAL_SECONDS,
+        acquire_timeout: float = ScanManagerConfig.POOL_ACQUIRE_TIMEOUT_SECONDS
+    ):
+        """
+        Initialize pool with dynamic configuration.
+
+        Args:
+            max_per_source: Maximum connections per source (default from ScanManagerConfig)
+            idle_timeout: Seconds before idle connections are closed
+            health_check_interval: Idle seconds after which a connection is checked before reuse
+            acquire_timeout: Seconds to wait for a free connection at the limit
+        """
+        if max_per_source <= 0:
+            raise ValueError("max_per_source must be positive")
+
+        self.max_per_source = max_per_source
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._sources: Dict[str, _SourcePool] = {}
+        self._condition = threading.Condition()
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
+
+    def acquire(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        health_check: Optional[Callable[[Any], bool]] = None,
+        reset: Optional[Callable[[Any], None]] = None,
+        scanner_type: str = '',
+        timeout: Optional[float] = None
+    ) -> PooledConnection:
+        """
+        Lease a connection for a source, reusing an idle one when possible.
+
+        Args:
+            key: Source fingerprint (see source_fingerprint)
+            factory: Opens a new driver connection
+            health_check: Returns False if an idle connection is no longer usable
+            reset: Cleans session state when the connection is returned (e.g. rollback)
+            scanner_type: Reported in statistics
+            timeout: Seconds to wait at the connection limit (default acquire_timeout)
+
+        Returns:
+            PooledConnection proxy; close() it to return the connection
+
+        Raises:
+            TimeoutError: If no connection became available in time
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            connection, last_used = self._reserve(key, scanner_type, reset, deadline)
+
+            if connection is None:
+                # Reserved a slot for a new connection
+                try:
+                    connection = factory()
+                except Exception:
+                    self._release_slot(key)
+                    raise
+                with self._condition:
+                    self._sources[key].stats['created'] += 1
+                logger.info(f"[OK] Opened pooled {scanner_type or 'scanner'} connection")
+                return PooledConnection(self, key, connection)
+
+            if (
+                health_check is not None
+                and time.monotonic() - last_used > self.health_check_interval
+                and not health_check(connection)
+            ):
+                logger.warning(f"[WARNING] Pooled {scanner_type or 'scanner'} connection failed health check")
+                with self._condition:
+                    self._sources[key].stats['health_check_failures'] += 1
+                self._close_quietly(connection)
+                self._release_slot(key)
+                continue
+
+            with self._condition:
+                self._sources[key].stats['reused'] += 1
+            return PooledConnection(self, key, connection)
+
+    def _reserve(
+        self,
+        key: str,
+        scanner_type: str,
+        reset: Optional[Callable[[Any], None]],
+        deadline: float
+    ) -> Tuple[Optional[Any], float]:
+        """Take an idle connection or a slot for a new one, waiting at the limit"""
+        expired = []
+        try:
+            with self._condition:
+                source = self._sources.get(key)
+                if source is None:
+                    source = self._sources[key] = _SourcePool(scanner_type)
+                if reset is not None:
+                    source.reset = reset
+
+                waited = False
+                while True:
+                    expired.extend(self._pop_expired(source))
+
+                    if source.idle:
+                        connection, last_used = source.idle.pop()
+                        source.in_use += 1
+                        return connection, last_used
+
+                    if source.in_use < self.max_per_source:
+                        source.in_use += 1
+                        return None, 0.0
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No pooled connection available within {self.acquire_timeout}s "
+                            f"(limit {self.max_per_source} per source)"
+                        )
+                    if not waited:
+                        source.stats['waits'] += 1
+                        waited = True
+                    self._condition.wait(remaining)
+        finally:
+            for connection in expired:
+                self._close_quietly(connection)
+
+    def _release_slot(self, key: str) -> None:
+        """Give back a reserved slot without returning a connection"""
+        with self._condition:
+            self._sources[key].in_use -= 1
+            self._condition.notify_all()
+
+    def release(self, key: str, connection: Any, discard: bool = False) -> None:
+        """
+        Return a leased connection to its source pool.
+
+        Args:
+            key: Source fingerprint the connection was acquired with
+            connection: Driver connection
+            discard: Close the connection instead of keeping it idle
+        """
+        with self._condition:
+            source = self._sources[key]
+            reset = source.reset
+
+        if not discard and reset is not None:
+            try:
+                reset(connection)
+            except Exception as e:
+                logger.warning(f"[WARNING] Discarding pooled connection after failed reset: {str(e)}")
+                discard = True
+
+        if discard:
+            self._close_quietly(connection)
+
+        with self._condition:
+            source.in_use -= 1
+            if discard:
+                source.stats['discarded'] += 1
+            else:
+                source.idle.append((connection, time.monotonic()))
+                self._start_reaper()
+            self._condition.notify_all()
+
+    def _pop_expired(self, source: _SourcePool) -> list:
+        """Remove idle connections past idle_timeout (oldest are at the left); caller holds the lock"""
+        expired = []
+        cutoff = time.monotonic() - self.idle_timeout
+        while source.idle and source.idle[0][1] < cutoff:
+            expired.append(source.idle.popleft()[0])
+            source.stats['closed_idle'] += 1
+        return expired
+
+    def reap_idle(self) -> int:
+        """
+        Close idle connections past idle_timeout across all sources.
+
+        Returns:
+            Number of connections closed
+        """
+        with self._condition:
+            expired = []
+            for source in self._sources.values():
+                expired.extend(self._pop_expired(source))
+
+        for connection in expired:
+            self._close_quietly(connection)
+        return len(expired)
+
+    def _start_reaper(self) -> None:
+        """Start the idle reaper thread if it is not running; caller holds the lock"""
+        if self._reaper is not None:
+            return
+        self._reaper_stop = threading.Event()
+        self._reaper = threading.Thread(
+            target=self._reap_loop,
+            args=(self._reaper_stop,),
+            name='scanner-pool-reaper',
+            daemon=True
+        )
+        self._reaper.start()
+
+    def _reap_loop(self, stop: threading.Event) -> None:
+        """Close expired idle connections of every source each health_check_interval until stopped"""
+        interval = max(self.health_check_interval, REAPER_MIN_INTERVAL_SECONDS)
+        while not stop.wait(interval):
+            try:
+                closed = self.reap_idle()
+            except Exception as e:
+                logger.error(f"[ERROR] Connection pool reaper failed: {str(e)}")
+                continue
+            if closed:
+                logger.info(f"[OK] Connection pool reaper closed {closed} idle connections")
+
+    def close_all(self) -> None:
+        """Stop the reaper and close every idle connection; leased connections are closed when released"""
+        with self._condition:
+            reaper, self._reaper = self._reaper, None
+            self._reaper_stop.set()
+            idle = []
+            for source in self._sources.values():
+                idle.extend(connection for connection, _ in source.idle)
+                source.idle.clear()
+
+        if reaper is not None:
+            reaper.join()
+        for connection in idle:
+            self._close_quietly(connection)
+        logger.info(f"[OK] Connection pool closed {len(idle)} idle connections")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Pool statistics per source fingerprint.
+
+        Returns:
+            {'sources': {fingerprint_prefix: {...}}, 'total_idle', 'total_in_use', limits}
+        """
+        with self._condition:
+            sources = {
+                key[:16]: {
+                    'scanner_type': source.scanner_type,
+                    'idle': len(source.idle),
+                    'in_use': source.in_use,
+                    **source.stats
+                }
+                for key, source in self._sources.items()
+            }
+
+        return {
+            'sources': sources,
+            'total_idle': sum(source['idle'] for source in sources.values()),
+            'total_in_use': sum(source['in_use'] for source in sources.values()),
+            'max_connections_per_source': self.max_per_source,
+            'idle_timeout_seconds': self.idle_timeout,
+            'health_check_interval_seconds': self.health_check_interval
+        }
+
+    @staticmethod
+    def _close_quietly(connection: Any) -> None:
+        """Close a driver connection, ignoring errors from dead connections"""
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"[WARNING] Error closing pooled connection: {str(e)}")
+
+
+# Global pool instance shared by ScannerManager and ScanService
+_connection_pool_instance: Optional[ScannerConnectionPool] = None
+_connection_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> ScannerConnectionPool:
+    """Get or create global ScannerConnectionPool instance"""
+    global _connection_pool_instance
+
+    with _connection_pool_lock:
+        if _connection_pool_instance is None:
+            _connection_pool_instance = ScannerConnectionPool()
+
+    return _connection_pool_instance
@@ -0,0 +1,292 @@
+"""
+VeriSyntra Content Deduplication
+
+The same export is often copied into dozens of folders and buckets. The
+content dedup index of a scan job recognises copies with a staged
+fingerprint, so each unique content is content-scanned once and its findings
+attached to every path, and duplicate clusters are reported (PDPL data
+minimisation):
+
+1. size: a file with a size not seen before is unique (no read at all)
+2. first and last ContentDedupConfig.BLOCK_BYTES (blake2b) for files of equal size
+3. full content hash (xxh3-128, BLAKE3 or blake2b, see HASH_ALGORITHM) only
+   when size, first and last blocks all collide
+
+Stages 2 and 3 are computed lazily, for the earlier file too, when the first
+collision occurs. Cloud objects are compared by size and the provider's
+content checksum (S3 ETag, GCS/Azure MD5) instead of reading their content.
+
+Memory grows with the number of unique contents of the job (one entry each).
+"""
+
+import hashlib
+import heapq
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Flexible import pattern
+try:
+    from ..config import ContentDedupConfig
+except ImportError:
+    from config.constants import ContentDedupConfig
+
+logger = logging.getLogger(__name__)
+
+# Index kinds (files are read, objects compared by provider checksum)
+KIND_FILE = 'file'
+KIND_OBJECT = 'object'
+
+
+def get_full_hasher(algorithm: Optional[str] = None) -> Tuple[str, Callable[[], Any]]:
+    """
+    Resolve the full-content hash algorithm.
+
+    Args:
+        algorithm: 'auto', 'xxhash', 'blake3' or 'blake2b' (default: ContentDedupConfig.HASH_ALGORITHM)
+
+    Returns:
+        (algorithm name, hasher factory)
+
+    Raises:
+        ValueError: If the algorithm is unknown
+        RuntimeError: If an explicitly requested algorithm's package is not installed
+    """
+    algorithm = algorithm or ContentDedupConfig.HASH_ALGORITHM
+    if algorithm not in ContentDedupConfig.HASH_ALGORITHMS:
+        raise ValueError(f"Unknown hash algorithm: {algorithm}. Supported: {ContentDedupConfig.HASH_ALGORITHMS}")
+
+    if algorithm in ('auto', 'xxhash'):
+        try:
+            import xxhash
+            return 'xxh3_128', xxhash.xxh3_128
+        except ImportError:
+            if algorithm == 'xxhash':
+                raise RuntimeError("xxhash package not installed. Install: pip install xxhash")
+    if algorithm in ('auto', 'blake3'):
+        try:
+            from blake3 import blake3
+            return 'blake3', blake3
+        except ImportError:
+            if algorithm == 'blake3':
+                raise RuntimeError("blake3 package not installed. Install: pip install blake3")
+    return 'blake2b', lambda: hashlib.blake2b(digest_size=32)
+
+
+class ContentBlob:
+    """One unique content and the paths holding it"""
+
+    __slots__ = ('blob_id', 'size', 'path', 'head_tail', 'full_hash', 'checksum', 'copies', 'paths', 'findings')
+
+    def __init__(self, blob_id: int, size: int, path: str):
+        self.blob_id = blob_id
+        self.size = size
+        self.path = path  # First path seen (the one content-scanned)
+        self.head_tail: Optional[str] = None  # None: not computed yet, '': unreadable
+        self.full_hash: Optional[str] = None
+        self.checksum: Optional[str] = None  # Provider checksum (cloud objects)
+        self.copies = 1
+        self.paths: List[str] = [path]  # Capped at ContentDedupConfig.REPORT_PATHS
+        # Content scan result shared by every copy (set by the content scanner)
+        self.findings: Optional[Dict[str, Any]] = None
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Strongest fingerprint computed for the content"""
+        return self.full_hash or self.checksum
+
+
+class ContentDedupIndex:
+    """Staged content fingerprints of one scan job"""
+
+    def __init__(self, block_bytes: Optional[int] = None, algorithm: Optional[str] = None):
+        """
+        Initialize index
+
+        Args:
+            block_bytes: First/last block size (default: ContentDedupConfig.BLOCK_BYTES)
+            algorithm: Full-content hash algorithm (default: ContentDedupConfig.HASH_ALGORITHM)
+        """
+        self.block_bytes = block_bytes or ContentDedupConfig.BLOCK_BYTES
+        self.algorithm, self._new_hasher = get_full_hasher(algorithm)
+        # (kind, size) -> {stage key: [blobs]}; files: head/tail hash (None = not hashed yet),
+        # objects: provider checksum
+        self._sizes: Dict[Tuple[str, int], Dict[Optional[str], List[ContentBlob]]] = {}
+        self._clusters: Dict[int, ContentBlob] = {}
+        self._next_id = 0
+        self.indexed = 0
+        self.unique = 0
+        self.head_tail_hashes = 0
+        self.full_hashes = 0
+        self.bytes_hashed = 0
+
+    def add(
+        self,
+        path: str,
+        size: int,
+        kind: str = KIND_FILE,
+        checksum: Optional[str] = None
+    ) -> Tuple[Optional[ContentBlob], bool]:
+        """
+        Record one file or object.
+
+        Args:
+            path: File path or object name
+            size: Size in bytes
+            kind: KIND_FILE (content read on collision) or KIND_OBJECT (compared by checksum)
+            checksum: Provider content checksum (objects)
+
+        Returns:
+            (blob, True if the content was seen before); (None, False) if not fingerprinted
+        """
+        if size < ContentDedupConfig.MIN_BYTES or (kind == KIND_OBJECT and not checksum):
+            return None, False
+        self.indexed += 1
+        stages = self._sizes.get((kind, size))
+        if stages is None:
+            # Stage 1: unique size, nothing to read
+            blob = self._new_blob(size, path)
+            blob.checksum = checksum
+            self._sizes[(kind, size)] = {checksum if kind == KIND_OBJECT else None: [blob]}
+            return blob, False
+
+        if kind == KIND_OBJECT:
+            candidates = stages.setdefault(checksum, [])
+            if candidates:
+                return self._add_copy(candidates[0], path), True
+            blob = self._new_blob(size, path)
+            blob.checksum = checksum
+            candidates.append(blob)
+            return blob, False
+
+        # Stage 2: hash first and last blocks, for the earlier unhashed file too
+        for blob in stages.pop(None, []):
+            blob.head_tail = self._head_tail_hash(blob.path, size)
+            stages.setdefault(blob.head_tail, []).append(blob)
+        head_tail = self._head_tail_hash(path, size)
+
+        # Stage 3: full hash only when size and first/last blocks collide
+        full_hash = None
+        if head_tail:
+            for blob in stages.get(head_tail, []):
+                if blob.full_hash is None:
+                    blob.full_hash = self._full_hash(blob.path) or ''
+                full_hash = full_hash or self._full_hash(path)
+                if full_hash and blob.full_hash == full_hash:
+                    return self._add_copy(blob, path), True
+
+        blob = self._new_blob(size, path)
+        blob.head_tail = head_tail
+        blob.full_hash = full_hash
+        stages.setdefault(head_tail, []).append(blob)
+        return blob, False
+
+    def add_assets(self, assets: List[Dict[str, Any]]) -> List[Optional[ContentBlob]]:
+        """
+        Record discovered assets (blocking: may read files).
+
+        Copies get 'duplicate_of' (the first path seen with the same content).
+
+        Args:
+            assets: File and object assets
+
+        Returns:
+            Blob per asset (None for assets not fingerprinted)
+        """
+        blobs: List[Optional[ContentBlob]] = []
+        for asset in assets:
+            asset.pop('duplicate_of', None)
+            path = asset.get('asset_path')
+            if not path or asset.get('asset_type') not in (KIND_FILE, KIND_OBJECT):
+                blobs.append(None)
+                continue
+            blob, duplicate = self.add(
+                path, asset.get('size_bytes') or 0, asset['asset_type'], asset.get('content_checksum')
+            )
+            if duplicate:
+                asset['duplicate_of'] = blob.path
+            blobs.append(blob)
+        return blobs
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Duplicate clusters and fingerprinting cost.
+
+        Returns:
+            {'algorithm', 'indexed', 'unique', 'clusters', 'duplicate_files',
+            'duplicate_bytes', 'head_tail_hashes', 'full_hashes', 'bytes_hashed',
+            'top_clusters': [{'fingerprint', 'size_bytes', 'copies', 'wasted_bytes', 'paths'}]}
+        """
+        clusters = list(self._clusters.values())
+        top = heapq.nlargest(
+            ContentDedupConfig.REPORT_CLUSTERS, clusters, key=lambda blob: (blob.size * (blob.copies - 1), -blob.blob_id)
+        )
+        return {
+            'algorithm': self.algorithm,
+            'indexed': self.indexed,
+            'unique': self.unique,
+            'clusters': len(clusters),
+            'duplicate_files': sum(blob.copies - 1 for blob in clusters),
+            'duplicate_bytes': sum(blob.size * (blob.copies - 1) for blob in clusters),
+            'head_tail_hashes': self.head_tail_hashes,
+            'full_hashes': self.full_hashes,
+            'bytes_hashed': self.bytes_hashed,
+            'top_clusters': [
+                {
+                    'fingerprint': blob.fingerprint,
+                    'size_bytes': blob.size,
+                    'copies': blob.copies,
+                    'wasted_bytes': blob.size * (blob.copies - 1),
+                    'paths': list(blob.paths)
+                }
+                for blob in top
+            ]
+        }
+
+    def _new_blob(self, size: int, path: str) -> ContentBlob:
+        self._next_id += 1
+        self.unique += 1
+        return ContentBlob(self._next_id, size, path)
+
+    def _add_copy(self, blob: ContentBlob, path: str) -> ContentBlob:
+        blob.copies += 1
+        if len(blob.paths) < ContentDedupConfig.REPORT_PATHS:
+            blob.paths.append(path)
+        self._clusters[blob.blob_id] = blob
+        return blob
+
+    def _head_tail_hash(self, path: str, size: int) -> str:
+        """Hash of the first and last blocks ('' if unreadable: never matches)"""
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(self.block_bytes)
+                digest.update(head)
+                read = len(head)
+                if size > self.block_bytes:
+                    f.seek(max(self.block_bytes, size - self.block_bytes))
+                    tail = f.read(self.block_bytes)
+                    digest.update(tail)
+                    read += len(tail)
+        except OSError as e:
+            logger.warning(f"[WARNING] Cannot fingerprint {path}: {str(e)}")
+            return ''
+        self.head_tail_hashes += 1
+        self.bytes_hashed += read
+        return digest.hexdigest()
+
+    def _full_hash(self, path: str) -> Optional[str]:
+        """Full content hash (None if unreadable)"""
+        digest = self._new_hasher()
+        try:
+            with open(path, 'rb') as f:
+                while True:
+                    block = f.read(ContentDedupConfig.READ_BYTES)
+                    if not block:
+                        break
+                    digest.update(block)
+                    self.bytes_hashed += len(block)
+        except OSError as e:
+            logger.warning(f"[WARNING] Cannot fingerprint {path}: {str(e)}")
+            return None
+        self.full_hashes += 1
+        return f"{self.algorithm}:{digest.hexdigest()}"
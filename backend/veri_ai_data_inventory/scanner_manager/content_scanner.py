@@ -0,0 +1,366 @@
+"""
+VeriSyntra Content Scanner
+
+Finds PII inside discovered files instead of judging them by name and size:
+the text of each supported file (ContentScanConfig.SUPPORTED_EXTENSIONS) is
+extracted piece by piece and run through the compiled Vietnamese PII patterns
+(ReportingConfig.REDACTION_PATTERNS, carried across piece boundaries by the
+streaming redactor in preview mode).
+
+Files are scanned in a shared worker process pool with per-file budgets:
+ContentScanConfig.MAX_BYTES_PER_FILE of content and MAX_SECONDS_PER_FILE,
+checked between extracted pieces. Each file gets PII category counts; batch
+statistics report throughput (MB/s, files/s) for sizing scan nodes.
+
+Plain text files larger than the byte budget (multi-GB logs and exports) are
+scanned in full by the large file scanner instead: memory-mapped, split into
+line-aligned chunks that the same worker pool scans in parallel.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+# Flexible import pattern
+try:
+    from ..config import ContentScanConfig
+    from ..utils.text_extraction import ExtractorUnavailableError, iter_file_text
+    from ..utils.utf8_validator import UTF8Validator
+except ImportError:
+    from config.constants import ContentScanConfig
+    from utils.text_extraction import ExtractorUnavailableError, iter_file_text
+    from utils.utf8_validator import UTF8Validator
+
+from .content_dedup import ContentBlob
+from .large_file_scanner import scan_large_file
+
+logger = logging.getLogger(__name__)
+
+# Per-file outcomes
+STATUS_SCANNED = 'scanned'
+STATUS_TRUNCATED = 'truncated'  # Byte budget reached; counts cover the scanned part
+STATUS_TIMEOUT = 'timeout'  # Time budget reached; counts cover the scanned part
+STATUS_UNSUPPORTED = 'unsupported'  # Format library not installed
+STATUS_ERROR = 'error'  # Unreadable or corrupt file
+
+# Worker results arriving this long after a file's time budget are abandoned
+RESULT_GRACE_SECONDS = 5.0
+
+
+def scan_file_content(
+    path: str,
+    pii_types: Optional[Tuple[str, ...]] = None,
+    max_bytes: Optional[int] = None,
+    max_seconds: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Count PII matches in one file (runs inside a worker process).
+
+    Args:
+        path: File path
+        pii_types: PII types to detect (None: all configured types)
+        max_bytes: Content budget (default: ContentScanConfig.MAX_BYTES_PER_FILE)
+        max_seconds: Time budget (default: ContentScanConfig.MAX_SECONDS_PER_FILE)
+
+    Returns:
+        {'status', 'pii_counts', 'has_vietnamese_data', 'bytes_read', 'seconds', 'error'}
+    """
+    # Imported here: the services package imports the scan service, which imports this module
+    try:
+        from ..services.redaction_service import StreamingRedactor, get_redaction_engine
+    except ImportError:
+        from services.redaction_service import StreamingRedactor, get_redaction_engine
+
+    max_bytes = max_bytes or ContentScanConfig.MAX_BYTES_PER_FILE
+    deadline = time.monotonic() + (max_seconds or ContentScanConfig.MAX_SECONDS_PER_FILE)
+    started = time.perf_counter()
+    stats: Dict[str, Any] = {'bytes_read': 0, 'truncated': False}
+    redactor = StreamingRedactor(get_redaction_engine(list(pii_types) if pii_types else None), 'preview')
+    has_vietnamese = False
+    status, error = STATUS_SCANNED, None
+
+    pieces = iter_file_text(path, max_bytes, stats)
+    try:
+        for text in pieces:
+            redactor.feed(text)
+            has_vietnamese = has_vietnamese or UTF8Validator.contains_vietnamese(text)
+            if time.monotonic() > deadline:
+                status = STATUS_TIMEOUT
+                break
+        redactor.flush()
+        if status == STATUS_SCANNED and stats['truncated']:
+            status = STATUS_TRUNCATED
+    except ExtractorUnavailableError as e:
+        status, error = STATUS_UNSUPPORTED, str(e)
+    except Exception as e:
+        # Corrupt documents and unreadable files; counts found so far are kept
+        redactor.flush()
+        status, error = STATUS_ERROR, f"{type(e).__name__}: {str(e)}"
+    finally:
+        pieces.close()
+
+    return {
+        'status': status,
+        'pii_counts': dict(redactor.counts),
+        'has_vietnamese_data': has_vietnamese,
+        'bytes_read': stats['bytes_read'],
+        'seconds': round(time.perf_counter() - started, 4),
+        'error': error
+    }
+
+
+def _scan_file_slice(paths: List[str], pii_types: Optional[Tuple[str, ...]]) -> List[Dict[str, Any]]:
+    """Scan several files in one worker task"""
+    return [scan_file_content(path, pii_types) for path in paths]
+
+
+def merge_content_statistics(
+    total: Optional[Dict[str, Any]],
+    stats: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Add the statistics of one content scan batch to running totals.
+
+    Args:
+        total: Totals so far (None: first batch)
+        stats: Batch statistics from ContentScanner.scan_files()
+
+    Returns:
+        Totals with throughput recomputed over the summed scan time
+    """
+    if not stats:
+        return total
+    total = dict(total or {})
+    for key in ('files_scanned', 'bytes_scanned', 'files_with_pii', 'files_deduplicated', 'seconds'):
+        total[key] = round(total.get(key, 0) + stats.get(key, 0), 4)
+    for key in ('statuses', 'pii_counts'):
+        total[key] = dict(Counter(total.get(key, {})) + Counter(stats.get(key, {})))
+    seconds = total['seconds']
+    total['mb_per_second'] = round(total['bytes_scanned'] / (1024 ** 2) / seconds, 2) if seconds else None
+    total['files_per_second'] = round(total['files_scanned'] / seconds, 1) if seconds else None
+    return total
+
+
+class ContentScanner:
+    """Scans file content for PII across the shared worker process pool"""
+
+    def __init__(self, max_workers: Optional[int] = None, pii_types: Optional[List[str]] = None):
+        """
+        Initialize content scanner
+
+        Args:
+            max_workers: Worker processes (default: ContentScanConfig.MAX_WORKERS, 0 = one per CPU core)
+            pii_types: PII types to detect (default: ContentScanConfig.PII_TYPES, empty = all)
+        """
+        workers = max_workers if max_workers is not None else ContentScanConfig.MAX_WORKERS
+        self.max_workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        pii_types = pii_types if pii_types is not None else ContentScanConfig.PII_TYPES
+        self.pii_types: Optional[Tuple[str, ...]] = tuple(pii_types) if pii_types else None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Totals of every batch scanned by this scanner (GET /health)
+        self.statistics: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def is_supported(path: str) -> bool:
+        """Whether the file's type has a text extractor"""
+        return os.path.splitext(path)[1].lower() in ContentScanConfig.SUPPORTED_EXTENSIONS
+
+    @staticmethod
+    def is_large_file(path: str) -> bool:
+        """Whether the file is scanned in full by the large file scanner"""
+        if not ContentScanConfig.LARGE_FILE_ENABLED:
+            return False
+        if os.path.splitext(path)[1].lower() not in ContentScanConfig.LARGE_FILE_EXTENSIONS:
+            return False
+        try:
+            return os.path.getsize(path) > ContentScanConfig.MAX_BYTES_PER_FILE
+        except OSError:
+            return False
+
+    def scan_files(self, paths: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Scan files (blocking).
+
+        Batches of at least ContentScanConfig.PARALLEL_THRESHOLD files are
+        spread over the worker processes, one file per task; smaller batches
+        (or a broken pool) are scanned in-process. Large text files are then
+        scanned one at a time, their chunks spread over the worker processes.
+
+        Args:
+            paths: Files to scan (unsupported types are skipped)
+
+        Returns:
+            ({path: scan_file_content() or scan_large_file() result}, batch statistics: files_scanned,
+            bytes_scanned, files_with_pii, seconds, statuses, pii_counts,
+            mb_per_second, files_per_second)
+        """
+        paths = [path for path in paths if self.is_supported(path)]
+        large_paths = {path for path in paths if self.is_large_file(path)}
+        paths = [path for path in paths if path not in large_paths]
+        started = time.perf_counter()
+        results: Optional[Dict[str, Dict[str, Any]]] = None
+
+        if len(paths) >= ContentScanConfig.PARALLEL_THRESHOLD and self.max_workers > 1:
+            try:
+                results = self._scan_in_pool(paths)
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"[WARNING] Content scan pool unavailable, scanning in-process: {str(e)}")
+                self.shutdown()
+        if results is None:
+            results = dict(zip(paths, _scan_file_slice(paths, self.pii_types)))
+        for path in sorted(large_paths):
+            results[path] = self._scan_large_file(path)
+
+        pii_counts: Counter = Counter()
+        for result in results.values():
+            pii_counts.update(result['pii_counts'])
+        stats = merge_content_statistics(None, {
+            'files_scanned': len(results),
+            'bytes_scanned': sum(result['bytes_read'] for result in results.values()),
+            'files_with_pii': sum(1 for result in results.values() if result['pii_counts']),
+            'seconds': time.perf_counter() - started,
+            'statuses': Counter(result['status'] for result in results.values()),
+            'pii_counts': pii_counts
+        })
+        with self._lock:
+            self.statistics = merge_content_statistics(self.statistics, stats)
+        return results, stats
+
+    def scan_assets(
+        self,
+        assets: List[Dict[str, Any]],
+        blobs: Optional[List[Optional[ContentBlob]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Scan the files of discovered assets and merge the findings into them (blocking).
+
+        Scanned assets get 'pii_counts' ({category: matches}), 'pii_categories',
+        'content_scan' (status) and, when PII or Vietnamese text was found,
+        pdpl_sensitive / has_vietnamese_data set. Large files also get
+        'pii_offsets' ({category: sampled match byte offsets}).
+
+        With content blobs from the job's ContentDedupIndex, each unique
+        content is scanned once: copies reuse the findings of the first scan.
+
+        Args:
+            assets: File assets (asset_path is a readable path)
+            blobs: ContentDedupIndex.add_assets() result for the assets (optional)
+
+        Returns:
+            Batch statistics (files_deduplicated: copies not scanned again),
+            or None if no asset had a supported type
+        """
+        paths: List[str] = []
+        # Content blobs scanned by this batch: blob_id -> (blob, path scanned)
+        scanning: Dict[int, Tuple[ContentBlob, str]] = {}
+        copies: List[Tuple[Dict[str, Any], ContentBlob]] = []
+        for asset, blob in zip(assets, blobs or [None] * len(assets)):
+            path = asset.get('asset_path')
+            if not path or not self.is_supported(path):
+                continue
+            if blob is not None and (blob.findings is not None or blob.blob_id in scanning):
+                copies.append((asset, blob))
+                continue
+            paths.append(path)
+            if blob is not None:
+                scanning[blob.blob_id] = (blob, path)
+        if not paths and not copies:
+            return None
+
+        results, stats = self.scan_files(paths)
+        for blob, path in scanning.values():
+            blob.findings = results.get(path)
+        if copies:
+            stats['files_deduplicated'] = len(copies)
+            with self._lock:
+                self.statistics = merge_content_statistics(self.statistics, {'files_deduplicated': len(copies)})
+
+        for asset in assets:
+            result = results.get(asset.get('asset_path'))
+            if result is not None:
+                self._apply_findings(asset, result)
+        for asset, blob in copies:
+            if blob.findings is not None:
+                self._apply_findings(asset, blob.findings)
+        return stats
+
+    @staticmethod
+    def _apply_findings(asset: Dict[str, Any], result: Dict[str, Any]) -> None:
+        asset['pii_counts'] = dict(result['pii_counts'])
+        asset['pii_categories'] = sorted(result['pii_counts'])
+        asset['content_scan'] = result['status']
+        if result.get('pii_offsets'):
+            asset['pii_offsets'] = result['pii_offsets']
+        asset['pdpl_sensitive'] = asset.get('pdpl_sensitive', False) or bool(result['pii_counts'])
+        asset['has_vietnamese_data'] = asset.get('has_vietnamese_data', False) or result['has_vietnamese_data']
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                logger.info(f"[OK] Content scan pool started with {self.max_workers} workers")
+            return self._executor
+
+    def _scan_large_file(self, path: str) -> Dict[str, Any]:
+        if self.max_workers > 1:
+            try:
+                return scan_large_file(path, self.pii_types, self._get_executor())
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"[WARNING] Content scan pool unavailable, scanning in-process: {str(e)}")
+                self.shutdown()
+        return scan_large_file(path, self.pii_types)
+
+    def _scan_in_pool(self, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        executor = self._get_executor()
+        futures = [(path, executor.submit(scan_file_content, path, self.pii_types)) for path in paths]
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for path, future in futures:
+            # Workers check the time budget between extracted pieces; this only
+            # catches a file stuck inside a format library
+            try:
+                results[path] = future.result(timeout=ContentScanConfig.MAX_SECONDS_PER_FILE + RESULT_GRACE_SECONDS)
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning(f"[WARNING] Content scan of {path} exceeded its time budget")
+                results[path] = {
+                    'status': STATUS_TIMEOUT,
+                    'pii_counts': {},
+                    'has_vietnamese_data': False,
+                    'bytes_read': 0,
+                    'seconds': ContentScanConfig.MAX_SECONDS_PER_FILE,
+                    'error': 'No result within the time budget'
+                }
+        return results
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Totals of all scanned batches (throughput for sizing scan nodes)"""
+        with self._lock:
+            return {'max_workers': self.max_workers, **(self.statistics or {})}
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (restarted on the next parallel batch)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global content scanner instance (shared worker pool)
+_content_scanner_instance: Optional[ContentScanner] = None
+_content_scanner_lock = threading.Lock()
+
+
+def get_content_scanner() -> ContentScanner:
+    """Get the shared content scanner"""
+    global _content_scanner_instance
+    with _content_scanner_lock:
+        if _content_scanner_instance is None:
+            _content_scanner_instance = ContentScanner()
+        return _content_scanner_instance
@@ -0,0 +1,352 @@
+"""
+VeriSyntra Dedup Stores
+
+Seen-item stores used by ResultAggregator to drop duplicate discovered items.
+Multi-bucket scans reach tens of millions of keys, so the store is pluggable:
+
+- exact:  in-memory set (exact, memory grows with every key)
+- bloom:  scalable Bloom filter (bounded false-positive rate, ~1.2 bytes/key at 0.1%)
+- sqlite: disk-backed exact store (memory bounded by the SQLite page cache)
+"""
+
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional
+
+# Flexible import pattern
+try:
+    from ..config import ScanManagerConfig
+except ImportError:
+    from config.constants import ScanManagerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class DedupStore:
+    """
+    Set of seen item keys.
+
+    add() returns True for a key not seen before; subclasses implement
+    _add(), __contains__(), clear() and memory_bytes().
+    """
+
+    backend = ''
+
+    def __init__(self):
+        self.unique_count = 0
+        self.duplicate_count = 0
+
+    def add(self, key: str) -> bool:
+        """
+        Record a key.
+
+        Args:
+            key: Item key (e.g. source identifier + path)
+
+        Returns:
+            True if the key is new, False if it was (or, for Bloom, may have been) seen
+        """
+        if self._add(key):
+            self.unique_count += 1
+            return True
+        self.duplicate_count += 1
+        return False
+
+    def add_many(self, keys: Iterable[str]) -> List[bool]:
+        """Record a batch of keys (see add())"""
+        return [self.add(key) for key in keys]
+
+    def _add(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def __contains__(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return self.unique_count
+
+    def clear(self) -> None:
+        """Forget all keys and counters"""
+        self.unique_count = 0
+        self.duplicate_count = 0
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the store"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources (files, connections)"""
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Store statistics: backend, key counts, duplicate rate and memory use"""
+        seen = self.unique_count + self.duplicate_count
+        return {
+            'backend': self.backend,
+            'unique_keys': self.unique_count,
+            'duplicate_keys': self.duplicate_count,
+            'duplicate_rate': round(self.duplicate_count / seen * 100, 2) if seen else 0.0,
+            'memory_bytes': self.memory_bytes()
+        }
+
+
+class ExactDedupStore(DedupStore):
+    """In-memory set of keys (exact)"""
+
+    backend = 'exact'
+
+    def __init__(self):
+        super().__init__()
+        self._keys = set()
+        self._key_bytes = 0
+
+    def _add(self, key: str) -> bool:
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self._key_bytes += sys.getsizeof(key)
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys.clear()
+        self._key_bytes = 0
+
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self._keys) + self._key_bytes
+
+
+class _BloomFilter:
+    """Fixed-capacity Bloom filter using double hashing"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hash_count = max(1, int(round(self.bit_count / capacity * math.log(2))))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+
+    def _positions(self, h1: int, h2: int):
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.bit_count
+
+    def contains(self, h1: int, h2: int) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(h1, h2))
+
+    def add(self, h1: int, h2: int) -> None:
+        bits = self.bits
+        for pos in self._positions(h1, h2):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def estimated_error_rate(self) -> float:
+        """Current false-positive probability for the number of keys added"""
+        fill = 1 - math.exp(-self.hash_count * self.count / self.bit_count)
+        return fill ** self.hash_count
+
+
+class ScalableBloomDedupStore(DedupStore):
+    """
+    Scalable Bloom filter (Almeida et al.).
+
+    Starts with one filter of initial_capacity; when it is full a filter
+    growth_factor times larger with an error rate tightened by tightening_ratio
+    is added, so the compound false-positive rate stays below error_rate for
+    any number of keys. A false positive drops a unique item as a duplicate.
+    """
+
+    backend = 'bloom'
+
+    def __init__(
+        self,
+        initial_capacity: int = ScanManagerConfig.DEDUP_BLOOM_INITIAL_CAPACITY,
+        error_rate: float = ScanManagerConfig.DEDUP_BLOOM_ERROR_RATE,
+        growth_factor: int = ScanManagerConfig.DEDUP_BLOOM_GROWTH_FACTOR,
+        tightening_ratio: float = ScanManagerConfig.DEDUP_BLOOM_TIGHTENING_RATIO
+    ):
+        super().__init__()
+        if initial_capacity < 1:
+            raise ValueError("initial_capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if not 0 < tightening_ratio < 1:
+            raise ValueError("tightening_ratio must be between 0 and 1")
+
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth_factor = growth_factor
+        self.tightening_ratio = tightening_ratio
+        self.filters: List[_BloomFilter] = []
+        self._add_filter()
+
+    def _add_filter(self) -> None:
+        index = len(self.filters)
+        # Geometric series: sum(e0 * r^i) = e0 / (1 - r) = error_rate
+        self.filters.append(_BloomFilter(
+            self.initial_capacity * self.growth_factor ** index,
+            self.error_rate * (1 - self.tightening_ratio) * self.tightening_ratio ** index
+        ))
+
+    @staticmethod
+    def _hashes(key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+    def _add(self, key: str) -> bool:
+        h1, h2 = self._hashes(key)
+        if any(bloom.contains(h1, h2) for bloom in self.filters):
+            return False
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            self._add_filter()
+            current = self.filters[-1]
+        current.add(h1, h2)
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        h1, h2 = self._hashes(key)
+        return any(bloom.contains(h1, h2) for bloom in self.filters)
+
+    def clear(self) -> None:
+        super().clear()
+        self.filters = []
+        self._add_filter()
+
+    def memory_bytes(self) -> int:
+        return sum(len(bloom.bits) for bloom in self.filters)
+
+    def estimated_error_rate(self) -> float:
+        """Current compound false-positive probability"""
+        miss = 1.0
+        for bloom in self.filters:
+            miss *= 1 - bloom.estimated_error_rate()
+        return 1 - miss
+
+    def get_statistics(self) -> Dict[str, Any]:
+        statistics = super().get_statistics()
+        statistics.update({
+            'filters': len(self.filters),
+            'error_rate_bound': self.error_rate,
+            'estimated_error_rate': self.estimated_error_rate()
+        })
+        return statistics
+
+
+class SQLiteDedupStore(DedupStore):
+    """
+    Disk-backed exact store in a SQLite database.
+
+    Memory is bounded by the page cache (ScanManagerConfig.DEDUP_SQLITE_CACHE_KIB).
+    Without a path, a temporary database is created and removed on close().
+    Not thread-safe on its own; ResultAggregator serializes access.
+    """
+
+    backend = 'sqlite'
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        cache_kib: int = ScanManagerConfig.DEDUP_SQLITE_CACHE_KIB
+    ):
+        super().__init__()
+        self._temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(
+                prefix='verisyntra-dedup-',
+                suffix='.sqlite',
+                dir=ScanManagerConfig.DEDUP_SQLITE_DIRECTORY or None
+            )
+            os.close(fd)
+        self.path = path
+        self.cache_kib = cache_kib
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # Scratch data: durability is not needed, speed is
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(f"PRAGMA cache_size=-{int(cache_kib)}")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY) WITHOUT ROWID")
+
+    def _add(self, key: str) -> bool:
+        cursor = self._connection.execute("INSERT OR IGNORE INTO seen (key) VALUES (?)", (key,))
+        return cursor.rowcount == 1
+
+    def add_many(self, keys: Iterable[str]) -> List[bool]:
+        """Record a batch of keys in one transaction"""
+        self._connection.execute("BEGIN")
+        try:
+            added = [self.add(key) for key in keys]
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        row = self._connection.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def clear(self) -> None:
+        super().clear()
+        self._connection.execute("DELETE FROM seen")
+
+    def memory_bytes(self) -> int:
+        # Page cache grows up to its limit, never beyond
+        return min(self.cache_kib * 1024, self.disk_bytes())
+
+    def disk_bytes(self) -> int:
+        """Size of the database file"""
+        page_count = self._connection.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self._connection.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+
+    def close(self) -> None:
+        try:
+            self._connection.close()
+        finally:
+            if self._temporary and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        statistics = super().get_statistics()
+        statistics['disk_bytes'] = self.disk_bytes()
+        return statistics
+
+
+# Backend name -> store class (dictionary routing, see ScanManagerConfig.DEDUP_BACKENDS)
+DEDUP_STORES = {
+    ExactDedupStore.backend: ExactDedupStore,
+    ScalableBloomDedupStore.backend: ScalableBloomDedupStore,
+    SQLiteDedupStore.backend: SQLiteDedupStore
+}
+
+
+def create_dedup_store(backend: Optional[str] = None, **options) -> DedupStore:
+    """
+    Create a dedup store.
+
+    Args:
+        backend: 'exact', 'bloom' or 'sqlite' (default: ScanManagerConfig.DEDUP_BACKEND)
+        **options: Backend constructor options (e.g. error_rate, path)
+
+    Returns:
+        DedupStore instance
+    """
+    backend = backend or ScanManagerConfig.DEDUP_BACKEND
+    store_class = DEDUP_STORES.get(backend)
+    if store_class is None:
+        raise ValueError(
+            f"Unknown dedup backend: {backend} "
+            f"(supported: {', '.join(ScanManagerConfig.DEDUP_BACKENDS)})"
+        )
+    logger.info(f"[OK] Dedup store created: {backend}")
+    return store_class(**options)
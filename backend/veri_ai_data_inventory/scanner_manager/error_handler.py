@@ -3,21 +3,229 @@ VeriSyntra Error Handler
 
 Provides retry logic and error handling for scanner operations.
 Uses dynamic configuration for retry attempts and delays.
+
+- Retries back off exponentially with jitter (ScanManagerConfig.RETRY_*);
+  only transient errors (is_retryable_error) are retried
+- Async code retries with asyncio.sleep, so the event loop is never blocked
+- A per-source circuit breaker makes scans of a source that keeps failing
+  fail fast instead of holding pool slots through every retry
+- The error log is a ring buffer of the ScanManagerConfig.ERROR_LOG_SIZE
+  most recent errors
 """
 
+import asyncio
+import inspect
+import random
+import threading
 import time
 import logging
-from typing import Callable, Any, Dict, Optional
+from collections import deque
+from typing import Callable, Any, Deque, Dict, Optional
 from functools import wraps
 
 # Flexible import pattern
 try:
     from ..config import ScanManagerConfig
+    from ..utils.cancellation import CancellationToken, ScanCancelledError
 except ImportError:
     from config.constants import ScanManagerConfig
+    from utils.cancellation import CancellationToken, ScanCancelledError
 
 logger = logging.getLogger(__name__)
 
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half_open'
+
+
+def backoff_delay(attempt: int, base_delay: Optional[float] = None) -> float:
+    """
+    Delay before retrying after the attempt-th failed attempt.
+    
+    Args:
+        attempt: Failed attempt number (1 = first attempt)
+        base_delay: Delay before the first retry (default: ScanManagerConfig.RETRY_DELAY_SECONDS)
+        
+    Returns:
+        Delay in seconds: exponential, capped at RETRY_MAX_DELAY_SECONDS,
+        minus a random fraction up to RETRY_JITTER_RATIO
+    """
+    if base_delay is None:
+        base_delay = ScanManagerConfig.RETRY_DELAY_SECONDS
+    delay = min(
+        base_delay * ScanManagerConfig.RETRY_BACKOFF_MULTIPLIER ** (attempt - 1),
+        ScanManagerConfig.RETRY_MAX_DELAY_SECONDS
+    )
+    return delay * (1.0 - ScanManagerConfig.RETRY_JITTER_RATIO * random.random())
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a source whose circuit is open"""
+    
+    def __init__(self, source_key: str, retry_after: float):
+        super().__init__(
+            f"Source unavailable after repeated failures (circuit open, retry in {retry_after:.0f}s)"
+        )
+        self.source_key = source_key
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of one data source.
+    
+    closed: calls pass; CIRCUIT_BREAKER_FAILURE_THRESHOLD consecutive failures open it.
+    open: calls fail fast with CircuitOpenError for CIRCUIT_BREAKER_RESET_SECONDS.
+    half_open: one trial call passes; success closes the circuit, failure reopens it,
+    and a cancelled trial releases the slot so the next call becomes the trial.
+    Thread-safe (scanners connect from worker threads and the event loop).
+    """
+    
+    def __init__(
+        self,
+        source_key: str,
+        failure_threshold: Optional[int] = None,
+        reset_seconds: Optional[float] = None
+    ):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            source_key: Source identity (connection fingerprint)
+            failure_threshold: Consecutive failures that open the circuit
+                (default from ScanManagerConfig)
+            reset_seconds: Time the circuit stays open (default from ScanManagerConfig)
+        """
+        self.source_key = source_key
+        self.failure_threshold = failure_threshold or ScanManagerConfig.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        self.reset_seconds = reset_seconds if reset_seconds is not None else ScanManagerConfig.CIRCUIT_BREAKER_RESET_SECONDS
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._trial_id = 0
+        self._lock = threading.Lock()
+    
+    def check(self) -> None:
+        """
+        Fail fast if a call would be rejected (does not claim the half-open trial).
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            retry_after = self._retry_after()
+            if retry_after is not None:
+                self.rejected += 1
+                raise CircuitOpenError(self.source_key, retry_after)
+    
+    def before_call(self) -> Optional[int]:
+        """
+        Admit a call, claiming the trial call of a half-open circuit.
+        
+        Returns:
+            Trial ID if this call is the half-open trial (pass it to release_trial), else None
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            retry_after = self._retry_after()
+            if retry_after is not None:
+                self.rejected += 1
+                raise CircuitOpenError(self.source_key, retry_after)
+            if self.state == CIRCUIT_OPEN:
+                self.state = CIRCUIT_HALF_OPEN
+                logger.info(f"[OK] Circuit of source {self.source_key[:12]} half-open: trying one connection")
+            if self.state == CIRCUIT_HALF_OPEN:
+                self._trial_running = True
+                self._trial_id += 1
+                return self._trial_id
+            return None
+    
+    def release_trial(self, trial_id: Optional[int]) -> None:
+        """
+        End a trial call without an outcome (no-op once it recorded success or failure).
+        
+        A trial that was cancelled counts as neither success nor failure: the
+        circuit stays half-open and the next call becomes the trial.
+        
+        Args:
+            trial_id: ID returned by before_call (None: not a trial)
+        """
+        if trial_id is None:
+            return
+        with self._lock:
+            if self._trial_running and self._trial_id == trial_id:
+                self._trial_running = False
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful call"""
+        with self._lock:
+            if self.state != CIRCUIT_CLOSED:
+                logger.info(f"[OK] Circuit of source {self.source_key[:12]} closed")
+            self.state = CIRCUIT_CLOSED
+            self.consecutive_failures = 0
+            self._trial_running = False
+    
+    def record_failure(self) -> None:
+        """Count a failed call; open the circuit at the threshold or when the trial fails"""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_running = False
+            if self.state == CIRCUIT_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != CIRCUIT_OPEN:
+                    logger.warning(
+                        f"[WARNING] Circuit of source {self.source_key[:12]} opened after "
+                        f"{self.consecutive_failures} consecutive failures"
+                    )
+                self.state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Circuit state, consecutive failures and rejected calls"""
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'rejected': self.rejected
+            }
+    
+    def _retry_after(self) -> Optional[float]:
+        """Seconds until a call may pass, or None if it may pass now (lock held)"""
+        if self.state == CIRCUIT_OPEN:
+            remaining = self._opened_at + self.reset_seconds - time.monotonic()
+            return remaining if remaining > 0 else None
+        if self.state == CIRCUIT_HALF_OPEN and self._trial_running:
+            return self.reset_seconds
+        return None
+
+
+# Circuit breakers by source key (shared by all scans of the process)
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(source_key: str) -> CircuitBreaker:
+    """Get the shared circuit breaker of a source"""
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(source_key)
+        if breaker is None:
+            breaker = CircuitBreaker(source_key)
+            _circuit_breakers[source_key] = breaker
+        return breaker
+
+
+def get_circuit_breaker_statistics() -> Dict[str, int]:
+    """Number of sources per circuit state"""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    counts = {CIRCUIT_CLOSED: 0, CIRCUIT_OPEN: 0, CIRCUIT_HALF_OPEN: 0}
+    for breaker in breakers:
+        counts[breaker.state] += 1
+    return counts
+
 
 class ScanErrorHandler:
     """
@@ -29,18 +237,20 @@ class ScanErrorHandler:
     def __init__(
         self,
         max_retries: int = ScanManagerConfig.DEFAULT_RETRY_ATTEMPTS,
-        retry_delay: int = ScanManagerConfig.RETRY_DELAY_SECONDS
+        retry_delay: float = ScanManagerConfig.RETRY_DELAY_SECONDS
     ):
         """
         Initialize error handler with dynamic configuration.
         
         Args:
-            max_retries: Maximum retry attempts (default from ScanManagerConfig)
-            retry_delay: Delay between retries in seconds (default from ScanManagerConfig)
+            max_retries: Maximum attempts (default from ScanManagerConfig)
+            retry_delay: Delay before the first retry in seconds (default from ScanManagerConfig)
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.error_log: list[Dict[str, Any]] = []
+        self.error_log: Deque[Dict[str, Any]] = deque(maxlen=ScanManagerConfig.ERROR_LOG_SIZE)
+        self.total_errors = 0
+        self._lock = threading.Lock()
     
     def retry_on_failure(
         self,
@@ -49,7 +259,7 @@ class ScanErrorHandler:
         **kwargs
     ) -> Dict[str, Any]:
         """
-        Execute operation with retry logic.
+        Execute operation with retry logic (blocking; use retry_async in async code).
         
         Args:
             operation: Function to execute
@@ -59,96 +269,240 @@ class ScanErrorHandler:
         Returns:
             Operation result or error response
         """
-        last_error = None
+        try:
+            return self.retry(operation, *args, **kwargs)
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': f'Operation failed after {self.max_retries} attempts',
+                'last_error': str(e),
+                'error_type': type(e).__name__,
+                'error_history': list(self.error_log)
+            }
+    
+    def retry(
+        self,
+        operation: Callable,
+        *args,
+        source_key: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Execute a blocking operation, retrying transient errors with backoff.
         
-        for attempt in range(self.max_retries):
+        Args:
+            operation: Function to execute
+            *args: Positional arguments for operation
+            source_key: Source identity whose circuit breaker guards the calls (optional)
+            cancel_token: Token that interrupts the wait between attempts (optional)
+            **kwargs: Keyword arguments for operation
+            
+        Returns:
+            Operation result
+            
+        Raises:
+            CircuitOpenError: If the source's circuit is open
+            ScanCancelledError: If cancelled while waiting to retry
+            Exception: The last error once it is not retryable or attempts are exhausted
+        """
+        breaker = get_circuit_breaker(source_key) if source_key else None
+        attempt = 0
+        while True:
+            attempt += 1
+            trial_id = breaker.before_call() if breaker is not None else None
             try:
-                logger.info(
-                    f"[INFO] Executing operation (attempt {attempt + 1}/{self.max_retries})"
-                )
-                
                 result = operation(*args, **kwargs)
-                
-                # Success
-                if attempt > 0:
-                    logger.info(
-                        f"[OK] Operation succeeded after {attempt + 1} attempts"
-                    )
-                
+            except Exception as e:
+                delay = self._handle_failure(e, attempt, breaker)
+                if delay is None:
+                    raise
+                if cancel_token is not None:
+                    if cancel_token.wait(delay):
+                        raise ScanCancelledError(cancel_token.reason) from e
+                else:
+                    time.sleep(delay)
+            else:
+                self._handle_success(attempt, breaker)
                 return result
-                
+            finally:
+                # A trial ended by cancellation (or any BaseException) must not hold the circuit half-open
+                if trial_id is not None:
+                    breaker.release_trial(trial_id)
+    
+    async def retry_async(
+        self,
+        operation: Callable,
+        *args,
+        source_key: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Execute an operation from async code, retrying transient errors with backoff.
+        
+        Waits with asyncio (the event loop keeps running). Coroutine results are
+        awaited; run blocking operations through asyncio.to_thread.
+        
+        Args:
+            operation: Function or coroutine function to execute
+            *args: Positional arguments for operation
+            source_key: Source identity whose circuit breaker guards the calls (optional)
+            cancel_token: Token that interrupts the wait between attempts (optional)
+            **kwargs: Keyword arguments for operation
+            
+        Returns:
+            Operation result
+            
+        Raises:
+            CircuitOpenError: If the source's circuit is open
+            ScanCancelledError: If cancelled while waiting to retry
+            Exception: The last error once it is not retryable or attempts are exhausted
+        """
+        breaker = get_circuit_breaker(source_key) if source_key else None
+        attempt = 0
+        while True:
+            attempt += 1
+            trial_id = breaker.before_call() if breaker is not None else None
+            try:
+                result = operation(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
             except Exception as e:
-                last_error = e
-                error_msg = str(e)
-                
-                # Log the error
-                error_entry = {
-                    'attempt': attempt + 1,
-                    'error': error_msg,
-                    'timestamp': time.time()
-                }
-                self.error_log.append(error_entry)
-                
-                logger.warning(
-                    f"[WARNING] Operation failed (attempt {attempt + 1}/{self.max_retries}): "
-                    f"{error_msg}"
-                )
-                
-                # Don't sleep on the last attempt
-                if attempt < self.max_retries - 1:
-                    logger.info(f"[INFO] Retrying in {self.retry_delay} seconds...")
-                    time.sleep(self.retry_delay)
-        
-        # All retries exhausted
-        logger.error(
-            f"[ERROR] Operation failed after {self.max_retries} attempts. "
-            f"Last error: {str(last_error)}"
+                delay = self._handle_failure(e, attempt, breaker)
+                if delay is None:
+                    raise
+                await self._wait_async(delay, cancel_token)
+            else:
+                self._handle_success(attempt, breaker)
+                return result
+            finally:
+                # A trial ended by asyncio cancellation must not hold the circuit half-open
+                if trial_id is not None:
+                    breaker.release_trial(trial_id)
+    
+    @staticmethod
+    async def _wait_async(delay: float, cancel_token: Optional[CancellationToken]) -> None:
+        """Sleep without blocking the event loop; wake up early on cancellation"""
+        if cancel_token is None:
+            await asyncio.sleep(delay)
+            return
+        loop = asyncio.get_running_loop()
+        cancelled = asyncio.Event()
+        cancel_token.add_callback(lambda: loop.call_soon_threadsafe(cancelled.set))
+        try:
+            await asyncio.wait_for(cancelled.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        cancel_token.raise_if_cancelled()
+    
+    def _handle_success(self, attempt: int, breaker: Optional[CircuitBreaker]) -> None:
+        if breaker is not None:
+            breaker.record_success()
+        if attempt > 1:
+            logger.info(f"[OK] Operation succeeded after {attempt} attempts")
+    
+    def _handle_failure(
+        self,
+        error: Exception,
+        attempt: int,
+        breaker: Optional[CircuitBreaker]
+    ) -> Optional[float]:
+        """
+        Log a failed attempt and decide whether to retry.
+        
+        Returns:
+            Delay before the next attempt, or None to give up
+        """
+        if isinstance(error, (ScanCancelledError, CircuitOpenError)):
+            return None
+        if breaker is not None:
+            breaker.record_failure()
+        
+        retryable = self.is_retryable_error(error)
+        self.record_error(error, attempt=attempt, retryable=retryable)
+        
+        if not retryable or attempt >= self.max_retries:
+            logger.error(
+                f"[ERROR] Operation failed after {attempt} attempt(s) "
+                f"({'attempts exhausted' if retryable else 'not retryable'}): "
+                f"{type(error).__name__}: {str(error)}"
+            )
+            return None
+        
+        delay = backoff_delay(attempt, self.retry_delay)
+        logger.warning(
+            f"[WARNING] Operation failed (attempt {attempt}/{self.max_retries}): "
+            f"{type(error).__name__}: {str(error)}; retrying in {delay:.1f} seconds"
         )
+        return delay
+    
+    def record_error(self, error: Exception, **details) -> None:
+        """
+        Add an error to the log (the oldest entry is dropped when full).
         
-        return {
-            'status': 'error',
-            'message': f'Operation failed after {self.max_retries} attempts',
-            'last_error': str(last_error),
-            'error_history': self.error_log
+        Args:
+            error: Exception to record
+            **details: Additional fields of the entry (attempt, source, ...)
+        """
+        entry = {
+            'error': str(error),
+            'error_type': type(error).__name__,
+            'timestamp': time.time()
         }
+        entry.update(details)
+        with self._lock:
+            self.error_log.append(entry)
+            self.total_errors += 1
     
     def get_error_summary(self) -> Dict[str, Any]:
         """
-        Get summary of all errors encountered.
+        Get summary of the errors encountered.
         
         Returns:
-            Error summary statistics
+            Error summary statistics (total count and the most recent errors)
         """
-        return {
-            'total_errors': len(self.error_log),
-            'errors': self.error_log
-        }
+        with self._lock:
+            return {
+                'total_errors': self.total_errors,
+                'errors': list(self.error_log),
+                'circuit_breakers': get_circuit_breaker_statistics()
+            }
     
     def clear_error_log(self):
         """Clear the error log"""
-        self.error_log.clear()
+        with self._lock:
+            self.error_log.clear()
+            self.total_errors = 0
     
     @staticmethod
     def is_retryable_error(error: Exception) -> bool:
         """
         Determine if an error is retryable.
         
+        Network errors and timeouts (ConnectionError, TimeoutError and driver
+        errors named in ScanManagerConfig.RETRYABLE_ERROR_TYPES) are transient;
+        an error wrapping one (raise ... from) is retryable too. Configuration,
+        permission and data errors are not.
+        
         Args:
             error: Exception to check
             
         Returns:
             True if error should trigger retry, False otherwise
         """
-        # Network/connection errors are retryable
-        retryable_error_types = [
-            'ConnectionError',
-            'TimeoutError',
-            'ConnectionRefusedError',
-            'ConnectionResetError',
-        ]
-        
-        error_type = type(error).__name__
-        return error_type in retryable_error_types
+        seen = set()
+        current: Optional[BaseException] = error
+        while current is not None and id(current) not in seen:
+            seen.add(id(current))
+            if isinstance(current, (ScanCancelledError, CircuitOpenError)):
+                return False
+            if isinstance(current, (ConnectionError, TimeoutError)):
+                return True
+            if any(cls.__name__ in ScanManagerConfig.RETRYABLE_ERROR_TYPES for cls in type(current).__mro__):
+                return True
+            current = current.__cause__ or current.__context__
+        return False
     
     @staticmethod
     def create_error_response(
@@ -184,6 +538,8 @@ def with_retry(max_retries: int = ScanManagerConfig.DEFAULT_RETRY_ATTEMPTS):
     """
     Decorator for adding retry logic to scanner methods.
     
+    Coroutine functions are retried with retry_async (non-blocking waits).
+    
     Args:
         max_retries: Maximum retry attempts (default from ScanManagerConfig)
         
@@ -194,6 +550,20 @@ def with_retry(max_retries: int = ScanManagerConfig.DEFAULT_RETRY_ATTEMPTS):
             pass
     """
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                error_handler = ScanErrorHandler(max_retries=max_retries)
+                try:
+                    return await error_handler.retry_async(func, *args, **kwargs)
+                except Exception as e:
+                    return error_handler.create_error_response(
+                        f'Operation failed after {max_retries} attempts',
+                        error=e,
+                        error_history=list(error_handler.error_log)
+                    )
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             error_handler = ScanErrorHandler(max_retries=max_retries)
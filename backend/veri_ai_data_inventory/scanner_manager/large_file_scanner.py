@@ -0,0 +1,290 @@
+"""
+VeriSyntra Large File Scanner
+
+Scans very large text and log files (application logs, data exports of tens
+of GB) for PII in full, where the content scanner would stop at
+ContentScanConfig.MAX_BYTES_PER_FILE.
+
+The file is memory-mapped and split into line-aligned chunks of
+ContentScanConfig.LARGE_FILE_CHUNK_BYTES; chunks are scanned in parallel worker
+processes with the compiled Vietnamese PII patterns. Each worker decodes one
+line-aligned window of LARGE_FILE_WINDOW_BYTES at a time and releases the
+mapped pages behind it, so Python heap usage stays flat however large the
+file is. Results are match counts per PII category plus a uniform sample of
+match byte offsets (for reviewers to locate the findings).
+"""
+
+import heapq
+import logging
+import mmap
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import Executor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+
+# Flexible import pattern
+try:
+    from ..config import ContentScanConfig
+    from ..utils.streaming_sampler import ReservoirSampler
+    from ..utils.utf8_validator import UTF8Validator
+except ImportError:
+    from config.constants import ContentScanConfig
+    from utils.streaming_sampler import ReservoirSampler
+    from utils.utf8_validator import UTF8Validator
+
+logger = logging.getLogger(__name__)
+
+# Chunk results arriving this long after the file's time budget are abandoned
+RESULT_GRACE_SECONDS = 5.0
+
+
+def _char_boundary(mm: mmap.mmap, position: int) -> int:
+    """Move a cut back to the start of a UTF-8 character (at most 3 bytes)"""
+    for _ in range(3):
+        if position <= 0 or mm[position] & 0xC0 != 0x80:
+            break
+        position -= 1
+    return position
+
+
+def _line_boundary(mm: mmap.mmap, target: int, limit: int) -> int:
+    """
+    Offset just after the first newline at or after target.
+
+    Searches up to limit; a line longer than that is cut at target (moved to a
+    character boundary) so one huge line cannot make a piece unbounded.
+    """
+    if target >= limit:
+        return limit
+    newline = mm.find(b'\n', target, limit)
+    if newline != -1:
+        return newline + 1
+    return _char_boundary(mm, target) if limit < len(mm) else limit
+
+
+def plan_chunks(path: str, chunk_bytes: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split a file into line-aligned chunks.
+
+    Only the pages around each boundary are read.
+
+    Args:
+        path: File path
+        chunk_bytes: Target chunk size (default: ContentScanConfig.LARGE_FILE_CHUNK_BYTES)
+
+    Returns:
+        [(start, end)] byte ranges covering the file
+    """
+    chunk_bytes = chunk_bytes or ContentScanConfig.LARGE_FILE_CHUNK_BYTES
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    chunks: List[Tuple[int, int]] = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = _line_boundary(mm, start + chunk_bytes, min(size, start + 2 * chunk_bytes))
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def _byte_offsets(text: str, positions: List[int], base: int) -> List[int]:
+    """File byte offsets of sorted character positions in a decoded window"""
+    if text.isascii():
+        return [base + position for position in positions]
+    offsets = []
+    consumed, byte_offset = 0, base
+    for position in positions:
+        byte_offset += len(text[consumed:position].encode('utf-8'))
+        consumed = position
+        offsets.append(byte_offset)
+    return offsets
+
+
+def scan_chunk(
+    path: str,
+    start: int,
+    end: int,
+    pii_types: Optional[Tuple[str, ...]] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Scan one byte range of a file (runs inside a worker process).
+
+    Args:
+        path: File path
+        start: Chunk start (line-aligned)
+        end: Chunk end (line-aligned)
+        pii_types: PII types to detect (None: all configured types)
+        deadline: time.time() after which the chunk stops early
+
+    Returns:
+        {'start', 'end', 'bytes_read', 'pii_counts', 'pii_offsets' ({category: sampled offsets}),
+        'has_vietnamese_data', 'timed_out'}
+    """
+    # Imported here: the services package imports the scan service, which imports the content scanner
+    try:
+        from ..services.redaction_service import get_redaction_engine
+    except ImportError:
+        from services.redaction_service import get_redaction_engine
+
+    engine = get_redaction_engine(list(pii_types) if pii_types else None)
+    window_bytes = ContentScanConfig.LARGE_FILE_WINDOW_BYTES
+    sample_size = ContentScanConfig.LARGE_FILE_SAMPLE_OFFSETS
+    counts: Counter = Counter()
+    # Seeded by chunk so a rescan samples the same offsets
+    samplers = {
+        pii_type: ReservoirSampler(sample_size, random.Random(start))
+        for pii_type, _, _ in engine.compiled
+    }
+    has_vietnamese = False
+    timed_out = False
+    position = start
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        while position < end:
+            if deadline is not None and time.time() > deadline:
+                timed_out = True
+                break
+            window_end = _line_boundary(mm, position + window_bytes, min(end, position + 2 * window_bytes))
+            text = mm[position:window_end].decode('utf-8', errors='replace')
+            for pii_type, pattern, _ in engine.compiled:
+                positions = [match.start() for match in pattern.finditer(text)]
+                if positions:
+                    counts[pii_type] += len(positions)
+                    samplers[pii_type].add_many(_byte_offsets(text, positions, position))
+            has_vietnamese = has_vietnamese or UTF8Validator.contains_vietnamese(text)
+            del text
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+                # Drop the scanned pages from this process (they stay in the page cache)
+                page_start = position - position % mmap.PAGESIZE
+                mm.madvise(mmap.MADV_DONTNEED, page_start, window_end - page_start)
+            position = window_end
+
+    return {
+        'start': start,
+        'end': end,
+        'bytes_read': position - start,
+        'pii_counts': dict(counts),
+        'pii_offsets': {
+            pii_type: sorted(sampler.samples) for pii_type, sampler in samplers.items() if sampler.samples
+        },
+        'has_vietnamese_data': has_vietnamese,
+        'timed_out': timed_out
+    }
+
+
+def merge_chunk_results(chunk_results: List[Dict[str, Any]], sample_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Combine chunk results into one file result.
+
+    Offset samples are merged by weighted sampling (each chunk's sample
+    stands for all of its matches), so the merged sample stays uniform over
+    the whole file.
+
+    Args:
+        chunk_results: scan_chunk() results
+        sample_size: Offsets kept per category (default: ContentScanConfig.LARGE_FILE_SAMPLE_OFFSETS)
+
+    Returns:
+        {'pii_counts', 'pii_offsets', 'has_vietnamese_data', 'bytes_read', 'timed_out'}
+    """
+    sample_size = sample_size if sample_size is not None else ContentScanConfig.LARGE_FILE_SAMPLE_OFFSETS
+    counts: Counter = Counter()
+    for result in chunk_results:
+        counts.update(result['pii_counts'])
+
+    rng = random.Random(0)
+    offsets: Dict[str, List[int]] = {}
+    for pii_type in counts:
+        keyed = []
+        for result in chunk_results:
+            sample = result['pii_offsets'].get(pii_type, [])
+            if sample:
+                weight = result['pii_counts'][pii_type] / len(sample)
+                # Efraimidis-Spirakis key: larger keys are kept
+                keyed.extend((rng.random() ** (1.0 / weight), offset) for offset in sample)
+        offsets[pii_type] = sorted(offset for _, offset in heapq.nlargest(sample_size, keyed))
+
+    return {
+        'pii_counts': dict(counts),
+        'pii_offsets': offsets,
+        'has_vietnamese_data': any(result['has_vietnamese_data'] for result in chunk_results),
+        'bytes_read': sum(result['bytes_read'] for result in chunk_results),
+        'timed_out': any(result['timed_out'] for result in chunk_results)
+    }
+
+
+def scan_large_file(
+    path: str,
+    pii_types: Optional[Tuple[str, ...]] = None,
+    executor: Optional[Executor] = None,
+    max_seconds: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Scan a whole text file in line-aligned chunks (blocking).
+
+    Args:
+        path: File path
+        pii_types: PII types to detect (None: all configured types)
+        executor: Worker process pool (None: scan the chunks in-process)
+        max_seconds: Time budget (default: ContentScanConfig.LARGE_FILE_MAX_SECONDS)
+
+    Returns:
+        scan_file_content()-style result with 'pii_offsets' and 'chunks' added
+
+    Raises:
+        BrokenProcessPool: If the worker pool died (caller falls back to in-process)
+    """
+    started = time.perf_counter()
+    budget = max_seconds or ContentScanConfig.LARGE_FILE_MAX_SECONDS
+    deadline = time.time() + budget
+    try:
+        chunks = plan_chunks(path)
+    except (OSError, ValueError) as e:
+        return {
+            'status': 'error',
+            'pii_counts': {},
+            'pii_offsets': {},
+            'has_vietnamese_data': False,
+            'bytes_read': 0,
+            'chunks': 0,
+            'seconds': round(time.perf_counter() - started, 4),
+            'error': f"{type(e).__name__}: {str(e)}"
+        }
+
+    if executor is None:
+        chunk_results = [scan_chunk(path, start, end, pii_types, deadline) for start, end in chunks]
+    else:
+        futures = [executor.submit(scan_chunk, path, start, end, pii_types, deadline) for start, end in chunks]
+        chunk_results = []
+        for (start, end), future in zip(chunks, futures):
+            try:
+                chunk_results.append(
+                    future.result(timeout=max(deadline - time.time(), 0) + RESULT_GRACE_SECONDS)
+                )
+            except FutureTimeoutError:
+                future.cancel()
+                chunk_results.append({
+                    'start': start, 'end': end, 'bytes_read': 0, 'pii_counts': {}, 'pii_offsets': {},
+                    'has_vietnamese_data': False, 'timed_out': True
+                })
+
+    merged = merge_chunk_results(chunk_results)
+    if merged['timed_out']:
+        logger.warning(f"[WARNING] Large file scan of {path} exceeded its {budget}s budget")
+    return {
+        'status': 'timeout' if merged['timed_out'] else 'scanned',
+        'pii_counts': merged['pii_counts'],
+        'pii_offsets': merged['pii_offsets'],
+        'has_vietnamese_data': merged['has_vietnamese_data'],
+        'bytes_read': merged['bytes_read'],
+        'chunks': len(chunks),
+        'seconds': round(time.perf_counter() - started, 4),
+        'error': None
+    }
@@ -0,0 +1,377 @@
+"""
+VeriSyntra Scan Progress Stream
+
+Pushes scan progress to subscribers (the server-sent events endpoint) instead
+of having dashboards poll the status API. Every event is a full snapshot of
+the job's progress (status, progress, asset count), so a newer event always
+supersedes an older one:
+
+- ProgressPublisher coalesces a scan's updates to at most
+  ProgressStreamConfig.MAX_UPDATES_PER_SECOND; status transitions are
+  published at once, and the latest pending update is flushed when its
+  interval ends. One background thread publishes for all scans, so the
+  bus is never called from the event loop
+- ProgressBus delivers events to subscribers: 'local' within one API
+  process, 'redis' (pub/sub) across all API workers
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+# Flexible import pattern
+try:
+    from ..config import ProgressStreamConfig
+except ImportError:
+    from config.constants import ProgressStreamConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressSubscription:
+    """Events of one scan for one subscriber"""
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event, or None if none arrived within timeout seconds"""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Stop receiving events"""
+
+
+class ProgressBus:
+    """Publish/subscribe channel per scan job. Subclasses implement every method below."""
+
+    backend = ''
+
+    def publish(self, scan_job_id: str, event: Dict[str, Any]) -> None:
+        """Deliver an event to the scan's subscribers (callable from any thread)"""
+        raise NotImplementedError
+
+    async def subscribe(self, scan_job_id: str) -> ProgressSubscription:
+        """Subscribe to a scan's events (events published after this call are received)"""
+        raise NotImplementedError
+
+    def latest(self, scan_job_id: str) -> Optional[Dict[str, Any]]:
+        """Last event published for a scan by any API worker, if the backend keeps it"""
+        return None
+
+    def close(self) -> None:
+        """Release backend connections"""
+
+
+class _LocalSubscription(ProgressSubscription):
+
+    def __init__(self, bus: 'LocalProgressBus', scan_job_id: str):
+        self.bus = bus
+        self.scan_job_id = scan_job_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=ProgressStreamConfig.SUBSCRIBER_QUEUE_SIZE)
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        """Queue an event (runs on the subscriber's loop); a full queue drops its oldest event"""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self.bus._unsubscribe(self)
+
+
+class LocalProgressBus(ProgressBus):
+    """In-process progress bus (single API worker, tests)"""
+
+    backend = 'local'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[_LocalSubscription]] = {}
+
+    def publish(self, scan_job_id: str, event: Dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(scan_job_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # Subscriber's event loop closed
+                self._unsubscribe(subscription)
+
+    async def subscribe(self, scan_job_id: str) -> ProgressSubscription:
+        subscription = _LocalSubscription(self, scan_job_id)
+        with self._lock:
+            self._subscribers.setdefault(scan_job_id, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: _LocalSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.scan_job_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.scan_job_id]
+
+    def subscriber_count(self) -> int:
+        """Open subscriptions across all scans"""
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+class _RedisSubscription(ProgressSubscription):
+
+    def __init__(self, pubsub: Any):
+        self.pubsub = pubsub
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+            if message is not None and message['type'] == 'message':
+                return json.loads(message['data'])
+
+    async def close(self) -> None:
+        await self.pubsub.unsubscribe()
+        await self.pubsub.close()
+
+
+class RedisProgressBus(ProgressBus):
+    """
+    Redis pub/sub progress bus shared by all API workers
+
+    Each scan has a channel; the latest event is also stored (with
+    ProgressStreamConfig.SNAPSHOT_TTL_SECONDS) so a worker that does not run
+    the scan can send the current state to a new subscriber.
+    """
+
+    backend = 'redis'
+
+    def __init__(
+        self,
+        url: str = ProgressStreamConfig.REDIS_URL,
+        prefix: str = ProgressStreamConfig.REDIS_CHANNEL_PREFIX
+    ):
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError:
+            raise RuntimeError("redis package not installed. Install: pip install redis")
+
+        self.url = url
+        self.prefix = prefix
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self._async_module = redis.asyncio
+        self._async_clients: Dict[int, Any] = {}
+
+    def _channel(self, scan_job_id: str) -> str:
+        return f"{self.prefix}:{scan_job_id}"
+
+    def publish(self, scan_job_id: str, event: Dict[str, Any]) -> None:
+        payload = json.dumps(event, default=str)
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.set(f"{self._channel(scan_job_id)}:latest", payload, ex=ProgressStreamConfig.SNAPSHOT_TTL_SECONDS)
+        pipeline.publish(self._channel(scan_job_id), payload)
+        pipeline.execute()
+
+    async def subscribe(self, scan_job_id: str) -> ProgressSubscription:
+        # One async client (connection pool) per event loop
+        loop_id = id(asyncio.get_running_loop())
+        client = self._async_clients.get(loop_id)
+        if client is None:
+            client = self._async_module.Redis.from_url(self.url, decode_responses=True)
+            self._async_clients[loop_id] = client
+        pubsub = client.pubsub()
+        await pubsub.subscribe(self._channel(scan_job_id))
+        return _RedisSubscription(pubsub)
+
+    def latest(self, scan_job_id: str) -> Optional[Dict[str, Any]]:
+        payload = self.client.get(f"{self._channel(scan_job_id)}:latest")
+        return json.loads(payload) if payload else None
+
+    def close(self) -> None:
+        self.client.close()
+
+
+PROGRESS_BUSES = {
+    'local': LocalProgressBus,
+    'redis': RedisProgressBus
+}
+
+
+def create_progress_bus(backend: Optional[str] = None, **options) -> ProgressBus:
+    """
+    Create a progress bus.
+
+    Args:
+        backend: 'local' or 'redis' (default: ProgressStreamConfig.BACKEND)
+        **options: Backend constructor options (url, prefix)
+
+    Returns:
+        ProgressBus instance
+    """
+    backend = backend or ProgressStreamConfig.BACKEND
+    bus_class = PROGRESS_BUSES.get(backend)
+    if bus_class is None:
+        raise ValueError(
+            f"Unknown progress bus backend: {backend} "
+            f"(supported: {', '.join(ProgressStreamConfig.BACKENDS)})"
+        )
+    return bus_class(**options)
+
+
+class ProgressPublisher:
+    """
+    Rate-limits progress events per scan before publishing them on a bus
+
+    Within a scan's interval (1 / MAX_UPDATES_PER_SECOND) later updates replace
+    the pending one, which is published when the interval ends. update() never
+    touches the bus: one background thread publishes queued events (the redis
+    bus blocks on the network) and flushes pending events when their interval
+    ends, so job listeners on the event loop stay non-blocking.
+    """
+
+    def __init__(self, bus: ProgressBus, max_updates_per_second: Optional[float] = None):
+        self.bus = bus
+        self.interval = 1.0 / (max_updates_per_second or ProgressStreamConfig.MAX_UPDATES_PER_SECOND)
+        self._condition = threading.Condition()
+        # scan_job_id -> [last publish time, pending event, scheduled flush ID]
+        self._scans: Dict[str, List[Any]] = {}
+        # Events to publish now, in order; flushes by due time: (due, flush ID, scan_job_id)
+        self._ready: Deque[Tuple[str, Dict[str, Any]]] = deque()
+        self._due: List[Tuple[float, int, str]] = []
+        self._flush_ids = itertools.count(1)
+        self._publishing = 0
+        self._thread: Optional[threading.Thread] = None
+        self.published = 0
+        self.coalesced = 0
+
+    def update(self, scan_job_id: str, event: Dict[str, Any], transition: bool = False, final: bool = False) -> None:
+        """
+        Queue or defer a progress event (never blocks on the bus)
+
+        Args:
+            scan_job_id: Scan job identifier
+            event: Progress snapshot
+            transition: Status changed (queued at once)
+            final: Terminal status; the scan's rate state is dropped
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._start_thread()
+            state = self._scans.setdefault(scan_job_id, [float('-inf'), None, None])
+            if not (transition or final) and now - state[0] < self.interval:
+                if state[1] is not None:
+                    self.coalesced += 1
+                state[1] = event
+                if state[2] is None:
+                    state[2] = next(self._flush_ids)
+                    heapq.heappush(self._due, (state[0] + self.interval, state[2], scan_job_id))
+                    self._condition.notify_all()
+                return
+            if state[1] is not None:
+                # Superseded by this event
+                self.coalesced += 1
+            if final:
+                del self._scans[scan_job_id]
+            else:
+                # A scheduled flush of the superseded event is skipped (its ID no longer matches)
+                state[0], state[1], state[2] = now, None, None
+            self._ready.append((scan_job_id, event))
+            self._condition.notify_all()
+
+    def job_changed(self, job: Any, transition: bool) -> None:
+        """JobState listener: publish the job's progress snapshot"""
+        event = job.progress_event()
+        self.update(str(job.scan_job_id), event, transition, job.is_terminal())
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been published (pending coalesced events excluded)
+
+        Args:
+            timeout: Seconds to wait (None: no limit)
+
+        Returns:
+            True if idle, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._ready and not self._publishing, timeout)
+
+    def _start_thread(self) -> None:
+        """Start the publisher thread on first use (condition held)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='progress-publisher', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Publisher thread: move due flushes to the ready queue and publish it"""
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    while self._due and self._due[0][0] <= now:
+                        _, flush_id, scan_job_id = heapq.heappop(self._due)
+                        state = self._scans.get(scan_job_id)
+                        if state is not None and state[2] == flush_id and state[1] is not None:
+                            self._ready.append((scan_job_id, state[1]))
+                            state[0], state[1], state[2] = now, None, None
+                    if self._ready:
+                        break
+                    self._condition.wait(self._due[0][0] - now if self._due else None)
+                batch = list(self._ready)
+                self._ready.clear()
+                self._publishing = len(batch)
+
+            for scan_job_id, event in batch:
+                self._publish(scan_job_id, event)
+
+            with self._condition:
+                self._publishing = 0
+                self._condition.notify_all()
+
+    def _publish(self, scan_job_id: str, event: Dict[str, Any]) -> None:
+        try:
+            self.bus.publish(scan_job_id, event)
+            self.published += 1
+        except Exception as e:
+            logger.warning(f"[WARNING] Failed to publish progress of scan {scan_job_id}: {str(e)}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Publishing counters: {'backend', 'published', 'coalesced', 'active_scans'}"""
+        with self._condition:
+            active = len(self._scans)
+        return {
+            'backend': self.bus.backend,
+            'published': self.published,
+            'coalesced': self.coalesced,
+            'active_scans': active
+        }
+
+
+# Global publisher instance (bus from ProgressStreamConfig.BACKEND)
+_progress_publisher_instance: Optional[ProgressPublisher] = None
+_progress_publisher_lock = threading.Lock()
+
+
+def get_progress_publisher() -> ProgressPublisher:
+    """Get the shared progress publisher"""
+    global _progress_publisher_instance
+    with _progress_publisher_lock:
+        if _progress_publisher_instance is None:
+            _progress_publisher_instance = ProgressPublisher(create_progress_bus())
+            logger.info(f"[OK] Progress stream enabled ({ProgressStreamConfig.BACKEND} bus)")
+        return _progress_publisher_instance
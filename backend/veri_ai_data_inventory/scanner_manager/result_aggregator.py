@@ -3,95 +3,258 @@ VeriSyntra Result Aggregator
 
 Aggregates and normalizes results from multiple scanner sources.
 Provides deduplication and统一 result format.
+
+Streaming scanners hand batches to add_item_batch() while they run; the
+aggregator keeps per-source counters and dedup keys only (never the items),
+and forwards unique items to registered sinks (job state, exporters).
+Seen keys live in a pluggable DedupStore (exact set, scalable Bloom filter
+or SQLite), see ScanManagerConfig.DEDUP_BACKEND.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Set
+import threading
+from typing import Dict, Any, List, Optional, Callable
 from collections import defaultdict
 
+from .dedup_store import DedupStore, create_dedup_store
+
 logger = logging.getLogger(__name__)
 
+# Sink receiving unique items as they are discovered: sink(source_identifier, items)
+ItemSink = Callable[[str, List[Dict[str, Any]]], None]
+
+# Natural item keys in lookup order (database tables, files, S3 objects, Azure/GCS objects)
+ITEM_KEY_FIELDS = ('full_name', 'path', 'key', 'name')
+
+# Source status while its scanner is still streaming batches
+SOURCE_STATUS_RUNNING = 'running'
+
+
+def natural_item_key(item: Dict[str, Any]) -> Optional[str]:
+    """Natural key of a discovered item (None if it has none), see ITEM_KEY_FIELDS"""
+    for field in ITEM_KEY_FIELDS:
+        value = item.get(field)
+        if value:
+            return str(value)
+    return None
+
 
 class ResultAggregator:
     """
     Aggregate results from multiple scanners into unified format.
     
     Provides deduplication, categorization, and statistics for
-    multi-source scan results.
+    multi-source scan results. Sources are keyed by source identifier,
+    so results may arrive in any order (e.g. parallel scans).
+    Thread-safe: parallel scans add batches concurrently.
     """
     
-    def __init__(self):
-        """Initialize result aggregator"""
-        self.aggregated_results: Dict[str, Any] = {
-            'sources': [],
+    def __init__(
+        self,
+        dedup_backend: Optional[str] = None,
+        dedup_store: Optional[DedupStore] = None,
+        **dedup_options
+    ):
+        """
+        Initialize result aggregator
+        
+        Args:
+            dedup_backend: 'exact', 'bloom' or 'sqlite' (default: ScanManagerConfig.DEDUP_BACKEND)
+            dedup_store: Ready-made store (overrides dedup_backend)
+            **dedup_options: Store options (e.g. error_rate, initial_capacity, path)
+        """
+        self._lock = threading.RLock()
+        self.sinks: List[ItemSink] = []
+        self.aggregated_results: Dict[str, Any] = self._empty_results()
+        self.dedup_store = dedup_store or create_dedup_store(dedup_backend, **dedup_options)
+    
+    @staticmethod
+    def _empty_results() -> Dict[str, Any]:
+        """Fresh aggregation state"""
+        return {
+            'sources': {},
             'total_items': 0,
+            'duplicate_items': 0,
             'items_by_category': defaultdict(int),
             'items_by_scanner_type': defaultdict(int),
             'errors': [],
             'metadata': {}
         }
-        self.seen_items: Set[str] = set()
     
-    def add_scanner_results(
+    def add_sink(self, sink: ItemSink) -> None:
+        """Register a consumer called with (source_identifier, unique_items) for every batch"""
+        with self._lock:
+            self.sinks.append(sink)
+    
+    def remove_sink(self, sink: ItemSink) -> None:
+        """Unregister a consumer added with add_sink()"""
+        with self._lock:
+            if sink in self.sinks:
+                self.sinks.remove(sink)
+    
+    def start_source(
         self,
+        source_identifier: str,
         scanner_type: str,
-        scanner_category: str,
-        results: Dict[str, Any],
-        source_identifier: str = ''
+        scanner_category: str
     ) -> None:
         """
-        Add results from a scanner.
+        Register a source before its scanner starts streaming batches.
         
         Args:
+            source_identifier: Unique identifier of the source in this aggregation
             scanner_type: Type of scanner (postgresql, s3, etc.)
             scanner_category: Category (database, cloud, filesystem)
-            results: Scanner results dictionary
-            source_identifier: Optional identifier for the source
         """
-        if results.get('status') == 'error':
-            self.aggregated_results['errors'].append({
+        with self._lock:
+            self.aggregated_results['sources'][source_identifier] = {
                 'scanner_type': scanner_type,
-                'source': source_identifier,
-                'error': results.get('message', 'Unknown error')
-            })
-            logger.warning(
-                f"[WARNING] Scanner {scanner_type} returned error: "
-                f"{results.get('message')}"
-            )
-            return
+                'scanner_category': scanner_category,
+                'source_identifier': source_identifier,
+                'item_count': 0,
+                'duplicate_count': 0,
+                'status': SOURCE_STATUS_RUNNING,
+                'partial': False
+            }
+    
+    def add_item_batch(
+        self,
+        source_identifier: str,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Consume one batch of discovered items from a running source.
         
-        # Extract item count
-        item_count = results.get('count', 0)
-        if item_count == 0:
-            # Try alternative count fields
-            data = results.get('data', {})
-            if isinstance(data, dict):
-                item_count = (
-                    len(data.get('tables', [])) +
-                    len(data.get('objects', [])) +
-                    len(data.get('files', []))
-                )
+        Duplicates (same natural key within the source) are dropped; unique
+        items are counted and forwarded to sinks, then released.
         
-        # Add to source list
-        source_entry = {
-            'scanner_type': scanner_type,
-            'scanner_category': scanner_category,
-            'source_identifier': source_identifier,
-            'item_count': item_count,
-            'status': results.get('status', 'success')
-        }
-        self.aggregated_results['sources'].append(source_entry)
+        Args:
+            source_identifier: Source registered with start_source()
+            items: Discovered item dicts (tables, objects, blobs or files)
+            
+        Returns:
+            Unique items of the batch (empty if the source is not running)
+        """
+        with self._lock:
+            source = self.aggregated_results['sources'].get(source_identifier)
+            if source is None or source['status'] != SOURCE_STATUS_RUNNING:
+                # Late batch from an abandoned or already finished scan
+                logger.debug(f"[INFO] Ignoring batch for inactive source: {source_identifier}")
+                return []
+            
+            keyed = []
+            unique_items = []
+            for item in items:
+                item_key = natural_item_key(item)
+                if item_key is None:
+                    unique_items.append(item)
+                else:
+                    keyed.append((f"{source_identifier}\x1f{item_key}", item))
+            
+            added = self.dedup_store.add_many(item_key for item_key, _ in keyed)
+            unique_items.extend(item for (_, item), is_new in zip(keyed, added) if is_new)
+            
+            duplicates = len(items) - len(unique_items)
+            source['item_count'] += len(unique_items)
+            source['duplicate_count'] += duplicates
+            self.aggregated_results['total_items'] += len(unique_items)
+            self.aggregated_results['duplicate_items'] += duplicates
+            self.aggregated_results['items_by_category'][source['scanner_category']] += len(unique_items)
+            self.aggregated_results['items_by_scanner_type'][source['scanner_type']] += len(unique_items)
+            sinks = list(self.sinks)
+        
+        for sink in sinks:
+            try:
+                sink(source_identifier, unique_items)
+            except Exception as e:
+                logger.error(f"[ERROR] Result sink failed for {source_identifier}: {str(e)}")
+        
+        return unique_items
+    
+    def finish_source(
+        self,
+        source_identifier: str,
+        results: Dict[str, Any]
+    ) -> None:
+        """
+        Record the final status of a streamed source.
         
-        # Update counters
-        self.aggregated_results['total_items'] += item_count
-        self.aggregated_results['items_by_category'][scanner_category] += item_count
-        self.aggregated_results['items_by_scanner_type'][scanner_type] += item_count
+        Args:
+            source_identifier: Source registered with start_source()
+            results: Scanner response (status, message, partial, count)
+        """
+        with self._lock:
+            source = self.aggregated_results['sources'].get(source_identifier)
+            if source is None or source['status'] != SOURCE_STATUS_RUNNING:
+                return
+            
+            source['status'] = results.get('status', 'success')
+            source['partial'] = bool(results.get('partial', False))
+            
+            if source['status'] == 'error':
+                self.aggregated_results['errors'].append({
+                    'scanner_type': source['scanner_type'],
+                    'source': source_identifier,
+                    'error': results.get('message', 'Unknown error')
+                })
+                logger.warning(
+                    f"[WARNING] Scanner {source['scanner_type']} returned error: "
+                    f"{results.get('message')}"
+                )
+                return
         
         logger.info(
-            f"[OK] Added {item_count} items from {scanner_type} "
-            f"({scanner_category})"
+            f"[OK] Added {source['item_count']} items from {source['scanner_type']} "
+            f"({source['scanner_category']})"
         )
     
+    def add_scanner_results(
+        self,
+        scanner_type: str,
+        scanner_category: str,
+        results: Dict[str, Any],
+        source_identifier: str = ''
+    ) -> None:
+        """
+        Add results from a scanner.
+        
+        Non-streaming counterpart of start_source()/add_item_batch()/finish_source():
+        counts are taken from the complete scanner response.
+        
+        Args:
+            scanner_type: Type of scanner (postgresql, s3, etc.)
+            scanner_category: Category (database, cloud, filesystem)
+            results: Scanner results dictionary
+            source_identifier: Optional identifier for the source
+        """
+        with self._lock:
+            if not source_identifier:
+                source_identifier = f"{scanner_type}-{len(self.aggregated_results['sources']) + 1}"
+            
+            if source_identifier not in self.aggregated_results['sources']:
+                self.start_source(source_identifier, scanner_type, scanner_category)
+            source = self.aggregated_results['sources'][source_identifier]
+            
+            if results.get('status') != 'error' and source['item_count'] == 0:
+                # Extract item count
+                item_count = results.get('count', 0)
+                if item_count == 0:
+                    # Try alternative count fields
+                    data = results.get('data', {})
+                    if isinstance(data, dict):
+                        item_count = sum(
+                            len(data.get(key, []))
+                            for key in ('tables', 'objects', 'blobs', 'files')
+                        )
+                
+                # Update counters
+                source['item_count'] = item_count
+                self.aggregated_results['total_items'] += item_count
+                self.aggregated_results['items_by_category'][scanner_category] += item_count
+                self.aggregated_results['items_by_scanner_type'][scanner_type] += item_count
+            
+            self.finish_source(source_identifier, results)
+    
     def deduplicate_items(
         self,
         items: List[Dict[str, Any]],
@@ -109,19 +272,13 @@ class ResultAggregator:
         """
         unique_items = []
         
-        for item in items:
-            item_key = item.get(key_field, '')
-            
-            if not item_key:
-                # No key field, include anyway
-                unique_items.append(item)
-                continue
-            
-            if item_key not in self.seen_items:
-                self.seen_items.add(item_key)
-                unique_items.append(item)
-            else:
-                logger.debug(f"[INFO] Skipping duplicate item: {item_key}")
+        with self._lock:
+            for item in items:
+                item_key = item.get(key_field, '')
+                
+                # Items without a key field are included anyway
+                if not item_key or self.dedup_store.add(str(item_key)):
+                    unique_items.append(item)
         
         if len(items) > len(unique_items):
             logger.info(
@@ -136,18 +293,21 @@ class ResultAggregator:
         Get the final aggregated results.
         
         Returns:
-            Aggregated results dictionary
+            Aggregated results dictionary (sources in registration order)
         """
-        return {
-            'sources': self.aggregated_results['sources'],
-            'total_items': self.aggregated_results['total_items'],
-            'items_by_category': dict(self.aggregated_results['items_by_category']),
-            'items_by_scanner_type': dict(self.aggregated_results['items_by_scanner_type']),
-            'total_sources': len(self.aggregated_results['sources']),
-            'total_errors': len(self.aggregated_results['errors']),
-            'errors': self.aggregated_results['errors'],
-            'metadata': self.aggregated_results['metadata']
-        }
+        with self._lock:
+            sources = [dict(source) for source in self.aggregated_results['sources'].values()]
+            return {
+                'sources': sources,
+                'total_items': self.aggregated_results['total_items'],
+                'duplicate_items': self.aggregated_results['duplicate_items'],
+                'items_by_category': dict(self.aggregated_results['items_by_category']),
+                'items_by_scanner_type': dict(self.aggregated_results['items_by_scanner_type']),
+                'total_sources': len(sources),
+                'total_errors': len(self.aggregated_results['errors']),
+                'errors': list(self.aggregated_results['errors']),
+                'metadata': self.aggregated_results['metadata']
+            }
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -156,22 +316,28 @@ class ResultAggregator:
         Returns:
             Statistics dictionary
         """
-        total_sources = len(self.aggregated_results['sources'])
-        successful_sources = sum(
-            1 for s in self.aggregated_results['sources']
-            if s['status'] == 'success'
-        )
-        
-        return {
-            'total_sources': total_sources,
-            'successful_sources': successful_sources,
-            'failed_sources': len(self.aggregated_results['errors']),
-            'success_rate': (successful_sources / total_sources * 100) if total_sources > 0 else 0.0,
-            'total_items_discovered': self.aggregated_results['total_items'],
-            'unique_items': len(self.seen_items),
-            'categories': list(self.aggregated_results['items_by_category'].keys()),
-            'scanner_types': list(self.aggregated_results['items_by_scanner_type'].keys())
-        }
+        with self._lock:
+            sources = list(self.aggregated_results['sources'].values())
+            total_sources = len(sources)
+            successful_sources = sum(1 for s in sources if s['status'] == 'success')
+            dedup_statistics = self.dedup_store.get_statistics()
+            
+            return {
+                'total_sources': total_sources,
+                'successful_sources': successful_sources,
+                'failed_sources': len(self.aggregated_results['errors']),
+                'partial_sources': sum(1 for s in sources if s['partial']),
+                'success_rate': (successful_sources / total_sources * 100) if total_sources > 0 else 0.0,
+                'total_items_discovered': self.aggregated_results['total_items'],
+                'duplicate_items': self.aggregated_results['duplicate_items'],
+                'unique_items': dedup_statistics['unique_keys'],
+                'duplicate_rate': dedup_statistics['duplicate_rate'],
+                'dedup_backend': dedup_statistics['backend'],
+                'dedup_memory_bytes': dedup_statistics['memory_bytes'],
+                'dedup': dedup_statistics,
+                'categories': list(self.aggregated_results['items_by_category'].keys()),
+                'scanner_types': list(self.aggregated_results['items_by_scanner_type'].keys())
+            }
     
     def merge_metadata(
         self,
@@ -185,24 +351,24 @@ class ResultAggregator:
             scanner_type: Scanner type identifier
             metadata: Metadata dictionary to merge
         """
-        if scanner_type not in self.aggregated_results['metadata']:
-            self.aggregated_results['metadata'][scanner_type] = []
-        
-        self.aggregated_results['metadata'][scanner_type].append(metadata)
+        with self._lock:
+            if scanner_type not in self.aggregated_results['metadata']:
+                self.aggregated_results['metadata'][scanner_type] = []
+            
+            self.aggregated_results['metadata'][scanner_type].append(metadata)
     
     def clear(self) -> None:
-        """Clear all aggregated results"""
-        self.aggregated_results = {
-            'sources': [],
-            'total_items': 0,
-            'items_by_category': defaultdict(int),
-            'items_by_scanner_type': defaultdict(int),
-            'errors': [],
-            'metadata': {}
-        }
-        self.seen_items.clear()
+        """Clear all aggregated results (registered sinks are kept)"""
+        with self._lock:
+            self.aggregated_results = self._empty_results()
+            self.dedup_store.clear()
         logger.info("[OK] Result aggregator cleared")
     
+    def close(self) -> None:
+        """Release the dedup store (removes a temporary SQLite database)"""
+        with self._lock:
+            self.dedup_store.close()
+    
     @staticmethod
     def normalize_database_results(results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -0,0 +1,478 @@
+"""
+VeriSyntra Scan Result Store
+
+Every asset a scan discovers is written to a per-job result file, so job
+state only keeps a capped preview, summary statistics and a pointer to the
+file. The results API pages through the file with filters (extension,
+Vietnamese file name, size range, PII category, asset type):
+
+- 'parquet' / 'arrow': columnar Parquet or Arrow IPC file written one row
+  group per ResultStoreConfig.ROW_GROUP_SIZE assets (requires pyarrow);
+  filters are pushed down to the row groups
+- 'sqlite': one SQLite table per job (standard library only), for
+  deployments without pyarrow
+
+Each asset gets a sequential row number; pages are requested with the row
+number to continue from (cursor), so a page never re-reads earlier rows.
+Result files older than APIConfig.TASK_RETENTION_HOURS are deleted.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Flexible import pattern
+try:
+    from ..config import APIConfig, ResultStoreConfig, resolve_data_path
+    from ..utils.utf8_validator import UTF8Validator
+except ImportError:
+    from config.constants import APIConfig, ResultStoreConfig, resolve_data_path
+    from utils.utf8_validator import UTF8Validator
+
+logger = logging.getLogger(__name__)
+
+# File extension per result format
+RESULT_FORMATS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+    'sqlite': '.sqlite'
+}
+
+# Asset fields stored as columns; any other asset field goes to 'extra' (JSON)
+ASSET_COLUMNS = [
+    'asset_type', 'asset_name', 'asset_path', 'size_bytes', 'row_count',
+    'column_count', 'has_vietnamese_data', 'pdpl_sensitive', 'pii_categories'
+]
+INTEGER_COLUMNS = ['size_bytes', 'row_count', 'column_count']
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def result_row(asset: Dict[str, Any], row: int) -> Dict[str, Any]:
+    """
+    Flatten an asset into a result row.
+
+    Args:
+        asset: Discovered asset (ScanService asset dict)
+        row: Sequential row number of the asset in its job
+
+    Returns:
+        Row with the stored columns plus derived 'extension' and 'vietnamese_name'
+    """
+    name = asset.get('asset_name') or asset.get('asset_path') or ''
+    base_name = name.replace('\\', '/').rsplit('/', 1)[-1]
+    extension = os.path.splitext(base_name)[1].lower() if asset.get('asset_type') != 'table' else ''
+    categories = asset.get('pii_categories') or []
+    extra = {key: value for key, value in asset.items() if key not in ASSET_COLUMNS}
+    return {
+        'row': row,
+        'asset_type': asset.get('asset_type', ''),
+        'asset_name': asset.get('asset_name', ''),
+        'asset_path': asset.get('asset_path') or '',
+        'extension': extension,
+        'size_bytes': _to_int(asset.get('size_bytes')),
+        'row_count': _to_int(asset.get('row_count')),
+        'column_count': _to_int(asset.get('column_count')),
+        'has_vietnamese_data': bool(asset.get('has_vietnamese_data')),
+        'vietnamese_name': UTF8Validator.contains_vietnamese(base_name),
+        'pdpl_sensitive': bool(asset.get('pdpl_sensitive')),
+        # Delimited on both ends so a category matches as a substring
+        'pii_categories': ''.join(f'|{category}' for category in categories) + '|' if categories else '',
+        'extra': json.dumps(extra, default=str) if extra else ''
+    }
+
+
+def row_asset(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the asset of a stored result row (with 'extension' and 'vietnamese_name')"""
+    asset = {
+        'asset_type': row['asset_type'],
+        'asset_name': row['asset_name'],
+        'asset_path': row['asset_path'],
+        'size_bytes': row['size_bytes'],
+        'has_vietnamese_data': bool(row['has_vietnamese_data']),
+        'pdpl_sensitive': bool(row['pdpl_sensitive']),
+        'extension': row['extension'],
+        'vietnamese_name': bool(row['vietnamese_name']),
+        'pii_categories': [category for category in (row['pii_categories'] or '').split('|') if category]
+    }
+    for key in ('row_count', 'column_count'):
+        if row[key] is not None:
+            asset[key] = row[key]
+    if row['extra']:
+        asset.update(json.loads(row['extra']))
+    return asset
+
+
+def normalize_filters(filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Validate result filters.
+
+    Args:
+        filters: {'extensions': [...], 'vietnamese_name': bool, 'min_size': int,
+                  'max_size': int, 'pii_category': str, 'asset_type': str} (all optional)
+
+    Returns:
+        Filters without unset entries; extensions lower-case with a leading dot
+    """
+    normalized = {key: value for key, value in (filters or {}).items() if value not in (None, '', [])}
+    if 'extensions' in normalized:
+        normalized['extensions'] = [
+            extension.lower() if extension.startswith('.') else f'.{extension.lower()}'
+            for extension in normalized['extensions']
+        ]
+    return normalized
+
+
+def row_matches(row: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Whether a result row passes normalized filters (in-memory preview)"""
+    if 'extensions' in filters and row['extension'] not in filters['extensions']:
+        return False
+    if 'vietnamese_name' in filters and row['vietnamese_name'] != filters['vietnamese_name']:
+        return False
+    if 'min_size' in filters and (row['size_bytes'] is None or row['size_bytes'] < filters['min_size']):
+        return False
+    if 'max_size' in filters and (row['size_bytes'] is None or row['size_bytes'] > filters['max_size']):
+        return False
+    if 'pii_category' in filters and f"|{filters['pii_category']}|" not in row['pii_categories']:
+        return False
+    if 'asset_type' in filters and row['asset_type'] != filters['asset_type']:
+        return False
+    return True
+
+
+class ResultSummary:
+    """Summary statistics of a job's results, updated as assets are written"""
+
+    def __init__(self):
+        self.total_assets = 0
+        self.total_bytes = 0
+        self.asset_types: Counter = Counter()
+        self.extensions: Counter = Counter()
+        self.pii_categories: Counter = Counter()
+        self.vietnamese_data = 0
+        self.vietnamese_names = 0
+        self.pdpl_sensitive = 0
+
+    def add(self, row: Dict[str, Any]) -> None:
+        self.total_assets += 1
+        self.total_bytes += row['size_bytes'] or 0
+        self.asset_types[row['asset_type']] += 1
+        if row['extension']:
+            self.extensions[row['extension']] += 1
+        for category in row['pii_categories'].split('|'):
+            if category:
+                self.pii_categories[category] += 1
+        self.vietnamese_data += row['has_vietnamese_data']
+        self.vietnamese_names += row['vietnamese_name']
+        self.pdpl_sensitive += row['pdpl_sensitive']
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total_assets': self.total_assets,
+            'total_bytes': self.total_bytes,
+            'asset_types': dict(self.asset_types),
+            'extensions': dict(self.extensions.most_common(ResultStoreConfig.SUMMARY_TOP_EXTENSIONS)),
+            'pii_categories': dict(self.pii_categories),
+            'vietnamese_data': self.vietnamese_data,
+            'vietnamese_names': self.vietnamese_names,
+            'pdpl_sensitive': self.pdpl_sensitive
+        }
+
+
+class ResultWriter:
+    """
+    Appends a job's assets to its result file. Subclasses implement _write_rows and _finish.
+
+    Not thread-safe: one scan writes its file from one task at a time.
+    """
+
+    format = ''
+
+    def __init__(self, path: str):
+        self.path = path
+        self.summary = ResultSummary()
+        self._buffer: List[Dict[str, Any]] = []
+        self._closed = False
+
+    @property
+    def result_file(self) -> Dict[str, str]:
+        """Pointer kept in job state"""
+        return {'path': self.path, 'format': self.format}
+
+    def append(self, assets: List[Dict[str, Any]]) -> None:
+        """Buffer assets; full row groups are written to the file"""
+        for asset in assets:
+            row = result_row(asset, self.summary.total_assets)
+            self.summary.add(row)
+            self._buffer.append(row)
+        while len(self._buffer) >= ResultStoreConfig.ROW_GROUP_SIZE:
+            self._write_rows(self._buffer[:ResultStoreConfig.ROW_GROUP_SIZE])
+            del self._buffer[:ResultStoreConfig.ROW_GROUP_SIZE]
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Write buffered rows and finish the file.
+
+        Returns:
+            Summary statistics of the written assets
+        """
+        if not self._closed:
+            if self._buffer:
+                self._write_rows(self._buffer)
+                self._buffer = []
+            self._finish()
+            self._closed = True
+            logger.info(f"[OK] Wrote {self.summary.total_assets} scan results to {self.path}")
+        return self.summary.to_dict()
+
+    def discard(self) -> None:
+        """Close and delete the file (scan failed)"""
+        if not self._closed:
+            self._buffer = []
+            self._finish()
+            self._closed = True
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def _finish(self) -> None:
+        raise NotImplementedError
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.dataset
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("pyarrow package not installed. Install: pip install pyarrow")
+    return pyarrow
+
+
+def _arrow_schema(pa: Any) -> Any:
+    return pa.schema([
+        ('row', pa.int64()),
+        ('asset_type', pa.string()),
+        ('asset_name', pa.string()),
+        ('asset_path', pa.string()),
+        ('extension', pa.string()),
+        ('size_bytes', pa.int64()),
+        ('row_count', pa.int64()),
+        ('column_count', pa.int64()),
+        ('has_vietnamese_data', pa.bool_()),
+        ('vietnamese_name', pa.bool_()),
+        ('pdpl_sensitive', pa.bool_()),
+        ('pii_categories', pa.string()),
+        ('extra', pa.string())
+    ])
+
+
+class ArrowResultWriter(ResultWriter):
+    """Columnar result file: Parquet (format 'parquet') or Arrow IPC (format 'arrow')"""
+
+    def __init__(self, path: str, format: str = 'parquet'):
+        super().__init__(path)
+        self._pa = _import_pyarrow()
+        self.format = format
+        self._schema = _arrow_schema(self._pa)
+        if format == 'parquet':
+            self._writer = self._pa.parquet.ParquetWriter(
+                path,
+                self._schema,
+                compression=ResultStoreConfig.PARQUET_COMPRESSION
+            )
+        else:
+            self._writer = self._pa.ipc.new_file(path, self._schema)
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def _finish(self) -> None:
+        self._writer.close()
+
+
+class SQLiteResultWriter(ResultWriter):
+    """Row-oriented result file for deployments without pyarrow"""
+
+    format = 'sqlite'
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "row INTEGER PRIMARY KEY, asset_type TEXT, asset_name TEXT, asset_path TEXT, "
+                "extension TEXT, size_bytes INTEGER, row_count INTEGER, column_count INTEGER, "
+                "has_vietnamese_data INTEGER, vietnamese_name INTEGER, pdpl_sensitive INTEGER, "
+                "pii_categories TEXT, extra TEXT)"
+            )
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO results VALUES (:row, :asset_type, :asset_name, :asset_path, :extension, "
+                ":size_bytes, :row_count, :column_count, :has_vietnamese_data, :vietnamese_name, "
+                ":pdpl_sensitive, :pii_categories, :extra)",
+                rows
+            )
+
+    def _finish(self) -> None:
+        self._connection.close()
+
+
+def open_result_writer(scan_job_id: Any, format: Optional[str] = None) -> ResultWriter:
+    """
+    Create the result file of a scan job (replacing an earlier one).
+
+    Result files past their retention are deleted first.
+
+    Args:
+        scan_job_id: Scan job identifier
+        format: 'parquet', 'arrow' or 'sqlite' (default: ResultStoreConfig.FORMAT)
+
+    Returns:
+        ResultWriter for the job
+
+    Raises:
+        ValueError: If the format is unknown
+        RuntimeError: If the format needs pyarrow and it is not installed
+    """
+    format = format or ResultStoreConfig.FORMAT
+    if format not in RESULT_FORMATS:
+        raise ValueError(
+            f"Unknown result format: {format} "
+            f"(supported: {', '.join(RESULT_FORMATS)})"
+        )
+    if format != 'sqlite':
+        _import_pyarrow()
+    directory = resolve_data_path(ResultStoreConfig.DIRECTORY)
+    os.makedirs(directory, exist_ok=True)
+    delete_expired_results()
+    path = os.path.join(directory, f"{scan_job_id}{RESULT_FORMATS[format]}")
+    if os.path.exists(path):
+        os.remove(path)
+    if format == 'sqlite':
+        return SQLiteResultWriter(path)
+    return ArrowResultWriter(path, format)
+
+
+def read_results(
+    result_file: Dict[str, str],
+    filters: Optional[Dict[str, Any]] = None,
+    cursor: int = 0,
+    limit: int = ResultStoreConfig.DEFAULT_PAGE_SIZE
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Read one page of a finished job's results.
+
+    Args:
+        result_file: Pointer from job state ({'path', 'format'})
+        filters: Result filters (see normalize_filters)
+        cursor: Row number to continue from (0 = first page)
+        limit: Maximum assets in the page
+
+    Returns:
+        (assets, cursor of the next page or None on the last page)
+    """
+    filters = normalize_filters(filters)
+    if result_file['format'] == 'sqlite':
+        rows = _read_sqlite(result_file['path'], filters, cursor, limit + 1)
+    else:
+        rows = _read_arrow(result_file['path'], result_file['format'], filters, cursor, limit + 1)
+    next_cursor = rows[limit]['row'] if len(rows) > limit else None
+    return [row_asset(row) for row in rows[:limit]], next_cursor
+
+
+def _read_arrow(path: str, format: str, filters: Dict[str, Any], cursor: int, count: int) -> List[Dict[str, Any]]:
+    pa = _import_pyarrow()
+    field = pa.dataset.field
+    expression = field('row') >= cursor
+    if 'extensions' in filters:
+        expression &= field('extension').isin(filters['extensions'])
+    if 'vietnamese_name' in filters:
+        expression &= field('vietnamese_name') == filters['vietnamese_name']
+    if 'min_size' in filters:
+        expression &= field('size_bytes') >= filters['min_size']
+    if 'max_size' in filters:
+        expression &= field('size_bytes') <= filters['max_size']
+    if 'pii_category' in filters:
+        expression &= pa.compute.match_substring(field('pii_categories'), f"|{filters['pii_category']}|")
+    if 'asset_type' in filters:
+        expression &= field('asset_type') == filters['asset_type']
+
+    dataset = pa.dataset.dataset(path, format='parquet' if format == 'parquet' else 'ipc')
+    rows: List[Dict[str, Any]] = []
+    for batch in dataset.to_batches(filter=expression, batch_size=max(count, 1024)):
+        rows.extend(batch.to_pylist())
+        if len(rows) >= count:
+            break
+    return rows[:count]
+
+
+def _read_sqlite(path: str, filters: Dict[str, Any], cursor: int, count: int) -> List[Dict[str, Any]]:
+    clauses, params = ["row >= ?"], [cursor]
+    if 'extensions' in filters:
+        clauses.append(f"extension IN ({', '.join('?' * len(filters['extensions']))})")
+        params.extend(filters['extensions'])
+    if 'vietnamese_name' in filters:
+        clauses.append("vietnamese_name = ?")
+        params.append(int(filters['vietnamese_name']))
+    if 'min_size' in filters:
+        clauses.append("size_bytes >= ?")
+        params.append(filters['min_size'])
+    if 'max_size' in filters:
+        clauses.append("size_bytes <= ?")
+        params.append(filters['max_size'])
+    if 'pii_category' in filters:
+        clauses.append("instr(pii_categories, ?) > 0")
+        params.append(f"|{filters['pii_category']}|")
+    if 'asset_type' in filters:
+        clauses.append("asset_type = ?")
+        params.append(filters['asset_type'])
+
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        connection.row_factory = sqlite3.Row
+        result = connection.execute(
+            f"SELECT * FROM results WHERE {' AND '.join(clauses)} ORDER BY row LIMIT ?",
+            params + [count]
+        )
+        return [dict(row) for row in result]
+    finally:
+        connection.close()
+
+
+def delete_expired_results() -> int:
+    """Delete result files older than APIConfig.TASK_RETENTION_HOURS; returns how many"""
+    cutoff = time.time() - APIConfig.TASK_RETENTION_HOURS * 3600
+    removed = 0
+    try:
+        entries = list(os.scandir(resolve_data_path(ResultStoreConfig.DIRECTORY)))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        if os.path.splitext(entry.name)[1] not in RESULT_FORMATS.values():
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError as e:
+            logger.warning(f"[WARNING] Could not delete expired result file {entry.path}: {str(e)}")
+    if removed:
+        logger.info(f"[OK] Deleted {removed} expired result files")
+    return removed
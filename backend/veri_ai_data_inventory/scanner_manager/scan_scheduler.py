@@ -0,0 +1,235 @@
+"""
+VeriSyntra Scan Scheduler
+
+Admission control for scans run by the API process. A scan starts only when
+the global limit (ScanManagerConfig.MAX_CONCURRENT_SCANS), its tenant's limit
+and its source's limit all have room; waiting scans are ordered by:
+
+1. priority level (ScanManagerConfig.SCAN_PRIORITIES, on-demand before scheduled)
+2. start-time fair queuing between tenants: each scan gets the virtual start
+   tag max(virtual time, tenant's previous finish tag) and advances its
+   tenant's finish tag by 1 / weight, so a tenant queuing 50 scans gets its
+   share of starts instead of the next 50
+3. submission order
+
+A waiting scan blocked by its tenant or source limit is passed over, not
+waited for. The scheduler is used from the API event loop.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+# Flexible import pattern
+try:
+    from ..config import ScanConfig, ScanManagerConfig
+except ImportError:
+    from config.constants import ScanConfig, ScanManagerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class _Ticket:
+    """A scan waiting for or holding a slot"""
+
+    def __init__(self, job_id: Any, tenant_id: str, source_key: str, priority: int, start_tag: float, seq: int):
+        self.job_id = job_id
+        self.tenant_id = tenant_id
+        self.source_key = source_key
+        self.priority = priority
+        self.start_tag = start_tag
+        self.seq = seq
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.started_at: Optional[float] = None
+
+    def order(self) -> tuple:
+        return self.priority, self.start_tag, self.seq
+
+
+class ScanScheduler:
+    """Fair, priority-aware admission of concurrent scans"""
+
+    def __init__(self, max_concurrent: Optional[int] = None):
+        """
+        Initialize scan scheduler
+
+        Args:
+            max_concurrent: Scans running at the same time (default: ScanManagerConfig.MAX_CONCURRENT_SCANS)
+        """
+        self.max_concurrent = max_concurrent or ScanManagerConfig.MAX_CONCURRENT_SCANS
+        self.waiting: Dict[Any, _Ticket] = {}
+        self.running: Dict[Any, _Ticket] = {}
+        self._virtual_time = 0.0
+        self._tenant_finish: Dict[str, float] = {}
+        self._seq = itertools.count()
+        self._average_duration = float(ScanConfig.ESTIMATED_SCAN_TIME_SECONDS)
+
+    @staticmethod
+    def tenant_limit(tenant_id: str) -> int:
+        """Concurrent scan quota of a tenant"""
+        return ScanManagerConfig.TENANT_SCAN_QUOTAS.get(tenant_id, ScanManagerConfig.MAX_CONCURRENT_SCANS_PER_TENANT)
+
+    async def acquire(
+        self,
+        job_id: Any,
+        tenant_id: Any,
+        source_key: str,
+        priority: Optional[str] = None
+    ) -> bool:
+        """
+        Wait until the scan may start
+
+        Args:
+            job_id: Scan job identifier
+            tenant_id: Tenant owning the scan
+            source_key: Physical source identity (per-source limit)
+            priority: Priority level (default: ScanManagerConfig.DEFAULT_SCAN_PRIORITY)
+
+        Returns:
+            True when the scan holds a slot (call release() when done);
+            False if it was withdrawn while waiting
+
+        Raises:
+            ValueError: If the priority level is unknown
+        """
+        priority = priority or ScanManagerConfig.DEFAULT_SCAN_PRIORITY
+        if priority not in ScanManagerConfig.SCAN_PRIORITIES:
+            raise ValueError(
+                f"Unknown scan priority: {priority} "
+                f"(supported: {', '.join(ScanManagerConfig.SCAN_PRIORITIES)})"
+            )
+        tenant_id = str(tenant_id)
+        weight = ScanManagerConfig.TENANT_SCHEDULING_WEIGHTS.get(tenant_id, 1.0)
+        start_tag = max(self._virtual_time, self._tenant_finish.get(tenant_id, 0.0))
+        self._tenant_finish[tenant_id] = start_tag + 1.0 / weight
+
+        ticket = _Ticket(
+            job_id,
+            tenant_id,
+            source_key,
+            ScanManagerConfig.SCAN_PRIORITIES.index(priority),
+            start_tag,
+            next(self._seq)
+        )
+        self.waiting[job_id] = ticket
+        self._dispatch()
+        if not ticket.future.done():
+            logger.info(
+                f"[OK] Scan job {job_id} queued by scheduler "
+                f"(position {self._position(ticket)}, priority {priority})"
+            )
+        try:
+            return await ticket.future
+        except asyncio.CancelledError:
+            if self.waiting.pop(job_id, None) is None:
+                self.release(job_id)
+            raise
+
+    def release(self, job_id: Any) -> None:
+        """Free the slot of a finished scan and start the next waiting scans"""
+        ticket = self.running.pop(job_id, None)
+        if ticket is None:
+            return
+        duration = time.monotonic() - ticket.started_at
+        self._average_duration += ScanManagerConfig.SCAN_DURATION_SMOOTHING * (duration - self._average_duration)
+        self._dispatch()
+
+    def withdraw(self, job_id: Any) -> bool:
+        """Remove a waiting scan (its acquire() returns False); False if it is not waiting"""
+        ticket = self.waiting.pop(job_id, None)
+        if ticket is None:
+            return False
+        ticket.future.set_result(False)
+        return True
+
+    def get_queue_info(self, job_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Queue position and estimated start of a waiting scan
+
+        The estimate assumes running and earlier waiting scans take the moving
+        average scan duration and ignores tenant and source limits.
+
+        Returns:
+            {'queue_position': int (1 = next), 'estimated_start': datetime, 'priority': str}
+            or None if the scan is not waiting
+        """
+        ticket = self.waiting.get(job_id)
+        if ticket is None:
+            return None
+        position = self._position(ticket)
+
+        # Free times of the slots, filled by the scans ahead in order
+        now = time.monotonic()
+        slots = [
+            max(running.started_at + self._average_duration - now, 0.0)
+            for running in self.running.values()
+        ]
+        slots += [0.0] * max(self.max_concurrent - len(slots), 0)
+        heapq.heapify(slots)
+        for _ in range(position - 1):
+            heapq.heapreplace(slots, slots[0] + self._average_duration)
+
+        return {
+            'queue_position': position,
+            'estimated_start': datetime.utcnow() + timedelta(seconds=slots[0]),
+            'priority': ScanManagerConfig.SCAN_PRIORITIES[ticket.priority]
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Running and waiting scans per tenant"""
+        tenants: Dict[str, Dict[str, int]] = {}
+        for state, tickets in (('running', self.running), ('waiting', self.waiting)):
+            for ticket in tickets.values():
+                counts = tenants.setdefault(ticket.tenant_id, {'running': 0, 'waiting': 0})
+                counts[state] += 1
+        return {
+            'max_concurrent': self.max_concurrent,
+            'running': len(self.running),
+            'waiting': len(self.waiting),
+            'average_duration_seconds': round(self._average_duration, 1),
+            'tenants': tenants
+        }
+
+    def _position(self, ticket: _Ticket) -> int:
+        order = ticket.order()
+        return 1 + sum(1 for other in self.waiting.values() if other.order() < order)
+
+    def _dispatch(self) -> None:
+        """Start waiting scans in fair order while slots and limits allow"""
+        while len(self.running) < self.max_concurrent:
+            tenant_running: Dict[str, int] = {}
+            source_running: Dict[str, int] = {}
+            for running in self.running.values():
+                tenant_running[running.tenant_id] = tenant_running.get(running.tenant_id, 0) + 1
+                source_running[running.source_key] = source_running.get(running.source_key, 0) + 1
+
+            eligible: List[_Ticket] = [
+                ticket for ticket in self.waiting.values()
+                if tenant_running.get(ticket.tenant_id, 0) < self.tenant_limit(ticket.tenant_id)
+                and source_running.get(ticket.source_key, 0) < ScanManagerConfig.MAX_CONCURRENT_SCANS_PER_SOURCE
+            ]
+            if not eligible:
+                return
+
+            ticket = min(eligible, key=_Ticket.order)
+            del self.waiting[ticket.job_id]
+            self._virtual_time = max(self._virtual_time, ticket.start_tag)
+            ticket.started_at = time.monotonic()
+            self.running[ticket.job_id] = ticket
+            ticket.future.set_result(True)
+
+
+# Global scheduler instance (shared by the API's scans)
+_scan_scheduler_instance: Optional[ScanScheduler] = None
+
+
+def get_scan_scheduler() -> ScanScheduler:
+    """Get the shared scan scheduler"""
+    global _scan_scheduler_instance
+    if _scan_scheduler_instance is None:
+        _scan_scheduler_instance = ScanScheduler()
+    return _scan_scheduler_instance
@@ -5,7 +5,7 @@ Defines the standard interface that all scanners must implement.
 This ensures consistent behavior across database, cloud, and filesystem scanners.
 """
 
-from typing import Protocol, Dict, Any, Optional
+from typing import Protocol, Dict, Any, Iterator, List, Optional
 
 
 class ScannerInterface(Protocol):
@@ -77,6 +77,51 @@ class ScannerInterface(Protocol):
         ...
 
 
+class StreamingScannerInterface(Protocol):
+    """
+    Protocol for scanners that stream discovered items in batches.
+    
+    Instead of building the complete tables/objects/files list before returning,
+    streaming scanners yield bounded batches as they are found, so consumers
+    (ResultAggregator, job state, exporters) see items during the scan.
+    Database, cloud and filesystem scanners all implement it.
+    """
+    
+    ITEM_KEY: str
+    """Result key of discovered items: 'tables', 'objects', 'blobs' or 'files'"""
+    
+    def iter_discovery_batches(
+        self,
+        batch_size: int,
+        cancel_token: Optional[Any] = None,
+        **options
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream discovered items.
+        
+        Args:
+            batch_size: Maximum items per batch
+            cancel_token: CancellationToken checked between tables, pages or directories
+            **options: Scanner-specific discovery parameters (prefix, max_depth, ...)
+        
+        Returns:
+            Iterator of non-empty item lists; stops early once cancel_token is cancelled
+        """
+        ...
+    
+    def get_checkpoint_cursor(self) -> Optional[Dict[str, Any]]:
+        """
+        Position after the last item yielded by iter_discovery_batches().
+        
+        Passing it back as the resume_from option continues the scan after
+        that item without re-emitting or re-listing completed work.
+        
+        Returns:
+            JSON-serializable cursor dict, or None before the first item
+        """
+        ...
+
+
 class BaseScannerAdapter:
     """
     Base adapter to help existing scanners conform to ScannerInterface.
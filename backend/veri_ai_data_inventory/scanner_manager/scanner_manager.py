@@ -7,25 +7,37 @@ Manages scanner lifecycle, error handling, and multi-source coordination.
 
 import logging
 import uuid
-from typing import Dict, Any, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 
 # Flexible import pattern
 try:
-    from ..config import ScanManagerConfig
+    from ..config import ScanManagerConfig, ScanConfig
     from ..utils import UTF8Validator
+    from ..utils.cancellation import CancellationToken, REASON_CANCELLED, REASON_TIMEOUT
+    from ..utils.catalog_discovery import iter_batches
 except ImportError:
-    from config.constants import ScanManagerConfig
+    from config.constants import ScanManagerConfig, ScanConfig
     from utils.utf8_validator import UTF8Validator
+    from utils.cancellation import CancellationToken, REASON_CANCELLED, REASON_TIMEOUT
+    from utils.catalog_discovery import iter_batches
 
 from .scanner_registry import ScannerRegistry
 from .scanner_interface import BaseScannerAdapter
-from .error_handler import ScanErrorHandler
+from .error_handler import ScanErrorHandler, get_circuit_breaker
 from .progress_tracker import ScanProgressTracker, ScanStatus
-from .result_aggregator import ResultAggregator
+from .result_aggregator import ResultAggregator, ItemSink
+from .connection_pool import ScannerConnectionPool, get_connection_pool, source_fingerprint
+from .async_scanner import ThreadedAsyncScanner
 
 logger = logging.getLogger(__name__)
 
+# Discovery entry points, in lookup order (filesystem, cloud, database scanners)
+DISCOVERY_METHODS = ('discover_files', 'discover_objects', 'discover_blobs', 'discover')
+
+# Item lists in discovery results of scanners without iter_discovery_batches()
+STREAMED_ITEM_KEYS = ('tables', 'objects', 'blobs', 'files')
+
 
 class ScannerManager:
     """
@@ -44,7 +56,9 @@ class ScannerManager:
         utf8_validator: Optional[UTF8Validator] = None,
         max_concurrent_scans: int = ScanManagerConfig.MAX_CONCURRENT_SCANS,
         scan_timeout: int = ScanManagerConfig.SCANNER_TIMEOUT_SECONDS,
-        enable_parallel: bool = ScanManagerConfig.ENABLE_PARALLEL_SCANNING
+        enable_parallel: bool = ScanManagerConfig.ENABLE_PARALLEL_SCANNING,
+        connection_pool: Optional[ScannerConnectionPool] = None,
+        dedup_backend: Optional[str] = None
     ):
         """
         Initialize Scanner Manager with dynamic configuration.
@@ -54,6 +68,9 @@ class ScannerManager:
             max_concurrent_scans: Maximum concurrent scans (default from ScanManagerConfig)
             scan_timeout: Scan timeout in seconds (default from ScanManagerConfig)
             enable_parallel: Enable parallel scanning (default from ScanManagerConfig)
+            connection_pool: Database connection pool (default: shared global pool,
+                             None when ScanManagerConfig.ENABLE_CONNECTION_POOLING is off)
+            dedup_backend: Result dedup store (default from ScanManagerConfig.DEDUP_BACKEND)
         """
         self.validator = utf8_validator or UTF8Validator()
         self.max_concurrent = max_concurrent_scans
@@ -63,9 +80,14 @@ class ScannerManager:
         self.registry = ScannerRegistry()
         self.error_handler = ScanErrorHandler()
         self.progress_tracker = ScanProgressTracker()
-        self.result_aggregator = ResultAggregator()
+        self.result_aggregator = ResultAggregator(dedup_backend)
         
         self.active_scanners: Dict[str, Any] = {}
+        self.cancel_tokens: Dict[str, CancellationToken] = {}
+        
+        if connection_pool is None and ScanManagerConfig.ENABLE_CONNECTION_POOLING:
+            connection_pool = get_connection_pool()
+        self.connection_pool = connection_pool
         
         logger.info(
             f"[OK] ScannerManager initialized (max_concurrent: {self.max_concurrent}, "
@@ -100,9 +122,13 @@ class ScannerManager:
         
         try:
             # Create scanner instance
-            # Pass UTF8Validator to scanners that support it
-            if scanner_type in ['local_filesystem', 'network_share']:
-                scanner = scanner_class(self.validator, connection_config)
+            # Database scanners lease a pooled connection for their source
+            if self.connection_pool is not None and hasattr(scanner_class, 'from_connection'):
+                return self._create_pooled_scanner(scanner_type, scanner_class, connection_config)
+            
+            # Local filesystem scanners take their root path; others the full config
+            if scanner_type == 'local_filesystem':
+                scanner = scanner_class(connection_config['root_path'])
             else:
                 scanner = scanner_class(connection_config)
             
@@ -113,25 +139,214 @@ class ScannerManager:
             logger.error(f"[ERROR] Failed to create scanner {scanner_type}: {str(e)}")
             return None
     
+    def _create_pooled_scanner(
+        self,
+        scanner_type: str,
+        scanner_class: Any,
+        connection_config: Dict[str, Any]
+    ) -> Any:
+        """
+        Create a scanner on a connection leased from the pool.
+        
+        The scanner's close() returns the connection to the pool.
+        
+        Args:
+            scanner_type: Scanner type identifier
+            scanner_class: Scanner class providing open_connection/from_connection
+            connection_config: Connection configuration
+            
+        Returns:
+            Scanner instance
+        """
+        connection = self.connection_pool.acquire(
+            source_fingerprint(scanner_type, connection_config),
+            factory=lambda: scanner_class.open_connection(connection_config),
+            health_check=getattr(scanner_class, 'check_connection', None),
+            reset=getattr(scanner_class, 'reset_connection', None),
+            scanner_type=scanner_type
+        )
+        
+        try:
+            scanner = scanner_class.from_connection(connection, connection_config)
+        except Exception:
+            connection.invalidate()
+            raise
+        
+        logger.info(f"[OK] Created scanner instance on pooled connection: {scanner_type}")
+        return scanner
+    
+    def create_async_scanner(
+        self,
+        scanner_type: str,
+        connection_config: Dict[str, Any]
+    ) -> Optional[Any]:
+        """
+        Create an async database scanner for use on the event loop.
+        
+        Uses the native async scanner when one is registered and its driver is
+        installed; otherwise wraps the sync scanner in ThreadedAsyncScanner.
+        No I/O happens until the scanner's connect() is awaited.
+        
+        Args:
+            scanner_type: Database scanner type identifier
+            connection_config: Connection configuration
+            
+        Returns:
+            Async scanner instance or None if the type is invalid
+        """
+        if self.registry.get_scanner_category(scanner_type) != 'database':
+            logger.error(f"[ERROR] No async scanner for non-database type: {scanner_type}")
+            return None
+        
+        async_class = self.registry.get_async_scanner_class(scanner_type)
+        if async_class is not None:
+            logger.info(f"[OK] Created native async scanner: {scanner_type}")
+            return async_class(connection_config)
+        
+        logger.info(f"[OK] Created threaded async scanner: {scanner_type}")
+        return ThreadedAsyncScanner(self, scanner_type, connection_config)
+    
+    def get_pool_statistics(self) -> Optional[Dict[str, Any]]:
+        """Get connection pool statistics (None when pooling is disabled)"""
+        if self.connection_pool is None:
+            return None
+        return self.connection_pool.get_statistics()
+    
+    @staticmethod
+    def run_discovery(
+        scanner: Any,
+        scan_options: Optional[Dict[str, Any]] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the scanner's discovery method (see DISCOVERY_METHODS).
+        
+        Args:
+            scanner: Scanner instance
+            scan_options: Keyword arguments for the discovery method
+            cancel_token: Token checked by the scanner between tables, pages or directories
+            
+        Returns:
+            Discovery result ('partial' is True when stopped by cancel_token)
+        """
+        options = dict(scan_options or {})
+        if cancel_token is not None:
+            options['cancel_token'] = cancel_token
+        
+        for method_name in DISCOVERY_METHODS:
+            method = getattr(scanner, method_name, None)
+            if method is not None:
+                return method(**options)
+        
+        raise RuntimeError(f"Scanner {type(scanner).__name__} has no discovery method")
+    
+    @staticmethod
+    def connect_scanner(scanner: Any, scanner_type: str) -> None:
+        """
+        Connect a scanner to its data source
+        
+        Raises:
+            ConnectionError: If connect() reports failure (retryable)
+        """
+        if not scanner.connect():
+            raise ConnectionError(f"Failed to connect to {scanner_type}")
+    
+    @staticmethod
+    def interrupt_on_cancel(scanner: Any, cancel_token: CancellationToken) -> None:
+        """Abort the scanner's in-flight query when the token is cancelled (if supported)"""
+        interrupt = getattr(scanner, 'interrupt', None)
+        if interrupt is not None:
+            cancel_token.add_callback(interrupt)
+    
+    def _stream_discovery(
+        self,
+        scan_id: str,
+        scanner: Any,
+        scan_options: Dict[str, Any],
+        cancel_token: CancellationToken,
+        on_batch: Callable[[List[Dict[str, Any]]], None]
+    ) -> Dict[str, Any]:
+        """
+        Hand discovered items to on_batch as the scanner finds them.
+        
+        Streaming scanners (StreamingScannerInterface) yield bounded batches;
+        other scanners are discovered in full and their items replayed in batches.
+        
+        Returns:
+            Discovery summary without the items ('count', 'partial', 'streamed')
+        """
+        count = 0
+        
+        if hasattr(scanner, 'iter_discovery_batches'):
+            batches = scanner.iter_discovery_batches(cancel_token=cancel_token, **scan_options)
+            try:
+                for batch in batches:
+                    on_batch(batch)
+                    count += len(batch)
+                    self.progress_tracker.update_progress(
+                        scan_id,
+                        items_discovered=count,
+                        current_operation=f'Discovered {count} items'
+                    )
+            finally:
+                close = getattr(batches, 'close', None)
+                if close is not None:
+                    close()
+            partial = cancel_token.is_cancelled
+        else:
+            discover_result = self.run_discovery(scanner, scan_options, cancel_token)
+            items = next(
+                (discover_result[key] for key in STREAMED_ITEM_KEYS if key in discover_result),
+                []
+            )
+            for batch in iter_batches(items, ScanConfig.DISCOVERY_ITEM_BATCH_SIZE):
+                on_batch(batch)
+                count += len(batch)
+            partial = bool(discover_result.get('partial')) or cancel_token.is_cancelled
+        
+        return {
+            'count': count,
+            'streamed': True,
+            'partial': partial,
+            'cancel_reason': cancel_token.reason if partial else None
+        }
+    
     def execute_scan(
         self,
         scanner_type: str,
         connection_config: Dict[str, Any],
-        scan_options: Optional[Dict[str, Any]] = None
+        scan_options: Optional[Dict[str, Any]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        scan_id: Optional[str] = None,
+        on_batch: Optional[Callable[[List[Dict[str, Any]]], None]] = None
     ) -> Dict[str, Any]:
         """
         Execute complete scan lifecycle: connect -> discover -> close.
         
+        With on_batch, discovered items are handed over in batches while the
+        scan runs and the response carries only the summary (no item list),
+        so memory stays bounded by the batch size.
+        
+        The scan stops cooperatively when cancel_scan() is called or the scan
+        timeout passes; the scanner is closed (its connection released) at once
+        and the discovered-so-far results are returned with 'partial': True.
+        
         Args:
             scanner_type: Scanner type identifier
             connection_config: Connection configuration
             scan_options: Optional scanning parameters
+            cancel_token: Cancellation token (default: new token with the scan timeout)
+            scan_id: Scan identifier (default: new UUID)
+            on_batch: Optional consumer of discovered item batches
             
         Returns:
             Scan results dictionary
         """
-        scan_id = str(uuid.uuid4())
+        scan_id = scan_id or str(uuid.uuid4())
         scan_options = scan_options or {}
+        if cancel_token is None:
+            cancel_token = CancellationToken(self.timeout)
+        self.cancel_tokens[scan_id] = cancel_token
         
         # Start progress tracking
         scanner_category = self.registry.get_scanner_category(scanner_type)
@@ -149,11 +364,16 @@ class ScannerManager:
                 current_operation='Creating scanner instance'
             )
             
+            # Fail fast (before taking a pool slot) while the source's circuit is open
+            source_key = source_fingerprint(scanner_type, connection_config)
+            get_circuit_breaker(source_key).check()
+            
             scanner = self.create_scanner(scanner_type, connection_config)
             if not scanner:
                 raise RuntimeError(f"Failed to create scanner: {scanner_type}")
             
             self.active_scanners[scan_id] = scanner
+            self.interrupt_on_cancel(scanner, cancel_token)
             
             # Connect with retry
             self.progress_tracker.update_progress(
@@ -163,10 +383,13 @@ class ScannerManager:
                 current_operation='Connecting to source'
             )
             
-            connect_result = self.error_handler.retry_on_failure(scanner.connect)
-            
-            if isinstance(connect_result, dict) and connect_result.get('status') == 'error':
-                raise RuntimeError(f"Connection failed: {connect_result.get('message')}")
+            self.error_handler.retry(
+                self.connect_scanner,
+                scanner,
+                scanner_type,
+                source_key=source_key,
+                cancel_token=cancel_token
+            )
             
             # Discover data
             self.progress_tracker.update_progress(
@@ -176,9 +399,11 @@ class ScannerManager:
                 current_operation='Discovering data assets'
             )
             
-            discover_result = scanner.discover_files(**scan_options) \
-                if scanner_type in ['local_filesystem', 'network_share'] \
-                else scanner.discover(**scan_options)
+            cancel_token.raise_if_cancelled()
+            if on_batch is not None:
+                discover_result = self._stream_discovery(scan_id, scanner, scan_options, cancel_token, on_batch)
+            else:
+                discover_result = self.run_discovery(scanner, scan_options, cancel_token)
             
             # Count discovered items
             item_count = len(discover_result) if isinstance(discover_result, list) else \
@@ -194,27 +419,56 @@ class ScannerManager:
             # Close scanner
             scanner.close()
             
-            # Mark as completed
-            self.progress_tracker.complete_scan(scan_id, success=True)
+            partial = bool(isinstance(discover_result, dict) and discover_result.get('partial')) \
+                or cancel_token.is_cancelled
+            cancel_reason = cancel_token.reason if partial else None
+            
+            # Mark as completed (cancelled scans keep their CANCELLED status)
+            if cancel_reason == REASON_CANCELLED:
+                self.progress_tracker.cancel_scan(scan_id)
+            else:
+                self.progress_tracker.complete_scan(
+                    scan_id,
+                    success=True,
+                    error_message=f"Stopped early ({cancel_reason})" if partial else None
+                )
             
             # Create standardized response
             result = BaseScannerAdapter.create_success_response(
-                message=f'Scan completed successfully',
+                message='Scan stopped early, results are partial' if partial else 'Scan completed successfully',
                 data=discover_result,
                 count=item_count,
                 scan_id=scan_id,
                 scanner_type=scanner_type,
-                scanner_category=scanner_category
+                scanner_category=scanner_category,
+                partial=partial,
+                cancel_reason=cancel_reason
             )
             
             logger.info(
                 f"[OK] Scan {scan_id} completed: {item_count} items discovered "
-                f"from {scanner_type}"
+                f"from {scanner_type}" + (f" (partial, {cancel_reason})" if partial else "")
             )
             
             return result
             
         except Exception as e:
+            if cancel_token.is_cancelled:
+                # Interrupted query or cancelled before discovery - nothing partial to return
+                logger.warning(f"[WARNING] Scan {scan_id} stopped ({cancel_token.reason}): {str(e)}")
+                if cancel_token.reason == REASON_CANCELLED:
+                    self.progress_tracker.cancel_scan(scan_id)
+                else:
+                    self.progress_tracker.complete_scan(scan_id, success=False, error_message=REASON_TIMEOUT)
+                return self.error_handler.create_error_response(
+                    message=f'Scan stopped ({cancel_token.reason})',
+                    error=e,
+                    scan_id=scan_id,
+                    scanner_type=scanner_type,
+                    partial=True,
+                    cancel_reason=cancel_token.reason
+                )
+            
             error_msg = str(e)
             logger.error(f"[ERROR] Scan {scan_id} failed: {error_msg}")
             
@@ -236,14 +490,21 @@ class ScannerManager:
                 except Exception:
                     pass
                 del self.active_scanners[scan_id]
+            cancel_token.close()
+            self.cancel_tokens.pop(scan_id, None)
     
     def execute_multi_source_scan(
         self,
-        scan_requests: List[Dict[str, Any]]
+        scan_requests: List[Dict[str, Any]],
+        item_sink: Optional[ItemSink] = None
     ) -> Dict[str, Any]:
         """
         Execute scans across multiple sources (database + cloud + filesystem).
         
+        Discovered items stream into the result aggregator (and item_sink) per
+        batch while the scans run; per-source results are keyed by source
+        identifier, so parallel completion order does not matter.
+        
         Args:
             scan_requests: List of scan request dictionaries:
                 [
@@ -254,6 +515,8 @@ class ScannerManager:
                         'source_identifier': str (optional)
                     }
                 ]
+            item_sink: Optional consumer called as item_sink(source_identifier, items)
+                with each batch of unique discovered items
         
         Returns:
             Aggregated results from all scanners
@@ -262,26 +525,21 @@ class ScannerManager:
         
         # Clear previous results
         self.result_aggregator.clear()
+        source_ids = self._assign_source_ids(scan_requests)
         
-        if self.enable_parallel and len(scan_requests) > 1:
-            # Parallel scanning
-            results = self._execute_parallel_scans(scan_requests)
-        else:
-            # Sequential scanning
-            results = self._execute_sequential_scans(scan_requests)
-        
-        # Aggregate all results
-        for request, result in zip(scan_requests, results):
-            scanner_type = request['scanner_type']
-            scanner_category = self.registry.get_scanner_category(scanner_type)
-            source_id = request.get('source_identifier', '')
-            
-            self.result_aggregator.add_scanner_results(
-                scanner_type,
-                scanner_category,
-                result,
-                source_id
-            )
+        if item_sink is not None:
+            self.result_aggregator.add_sink(item_sink)
+        
+        try:
+            if self.enable_parallel and len(scan_requests) > 1:
+                # Parallel scanning
+                self._execute_parallel_scans(scan_requests, source_ids)
+            else:
+                # Sequential scanning
+                self._execute_sequential_scans(scan_requests, source_ids)
+        finally:
+            if item_sink is not None:
+                self.result_aggregator.remove_sink(item_sink)
         
         # Get aggregated results
         aggregated = self.result_aggregator.get_aggregated_results()
@@ -299,55 +557,118 @@ class ScannerManager:
             'statistics': statistics
         }
     
+    @staticmethod
+    def _assign_source_ids(scan_requests: List[Dict[str, Any]]) -> List[str]:
+        """Unique source identifier per request ('<scanner_type>-<n>' when not given)"""
+        source_ids = []
+        for index, request in enumerate(scan_requests):
+            source_id = request.get('source_identifier') or f"{request['scanner_type']}-{index + 1}"
+            if source_id in source_ids:
+                source_id = f"{source_id}-{index + 1}"
+            source_ids.append(source_id)
+        return source_ids
+    
+    def _scan_source(
+        self,
+        request: Dict[str, Any],
+        source_id: str,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """Scan one source, streaming its item batches into the result aggregator"""
+        scanner_type = request['scanner_type']
+        self.result_aggregator.start_source(
+            source_id,
+            scanner_type,
+            self.registry.get_scanner_category(scanner_type)
+        )
+        
+        result = self.execute_scan(
+            scanner_type,
+            request['connection_config'],
+            request.get('scan_options', {}),
+            cancel_token,
+            on_batch=lambda batch: self.result_aggregator.add_item_batch(source_id, batch)
+        )
+        result['source_identifier'] = source_id
+        self.result_aggregator.finish_source(source_id, result)
+        return result
+    
     def _execute_parallel_scans(
         self,
-        scan_requests: List[Dict[str, Any]]
+        scan_requests: List[Dict[str, Any]],
+        source_ids: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Execute scans in parallel using thread pool"""
-        results = []
+        """
+        Execute scans in parallel using thread pool.
         
-        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+        Each scan gets its own CancellationToken with the scan timeout. Scans still
+        running ScanManagerConfig.CANCEL_GRACE_SECONDS after that are reported as
+        timed out and abandoned (their tokens stay cancelled, so they stop at the
+        next checkpoint instead of consuming source capacity).
+        
+        Returns:
+            Scan results in request order
+        """
+        source_ids = source_ids or self._assign_source_ids(scan_requests)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(scan_requests)
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent)
+        futures = {}
+        
+        try:
             # Submit all scan jobs
-            future_to_request = {
-                executor.submit(
-                    self.execute_scan,
-                    req['scanner_type'],
-                    req['connection_config'],
-                    req.get('scan_options', {})
-                ): req
-                for req in scan_requests
-            }
+            for index, (req, source_id) in enumerate(zip(scan_requests, source_ids)):
+                token = CancellationToken(self.timeout)
+                future = executor.submit(self._scan_source, req, source_id, token)
+                futures[future] = (index, token)
             
-            # Collect results as they complete
-            for future in as_completed(future_to_request):
-                try:
-                    result = future.result(timeout=self.timeout)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"[ERROR] Parallel scan failed: {str(e)}")
-                    results.append(self.error_handler.create_error_response(
-                        message='Parallel scan failed',
-                        error=e
-                    ))
+            # Collect results as they complete; queued scans share the overall deadline
+            try:
+                for future in as_completed(
+                    futures,
+                    timeout=self.timeout + ScanManagerConfig.CANCEL_GRACE_SECONDS
+                ):
+                    index = futures[future][0]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"[ERROR] Parallel scan failed: {str(e)}")
+                        results[index] = self.error_handler.create_error_response(
+                            message='Parallel scan failed',
+                            error=e
+                        )
+                        self.result_aggregator.finish_source(source_ids[index], results[index])
+            except FuturesTimeoutError as e:
+                for future, (index, token) in futures.items():
+                    if future.done():
+                        continue
+                    token.cancel(REASON_TIMEOUT)
+                    future.cancel()
+                    logger.error("[ERROR] Parallel scan abandoned after timeout")
+                    results[index] = self.error_handler.create_error_response(
+                        message='Parallel scan timed out',
+                        error=e,
+                        partial=True,
+                        cancel_reason=REASON_TIMEOUT
+                    )
+                    # Late batches from the abandoned scan are ignored once finished
+                    self.result_aggregator.finish_source(source_ids[index], results[index])
+        finally:
+            # Do not block on abandoned scans; queued ones never start
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return results
     
     def _execute_sequential_scans(
         self,
-        scan_requests: List[Dict[str, Any]]
+        scan_requests: List[Dict[str, Any]],
+        source_ids: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Execute scans sequentially"""
-        results = []
-        
-        for request in scan_requests:
-            result = self.execute_scan(
-                request['scanner_type'],
-                request['connection_config'],
-                request.get('scan_options', {})
-            )
-            results.append(result)
-        
-        return results
+        source_ids = source_ids or self._assign_source_ids(scan_requests)
+        return [
+            self._scan_source(request, source_id)
+            for request, source_id in zip(scan_requests, source_ids)
+        ]
     
     def get_scan_status(self, scan_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific scan"""
@@ -362,7 +683,10 @@ class ScannerManager:
         return self.progress_tracker.get_active_scans()
     
     def cancel_scan(self, scan_id: str) -> bool:
-        """Cancel an active scan"""
+        """Cancel an active scan (the scanner stops at its next checkpoint)"""
+        token = self.cancel_tokens.get(scan_id)
+        if token is not None:
+            token.cancel(REASON_CANCELLED)
         return self.progress_tracker.cancel_scan(scan_id)
     
     def list_available_scanners(self) -> Dict[str, str]:
@@ -374,5 +698,6 @@ class ScannerManager:
         return {
             'progress': self.progress_tracker.get_summary(),
             'results': self.result_aggregator.get_statistics(),
-            'errors': self.error_handler.get_error_summary()
+            'errors': self.error_handler.get_error_summary(),
+            'connection_pool': self.get_pool_statistics()
         }
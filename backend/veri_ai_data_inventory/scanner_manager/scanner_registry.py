@@ -6,6 +6,7 @@ Maps scanner type identifiers to their implementation classes.
 """
 
 from typing import Dict, Type, Any, Optional
+import importlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,9 +24,9 @@ class ScannerRegistry:
     # Format: 'scanner_type': ('module_path', 'ClassName')
     _SCANNER_MAPPINGS: Dict[str, tuple] = {
         # Database scanners (Step 2)
-        'postgresql': ('database_scanners.postgresql_scanner', 'PostgreSQLScanner'),
-        'mysql': ('database_scanners.mysql_scanner', 'MySQLScanner'),
-        'mongodb': ('database_scanners.mongodb_scanner', 'MongoDBScanner'),
+        'postgresql': ('postgresql_scanner', 'PostgreSQLScanner'),
+        'mysql': ('mysql_scanner', 'MySQLScanner'),
+        'mongodb': ('mongodb_scanner', 'MongoDBScanner'),
         'mssql': ('database_scanners.mssql_scanner', 'MSSQLScanner'),
         
         # Cloud scanners (Step 4)
@@ -38,8 +39,15 @@ class ScannerRegistry:
         'network_share': ('filesystem_scanners.network_share_scanner', 'NetworkShareScanner'),
     }
     
+    # Native async scanners used by ScanService
+    # Types without an entry are wrapped in ThreadedAsyncScanner
+    _ASYNC_SCANNER_MAPPINGS: Dict[str, tuple] = {
+        'postgresql': ('async_postgresql_scanner', 'AsyncPostgreSQLScanner'),
+    }
+    
     # Cache for loaded scanner classes
     _loaded_scanners: Dict[str, Type] = {}
+    _loaded_async_scanners: Dict[str, Optional[Type]] = {}
     
     @classmethod
     def get_scanner_class(cls, scanner_type: str) -> Optional[Type]:
@@ -68,17 +76,10 @@ class ScannerRegistry:
             # Flexible import: try package import first, then standalone
             try:
                 # Package import (when used as part of microservice)
-                module = __import__(
-                    f'..{module_path}',
-                    fromlist=[class_name],
-                    level=1
-                )
+                module = importlib.import_module(f'..{module_path}', package=__package__)
             except ImportError:
                 # Standalone import (when running tests/scripts)
-                module = __import__(
-                    module_path,
-                    fromlist=[class_name]
-                )
+                module = importlib.import_module(module_path)
             
             scanner_class = getattr(module, class_name)
             
@@ -95,6 +96,42 @@ class ScannerRegistry:
             )
             return None
     
+    @classmethod
+    def get_async_scanner_class(cls, scanner_type: str) -> Optional[Type]:
+        """
+        Get native async scanner class by type identifier with lazy loading.
+        
+        Args:
+            scanner_type: Scanner type identifier (e.g., 'postgresql')
+            
+        Returns:
+            Async scanner class, or None if the type has none or its driver is not installed
+        """
+        if scanner_type in cls._loaded_async_scanners:
+            return cls._loaded_async_scanners[scanner_type]
+        
+        if scanner_type not in cls._ASYNC_SCANNER_MAPPINGS:
+            return None
+        
+        module_path, class_name = cls._ASYNC_SCANNER_MAPPINGS[scanner_type]
+        
+        try:
+            try:
+                module = importlib.import_module(f'..{module_path}', package=__package__)
+            except ImportError:
+                module = importlib.import_module(module_path)
+            scanner_class = getattr(module, class_name)
+            logger.info(f"[OK] Loaded async scanner class: {scanner_type} -> {class_name}")
+        except (ImportError, AttributeError) as e:
+            logger.warning(
+                f"[WARNING] Async scanner '{scanner_type}' unavailable "
+                f"({module_path}.{class_name}): {str(e)}"
+            )
+            scanner_class = None
+        
+        cls._loaded_async_scanners[scanner_type] = scanner_class
+        return scanner_class
+    
     @classmethod
     def list_available_scanners(cls) -> Dict[str, str]:
         """
@@ -180,4 +217,5 @@ class ScannerRegistry:
     def clear_cache(cls):
         """Clear the loaded scanner class cache"""
         cls._loaded_scanners.clear()
+        cls._loaded_async_scanners.clear()
         logger.info("[OK] Scanner registry cache cleared")
@@ -0,0 +1,355 @@
+"""
+VeriSyntra Watermark Store
+
+Persists per-source asset watermarks for incremental (delta) scans.
+A watermark is a cheap change marker taken from discovery metadata:
+
+- files:  modification time + size
+- S3:     LastModified + ETag
+- Azure:  ETag + last modified
+- GCS:    generation + metageneration
+- tables: DDL hash (columns, types, nullability, primary key) + row estimate
+
+Unchanged assets keep their previous classification (the stored discovered
+asset) and are not profiled again; a delta report lists added, changed,
+unchanged and removed assets.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# Flexible import pattern
+try:
+    from ..config import ScanConfig, resolve_data_path
+except ImportError:
+    from config.constants import ScanConfig, resolve_data_path
+
+from .result_aggregator import natural_item_key
+
+logger = logging.getLogger(__name__)
+
+# Item fields forming the watermark of non-database items (by scanner ITEM_KEY)
+WATERMARK_FIELDS = {
+    'files': ('modified', 'size'),
+    'objects': ('last_modified', 'etag', 'generation', 'metageneration', 'size'),
+    'blobs': ('etag', 'last_modified', 'size')
+}
+
+
+def table_watermark(table: Dict[str, Any]) -> str:
+    """
+    Watermark of a discovered table: DDL hash plus row estimate.
+
+    Must be taken before column filtering (which drops columns in place).
+    """
+    ddl = json.dumps([
+        [col.get('column_name'), col.get('data_type'), col.get('is_nullable'), col.get('is_primary_key')]
+        for col in table.get('columns', [])
+    ], default=str)
+    ddl_hash = hashlib.sha256(ddl.encode('utf-8')).hexdigest()[:16]
+    return f"{ddl_hash}|{table.get('row_estimate', table.get('row_count'))}"
+
+
+def asset_watermark(items_key: str, item: Dict[str, Any]) -> str:
+    """
+    Watermark of a discovered item.
+
+    Args:
+        items_key: Scanner ITEM_KEY ('tables', 'objects', 'blobs' or 'files')
+        item: Discovered item dict
+
+    Returns:
+        Change marker; differs whenever the asset changed
+    """
+    if items_key == 'tables':
+        return table_watermark(item)
+    return '|'.join(str(item.get(field)) for field in WATERMARK_FIELDS[items_key])
+
+
+def watermark_source_id(scanner_type: str, connection_config: Dict[str, Any]) -> str:
+    """
+    Stable identity of a scanned source.
+
+    connection_config['source_identifier'] wins; otherwise a hash of the scanner
+    type and connection settings without ScanConfig.WATERMARK_SOURCE_IGNORED_KEYS.
+    """
+    if connection_config.get('source_identifier'):
+        return str(connection_config['source_identifier'])
+    settings = {
+        key: value for key, value in connection_config.items()
+        if key not in ScanConfig.WATERMARK_SOURCE_IGNORED_KEYS
+    }
+    payload = json.dumps([scanner_type, settings], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class DeltaScan:
+    """
+    One incremental scan of a source.
+
+    split() separates new/changed items (to process) from unchanged ones
+    (their stored assets are carried forward); record() stores the assets of
+    processed items; finish() removes assets not seen by a complete scan and
+    returns the delta report.
+    """
+
+    def __init__(self, store: 'WatermarkStore', source_id: str, scan_number: int, baseline: bool, reset: bool):
+        self.store = store
+        self.source_id = source_id
+        self.scan_number = scan_number
+        self.baseline = baseline  # First scan of the source: everything is added
+        self.reset = reset  # Scan context changed: previous classifications are not reused
+        self.pending: Dict[str, Tuple[str, str]] = {}  # asset key -> (watermark, 'added'/'changed')
+        self.counts = {'added': 0, 'changed': 0, 'unchanged': 0}
+
+    def split(
+        self,
+        items_key: str,
+        items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split a batch of discovered items by watermark.
+
+        Args:
+            items_key: Scanner ITEM_KEY of the items
+            items: Discovered item dicts
+
+        Returns:
+            (items to process, carried-forward assets of unchanged items)
+        """
+        keyed = [(natural_item_key(item), item) for item in items]
+        previous = self.store.lookup(self.source_id, [key for key, _ in keyed if key is not None])
+
+        to_process = []
+        carried = []
+        unchanged_keys = []
+        for key, item in keyed:
+            watermark = asset_watermark(items_key, item)
+            stored = previous.get(key)
+            if stored is not None and stored[0] == watermark and not self.reset:
+                carried.append(stored[1])
+                unchanged_keys.append(key)
+                continue
+            to_process.append(item)
+            if key is not None:
+                status = 'changed' if stored is not None else 'added'
+                self.pending[key] = (watermark, status)
+                self.counts[status] += 1
+
+        self.counts['unchanged'] += len(unchanged_keys)
+        self.store.touch(self.source_id, unchanged_keys, self.scan_number)
+        return to_process, carried
+
+    def record(self, assets: List[Dict[str, Any]]) -> None:
+        """Store watermarks and assets of processed items (keyed by asset_path)"""
+        rows = []
+        for asset in assets:
+            pending = self.pending.pop(asset.get('asset_path'), None)
+            if pending is not None:
+                rows.append((asset['asset_path'], pending[0], asset))
+        self.store.save(self.source_id, rows, self.scan_number)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State needed to continue this scan after a restart (see WatermarkStore.resume)"""
+        return {
+            'source_id': self.source_id,
+            'scan_number': self.scan_number,
+            'baseline': self.baseline,
+            'reset': self.reset,
+            'counts': dict(self.counts)
+        }
+
+    def finish(self, complete: bool = True) -> Dict[str, Any]:
+        """
+        End the scan and build the delta report.
+
+        Args:
+            complete: False for partial (cancelled/timed out) scans - assets not
+                      reached are kept, not reported as removed
+
+        Returns:
+            {'baseline', 'added', 'changed', 'unchanged', 'removed', 'removed_assets', 'partial'}
+        """
+        removed_keys: List[str] = []
+        removed_count = 0
+        if complete:
+            removed_count, removed_keys = self.store.remove_unseen(self.source_id, self.scan_number)
+
+        report = {
+            'baseline': self.baseline,
+            **self.counts,
+            'removed': removed_count,
+            'removed_assets': removed_keys,
+            'partial': not complete
+        }
+        logger.info(
+            f"[OK] Delta scan {self.scan_number} of source {self.source_id[:16]}: "
+            f"{report['added']} added, {report['changed']} changed, "
+            f"{report['unchanged']} unchanged, {removed_count} removed"
+        )
+        return report
+
+
+class WatermarkStore:
+    """
+    SQLite-backed watermark store shared by scan jobs (thread-safe).
+
+    Scan numbers increase per source at begin(), so assets touched by a failed
+    scan are still detected as removed by the next complete scan.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = resolve_data_path(path or ScanConfig.WATERMARK_DB_PATH)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS scan_sources ("
+                "source_id TEXT PRIMARY KEY, context TEXT, last_scan INTEGER, updated_at TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS asset_watermarks ("
+                "source_id TEXT, asset_key TEXT, watermark TEXT, asset TEXT, last_scan INTEGER, "
+                "PRIMARY KEY (source_id, asset_key)) WITHOUT ROWID"
+            )
+
+    def begin(self, source_id: str, context: Optional[str] = None) -> DeltaScan:
+        """
+        Start an incremental scan of a source.
+
+        Args:
+            source_id: Source identity (see watermark_source_id)
+            context: Scan settings affecting classification (e.g. column filter);
+                     when it differs from the previous scan, every asset is reprocessed
+
+        Returns:
+            DeltaScan for this scan
+        """
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT context, last_scan FROM scan_sources WHERE source_id = ?",
+                (source_id,)
+            ).fetchone()
+            scan_number = (row[1] if row else 0) + 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO scan_sources (source_id, context, last_scan, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (source_id, context, scan_number, datetime.utcnow().isoformat())
+            )
+        return DeltaScan(
+            self,
+            source_id,
+            scan_number,
+            baseline=row is None,
+            reset=row is not None and row[0] != context
+        )
+
+    def resume(self, snapshot: Dict[str, Any]) -> DeltaScan:
+        """
+        Continue an interrupted incremental scan from DeltaScan.snapshot().
+
+        The scan number is kept, so assets seen before the interruption still
+        count as seen when the resumed scan finishes.
+        """
+        delta = DeltaScan(
+            self,
+            snapshot['source_id'],
+            snapshot['scan_number'],
+            baseline=snapshot['baseline'],
+            reset=snapshot['reset']
+        )
+        delta.counts.update(snapshot['counts'])
+        return delta
+
+    def lookup(self, source_id: str, asset_keys: List[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Stored (watermark, asset) per asset key"""
+        if not asset_keys:
+            return {}
+        placeholders = ','.join('?' * len(asset_keys))
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT asset_key, watermark, asset FROM asset_watermarks "
+                f"WHERE source_id = ? AND asset_key IN ({placeholders})",
+                [source_id, *asset_keys]
+            ).fetchall()
+        return {key: (watermark, json.loads(asset)) for key, watermark, asset in rows}
+
+    def touch(self, source_id: str, asset_keys: List[str], scan_number: int) -> None:
+        """Mark unchanged assets as seen by a scan"""
+        if not asset_keys:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "UPDATE asset_watermarks SET last_scan = ? WHERE source_id = ? AND asset_key = ?",
+                [(scan_number, source_id, key) for key in asset_keys]
+            )
+
+    def save(self, source_id: str, rows: List[Tuple[str, str, Dict[str, Any]]], scan_number: int) -> None:
+        """Upsert (asset_key, watermark, asset) rows seen by a scan"""
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO asset_watermarks "
+                "(source_id, asset_key, watermark, asset, last_scan) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (source_id, key, watermark, json.dumps(asset, default=str), scan_number)
+                    for key, watermark, asset in rows
+                ]
+            )
+
+    def remove_unseen(self, source_id: str, scan_number: int) -> Tuple[int, List[str]]:
+        """
+        Delete assets not seen by a complete scan.
+
+        Returns:
+            (removed count, removed asset keys up to ScanConfig.MAX_REMOVED_ASSETS_REPORTED)
+        """
+        with self._lock, self._connection:
+            removed_count = self._connection.execute(
+                "SELECT COUNT(*) FROM asset_watermarks WHERE source_id = ? AND last_scan < ?",
+                (source_id, scan_number)
+            ).fetchone()[0]
+            removed_keys = [
+                row[0] for row in self._connection.execute(
+                    "SELECT asset_key FROM asset_watermarks WHERE source_id = ? AND last_scan < ? "
+                    "ORDER BY asset_key LIMIT ?",
+                    (source_id, scan_number, ScanConfig.MAX_REMOVED_ASSETS_REPORTED)
+                )
+            ]
+            self._connection.execute(
+                "DELETE FROM asset_watermarks WHERE source_id = ? AND last_scan < ?",
+                (source_id, scan_number)
+            )
+        return removed_count, removed_keys
+
+    def forget_source(self, source_id: str) -> None:
+        """Drop all watermarks of a source (next incremental scan is a baseline)"""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM asset_watermarks WHERE source_id = ?", (source_id,))
+            self._connection.execute("DELETE FROM scan_sources WHERE source_id = ?", (source_id,))
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+
+# Global store instance (opened on first incremental scan)
+_watermark_store_instance: Optional[WatermarkStore] = None
+_watermark_store_lock = threading.Lock()
+
+
+def get_watermark_store() -> WatermarkStore:
+    """Get the shared watermark store (ScanConfig.WATERMARK_DB_PATH)"""
+    global _watermark_store_instance
+    with _watermark_store_lock:
+        if _watermark_store_instance is None:
+            _watermark_store_instance = WatermarkStore()
+            logger.info(f"[OK] Watermark store opened: {_watermark_store_instance.path}")
+        return _watermark_store_instance
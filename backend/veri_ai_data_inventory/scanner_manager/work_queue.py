@@ -0,0 +1,794 @@
+"""
+VeriSyntra Scan Work Queue
+
+Scan jobs are split into work units that scan worker processes lease and ack:
+
+- plan:   connects to the source and splits the job into the units below
+- tables: filters and profiles a group of discovered database tables
+- items:  streams one directory subtree or cloud prefix
+
+A leased unit is invisible to other workers until its visibility timeout;
+workers extend the lease while the unit runs. A unit whose lease expires
+(worker died) or that fails is retried with exponential backoff, up to
+WorkQueueConfig.MAX_ATTEMPTS leases, then dead-lettered. Acks are accepted
+only from the current lease holder, so a unit handed to another worker is
+never counted twice. A plan unit's child units are added in the same atomic
+step as its ack.
+
+Backends:
+- redis:  shared by API nodes and workers on any number of hosts
+- sqlite: single node (worker processes share the database file) and tests
+
+Unit payloads carry the connection_config a worker needs, credentials
+included; units are deleted once acked.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+# Flexible import pattern
+try:
+    from ..config import APIConfig, WorkQueueConfig, resolve_data_path
+except ImportError:
+    from config.constants import APIConfig, WorkQueueConfig, resolve_data_path
+
+logger = logging.getLogger(__name__)
+
+# Work unit kinds
+UNIT_PLAN = 'plan'
+UNIT_TABLES = 'tables'
+UNIT_ITEMS = 'items'
+
+# Work unit states
+UNIT_PENDING = 'pending'
+UNIT_LEASED = 'leased'
+UNIT_DEAD = 'dead'
+
+
+def new_unit(kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Work unit dict for submit_job() / ack(new_units=...)"""
+    return {'unit_id': uuid4().hex, 'kind': kind, 'payload': payload}
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before the next lease of a unit that failed its attempts-th lease"""
+    return WorkQueueConfig.RETRY_DELAY_SECONDS * WorkQueueConfig.RETRY_BACKOFF_MULTIPLIER ** (attempts - 1)
+
+
+def job_status(record: Dict[str, Any]) -> str:
+    """
+    Status of a queued job from its unit counters.
+
+    A job whose plan unit was dead-lettered failed; a planned job is complete
+    once every unit is done or dead (dead units make it partial).
+    """
+    if record['cancelled']:
+        return APIConfig.STATUS_CANCELLED
+    if not record['planned'] and record['units_failed']:
+        return APIConfig.STATUS_FAILED
+    if record['planned'] and record['units_done'] + record['units_failed'] >= record['units_total']:
+        return APIConfig.STATUS_COMPLETED
+    return APIConfig.STATUS_RUNNING if record['started'] else APIConfig.STATUS_PENDING
+
+
+class WorkQueue:
+    """
+    Queue of scan work units shared by the API and scan workers.
+
+    Leases are dicts {'unit_id', 'scan_job_id', 'kind', 'payload', 'attempts', 'lease_id'}.
+    Subclasses implement every method below.
+    """
+
+    backend = ''
+
+    def submit_job(self, scan_job_id: str, spec: Dict[str, Any], units: List[Dict[str, Any]]) -> None:
+        """
+        Create a job record and enqueue its first units.
+
+        Args:
+            scan_job_id: Scan job identifier
+            spec: Scan request (restores the job view on any API node)
+            units: Units from new_unit()
+        """
+        raise NotImplementedError
+
+    def lease(self, worker_id: str, visibility_timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Lease the next available unit (expired leases are reclaimed first).
+
+        Args:
+            worker_id: Identifier of the leasing worker
+            visibility_timeout: Lease duration (default WorkQueueConfig.VISIBILITY_TIMEOUT_SECONDS)
+
+        Returns:
+            Lease dict, or None if no unit is available
+        """
+        raise NotImplementedError
+
+    def extend(self, lease: Dict[str, Any], visibility_timeout: Optional[float] = None) -> bool:
+        """Extend a lease; False if it was lost (expired and reclaimed, or job cancelled)"""
+        raise NotImplementedError
+
+    def ack(
+        self,
+        lease: Dict[str, Any],
+        result: Optional[Dict[str, Any]] = None,
+        new_units: Optional[List[Dict[str, Any]]] = None
+    ) -> bool:
+        """
+        Complete a leased unit.
+
+        Args:
+            lease: Lease from lease()
+            result: Unit result appended to the job's results (assets, counts)
+            new_units: Child units enqueued atomically with the ack (plan units)
+
+        Returns:
+            True if accepted; False if the lease was lost (result discarded)
+        """
+        raise NotImplementedError
+
+    def fail(self, lease: Dict[str, Any], error: str) -> Optional[str]:
+        """
+        Report a failed unit: retried after a backoff or dead-lettered.
+
+        Returns:
+            'pending' (will be retried), 'dead', or None if the lease was lost
+        """
+        raise NotImplementedError
+
+    def cancel_job(self, scan_job_id: str) -> bool:
+        """Mark a job cancelled and drop its pending units (False if unknown)"""
+        raise NotImplementedError
+
+    def is_cancelled(self, scan_job_id: str) -> bool:
+        """Whether a job was cancelled (workers stop its running units)"""
+        raise NotImplementedError
+
+    def get_job(self, scan_job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Job record.
+
+        Returns:
+            {'scan_job_id', 'spec', 'status', 'units_total', 'units_done',
+             'units_failed', 'units_pending', 'errors', 'created_at', 'updated_at'} or None
+        """
+        raise NotImplementedError
+
+    def read_results(self, scan_job_id: str, after: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        """Unit results of a job with sequence numbers greater than after: [(seq, result)]"""
+        raise NotImplementedError
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Queue depth: {'backend', 'pending', 'leased', 'dead'}"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release backend connections"""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    SQLite work queue for a single node.
+
+    Worker processes on the host share the database file (WAL mode);
+    every state change runs in an IMMEDIATE transaction.
+    """
+
+    backend = 'sqlite'
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = resolve_data_path(path or WorkQueueConfig.SQLITE_PATH)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        if self.path != ':memory:':
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        for statement in (
+            "CREATE TABLE IF NOT EXISTS scan_jobs ("
+            "scan_job_id TEXT PRIMARY KEY, spec TEXT, units_total INTEGER, units_done INTEGER, "
+            "units_failed INTEGER, planned INTEGER, started INTEGER, cancelled INTEGER, "
+            "created_at REAL, updated_at REAL, finished_at REAL)",
+            "CREATE TABLE IF NOT EXISTS work_units ("
+            "unit_id TEXT PRIMARY KEY, scan_job_id TEXT, kind TEXT, payload TEXT, state TEXT, "
+            "attempts INTEGER, available_at REAL, lease_id TEXT, lease_expires REAL, "
+            "worker_id TEXT, last_error TEXT)",
+            "CREATE INDEX IF NOT EXISTS work_units_ready ON work_units (state, available_at)",
+            "CREATE INDEX IF NOT EXISTS work_units_job ON work_units (scan_job_id)",
+            "CREATE TABLE IF NOT EXISTS job_errors (scan_job_id TEXT, error TEXT)",
+            "CREATE TABLE IF NOT EXISTS unit_results ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, scan_job_id TEXT, result TEXT)",
+            "CREATE INDEX IF NOT EXISTS unit_results_job ON unit_results (scan_job_id, seq)"
+        ):
+            self._connection.execute(statement)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Serialized write transaction (locks the database for other processes too)"""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    @staticmethod
+    def _insert_units(db: sqlite3.Connection, scan_job_id: str, units: List[Dict[str, Any]], now: float) -> None:
+        db.executemany(
+            "INSERT INTO work_units (unit_id, scan_job_id, kind, payload, state, attempts, available_at) "
+            "VALUES (?, ?, ?, ?, ?, 0, ?)",
+            [
+                (unit['unit_id'], scan_job_id, unit['kind'], json.dumps(unit['payload'], default=str), UNIT_PENDING, now)
+                for unit in units
+            ]
+        )
+
+    @staticmethod
+    def _finish_if_done(db: sqlite3.Connection, scan_job_id: str, now: float) -> None:
+        db.execute(
+            "UPDATE scan_jobs SET finished_at = ? WHERE scan_job_id = ? AND finished_at IS NULL "
+            "AND planned = 1 AND units_done + units_failed >= units_total",
+            (now, scan_job_id)
+        )
+
+    def _dead_letter(self, db: sqlite3.Connection, unit_id: str, scan_job_id: str, error: str, now: float) -> None:
+        db.execute(
+            "UPDATE work_units SET state = ?, lease_id = NULL, last_error = ? WHERE unit_id = ?",
+            (UNIT_DEAD, error, unit_id)
+        )
+        db.execute(
+            "UPDATE scan_jobs SET units_failed = units_failed + 1, updated_at = ? WHERE scan_job_id = ?",
+            (now, scan_job_id)
+        )
+        db.execute("INSERT INTO job_errors (scan_job_id, error) VALUES (?, ?)", (scan_job_id, error))
+        self._finish_if_done(db, scan_job_id, now)
+        logger.warning(f"[WARNING] Work unit {unit_id} of job {scan_job_id} dead-lettered: {error}")
+
+    def _purge_expired(self, db: sqlite3.Connection, now: float) -> None:
+        """Delete finished jobs older than WorkQueueConfig.JOB_RETENTION_SECONDS"""
+        expired = [
+            row[0] for row in db.execute(
+                "SELECT scan_job_id FROM scan_jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+                (now - WorkQueueConfig.JOB_RETENTION_SECONDS,)
+            )
+        ]
+        for table in ('work_units', 'job_errors', 'unit_results', 'scan_jobs'):
+            db.executemany(f"DELETE FROM {table} WHERE scan_job_id = ?", [(job_id,) for job_id in expired])
+
+    def submit_job(self, scan_job_id: str, spec: Dict[str, Any], units: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._transaction() as db:
+            self._purge_expired(db, now)
+            db.execute(
+                "INSERT INTO scan_jobs (scan_job_id, spec, units_total, units_done, units_failed, "
+                "planned, started, cancelled, created_at, updated_at) VALUES (?, ?, ?, 0, 0, 0, 0, 0, ?, ?)",
+                (str(scan_job_id), json.dumps(spec, default=str), len(units), now, now)
+            )
+            self._insert_units(db, str(scan_job_id), units, now)
+        logger.info(f"[OK] Scan job {scan_job_id} queued ({len(units)} units)")
+
+    def lease(self, worker_id: str, visibility_timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        visibility_timeout = visibility_timeout or WorkQueueConfig.VISIBILITY_TIMEOUT_SECONDS
+        now = time.time()
+        with self._transaction() as db:
+            while True:
+                row = db.execute(
+                    "SELECT unit_id, scan_job_id, kind, payload, state, attempts FROM work_units "
+                    "WHERE (state = ? AND available_at <= ?) OR (state = ? AND lease_expires <= ?) "
+                    "ORDER BY available_at LIMIT 1",
+                    (UNIT_PENDING, now, UNIT_LEASED, now)
+                ).fetchone()
+                if row is None:
+                    return None
+                unit_id, scan_job_id, kind, payload, state, attempts = row
+                if state == UNIT_LEASED and attempts >= WorkQueueConfig.MAX_ATTEMPTS:
+                    # Lease expired on the last attempt (worker keeps dying on this unit)
+                    self._dead_letter(db, unit_id, scan_job_id, f"Unit {unit_id} lease expired {attempts} times", now)
+                    continue
+                lease_id = uuid4().hex
+                db.execute(
+                    "UPDATE work_units SET state = ?, attempts = attempts + 1, lease_id = ?, "
+                    "lease_expires = ?, worker_id = ? WHERE unit_id = ?",
+                    (UNIT_LEASED, lease_id, now + visibility_timeout, worker_id, unit_id)
+                )
+                db.execute(
+                    "UPDATE scan_jobs SET started = 1, updated_at = ? WHERE scan_job_id = ?",
+                    (now, scan_job_id)
+                )
+                return {
+                    'unit_id': unit_id,
+                    'scan_job_id': scan_job_id,
+                    'kind': kind,
+                    'payload': json.loads(payload),
+                    'attempts': attempts + 1,
+                    'lease_id': lease_id
+                }
+
+    def extend(self, lease: Dict[str, Any], visibility_timeout: Optional[float] = None) -> bool:
+        visibility_timeout = visibility_timeout or WorkQueueConfig.VISIBILITY_TIMEOUT_SECONDS
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE work_units SET lease_expires = ? WHERE unit_id = ? AND lease_id = ? AND state = ?",
+                (time.time() + visibility_timeout, lease['unit_id'], lease['lease_id'], UNIT_LEASED)
+            )
+            return cursor.rowcount == 1
+
+    def ack(
+        self,
+        lease: Dict[str, Any],
+        result: Optional[Dict[str, Any]] = None,
+        new_units: Optional[List[Dict[str, Any]]] = None
+    ) -> bool:
+        now = time.time()
+        scan_job_id = lease['scan_job_id']
+        with self._transaction() as db:
+            cursor = db.execute(
+                "DELETE FROM work_units WHERE unit_id = ? AND lease_id = ? AND state = ?",
+                (lease['unit_id'], lease['lease_id'], UNIT_LEASED)
+            )
+            if cursor.rowcount != 1:
+                return False
+            if result is not None:
+                db.execute(
+                    "INSERT INTO unit_results (scan_job_id, result) VALUES (?, ?)",
+                    (scan_job_id, json.dumps(result, default=str))
+                )
+            cancelled = db.execute(
+                "SELECT cancelled FROM scan_jobs WHERE scan_job_id = ?", (scan_job_id,)
+            ).fetchone()[0]
+            if new_units and not cancelled:
+                self._insert_units(db, scan_job_id, new_units, now)
+                db.execute(
+                    "UPDATE scan_jobs SET units_total = units_total + ? WHERE scan_job_id = ?",
+                    (len(new_units), scan_job_id)
+                )
+            db.execute(
+                "UPDATE scan_jobs SET units_done = units_done + 1, updated_at = ?, "
+                "planned = MAX(planned, ?) WHERE scan_job_id = ?",
+                (now, int(lease['kind'] == UNIT_PLAN), scan_job_id)
+            )
+            self._finish_if_done(db, scan_job_id, now)
+        return True
+
+    def fail(self, lease: Dict[str, Any], error: str) -> Optional[str]:
+        now = time.time()
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT attempts FROM work_units WHERE unit_id = ? AND lease_id = ? AND state = ?",
+                (lease['unit_id'], lease['lease_id'], UNIT_LEASED)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] >= WorkQueueConfig.MAX_ATTEMPTS:
+                self._dead_letter(db, lease['unit_id'], lease['scan_job_id'], error, now)
+                return UNIT_DEAD
+            db.execute(
+                "UPDATE work_units SET state = ?, lease_id = NULL, available_at = ?, last_error = ? "
+                "WHERE unit_id = ?",
+                (UNIT_PENDING, now + retry_delay(row[0]), error, lease['unit_id'])
+            )
+            return UNIT_PENDING
+
+    def cancel_job(self, scan_job_id: str) -> bool:
+        now = time.time()
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE scan_jobs SET cancelled = 1, updated_at = ?, finished_at = ? WHERE scan_job_id = ?",
+                (now, now, str(scan_job_id))
+            )
+            if cursor.rowcount != 1:
+                return False
+            db.execute(
+                "DELETE FROM work_units WHERE scan_job_id = ? AND state = ?",
+                (str(scan_job_id), UNIT_PENDING)
+            )
+        return True
+
+    def is_cancelled(self, scan_job_id: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT cancelled FROM scan_jobs WHERE scan_job_id = ?", (str(scan_job_id),)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def get_job(self, scan_job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT spec, units_total, units_done, units_failed, planned, started, cancelled, "
+                "created_at, updated_at FROM scan_jobs WHERE scan_job_id = ?",
+                (str(scan_job_id),)
+            ).fetchone()
+            if row is None:
+                return None
+            errors = [
+                error for (error,) in self._connection.execute(
+                    "SELECT error FROM job_errors WHERE scan_job_id = ? ORDER BY rowid", (str(scan_job_id),)
+                )
+            ]
+        record = dict(zip(
+            ('spec', 'units_total', 'units_done', 'units_failed', 'planned', 'started', 'cancelled',
+             'created_at', 'updated_at'),
+            row
+        ))
+        record['spec'] = json.loads(record['spec'])
+        return self._job_record(str(scan_job_id), record, errors)
+
+    @staticmethod
+    def _job_record(scan_job_id: str, record: Dict[str, Any], errors: List[str]) -> Dict[str, Any]:
+        return {
+            'scan_job_id': scan_job_id,
+            'spec': record['spec'],
+            'status': job_status(record),
+            'units_total': record['units_total'],
+            'units_done': record['units_done'],
+            'units_failed': record['units_failed'],
+            'units_pending': record['units_total'] - record['units_done'] - record['units_failed'],
+            'errors': errors,
+            'created_at': record['created_at'],
+            'updated_at': record['updated_at']
+        }
+
+    def read_results(self, scan_job_id: str, after: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT seq, result FROM unit_results WHERE scan_job_id = ? AND seq > ? ORDER BY seq",
+                (str(scan_job_id), after)
+            ).fetchall()
+        return [(seq, json.loads(result)) for seq, result in rows]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._connection.execute(
+                "SELECT state, COUNT(*) FROM work_units GROUP BY state"
+            ).fetchall())
+        return {
+            'backend': self.backend,
+            'pending': counts.get(UNIT_PENDING, 0),
+            'leased': counts.get(UNIT_LEASED, 0),
+            'dead': counts.get(UNIT_DEAD, 0)
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+# Lua helpers shared by the Redis scripts (server time keeps leases consistent across hosts)
+_LUA_HELPERS = """
+if redis.replicate_commands then redis.replicate_commands() end
+local prefix = ARGV[1]
+local function now()
+    local t = redis.call('TIME')
+    return tonumber(t[1]) + tonumber(t[2]) / 1000000
+end
+local function job_key(job_id)
+    return prefix .. ':job:' .. job_id
+end
+local function finish_if_done(job_id, t, retention)
+    local key = job_key(job_id)
+    local v = redis.call('HMGET', key, 'planned', 'units_total', 'units_done', 'units_failed')
+    if v[1] == '1' and tonumber(v[3]) + tonumber(v[4]) >= tonumber(v[2]) then
+        redis.call('HSET', key, 'finished_at', t)
+        for _, suffix in ipairs({'', ':units', ':errors', ':results'}) do
+            redis.call('EXPIRE', key .. suffix, retention)
+        end
+    end
+end
+local function add_unit(job_id, unit, t)
+    local key = prefix .. ':unit:' .. unit['unit_id']
+    redis.call('HSET', key, 'scan_job_id', job_id, 'kind', unit['kind'], 'payload', unit['payload'],
+        'state', 'pending', 'attempts', 0)
+    redis.call('SADD', job_key(job_id) .. ':units', unit['unit_id'])
+    redis.call('ZADD', prefix .. ':ready', t, unit['unit_id'])
+end
+local function dead_letter(unit_id, job_id, err, t, retention)
+    local key = prefix .. ':unit:' .. unit_id
+    redis.call('HSET', key, 'state', 'dead', 'lease_id', '', 'last_error', err)
+    redis.call('EXPIRE', key, retention)
+    redis.call('HINCRBY', job_key(job_id), 'units_failed', 1)
+    redis.call('HSET', job_key(job_id), 'updated_at', t)
+    redis.call('RPUSH', job_key(job_id) .. ':errors', err)
+    finish_if_done(job_id, t, retention)
+end
+local function holds_lease(key, lease_id)
+    return redis.call('HGET', key, 'state') == 'leased' and redis.call('HGET', key, 'lease_id') == lease_id
+end
+"""
+
+# ARGV: prefix, job_id, spec, units_json
+_LUA_SUBMIT = _LUA_HELPERS + """
+local t = now()
+local units = cjson.decode(ARGV[4])
+redis.call('HSET', job_key(ARGV[2]), 'spec', ARGV[3], 'units_total', #units, 'units_done', 0,
+    'units_failed', 0, 'planned', 0, 'started', 0, 'cancelled', 0, 'created_at', t, 'updated_at', t)
+for _, unit in ipairs(units) do add_unit(ARGV[2], unit, t) end
+return 1
+"""
+
+# ARGV: prefix, worker_id, lease_id, visibility_timeout, max_attempts, retention
+_LUA_LEASE = _LUA_HELPERS + """
+local t = now()
+local ready = prefix .. ':ready'
+local leased = prefix .. ':leased'
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', leased, '-inf', t)) do
+    redis.call('ZREM', leased, id)
+    local key = prefix .. ':unit:' .. id
+    local attempts = tonumber(redis.call('HGET', key, 'attempts'))
+    if attempts == nil then
+        -- Unit hash expired with its job
+    elseif attempts >= tonumber(ARGV[5]) then
+        dead_letter(id, redis.call('HGET', key, 'scan_job_id'),
+            'Unit ' .. id .. ' lease expired ' .. attempts .. ' times', t, ARGV[6])
+    else
+        redis.call('HSET', key, 'state', 'pending', 'lease_id', '')
+        redis.call('ZADD', ready, t, id)
+    end
+end
+local ids = redis.call('ZRANGEBYSCORE', ready, '-inf', t, 'LIMIT', 0, 1)
+if #ids == 0 then return false end
+local id = ids[1]
+local key = prefix .. ':unit:' .. id
+redis.call('ZREM', ready, id)
+local attempts = redis.call('HINCRBY', key, 'attempts', 1)
+redis.call('HSET', key, 'state', 'leased', 'lease_id', ARGV[3], 'worker_id', ARGV[2])
+redis.call('ZADD', leased, t + tonumber(ARGV[4]), id)
+local job_id = redis.call('HGET', key, 'scan_job_id')
+redis.call('HSET', job_key(job_id), 'started', 1, 'updated_at', t)
+return {id, job_id, redis.call('HGET', key, 'kind'), redis.call('HGET', key, 'payload'), attempts}
+"""
+
+# ARGV: prefix, unit_id, lease_id, visibility_timeout
+_LUA_EXTEND = _LUA_HELPERS + """
+local key = prefix .. ':unit:' .. ARGV[2]
+if not holds_lease(key, ARGV[3]) then return 0 end
+redis.call('ZADD', prefix .. ':leased', now() + tonumber(ARGV[4]), ARGV[2])
+return 1
+"""
+
+# ARGV: prefix, unit_id, lease_id, result_json ('' for none), new_units_json, retention
+_LUA_ACK = _LUA_HELPERS + """
+local key = prefix .. ':unit:' .. ARGV[2]
+if not holds_lease(key, ARGV[3]) then return 0 end
+local t = now()
+local job_id = redis.call('HGET', key, 'scan_job_id')
+local kind = redis.call('HGET', key, 'kind')
+local jkey = job_key(job_id)
+redis.call('ZREM', prefix .. ':leased', ARGV[2])
+redis.call('DEL', key)
+redis.call('SREM', jkey .. ':units', ARGV[2])
+if ARGV[4] ~= '' then redis.call('RPUSH', jkey .. ':results', ARGV[4]) end
+local units = cjson.decode(ARGV[5])
+if #units > 0 and redis.call('HGET', jkey, 'cancelled') ~= '1' then
+    for _, unit in ipairs(units) do add_unit(job_id, unit, t) end
+    redis.call('HINCRBY', jkey, 'units_total', #units)
+end
+if kind == 'plan' then redis.call('HSET', jkey, 'planned', 1) end
+redis.call('HINCRBY', jkey, 'units_done', 1)
+redis.call('HSET', jkey, 'updated_at', t)
+finish_if_done(job_id, t, ARGV[6])
+return 1
+"""
+
+# ARGV: prefix, unit_id, lease_id, error, max_attempts, retry_delay, backoff_multiplier, retention
+_LUA_FAIL = _LUA_HELPERS + """
+local key = prefix .. ':unit:' .. ARGV[2]
+if not holds_lease(key, ARGV[3]) then return false end
+local t = now()
+local attempts = tonumber(redis.call('HGET', key, 'attempts'))
+redis.call('ZREM', prefix .. ':leased', ARGV[2])
+if attempts >= tonumber(ARGV[5]) then
+    dead_letter(ARGV[2], redis.call('HGET', key, 'scan_job_id'), ARGV[4], t, ARGV[8])
+    return 'dead'
+end
+redis.call('HSET', key, 'state', 'pending', 'lease_id', '', 'last_error', ARGV[4])
+redis.call('ZADD', prefix .. ':ready', t + tonumber(ARGV[6]) * tonumber(ARGV[7]) ^ (attempts - 1), ARGV[2])
+return 'pending'
+"""
+
+# ARGV: prefix, job_id, retention
+_LUA_CANCEL = _LUA_HELPERS + """
+local jkey = job_key(ARGV[2])
+if redis.call('EXISTS', jkey) == 0 then return 0 end
+local t = now()
+redis.call('HSET', jkey, 'cancelled', 1, 'updated_at', t, 'finished_at', t)
+for _, id in ipairs(redis.call('SMEMBERS', jkey .. ':units')) do
+    local key = prefix .. ':unit:' .. id
+    if redis.call('HGET', key, 'state') == 'pending' then
+        redis.call('ZREM', prefix .. ':ready', id)
+        redis.call('DEL', key)
+        redis.call('SREM', jkey .. ':units', id)
+    end
+end
+for _, suffix in ipairs({'', ':units', ':errors', ':results'}) do
+    redis.call('EXPIRE', jkey .. suffix, ARGV[3])
+end
+return 1
+"""
+
+
+class RedisWorkQueue(WorkQueue):
+    """
+    Redis work queue shared by API nodes and scan workers on any host.
+
+    Ready units live in a sorted set scored by availability time, leased
+    units in one scored by lease expiry; every transition is one Lua script,
+    so concurrent workers never lease or ack the same unit twice. All keys
+    share WorkQueueConfig.REDIS_KEY_PREFIX (use a hash-tagged prefix on Redis Cluster).
+    """
+
+    backend = 'redis'
+
+    def __init__(self, url: str = WorkQueueConfig.REDIS_URL, prefix: str = WorkQueueConfig.REDIS_KEY_PREFIX):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("redis package not installed. Install: pip install redis")
+
+        self.prefix = prefix
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self._submit = self.client.register_script(_LUA_SUBMIT)
+        self._lease = self.client.register_script(_LUA_LEASE)
+        self._extend = self.client.register_script(_LUA_EXTEND)
+        self._ack = self.client.register_script(_LUA_ACK)
+        self._fail = self.client.register_script(_LUA_FAIL)
+        self._cancel = self.client.register_script(_LUA_CANCEL)
+
+    def _job_key(self, scan_job_id: str) -> str:
+        return f"{self.prefix}:job:{scan_job_id}"
+
+    @staticmethod
+    def _encode_units(units: Optional[List[Dict[str, Any]]]) -> str:
+        return json.dumps([
+            dict(unit, payload=json.dumps(unit['payload'], default=str)) for unit in units or []
+        ])
+
+    def submit_job(self, scan_job_id: str, spec: Dict[str, Any], units: List[Dict[str, Any]]) -> None:
+        self._submit(args=[self.prefix, str(scan_job_id), json.dumps(spec, default=str), self._encode_units(units)])
+        logger.info(f"[OK] Scan job {scan_job_id} queued ({len(units)} units)")
+
+    def lease(self, worker_id: str, visibility_timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        lease_id = uuid4().hex
+        leased = self._lease(args=[
+            self.prefix,
+            worker_id,
+            lease_id,
+            visibility_timeout or WorkQueueConfig.VISIBILITY_TIMEOUT_SECONDS,
+            WorkQueueConfig.MAX_ATTEMPTS,
+            WorkQueueConfig.JOB_RETENTION_SECONDS
+        ])
+        if not leased:
+            return None
+        unit_id, scan_job_id, kind, payload, attempts = leased
+        return {
+            'unit_id': unit_id,
+            'scan_job_id': scan_job_id,
+            'kind': kind,
+            'payload': json.loads(payload),
+            'attempts': int(attempts),
+            'lease_id': lease_id
+        }
+
+    def extend(self, lease: Dict[str, Any], visibility_timeout: Optional[float] = None) -> bool:
+        return bool(self._extend(args=[
+            self.prefix,
+            lease['unit_id'],
+            lease['lease_id'],
+            visibility_timeout or WorkQueueConfig.VISIBILITY_TIMEOUT_SECONDS
+        ]))
+
+    def ack(
+        self,
+        lease: Dict[str, Any],
+        result: Optional[Dict[str, Any]] = None,
+        new_units: Optional[List[Dict[str, Any]]] = None
+    ) -> bool:
+        return bool(self._ack(args=[
+            self.prefix,
+            lease['unit_id'],
+            lease['lease_id'],
+            json.dumps(result, default=str) if result is not None else '',
+            self._encode_units(new_units),
+            WorkQueueConfig.JOB_RETENTION_SECONDS
+        ]))
+
+    def fail(self, lease: Dict[str, Any], error: str) -> Optional[str]:
+        state = self._fail(args=[
+            self.prefix,
+            lease['unit_id'],
+            lease['lease_id'],
+            error,
+            WorkQueueConfig.MAX_ATTEMPTS,
+            WorkQueueConfig.RETRY_DELAY_SECONDS,
+            WorkQueueConfig.RETRY_BACKOFF_MULTIPLIER,
+            WorkQueueConfig.JOB_RETENTION_SECONDS
+        ])
+        if state == UNIT_DEAD:
+            logger.warning(f"[WARNING] Work unit {lease['unit_id']} of job {lease['scan_job_id']} dead-lettered: {error}")
+        return state or None
+
+    def cancel_job(self, scan_job_id: str) -> bool:
+        return bool(self._cancel(args=[self.prefix, str(scan_job_id), WorkQueueConfig.JOB_RETENTION_SECONDS]))
+
+    def is_cancelled(self, scan_job_id: str) -> bool:
+        return self.client.hget(self._job_key(scan_job_id), 'cancelled') == '1'
+
+    def get_job(self, scan_job_id: str) -> Optional[Dict[str, Any]]:
+        key = self._job_key(scan_job_id)
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.hgetall(key)
+        pipeline.lrange(f"{key}:errors", 0, -1)
+        fields, errors = pipeline.execute()
+        if not fields:
+            return None
+        record = {
+            'spec': json.loads(fields['spec']),
+            'created_at': float(fields['created_at']),
+            'updated_at': float(fields['updated_at'])
+        }
+        for name in ('units_total', 'units_done', 'units_failed', 'planned', 'started', 'cancelled'):
+            record[name] = int(fields.get(name, 0))
+        return SQLiteWorkQueue._job_record(str(scan_job_id), record, errors)
+
+    def read_results(self, scan_job_id: str, after: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        results = self.client.lrange(f"{self._job_key(scan_job_id)}:results", after, -1)
+        return [(after + index + 1, json.loads(result)) for index, result in enumerate(results)]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'backend': self.backend,
+            'pending': self.client.zcard(f"{self.prefix}:ready"),
+            'leased': self.client.zcard(f"{self.prefix}:leased"),
+            'dead': None  # Dead units expire with their job; counted per job in units_failed
+        }
+
+    def close(self) -> None:
+        self.client.close()
+
+
+WORK_QUEUES = {
+    'sqlite': SQLiteWorkQueue,
+    'redis': RedisWorkQueue
+}
+
+
+def create_work_queue(backend: Optional[str] = None, **options) -> WorkQueue:
+    """
+    Create a work queue.
+
+    Args:
+        backend: 'sqlite' or 'redis' (default: WorkQueueConfig.BACKEND)
+        **options: Backend constructor options (path, url, prefix)
+
+    Returns:
+        WorkQueue instance
+    """
+    backend = backend or WorkQueueConfig.BACKEND
+    queue_class = WORK_QUEUES.get(backend)
+    if queue_class is None:
+        raise ValueError(
+            f"Unknown work queue backend: {backend} "
+            f"(supported: {', '.join(WorkQueueConfig.BACKENDS)})"
+        )
+    logger.info(f"[OK] Work queue created: {backend}")
+    return queue_class(**options)
+
+
+# Global queue instance (opened on first queued scan)
+_work_queue_instance: Optional[WorkQueue] = None
+_work_queue_lock = threading.Lock()
+
+
+def get_work_queue() -> WorkQueue:
+    """Get the shared work queue (WorkQueueConfig.BACKEND)"""
+    global _work_queue_instance
+    with _work_queue_lock:
+        if _work_queue_instance is None:
+            _work_queue_instance = create_work_queue()
+        return _work_queue_instance
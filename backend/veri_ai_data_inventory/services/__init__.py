@@ -5,11 +5,16 @@ Service layer for business logic and state management.
 """
 
 from .job_state_manager import JobStateManager
+from .job_store import JobStore, create_job_store
 from .scan_service import ScanService
+from .scan_worker import ScanWorker
 from .flow_discovery_service import FlowDiscoveryService
 
 __all__ = [
     'JobStateManager',
+    'JobStore',
+    'create_job_store',
     'ScanService',
+    'ScanWorker',
     'FlowDiscoveryService',
 ]
@@ -1,28 +1,30 @@
 """
 VeriSyntra Job State Manager
 
-In-memory state management for scan jobs using dynamic configuration.
-This implementation uses a simple dictionary-based approach suitable for
-prototype/development. Production should use Redis or database-backed storage.
+State management for scan jobs using dynamic configuration.
+Job state is kept in a pluggable job store (services.job_store): in memory
+for a single API process, or in Redis to share jobs between API workers.
 
 Key Features:
 - Dynamic configuration from APIConfig (zero hard-coding)
 - Thread-safe operations for concurrent access
-- Automatic cleanup of expired jobs
+- Tenant/status indexes for listing and statistics
+- Automatic expiry of finished jobs after the retention period
 - Vietnamese business context preservation
 """
 
 import logging
+import time
 from datetime import datetime, timedelta
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
 # Import dynamic configuration
 try:
-    from ..config.constants import APIConfig
+    from ..config.constants import APIConfig, JobStoreConfig
 except ImportError:
-    from config.constants import APIConfig
+    from config.constants import APIConfig, JobStoreConfig
 
 logger = logging.getLogger(__name__)
 
@@ -56,13 +58,27 @@ class JobState:
         self.status = APIConfig.STATUS_PENDING
         self.progress = 0
         self.discovered_assets = []
+        self.total_assets = 0  # All streamed assets (discovered_assets is capped)
         self.filter_statistics = None
         self.errors = []
+        self.partial = False  # True when stopped early (cancelled or timed out)
+        self.cancel_reason = None
+        self.delta = None  # Delta report of incremental scans (added/changed/unchanged/removed)
+        self.result_file = None  # Result file holding every asset ({'path', 'format'})
+        self.result_summary = None  # Summary statistics of the result file
+        self.content_statistics = None  # Content PII scan totals and throughput (file scans)
+        self.duplicate_report = None  # Duplicate content clusters (files and objects)
+        self.result_writer = None  # ResultWriter of the running scan (never persisted)
+        self.content_index = None  # ContentDedupIndex of the running scan (never persisted)
         
         self.created_at = datetime.utcnow()
+        self.updated_at = self.created_at
         self.started_at = None
         self.completed_at = None
         self.duration_seconds = None
+        
+        # Called as listener(job, transition) on progress (False) and status changes (True)
+        self.listeners: List[Callable[['JobState', bool], None]] = []
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert job state to dictionary"""
@@ -73,7 +89,14 @@ class JobState:
             'status': self.status,
             'progress': self.progress,
             'discovered_assets': self.discovered_assets,
+            'total_assets': self.total_assets,
             'filter_statistics': self.filter_statistics,
+            'partial': self.partial,
+            'cancel_reason': self.cancel_reason,
+            'delta': self.delta,
+            'result_summary': self.result_summary,
+            'content_statistics': self.content_statistics,
+            'duplicate_report': self.duplicate_report,
             'errors': self.errors[:APIConfig.MAX_ERRORS_PER_RESPONSE],  # Use config limit
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'started_at': self.started_at.isoformat() if self.started_at else None,
@@ -82,22 +105,127 @@ class JobState:
             'veri_business_context': self.veri_business_context
         }
     
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Complete JSON-serializable state for job stores
+        
+        connection_config is left out: credentials are never persisted.
+        """
+        return {
+            'scan_job_id': str(self.scan_job_id),
+            'tenant_id': str(self.tenant_id),
+            'source_type': self.source_type,
+            'column_filter': self.column_filter,
+            'veri_business_context': self.veri_business_context,
+            'status': self.status,
+            'progress': self.progress,
+            'discovered_assets': self.discovered_assets,
+            'total_assets': self.total_assets,
+            'filter_statistics': self.filter_statistics,
+            'errors': self.errors,
+            'partial': self.partial,
+            'cancel_reason': self.cancel_reason,
+            'delta': self.delta,
+            'result_file': self.result_file,
+            'result_summary': self.result_summary,
+            'content_statistics': self.content_statistics,
+            'duplicate_report': self.duplicate_report,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'duration_seconds': self.duration_seconds
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> 'JobState':
+        """Rebuild a job state saved with to_record() (without connection_config)"""
+        job = cls(
+            scan_job_id=UUID(record['scan_job_id']),
+            tenant_id=UUID(record['tenant_id']),
+            source_type=record['source_type'],
+            connection_config={},
+            column_filter=record['column_filter'],
+            veri_business_context=record['veri_business_context']
+        )
+        for key in (
+            'status', 'progress', 'discovered_assets', 'total_assets', 'filter_statistics',
+            'errors', 'partial', 'cancel_reason', 'delta', 'duration_seconds'
+        ):
+            setattr(job, key, record[key])
+        for key in ('result_file', 'result_summary', 'content_statistics', 'duplicate_report'):
+            # Absent from records saved before these fields
+            setattr(job, key, record.get(key))
+        for key in ('created_at', 'updated_at', 'started_at', 'completed_at'):
+            setattr(job, key, datetime.fromisoformat(record[key]) if record[key] else None)
+        return job
+    
+    def progress_event(self) -> Dict[str, Any]:
+        """Progress snapshot pushed to progress stream subscribers (no asset lists)"""
+        return {
+            'scan_job_id': str(self.scan_job_id),
+            'status': self.status,
+            'progress': self.progress,
+            'total_assets': self.total_assets,
+            'partial': self.partial,
+            'cancel_reason': self.cancel_reason,
+            'errors': self.errors[:APIConfig.MAX_ERRORS_PER_RESPONSE],  # Use config limit
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+    
+    def _notify(self, transition: bool = False):
+        """Report a change to the listeners (listener errors never fail the scan)"""
+        self.updated_at = datetime.utcnow()
+        for listener in self.listeners:
+            try:
+                listener(self, transition)
+            except Exception as e:
+                logger.warning(f"[WARNING] Job listener failed for job {self.scan_job_id}: {str(e)}")
+    
     def start(self):
         """Mark job as started using dynamic status"""
         self.status = APIConfig.STATUS_RUNNING
         self.started_at = datetime.utcnow()
         logger.info(f"[OK] Scan job {self.scan_job_id} started")
+        self._notify(transition=True)
     
     def update_progress(self, progress: int):
         """Update job progress (0-100)"""
-        self.progress = max(0, min(100, progress))
+        progress = max(0, min(100, progress))
+        if progress != self.progress:
+            self.progress = progress
+            self._notify()
     
-    def complete(self, discovered_assets: List[Dict[str, Any]], filter_statistics: Optional[Dict[str, Any]] = None):
-        """Mark job as completed using dynamic status"""
+    def add_discovered_assets(self, assets: List[Dict[str, Any]]):
+        """Append assets streamed while the scan runs (kept up to MAX_ASSETS_PER_RESPONSE)"""
+        room = APIConfig.MAX_ASSETS_PER_RESPONSE - len(self.discovered_assets)
+        if room > 0:
+            self.discovered_assets.extend(assets[:room])
+        self.total_assets += len(assets)
+        self._notify()
+    
+    def complete(
+        self,
+        discovered_assets: Optional[List[Dict[str, Any]]] = None,
+        filter_statistics: Optional[Dict[str, Any]] = None,
+        partial: bool = False,
+        cancel_reason: Optional[str] = None
+    ):
+        """
+        Mark job as completed using dynamic status (partial when it hit its deadline)
+        
+        discovered_assets replaces the streamed assets when given.
+        """
         self.status = APIConfig.STATUS_COMPLETED
         self.progress = 100
-        self.discovered_assets = discovered_assets[:APIConfig.MAX_ASSETS_PER_RESPONSE]  # Use config limit
+        if discovered_assets is not None:
+            self.discovered_assets = discovered_assets[:APIConfig.MAX_ASSETS_PER_RESPONSE]  # Use config limit
+            self.total_assets = len(discovered_assets)
         self.filter_statistics = filter_statistics
+        self.partial = partial
+        self.cancel_reason = cancel_reason
         self.completed_at = datetime.utcnow()
         
         if self.started_at:
@@ -105,8 +233,9 @@ class JobState:
         
         logger.info(
             f"[OK] Scan job {self.scan_job_id} completed: "
-            f"{len(self.discovered_assets)} assets discovered in {self.duration_seconds}s"
+            f"{self.total_assets} assets discovered in {self.duration_seconds}s"
         )
+        self._notify(transition=True)
     
     def fail(self, error_message: str):
         """Mark job as failed using dynamic status"""
@@ -121,16 +250,23 @@ class JobState:
             self.duration_seconds = int((self.completed_at - self.started_at).total_seconds())
         
         logger.error(f"[ERROR] Scan job {self.scan_job_id} failed: {truncated_error}")
+        self._notify(transition=True)
     
-    def cancel(self):
-        """Mark job as cancelled using dynamic status"""
+    def cancel(self, discovered_assets: Optional[List[Dict[str, Any]]] = None):
+        """Mark job as cancelled using dynamic status, keeping assets discovered before cancellation"""
         self.status = APIConfig.STATUS_CANCELLED
         self.completed_at = datetime.utcnow()
+        self.partial = True
+        self.cancel_reason = self.cancel_reason or 'cancelled'
+        if discovered_assets is not None:
+            self.discovered_assets = discovered_assets[:APIConfig.MAX_ASSETS_PER_RESPONSE]  # Use config limit
+            self.total_assets = len(discovered_assets)
         
         if self.started_at:
             self.duration_seconds = int((self.completed_at - self.started_at).total_seconds())
         
         logger.info(f"[OK] Scan job {self.scan_job_id} cancelled")
+        self._notify(transition=True)
     
     def is_terminal(self) -> bool:
         """Check if job is in terminal state"""
@@ -155,17 +291,31 @@ class JobState:
 
 class JobStateManager:
     """
-    Thread-safe in-memory job state manager
+    Thread-safe job state manager
     
-    Manages scan job lifecycle using dynamic configuration.
-    Suitable for development/prototype. Production should use Redis/database.
+    Manages scan job lifecycle using dynamic configuration. Job state lives
+    in a JobStore (JobStoreConfig.BACKEND): 'memory' for one API process,
+    'redis' to share jobs between API workers. Jobs running in this process
+    are kept as live objects and written to the store on status changes and
+    at most every JobStoreConfig.PERSIST_INTERVAL_SECONDS while they progress.
     """
     
-    def __init__(self):
-        """Initialize job state manager"""
-        self._jobs: Dict[UUID, JobState] = {}
+    def __init__(self, store: Optional[Any] = None):
+        """
+        Initialize job state manager
+        
+        Args:
+            store: JobStore holding job state (default: JobStoreConfig.BACKEND store)
+        """
+        if store is None:
+            # Imported here: job stores rebuild JobState objects from this module
+            from .job_store import create_job_store
+            store = create_job_store()
+        self.store = store
+        self._live: Dict[UUID, JobState] = {}  # Jobs running in this process
+        self._persisted_at: Dict[UUID, float] = {}
         self._lock = Lock()
-        logger.info("[OK] JobStateManager initialized (in-memory storage)")
+        logger.info(f"[OK] JobStateManager initialized ({store.backend} job store)")
     
     def create_job(
         self,
@@ -177,72 +327,93 @@ class JobStateManager:
         veri_business_context: Optional[Dict[str, Any]] = None
     ) -> JobState:
         """Create new job state"""
+        job_state = JobState(
+            scan_job_id=scan_job_id,
+            tenant_id=tenant_id,
+            source_type=source_type,
+            connection_config=connection_config,
+            column_filter=column_filter,
+            veri_business_context=veri_business_context
+        )
+        job_state.listeners.append(self._job_changed)
+        self.store.save(job_state)
         with self._lock:
-            job_state = JobState(
-                scan_job_id=scan_job_id,
-                tenant_id=tenant_id,
-                source_type=source_type,
-                connection_config=connection_config,
-                column_filter=column_filter,
-                veri_business_context=veri_business_context
-            )
-            self._jobs[scan_job_id] = job_state
-            
-            logger.info(
-                f"[OK] Created job {scan_job_id} for tenant {tenant_id} "
-                f"(source: {source_type})"
-            )
-            
-            return job_state
+            self._live[scan_job_id] = job_state
+            self._persisted_at[scan_job_id] = time.monotonic()
+        
+        logger.info(
+            f"[OK] Created job {scan_job_id} for tenant {tenant_id} "
+            f"(source: {source_type})"
+        )
+        
+        return job_state
     
     def get_job(self, scan_job_id: UUID) -> Optional[JobState]:
-        """Get job state by ID"""
+        """Get job state by ID (live object if the job runs in this process)"""
         with self._lock:
-            return self._jobs.get(scan_job_id)
+            job = self._live.get(scan_job_id)
+        if job is not None:
+            return job
+        
+        job = self.store.load(str(scan_job_id))
+        if job is not None and self._job_changed not in job.listeners:
+            job.listeners.append(self._job_changed)
+        return job
     
     def update_job(self, scan_job_id: UUID, **kwargs) -> bool:
         """Update job state fields"""
-        with self._lock:
-            job = self._jobs.get(scan_job_id)
-            if not job:
-                logger.warning(f"[WARNING] Job {scan_job_id} not found for update")
-                return False
-            
-            for key, value in kwargs.items():
-                if hasattr(job, key):
-                    setattr(job, key, value)
-            
-            return True
+        job = self.get_job(scan_job_id)
+        if not job:
+            logger.warning(f"[WARNING] Job {scan_job_id} not found for update")
+            return False
+        
+        for key, value in kwargs.items():
+            if hasattr(job, key):
+                setattr(job, key, value)
+        
+        self._save(job)
+        return True
     
     def delete_job(self, scan_job_id: UUID) -> bool:
         """Delete job state (for cancellation)"""
-        with self._lock:
-            if scan_job_id in self._jobs:
-                job = self._jobs[scan_job_id]
-                job.cancel()
-                del self._jobs[scan_job_id]
-                logger.info(f"[OK] Job {scan_job_id} deleted")
-                return True
-            
+        job = self.get_job(scan_job_id)
+        if job is None:
             logger.warning(f"[WARNING] Job {scan_job_id} not found for deletion")
             return False
+        
+        job.listeners.remove(self._job_changed)
+        job.cancel()
+        with self._lock:
+            self._live.pop(scan_job_id, None)
+            self._persisted_at.pop(scan_job_id, None)
+        self.store.delete(str(scan_job_id))
+        logger.info(f"[OK] Job {scan_job_id} deleted")
+        return True
     
     def list_jobs(
         self,
         tenant_id: Optional[UUID] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[JobState]:
-        """List jobs with optional filtering"""
+        """
+        List jobs with optional filtering (index lookup, no full scan)
+        
+        Args:
+            tenant_id: Only jobs of this tenant
+            status: Only jobs in this status
+            limit: Maximum number of jobs
+        
+        Returns:
+            Jobs, most recently updated first
+        """
+        jobs = self.store.query(
+            str(tenant_id) if tenant_id else None,
+            status,
+            limit
+        )
         with self._lock:
-            jobs = list(self._jobs.values())
-            
-            if tenant_id:
-                jobs = [j for j in jobs if j.tenant_id == tenant_id]
-            
-            if status:
-                jobs = [j for j in jobs if j.status == status]
-            
-            return jobs
+            return [self._live.get(job.scan_job_id, job) for job in jobs]
     
     def cleanup_expired_jobs(self) -> int:
         """
@@ -251,40 +422,47 @@ class JobStateManager:
         Returns:
             Number of jobs cleaned up
         """
-        with self._lock:
-            expired_job_ids = [
-                job_id for job_id, job in self._jobs.items()
-                if job.is_terminal() and job.is_expired()
-            ]
-            
-            for job_id in expired_job_ids:
-                del self._jobs[job_id]
-            
-            if expired_job_ids:
-                logger.info(
-                    f"[OK] Cleaned up {len(expired_job_ids)} expired jobs "
-                    f"(retention: {APIConfig.TASK_RETENTION_HOURS}h)"
-                )
-            
-            return len(expired_job_ids)
+        removed = self.store.expire()
+        if removed:
+            logger.info(
+                f"[OK] Cleaned up {removed} expired jobs "
+                f"(retention: {APIConfig.TASK_RETENTION_HOURS}h)"
+            )
+        return removed
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get job state manager statistics"""
+        total_jobs, status_counts = self.store.count_by_status()
+        with self._lock:
+            live_jobs = len(self._live)
+        
+        return {
+            'total_jobs': total_jobs,
+            'status_counts': status_counts,
+            'live_jobs': live_jobs,
+            'store_backend': self.store.backend,
+            'retention_hours': APIConfig.TASK_RETENTION_HOURS,
+            'max_background_tasks': APIConfig.MAX_BACKGROUND_TASKS
+        }
+    
+    def _job_changed(self, job: JobState, transition: bool) -> None:
+        """JobState listener: write status changes at once, progress at most every PERSIST_INTERVAL_SECONDS"""
+        if not transition:
+            with self._lock:
+                last = self._persisted_at.get(job.scan_job_id, float('-inf'))
+            if time.monotonic() - last < JobStoreConfig.PERSIST_INTERVAL_SECONDS:
+                return
+        self._save(job)
+    
+    def _save(self, job: JobState) -> None:
+        self.store.save(job)
         with self._lock:
-            total_jobs = len(self._jobs)
-            status_counts = {}
-            
-            for status in APIConfig.VALID_STATUSES:
-                status_counts[status] = sum(
-                    1 for job in self._jobs.values() if job.status == status
-                )
-            
-            return {
-                'total_jobs': total_jobs,
-                'status_counts': status_counts,
-                'retention_hours': APIConfig.TASK_RETENTION_HOURS,
-                'max_background_tasks': APIConfig.MAX_BACKGROUND_TASKS
-            }
+            if job.is_terminal():
+                # Finished: the store copy is complete; stop tracking the live object
+                self._live.pop(job.scan_job_id, None)
+                self._persisted_at.pop(job.scan_job_id, None)
+            else:
+                self._persisted_at[job.scan_job_id] = time.monotonic()
 
 
 # Global singleton instance (for development/prototype)
@@ -0,0 +1,392 @@
+"""
+VeriSyntra Job Store
+
+Storage of scan job state behind JobStateManager. Both backends keep the
+same secondary indexes, so listing and counting never scan every job:
+
+- all jobs, jobs by tenant, by status and by tenant and status, each
+  ordered by last update
+- finished jobs expire APIConfig.TASK_RETENTION_HOURS after they finish
+
+'memory' holds JobState objects in one process; indexes are insertion-ordered
+dicts and a heap of expiry times is swept on every store operation.
+
+'redis' shares job state between API workers: one hash per job (state and
+the capped asset list in separate fields, so progress writes do not resend
+unchanged assets), sorted sets scored by update time as indexes, and native
+key TTL for retention. Index entries of expired jobs are purged lazily.
+"""
+
+import heapq
+import json
+import logging
+import time
+from datetime import timezone
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import dynamic configuration
+try:
+    from ..config.constants import APIConfig, JobStoreConfig
+    from .job_state_manager import JobState
+except ImportError:
+    from config.constants import APIConfig, JobStoreConfig
+    from services.job_state_manager import JobState
+
+logger = logging.getLogger(__name__)
+
+
+def retention_seconds() -> int:
+    """Time finished jobs are kept"""
+    return APIConfig.TASK_RETENTION_HOURS * 3600
+
+
+def index_keys(tenant_id: str, status: str) -> List[str]:
+    """Index names a job with this tenant and status belongs to"""
+    return ['all', f'tenant:{tenant_id}', f'status:{status}', f'tenant:{tenant_id}:status:{status}']
+
+
+def query_key(tenant_id: Optional[str], status: Optional[str]) -> str:
+    """Index answering a list query with these filters"""
+    if tenant_id and status:
+        return f'tenant:{tenant_id}:status:{status}'
+    if tenant_id:
+        return f'tenant:{tenant_id}'
+    if status:
+        return f'status:{status}'
+    return 'all'
+
+
+class JobStore:
+    """Indexed scan job storage. Subclasses implement every method below."""
+
+    backend = ''
+
+    def save(self, job: JobState) -> None:
+        """Insert or update a job and its index entries (finished jobs start their retention)"""
+        raise NotImplementedError
+
+    def load(self, scan_job_id: str) -> Optional[JobState]:
+        """Job by ID (None if unknown or expired)"""
+        raise NotImplementedError
+
+    def delete(self, scan_job_id: str) -> bool:
+        """Remove a job; False if it is not stored"""
+        raise NotImplementedError
+
+    def query(
+        self,
+        tenant_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[JobState]:
+        """Jobs matching the filters, most recently updated first"""
+        raise NotImplementedError
+
+    def count_by_status(self) -> Tuple[int, Dict[str, int]]:
+        """(total jobs, jobs per status in APIConfig.VALID_STATUSES)"""
+        raise NotImplementedError
+
+    def expire(self) -> int:
+        """Remove jobs past their retention; returns how many were removed"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release backend connections"""
+
+
+class MemoryJobStore(JobStore):
+    """In-process job store (single API worker, tests)"""
+
+    backend = 'memory'
+
+    def __init__(self):
+        self._lock = Lock()
+        self._jobs: Dict[str, JobState] = {}
+        # index name -> job IDs, oldest update first (dicts keep insertion order)
+        self._indexes: Dict[str, Dict[str, None]] = {}
+        # job ID -> (tenant, status) of its index entries
+        self._indexed: Dict[str, Tuple[str, str]] = {}
+        # Retention: expiry time per finished job and a heap of (expiry, job ID)
+        self._expires_at: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+    def save(self, job: JobState) -> None:
+        scan_job_id = str(job.scan_job_id)
+        with self._lock:
+            self._sweep()
+            self._jobs[scan_job_id] = job
+            self._unindex(scan_job_id)
+            entry = (str(job.tenant_id), job.status)
+            for name in index_keys(*entry):
+                self._indexes.setdefault(name, {})[scan_job_id] = None
+            self._indexed[scan_job_id] = entry
+
+            if not job.is_terminal():
+                # Stale heap entries are skipped by the sweep
+                self._expires_at.pop(scan_job_id, None)
+            elif scan_job_id not in self._expires_at:
+                expires_at = time.time() + retention_seconds()
+                self._expires_at[scan_job_id] = expires_at
+                heapq.heappush(self._expiry_heap, (expires_at, scan_job_id))
+
+    def load(self, scan_job_id: str) -> Optional[JobState]:
+        with self._lock:
+            self._sweep()
+            return self._jobs.get(str(scan_job_id))
+
+    def delete(self, scan_job_id: str) -> bool:
+        with self._lock:
+            return self._remove(str(scan_job_id))
+
+    def query(
+        self,
+        tenant_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[JobState]:
+        with self._lock:
+            self._sweep()
+            index = self._indexes.get(query_key(tenant_id and str(tenant_id), status), {})
+            jobs = []
+            for scan_job_id in reversed(index):
+                if limit is not None and len(jobs) >= limit:
+                    break
+                jobs.append(self._jobs[scan_job_id])
+            return jobs
+
+    def count_by_status(self) -> Tuple[int, Dict[str, int]]:
+        with self._lock:
+            self._sweep()
+            return len(self._jobs), {
+                status: len(self._indexes.get(f'status:{status}', ()))
+                for status in APIConfig.VALID_STATUSES
+            }
+
+    def expire(self) -> int:
+        with self._lock:
+            return self._sweep()
+
+    def _sweep(self) -> int:
+        """Remove jobs whose retention ended (lock held)"""
+        removed = 0
+        now = time.time()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, scan_job_id = heapq.heappop(self._expiry_heap)
+            if self._expires_at.get(scan_job_id) == expires_at:
+                self._remove(scan_job_id)
+                removed += 1
+        return removed
+
+    def _unindex(self, scan_job_id: str) -> None:
+        entry = self._indexed.pop(scan_job_id, None)
+        if entry is None:
+            return
+        for name in index_keys(*entry):
+            index = self._indexes.get(name)
+            if index is not None:
+                index.pop(scan_job_id, None)
+                if not index:
+                    del self._indexes[name]
+
+    def _remove(self, scan_job_id: str) -> bool:
+        if self._jobs.pop(scan_job_id, None) is None:
+            return False
+        self._unindex(scan_job_id)
+        self._expires_at.pop(scan_job_id, None)
+        return True
+
+
+# Store a job and move its index entries; the first save of a finished job sets its TTL
+# ARGV: prefix, job ID, tenant, status, update time, retention (0: running), state, assets ('' = unchanged)
+_LUA_SAVE = """
+local prefix, id, tenant, status = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+local key = prefix .. ':job:' .. id
+local indexed = redis.call('HGET', prefix .. ':indexed', id)
+if indexed and indexed ~= tenant .. '\\t' .. status then
+  local old_tenant, old_status = string.match(indexed, '^(.*)\\t(.*)$')
+  redis.call('ZREM', prefix .. ':tenant:' .. old_tenant, id)
+  redis.call('ZREM', prefix .. ':status:' .. old_status, id)
+  redis.call('ZREM', prefix .. ':tenant:' .. old_tenant .. ':status:' .. old_status, id)
+end
+redis.call('HSET', key, 'state', ARGV[7])
+if ARGV[8] ~= '' then
+  redis.call('HSET', key, 'assets', ARGV[8])
+end
+redis.call('HSET', prefix .. ':indexed', id, tenant .. '\\t' .. status)
+local score = tonumber(ARGV[5])
+redis.call('ZADD', prefix .. ':all', score, id)
+redis.call('ZADD', prefix .. ':tenant:' .. tenant, score, id)
+redis.call('ZADD', prefix .. ':status:' .. status, score, id)
+redis.call('ZADD', prefix .. ':tenant:' .. tenant .. ':status:' .. status, score, id)
+local retention = tonumber(ARGV[6])
+if retention == 0 then
+  redis.call('PERSIST', key)
+  redis.call('ZREM', prefix .. ':expiry', id)
+elseif redis.call('TTL', key) < 0 then
+  redis.call('EXPIRE', key, retention)
+  redis.call('ZADD', prefix .. ':expiry', score + retention, id)
+end
+return 1
+"""
+
+# Remove the index entries of one job (deleted, or expired by its TTL)
+_LUA_UNINDEX = """
+local function unindex(prefix, id)
+  local indexed = redis.call('HGET', prefix .. ':indexed', id)
+  if indexed then
+    local tenant, status = string.match(indexed, '^(.*)\\t(.*)$')
+    redis.call('ZREM', prefix .. ':tenant:' .. tenant, id)
+    redis.call('ZREM', prefix .. ':status:' .. status, id)
+    redis.call('ZREM', prefix .. ':tenant:' .. tenant .. ':status:' .. status, id)
+    redis.call('HDEL', prefix .. ':indexed', id)
+  end
+  redis.call('ZREM', prefix .. ':all', id)
+  redis.call('ZREM', prefix .. ':expiry', id)
+end
+"""
+
+# ARGV: prefix, job ID
+_LUA_DELETE = _LUA_UNINDEX + """
+local existed = redis.call('DEL', ARGV[1] .. ':job:' .. ARGV[2])
+unindex(ARGV[1], ARGV[2])
+return existed
+"""
+
+# ARGV: prefix, now
+_LUA_PURGE = _LUA_UNINDEX + """
+local expired = redis.call('ZRANGEBYSCORE', ARGV[1] .. ':expiry', '-inf', ARGV[2])
+for _, id in ipairs(expired) do
+  redis.call('DEL', ARGV[1] .. ':job:' .. id)
+  unindex(ARGV[1], id)
+end
+return #expired
+"""
+
+
+class RedisJobStore(JobStore):
+    """
+    Redis job store shared by all API workers
+
+    All keys share JobStoreConfig.REDIS_KEY_PREFIX (use a hash-tagged
+    prefix on Redis Cluster). Every write is one Lua script, so a job's
+    hash and index entries never disagree.
+    """
+
+    backend = 'redis'
+
+    def __init__(self, url: str = JobStoreConfig.REDIS_URL, prefix: str = JobStoreConfig.REDIS_KEY_PREFIX):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("redis package not installed. Install: pip install redis")
+
+        self.prefix = prefix
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self._save = self.client.register_script(_LUA_SAVE)
+        self._delete = self.client.register_script(_LUA_DELETE)
+        self._purge = self.client.register_script(_LUA_PURGE)
+        self._lock = Lock()
+        # job ID -> (asset list identity, length) last written, to skip unchanged asset lists
+        self._written_assets: Dict[str, Tuple[int, int]] = {}
+
+    def _job_key(self, scan_job_id: str) -> str:
+        return f"{self.prefix}:job:{scan_job_id}"
+
+    def save(self, job: JobState) -> None:
+        scan_job_id = str(job.scan_job_id)
+        record = job.to_record()
+        assets = record.pop('discovered_assets')
+        signature = (id(job.discovered_assets), len(job.discovered_assets))
+        with self._lock:
+            changed = self._written_assets.get(scan_job_id) != signature
+            if job.is_terminal():
+                self._written_assets.pop(scan_job_id, None)
+            else:
+                self._written_assets[scan_job_id] = signature
+
+        self._save(args=[
+            self.prefix,
+            scan_job_id,
+            str(job.tenant_id),
+            job.status,
+            job.updated_at.replace(tzinfo=timezone.utc).timestamp(),
+            retention_seconds() if job.is_terminal() else 0,
+            json.dumps(record, default=str),
+            json.dumps(assets, default=str) if changed or job.is_terminal() else ''
+        ])
+
+    def load(self, scan_job_id: str) -> Optional[JobState]:
+        state, assets = self.client.hmget(self._job_key(str(scan_job_id)), 'state', 'assets')
+        return self._decode(state, assets)
+
+    def delete(self, scan_job_id: str) -> bool:
+        with self._lock:
+            self._written_assets.pop(str(scan_job_id), None)
+        return bool(self._delete(args=[self.prefix, str(scan_job_id)]))
+
+    def query(
+        self,
+        tenant_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[JobState]:
+        self.expire()
+        index = f"{self.prefix}:{query_key(tenant_id and str(tenant_id), status)}"
+        job_ids = self.client.zrevrange(index, 0, -1 if limit is None else limit - 1)
+        pipeline = self.client.pipeline(transaction=False)
+        for scan_job_id in job_ids:
+            pipeline.hmget(self._job_key(scan_job_id), 'state', 'assets')
+        jobs = [self._decode(state, assets) for state, assets in pipeline.execute()]
+        return [job for job in jobs if job is not None]
+
+    def count_by_status(self) -> Tuple[int, Dict[str, int]]:
+        self.expire()
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.zcard(f"{self.prefix}:all")
+        for status in APIConfig.VALID_STATUSES:
+            pipeline.zcard(f"{self.prefix}:status:{status}")
+        total, *counts = pipeline.execute()
+        return total, dict(zip(APIConfig.VALID_STATUSES, counts))
+
+    def expire(self) -> int:
+        # Hashes are already gone (key TTL); this drops their index entries
+        return self._purge(args=[self.prefix, time.time()])
+
+    def close(self) -> None:
+        self.client.close()
+
+    @staticmethod
+    def _decode(state: Optional[str], assets: Optional[str]) -> Optional[JobState]:
+        if state is None:
+            return None
+        record = json.loads(state)
+        record['discovered_assets'] = json.loads(assets) if assets else []
+        return JobState.from_record(record)
+
+
+JOB_STORES = {
+    'memory': MemoryJobStore,
+    'redis': RedisJobStore
+}
+
+
+def create_job_store(backend: Optional[str] = None, **options) -> JobStore:
+    """
+    Create a job store.
+
+    Args:
+        backend: 'memory' or 'redis' (default: JobStoreConfig.BACKEND)
+        **options: Backend constructor options (url, prefix)
+
+    Returns:
+        JobStore instance
+    """
+    backend = backend or JobStoreConfig.BACKEND
+    store_class = JOB_STORES.get(backend)
+    if store_class is None:
+        raise ValueError(
+            f"Unknown job store backend: {backend} "
+            f"(supported: {', '.join(JobStoreConfig.BACKENDS)})"
+        )
+    return store_class(**options)
@@ -0,0 +1,604 @@
+"""
+Vietnamese PII Redaction Service
+Shared compiled redaction engine and streaming redaction for large documents
+
+CONFIG-DRIVEN - Uses ReportingConfig.REDACTION_PATTERNS and REDACTION_MASKS
+(zero hard-coding). Patterns are compiled once per PII type selection and
+shared by the /redact-text endpoint, the streaming endpoint and the CLI.
+
+Streaming mode processes input in fixed-size chunks through one stage per PII
+type, in the order whole-text redaction applies them. Each stage holds back
+ReportingConfig.REDACTION_STREAM_CARRY_OVER characters (longer than any PII
+match) and never splits a match, so the streamed output equals whole-text
+redaction and memory stays constant regardless of input size.
+
+Batch mode redacts many small records (data subject request fulfilment) across
+a shared process pool. Each worker process compiles the engine once per PII
+type selection, and results are returned in input order with aggregate stats.
+
+Usage (CLI, from veri_ai_data_inventory/):
+    python -m services.redaction_service khach_hang.csv khach_hang_redacted.csv
+    python -m services.redaction_service app.log - --types cccd email
+"""
+
+import argparse
+import codecs
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+# Flexible import pattern for package and standalone execution
+try:
+    from ..config.reporting_constants import ReportingConfig
+except ImportError:
+    from config.reporting_constants import ReportingConfig
+
+logger = logging.getLogger(__name__)
+
+
+# Strategies that report the original value in redaction details
+SHOW_ORIGINAL_STRATEGIES = ["preview", "partial_mask"]
+
+# Strategy that detects PII without modifying the text
+PREVIEW_STRATEGY = "preview"
+
+
+class RedactionEngine:
+    """
+    Compiled Vietnamese PII redaction engine
+
+    Holds one compiled regex per requested PII type. Instances are immutable
+    and safe to share across requests and threads - use get_redaction_engine()
+    to reuse the cached engine for a PII type selection.
+    """
+
+    def __init__(self, pii_types: Optional[List[str]] = None):
+        """
+        Compile redaction patterns from ReportingConfig
+
+        Args:
+            pii_types: PII types to redact (ReportingConfig.REDACTION_PATTERNS keys).
+                       None redacts every configured type. Unknown types are ignored.
+        """
+        patterns = ReportingConfig.REDACTION_PATTERNS
+        masks = ReportingConfig.REDACTION_MASKS
+
+        self.pii_types: List[str] = list(pii_types) if pii_types else list(patterns.keys())
+        self.compiled: List[Tuple[str, Pattern, str]] = [
+            (
+                pii_type,
+                re.compile(patterns[pii_type]),
+                masks.get(pii_type, ReportingConfig.DEFAULT_REDACTION_MASK)
+            )
+            for pii_type in self.pii_types
+            if pii_type in patterns
+        ]
+
+    def redact(
+        self,
+        text: str,
+        redaction_strategy: str = "partial_mask"
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Redact PII from a complete text
+
+        PII types are applied in order; each type is matched against the text
+        already redacted by the previous types.
+
+        Args:
+            text: Text to redact
+            redaction_strategy: Redaction strategy ("preview" detects only)
+
+        Returns:
+            (redacted_text, redactions_made)
+        """
+        redacted_text = text
+        redactions_made = []
+        show_original = redaction_strategy in SHOW_ORIGINAL_STRATEGIES
+
+        for pii_type, pattern, mask in self.compiled:
+            matches = list(pattern.finditer(redacted_text))
+
+            for match in matches:
+                original_value = match.group()
+                redactions_made.append({
+                    "pii_type": pii_type,
+                    "pii_type_vi": mask,  # Vietnamese label from config
+                    "original_value": original_value if show_original else "[HIDDEN]",
+                    "masked_value": mask,
+                    "position": match.start(),
+                    "length": len(original_value)
+                })
+
+            # Apply redaction (unless preview mode)
+            if matches and redaction_strategy != PREVIEW_STRATEGY:
+                redacted_text = pattern.sub(mask, redacted_text)
+
+        return redacted_text, redactions_made
+
+
+@lru_cache(maxsize=32)
+def _get_cached_engine(pii_types: Optional[Tuple[str, ...]]) -> RedactionEngine:
+    """Compile and cache an engine per PII type selection"""
+    return RedactionEngine(list(pii_types) if pii_types else None)
+
+
+def get_redaction_engine(pii_types: Optional[List[str]] = None) -> RedactionEngine:
+    """
+    Get shared compiled RedactionEngine for a PII type selection
+
+    Args:
+        pii_types: PII types to redact (None for all configured types)
+
+    Returns:
+        Cached RedactionEngine instance
+    """
+    return _get_cached_engine(tuple(pii_types) if pii_types else None)
+
+
+class _StreamStage:
+    """
+    Streaming redaction of one PII type
+
+    Stages are chained in engine order, each redacting the output of the
+    previous one - the same order RedactionEngine.redact() applies to a
+    whole text. A stage holds back carry_over characters and never emits
+    part of a match: a match crossing the boundary is kept, whole, for the
+    next call.
+    """
+
+    def __init__(self, pii_type: str, pattern: Pattern, mask: str, carry_over: int, redact: bool):
+        self.pii_type = pii_type
+        self.pattern = pattern
+        self.mask = mask
+        self.carry_over = carry_over
+        self.redact = redact
+        self.count = 0
+        self._pending = ''
+        self._context = ''  # Input emitted just before _pending (word boundaries)
+
+    def feed(self, text: str, final: bool = False) -> str:
+        """
+        Add input and return the redacted text that can no longer change
+
+        Args:
+            text: Output of the previous stage
+            final: End of input (emit everything)
+
+        Returns:
+            Redacted text (may be empty while input is held back)
+        """
+        self._pending += text
+        if not final and len(self._pending) <= self.carry_over:
+            return ''
+
+        window = self._context + self._pending
+        start = len(self._context)
+        cut = len(window) if final else len(window) - self.carry_over
+        pieces = []
+        last = start
+        match_count = 0
+
+        for match in self.pattern.finditer(window, start):
+            if match.start() >= cut:
+                break
+            if match.end() > cut:
+                # Keep the whole match (it may still grow) for the next call
+                cut = match.start()
+                break
+            match_count += 1
+            if self.redact:
+                pieces.append(window[last:match.start()])
+                pieces.append(self.mask)
+                last = match.end()
+
+        if cut == start:
+            return ''
+
+        self.count += match_count
+        pieces.append(window[last:cut])
+        self._context = window[max(0, cut - self.carry_over):cut]
+        self._pending = window[cut:]
+        return ''.join(pieces)
+
+
+class StreamingRedactor:
+    """
+    Constant-memory chunked redaction with carry-over across chunk boundaries
+
+    Feed text incrementally with feed() and call flush() at end of input.
+    Each call returns the redacted text that is safe to emit so far; the
+    concatenated output equals RedactionEngine.redact() of the whole text.
+    Per-type redaction counts are available from get_summary().
+    """
+
+    def __init__(
+        self,
+        engine: Optional[RedactionEngine] = None,
+        redaction_strategy: str = "full_mask",
+        chunk_size: int = ReportingConfig.REDACTION_STREAM_CHUNK_SIZE,  # Dynamic config
+        carry_over: int = ReportingConfig.REDACTION_STREAM_CARRY_OVER  # Dynamic config
+    ):
+        """
+        Initialize streaming redactor
+
+        Args:
+            engine: Compiled engine (default: shared engine for all PII types)
+            redaction_strategy: Redaction strategy ("preview" detects only)
+            chunk_size: Characters redacted per chunk (from ReportingConfig)
+            carry_over: Characters held back at chunk boundaries, longer than
+                        any PII match (from ReportingConfig)
+        """
+        if chunk_size <= 0 or carry_over < 0:
+            raise ValueError("chunk_size must be positive and carry_over non-negative")
+
+        self.engine = engine or get_redaction_engine()
+        self.redaction_strategy = redaction_strategy
+        self.chunk_size = chunk_size
+        self.carry_over = carry_over
+
+        self._pending = ''
+        self._stages = [
+            _StreamStage(pii_type, pattern, mask, carry_over, redaction_strategy != PREVIEW_STRATEGY)
+            for pii_type, pattern, mask in self.engine.compiled
+        ]
+        self.chars_processed = 0
+        self.chunks_emitted = 0
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Redaction counts per PII type (types with matches only)"""
+        return {stage.pii_type: stage.count for stage in self._stages if stage.count}
+
+    def feed(self, text: str) -> str:
+        """
+        Add input text and return redacted output that is safe to emit
+
+        Args:
+            text: Next piece of input text (any size)
+
+        Returns:
+            Redacted text (may be empty while input is buffered)
+        """
+        self._pending += text
+        output = []
+
+        while len(self._pending) >= self.chunk_size:
+            chunk = self._pending[:self.chunk_size]
+            self._pending = self._pending[self.chunk_size:]
+            output.append(self._emit(chunk))
+
+        return ''.join(output)
+
+    def flush(self) -> str:
+        """
+        Redact and return all remaining buffered text (end of input)
+
+        Returns:
+            Redacted remaining text
+        """
+        chunk, self._pending = self._pending, ''
+        return self._emit(chunk, final=True)
+
+    def redact_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Redact an iterable of text chunks
+
+        Args:
+            chunks: Input text pieces
+
+        Yields:
+            Redacted output pieces (empty pieces are skipped)
+        """
+        for chunk in chunks:
+            output = self.feed(chunk)
+            if output:
+                yield output
+
+        output = self.flush()
+        if output:
+            yield output
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get redaction counts per PII type and stream statistics
+
+        Returns:
+            Summary dictionary
+        """
+        counts = self.counts
+        return {
+            "redaction_counts": counts,
+            "redaction_count": sum(counts.values()),
+            "pii_types_checked": self.engine.pii_types,
+            "redaction_strategy": self.redaction_strategy,
+            "chars_processed": self.chars_processed,
+            "chunks_processed": self.chunks_emitted
+        }
+
+    def _emit(self, chunk: str, final: bool = False) -> str:
+        """Pass one input chunk through the PII type stages"""
+        self.chars_processed += len(chunk)
+        self.chunks_emitted += 1
+        for stage in self._stages:
+            chunk = stage.feed(chunk, final)
+        return chunk
+
+
+def iter_decoded_chunks(
+    stream: BinaryIO,
+    encoding: str = 'utf-8',
+    read_bytes: int = ReportingConfig.REDACTION_STREAM_READ_BYTES  # Dynamic config
+) -> Iterator[str]:
+    """
+    Read a binary stream in fixed-size blocks and decode incrementally
+
+    Multi-byte UTF-8 sequences (Vietnamese diacritics) split across blocks
+    are decoded correctly.
+
+    Args:
+        stream: Binary file-like object
+        encoding: Text encoding
+        read_bytes: Bytes per read (from ReportingConfig)
+
+    Yields:
+        Decoded text pieces
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+
+    while True:
+        block = stream.read(read_bytes)
+        if not block:
+            break
+        text = decoder.decode(block)
+        if text:
+            yield text
+
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def redact_file(
+    input_stream: BinaryIO,
+    output_stream: BinaryIO,
+    pii_types: Optional[List[str]] = None,
+    redaction_strategy: str = "full_mask",
+    encoding: str = 'utf-8',
+    chunk_size: int = ReportingConfig.REDACTION_STREAM_CHUNK_SIZE  # Dynamic config
+) -> Dict[str, Any]:
+    """
+    Stream-redact a binary input into a binary output
+
+    Args:
+        input_stream: Readable binary stream
+        output_stream: Writable binary stream
+        pii_types: PII types to redact (None for all)
+        redaction_strategy: Redaction strategy
+        encoding: Text encoding of input and output
+        chunk_size: Characters redacted per chunk (from ReportingConfig)
+
+    Returns:
+        Redaction summary from StreamingRedactor.get_summary()
+    """
+    redactor = StreamingRedactor(
+        engine=get_redaction_engine(pii_types),
+        redaction_strategy=redaction_strategy,
+        chunk_size=chunk_size
+    )
+
+    for output in redactor.redact_stream(iter_decoded_chunks(input_stream, encoding)):
+        output_stream.write(output.encode(encoding))
+
+    summary = redactor.get_summary()
+    logger.info(
+        f"[OK] Stream redaction complete: {summary['redaction_count']} PII instances "
+        f"in {summary['chars_processed']} characters"
+    )
+    return summary
+
+
+# ============================================================================
+# Batch Redaction - many small records across a worker process pool
+# ============================================================================
+
+_batch_executor: Optional[ProcessPoolExecutor] = None
+_batch_executor_workers: int = 0
+_batch_executor_lock = threading.Lock()
+
+
+def _resolve_batch_workers(max_workers: Optional[int] = None) -> int:
+    """Resolve worker count (0/None means one per CPU core)"""
+    workers = max_workers if max_workers is not None else ReportingConfig.REDACTION_BATCH_MAX_WORKERS
+    return workers if workers and workers > 0 else (os.cpu_count() or 1)
+
+
+def get_batch_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Get shared process pool for batch redaction
+
+    The pool is created lazily and reused across requests so worker processes
+    keep their compiled engines warm.
+
+    Args:
+        max_workers: Worker processes (None uses ReportingConfig)
+
+    Returns:
+        Shared ProcessPoolExecutor instance
+    """
+    global _batch_executor, _batch_executor_workers
+
+    workers = _resolve_batch_workers(max_workers)
+    with _batch_executor_lock:
+        if _batch_executor is None or _batch_executor_workers != workers:
+            if _batch_executor is not None:
+                _batch_executor.shutdown(wait=False)
+            _batch_executor = ProcessPoolExecutor(max_workers=workers)
+            _batch_executor_workers = workers
+            logger.info(f"[OK] Batch redaction pool started with {workers} workers")
+        return _batch_executor
+
+
+def shutdown_batch_executor() -> None:
+    """Shut down the shared batch redaction pool (if started)"""
+    global _batch_executor
+
+    with _batch_executor_lock:
+        if _batch_executor is not None:
+            _batch_executor.shutdown(wait=True)
+            _batch_executor = None
+
+
+def _redact_record_slice(
+    texts: List[str],
+    pii_types: Optional[Tuple[str, ...]],
+    redaction_strategy: str
+) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """Redact a slice of record texts (runs inside a worker process)"""
+    engine = _get_cached_engine(pii_types)
+    return [engine.redact(text, redaction_strategy) for text in texts]
+
+
+def redact_batch(
+    texts: List[str],
+    pii_types: Optional[List[str]] = None,
+    redaction_strategy: str = "full_mask",
+    max_workers: Optional[int] = None,
+    records_per_task: int = ReportingConfig.REDACTION_BATCH_RECORDS_PER_TASK,  # Dynamic config
+    parallel_threshold: int = ReportingConfig.REDACTION_BATCH_PARALLEL_THRESHOLD  # Dynamic config
+) -> Dict[str, Any]:
+    """
+    Redact many records with the same redaction profile
+
+    Batches of at least parallel_threshold records are split into slices of
+    records_per_task and fanned out across the shared process pool. Smaller
+    batches (or a broken pool) are redacted in-process with the cached engine.
+
+    Args:
+        texts: Record texts to redact
+        pii_types: PII types to redact (None for all)
+        redaction_strategy: Redaction strategy
+        max_workers: Worker processes (None uses ReportingConfig)
+        records_per_task: Records per worker task (from ReportingConfig)
+        parallel_threshold: Minimum batch size for the process pool (from ReportingConfig)
+
+    Returns:
+        Dict with "results" ((redacted_text, redactions_made) per record, in
+        input order) and "statistics" (aggregate counts and throughput)
+    """
+    if records_per_task <= 0:
+        raise ValueError("records_per_task must be positive")
+
+    start_time = time.perf_counter()
+    type_key = tuple(pii_types) if pii_types else None
+    workers_used = 1
+    results: Optional[List[Tuple[str, List[Dict[str, Any]]]]] = None
+
+    if len(texts) >= parallel_threshold and _resolve_batch_workers(max_workers) > 1:
+        slices = [texts[i:i + records_per_task] for i in range(0, len(texts), records_per_task)]
+        try:
+            executor = get_batch_executor(max_workers)
+            results = []
+            # Executor.map preserves slice order -> results stay in input order
+            for slice_results in executor.map(
+                _redact_record_slice,
+                slices,
+                [type_key] * len(slices),
+                [redaction_strategy] * len(slices)
+            ):
+                results.extend(slice_results)
+            workers_used = min(_batch_executor_workers, len(slices))
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"[WARNING] Batch redaction pool unavailable, redacting in-process: {str(e)}")
+            shutdown_batch_executor()
+            results = None
+
+    if results is None:
+        results = _redact_record_slice(texts, type_key, redaction_strategy)
+
+    elapsed = time.perf_counter() - start_time
+    redaction_counts: Dict[str, int] = defaultdict(int)
+    records_with_pii = 0
+    for _, redactions_made in results:
+        if redactions_made:
+            records_with_pii += 1
+        for redaction in redactions_made:
+            redaction_counts[redaction["pii_type"]] += 1
+
+    statistics = {
+        "records_processed": len(texts),
+        "records_with_pii": records_with_pii,
+        "redaction_count": sum(redaction_counts.values()),
+        "redaction_counts": dict(redaction_counts),
+        "chars_processed": sum(len(text) for text in texts),
+        "pii_types_checked": list(pii_types) if pii_types else list(ReportingConfig.REDACTION_PATTERNS.keys()),
+        "redaction_strategy": redaction_strategy,
+        "workers_used": workers_used,
+        "elapsed_seconds": round(elapsed, 4),
+        "records_per_second": round(len(texts) / elapsed, 1) if elapsed > 0 else None
+    }
+
+    logger.info(
+        f"[OK] Batch redaction complete: {statistics['redaction_count']} PII instances "
+        f"in {len(texts)} records ({workers_used} workers)"
+    )
+    return {"results": results, "statistics": statistics}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for streaming file redaction"""
+    parser = argparse.ArgumentParser(
+        description="VeriSyntra streaming Vietnamese PII redaction",
+        epilog="Use '-' for stdin/stdout. Summary JSON is written to stderr."
+    )
+    parser.add_argument('input', help="Input file path or '-'")
+    parser.add_argument('output', help="Output file path or '-'")
+    parser.add_argument(
+        '--types',
+        nargs='+',
+        default=None,
+        help=f"PII types to redact (default: all of {', '.join(ReportingConfig.REDACTION_PATTERNS)})"
+    )
+    parser.add_argument('--strategy', default='full_mask', help="Redaction strategy")
+    parser.add_argument('--encoding', default='utf-8', help="Input/output text encoding")
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=ReportingConfig.REDACTION_STREAM_CHUNK_SIZE,
+        help="Characters redacted per chunk"
+    )
+    args = parser.parse_args(argv)
+
+    input_stream = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    output_stream = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+
+    try:
+        summary = redact_file(
+            input_stream,
+            output_stream,
+            pii_types=args.types,
+            redaction_strategy=args.strategy,
+            encoding=args.encoding,
+            chunk_size=args.chunk_size
+        )
+    finally:
+        if input_stream is not sys.stdin.buffer:
+            input_stream.close()
+        if output_stream is not sys.stdout.buffer:
+            output_stream.close()
+
+    print(json.dumps(summary, ensure_ascii=False, indent=2), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""
+VeriSyntra Queued Scans
+
+Scan execution through the work queue (WorkQueueConfig.EXECUTION_MODE = 'queue'):
+the API node queues a scan as a plan unit, scan workers (services.scan_worker)
+split it into work units and execute them, and the API node folds the unit
+results back into the job state.
+
+QueuedScanMixin is inherited by ScanService; its methods use the service's
+scanners, job states and queued_jobs.
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+# Import dynamic configuration
+try:
+    from ..config.constants import APIConfig, FilesystemConfig, WorkQueueConfig
+    from ..scanner_manager.work_queue import UNIT_ITEMS, UNIT_PLAN, UNIT_TABLES, get_work_queue, new_unit
+    from ..services.job_state_manager import JobState
+    from ..utils.cancellation import CancellationToken
+except ImportError:
+    from config.constants import APIConfig, FilesystemConfig, WorkQueueConfig
+    from scanner_manager.work_queue import UNIT_ITEMS, UNIT_PLAN, UNIT_TABLES, get_work_queue, new_unit
+    from services.job_state_manager import JobState
+    from utils.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedScanMixin:
+    """
+    Queue-mode scan execution for ScanService
+    
+    Queues scans, executes leased work units (scan workers) and synchronizes
+    queued jobs with the queue.
+    """
+    
+    async def enqueue_scan(
+        self,
+        scan_job_id: UUID,
+        tenant_id: UUID,
+        source_type: str,
+        connection_config: Dict[str, Any],
+        column_filter: Optional[Dict[str, Any]] = None,
+        veri_business_context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Queue a scan for scan worker processes (WorkQueueConfig.EXECUTION_MODE = 'queue')
+        
+        The job is queued as a single plan unit; the worker leasing it splits the
+        scan into table groups, directories or prefixes (see execute_work_unit()).
+        get_scan_status() folds unit results into the job state, on any API node.
+        Incremental and resumed scans run in-process (watermarks and checkpoints
+        are stored on the API node).
+        
+        Args:
+            scan_job_id: Job identifier (created with create_scan_job())
+            tenant_id: Tenant identifier
+            source_type: Data source type
+            connection_config: Connection configuration (carried by the queued units)
+            column_filter: Column filtering config (optional)
+            veri_business_context: Vietnamese business context (optional)
+        
+        Raises:
+            ValueError: If the source type is not supported
+        """
+        self._determine_scanner_type(source_type, connection_config)
+        
+        # The job record holds the request without credentials; only units carry them
+        spec = {
+            'tenant_id': str(tenant_id),
+            'source_type': source_type,
+            'column_filter': column_filter,
+            'veri_business_context': veri_business_context
+        }
+        plan = new_unit(UNIT_PLAN, {'scan': dict(spec, connection_config=connection_config)})
+        await asyncio.to_thread(get_work_queue().submit_job, str(scan_job_id), spec, [plan])
+        self.queued_jobs[scan_job_id] = 0
+    
+    async def execute_work_unit(
+        self,
+        unit: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute one leased work unit (called by scan workers)
+        
+        - plan: splits the scan into units - databases into groups of
+          WorkQueueConfig.TABLES_PER_UNIT discovered tables, filesystems into the
+          root directory's files plus one unit per top-level subdirectory, cloud
+          storage into one unit per connection_config['prefixes'] entry
+          (the whole bucket or container when not given)
+        - tables: filters and samples a group of tables
+        - items: streams one directory subtree or prefix
+        
+        Args:
+            unit: Lease from WorkQueue.lease()
+            cancel_token: Stops the unit early (cancelled job, lost lease or deadline)
+        
+        Returns:
+            {'units': [...]} for plan units; otherwise the unit result
+            {'assets', 'count', 'filter_statistics', 'partial', 'cancel_reason'}
+            (assets capped at APIConfig.MAX_ASSETS_PER_RESPONSE, count is exact)
+        """
+        scan = unit['payload']['scan']
+        source_type = scan['source_type']
+        scanner_type = self._determine_scanner_type(source_type, scan['connection_config'])
+        
+        if unit['kind'] == UNIT_PLAN and source_type != "database":
+            # Directory listing or configured prefixes; no scanner needed
+            return {'units': await asyncio.to_thread(self._split_scan, scan, scanner_type)}
+        
+        scanner = await self._open_scanner(source_type, scanner_type, scan['connection_config'], cancel_token)
+        try:
+            if unit['kind'] == UNIT_PLAN:
+                units = []
+                async for batch in scanner.iter_table_batches(WorkQueueConfig.TABLES_PER_UNIT, cancel_token=cancel_token):
+                    units.append(new_unit(UNIT_TABLES, {'scan': scan, 'tables': batch}))
+                return {'units': units}
+            
+            # Unit-local job collecting the unit's assets
+            job = JobState(
+                unit['scan_job_id'],
+                scan['tenant_id'],
+                source_type,
+                {},
+                scan.get('column_filter'),
+                scan.get('veri_business_context')
+            )
+            if unit['kind'] == UNIT_TABLES:
+                filter_stats = await self._scan_table_unit(scanner, unit['payload']['tables'], scan, job, cancel_token)
+            elif unit['kind'] == UNIT_ITEMS:
+                filter_stats = None
+                await self._stream_discovered_items(
+                    scanner, job, cancel_token, discovery_options=unit['payload'].get('options')
+                )
+            else:
+                raise ValueError(f"Unknown work unit kind: {unit['kind']}")
+            
+            partial = cancel_token is not None and cancel_token.is_cancelled
+            return {
+                'assets': job.discovered_assets,
+                'count': job.total_assets,
+                'filter_statistics': filter_stats,
+                'partial': partial,
+                'cancel_reason': cancel_token.reason if partial else None
+            }
+        finally:
+            await self._close_scanner(source_type, scanner)
+    
+    async def _sync_queued_job(self, scan_job_id: UUID, job: Optional[JobState]) -> Optional[JobState]:
+        """
+        Fold new unit results and the queue status of a queued scan into its job state
+        
+        A job queued by another API node (or before a restart) is recreated
+        from the queue's job record.
+        
+        Args:
+            scan_job_id: Job identifier
+            job: Local job state (None: not known to this node)
+        
+        Returns:
+            Updated job state, or None if the queue does not know the job either
+        """
+        work_queue = get_work_queue()
+        record = await asyncio.to_thread(work_queue.get_job, str(scan_job_id))
+        if record is None:
+            return job
+        if job is None:
+            spec = record['spec']
+            job = await self.create_scan_job(
+                scan_job_id=scan_job_id,
+                tenant_id=UUID(spec['tenant_id']),
+                source_type=spec['source_type'],
+                connection_config={},
+                column_filter=spec['column_filter'],
+                veri_business_context=spec['veri_business_context']
+            )
+            self.queued_jobs[scan_job_id] = 0
+        if job.is_terminal():
+            self.queued_jobs.pop(scan_job_id, None)
+            return job
+        
+        last_seq = self.queued_jobs.get(scan_job_id, 0)
+        for seq, result in await asyncio.to_thread(work_queue.read_results, str(scan_job_id), last_seq):
+            job.add_discovered_assets(result['assets'])
+            # Unit results carry capped asset lists with exact counts
+            job.total_assets += result['count'] - len(result['assets'])
+            job.filter_statistics = self._merge_filter_statistics(
+                job.filter_statistics, result.get('filter_statistics')
+            )
+            if result.get('partial'):
+                job.partial = True
+                job.cancel_reason = job.cancel_reason or result.get('cancel_reason')
+            last_seq = seq
+        self.queued_jobs[scan_job_id] = last_seq
+        
+        status = record['status']
+        if status != APIConfig.STATUS_PENDING and job.status == APIConfig.STATUS_PENDING:
+            job.start()
+        if record['units_total']:
+            job.update_progress(int(100 * (record['units_done'] + record['units_failed']) / record['units_total']))
+        
+        if status == APIConfig.STATUS_COMPLETED:
+            # Dead-lettered units leave the job partial, with their errors
+            job.errors.extend(record['errors'])
+            job.complete(
+                filter_statistics=job.filter_statistics,
+                partial=job.partial or record['units_failed'] > 0,
+                cancel_reason=job.cancel_reason
+            )
+        elif status == APIConfig.STATUS_FAILED:
+            job.fail('; '.join(record['errors']) or "Scan planning failed")
+        elif status == APIConfig.STATUS_CANCELLED:
+            job.cancel()
+        if job.is_terminal():
+            self.queued_jobs.pop(scan_job_id, None)
+        return job
+    
+    @staticmethod
+    def _merge_filter_statistics(
+        total: Optional[Dict[str, Any]],
+        stats: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Add the column filter statistics of one work unit to the job totals"""
+        if not stats:
+            return total
+        total = dict(total or {})
+        for key in ('total_tables', 'total_columns_discovered', 'total_columns_scanned', 'columns_filtered_out'):
+            total[key] = total.get(key, 0) + stats[key]
+        discovered = total['total_columns_discovered']
+        total['reduction_percentage'] = round(total['columns_filtered_out'] / discovered * 100, 2) if discovered else 0.0
+        return total
+    
+    @staticmethod
+    def _split_scan(scan: Dict[str, Any], scanner_type: str) -> List[Dict[str, Any]]:
+        """
+        Split a cloud or filesystem scan into items units
+        
+        Filesystem subdirectory units walk FilesystemConfig.DEFAULT_MAX_DEPTH - 1
+        levels below the subdirectory, matching the depth of a single walk.
+        """
+        connection_config = scan['connection_config']
+        
+        if scan['source_type'] == "cloud":
+            # Azure filters by name_starts_with; S3 and GCS by prefix
+            option = 'name_starts_with' if scanner_type == 'azure_blob' else 'prefix'
+            prefixes = connection_config.get('prefixes') or ['']
+            return [new_unit(UNIT_ITEMS, {'scan': scan, 'options': {option: prefix}}) for prefix in prefixes]
+        
+        path_key = 'share_path' if scanner_type == 'network_share' else 'root_path'
+        root = Path(connection_config[path_key])
+        with os.scandir(root) as entries:
+            subdirectories = sorted(
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=FilesystemConfig.DEFAULT_FOLLOW_SYMLINKS)
+            )
+        
+        units = [new_unit(UNIT_ITEMS, {'scan': scan, 'options': {'max_depth': 0}})]
+        if FilesystemConfig.DEFAULT_MAX_DEPTH > 0:
+            for name in subdirectories:
+                subtree = dict(connection_config, **{path_key: str(root / name)})
+                units.append(new_unit(UNIT_ITEMS, {
+                    'scan': dict(scan, connection_config=subtree),
+                    'options': {'max_depth': FilesystemConfig.DEFAULT_MAX_DEPTH - 1}
+                }))
+        return units
@@ -12,28 +12,73 @@ Key Features:
 - Dynamic configuration (zero hard-coding)
 """
 
+import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
 # Import dynamic configuration
 try:
-    from ..config.constants import APIConfig, ScanConfig
+    from ..config.constants import (
+        APIConfig, ContentDedupConfig, ContentScanConfig, ProgressStreamConfig, ResultStoreConfig,
+        ScanConfig, ScanManagerConfig, WorkQueueConfig
+    )
     from ..scanner_manager.scanner_manager import ScannerManager
+    from ..scanner_manager.checkpoint_store import ScanCheckpoint, get_checkpoint_store
+    from ..scanner_manager.error_handler import get_circuit_breaker
+    from ..scanner_manager.connection_pool import source_fingerprint
+    from ..scanner_manager.scan_scheduler import get_scan_scheduler
+    from ..scanner_manager.progress_stream import get_progress_publisher
+    from ..scanner_manager.content_scanner import get_content_scanner, merge_content_statistics
+    from ..scanner_manager.content_dedup import ContentDedupIndex
+    from ..scanner_manager.result_store import (
+        normalize_filters, open_result_writer, read_results, result_row, row_asset, row_matches
+    )
+    from ..scanner_manager.work_queue import get_work_queue
+    from ..scanner_manager.watermark_store import DeltaScan, get_watermark_store, watermark_source_id
     from ..services.job_state_manager import get_job_state_manager, JobState
+    from ..services.scan_queue import QueuedScanMixin
+    from ..services.column_filter_service import ColumnFilterService
+    from ..models.column_filter import ColumnFilterConfig
+    from ..utils.vietnamese_text_analyzer import VietnameseTextAnalyzer
+    from ..utils.cancellation import CancellationToken, REASON_CANCELLED
 except ImportError:
-    from config.constants import APIConfig, ScanConfig
+    from config.constants import (
+        APIConfig, ContentDedupConfig, ContentScanConfig, ProgressStreamConfig, ResultStoreConfig,
+        ScanConfig, ScanManagerConfig, WorkQueueConfig
+    )
     from scanner_manager.scanner_manager import ScannerManager
+    from scanner_manager.checkpoint_store import ScanCheckpoint, get_checkpoint_store
+    from scanner_manager.error_handler import get_circuit_breaker
+    from scanner_manager.connection_pool import source_fingerprint
+    from scanner_manager.scan_scheduler import get_scan_scheduler
+    from scanner_manager.progress_stream import get_progress_publisher
+    from scanner_manager.content_scanner import get_content_scanner, merge_content_statistics
+    from scanner_manager.content_dedup import ContentDedupIndex
+    from scanner_manager.result_store import (
+        normalize_filters, open_result_writer, read_results, result_row, row_asset, row_matches
+    )
+    from scanner_manager.work_queue import get_work_queue
+    from scanner_manager.watermark_store import DeltaScan, get_watermark_store, watermark_source_id
     from services.job_state_manager import get_job_state_manager, JobState
+    from services.scan_queue import QueuedScanMixin
+    from services.column_filter_service import ColumnFilterService
+    from models.column_filter import ColumnFilterConfig
+    from utils.vietnamese_text_analyzer import VietnameseTextAnalyzer
+    from utils.cancellation import CancellationToken, REASON_CANCELLED
 
 logger = logging.getLogger(__name__)
 
 
-class ScanService:
+class ScanService(QueuedScanMixin):
     """
     Main scan orchestration service
     
     Coordinates between API endpoints, ScannerManager, and job state management.
+    Queue-mode execution (enqueue_scan, execute_work_unit) is in services.scan_queue.
     Uses dynamic configuration throughout - zero hard-coded values.
     """
     
@@ -41,6 +86,11 @@ class ScanService:
         """Initialize scan service"""
         self.scanner_manager = ScannerManager()
         self.job_state_manager = get_job_state_manager()
+        self.scheduler = get_scan_scheduler()
+        self.progress_publisher = get_progress_publisher()
+        self.cancel_tokens: Dict[UUID, CancellationToken] = {}
+        # Jobs run by scan workers: sequence number of the last unit result read
+        self.queued_jobs: Dict[UUID, int] = {}
         logger.info("[OK] ScanService initialized")
     
     async def create_scan_job(
@@ -75,6 +125,8 @@ class ScanService:
                 column_filter=column_filter,
                 veri_business_context=veri_business_context
             )
+            # Push progress and status changes to progress stream subscribers
+            job_state.listeners.append(self.progress_publisher.job_changed)
             
             logger.info(
                 f"[OK] Scan job {scan_job_id} created for tenant {tenant_id}"
@@ -93,7 +145,9 @@ class ScanService:
         source_type: str,
         connection_config: Dict[str, Any],
         column_filter: Optional[Dict[str, Any]] = None,
-        veri_business_context: Optional[Dict[str, Any]] = None
+        veri_business_context: Optional[Dict[str, Any]] = None,
+        incremental: bool = False,
+        priority: Optional[str] = None
     ):
         """
         Execute scan in background
@@ -104,12 +158,52 @@ class ScanService:
         3. Execute scan with progress tracking
         4. Process results
         5. Update job state
+        
+        Discovered assets are added to the job state batch by batch while the
+        scan runs, so status polls see them before the scan ends.
+        
+        Scanners check a CancellationToken between tables, pages or directories.
+        cancel_scan() or the ScanManagerConfig.SCANNER_TIMEOUT_SECONDS deadline stops
+        the scan early; the scanner is closed at once and the assets discovered so far
+        are kept with partial=True.
+        
+        With incremental=True only assets whose watermark changed since the last
+        scan of the source are processed; unchanged assets carry their previous
+        classification forward and the job gets a delta report
+        (added/changed/unchanged/removed).
+        
+        With ResultStoreConfig.ENABLED every asset is also written to a result
+        file (get_scan_results() pages through it); the job state keeps the
+        capped asset preview, summary statistics and the file pointer.
+        
+        With ScanManagerConfig.ENABLE_SCAN_CHECKPOINTS the scanner cursor is saved
+        at the configured interval; running a job again after a crash resumes
+        from its checkpoint without re-emitting assets already published.
+        
+        The job stays pending until the scan scheduler admits it (global, tenant
+        and source limits; fair share between tenants; priority levels, default
+        ScanManagerConfig.DEFAULT_SCAN_PRIORITY); the deadline starts then.
         """
         job = self.job_state_manager.get_job(scan_job_id)
         if not job:
             logger.error(f"[ERROR] Job {scan_job_id} not found")
             return
         
+        admitted = await self.scheduler.acquire(
+            scan_job_id,
+            tenant_id,
+            self._scheduling_key(source_type, connection_config),
+            priority
+        )
+        if not admitted:
+            # Cancelled while waiting for a slot
+            logger.info(f"[OK] Scan job {scan_job_id} withdrawn before it started")
+            return
+        
+        cancel_token = CancellationToken(ScanManagerConfig.SCANNER_TIMEOUT_SECONDS)
+        self.cancel_tokens[scan_job_id] = cancel_token
+        checkpoint = None
+        
         try:
             # Mark job as started - uses APIConfig.STATUS_RUNNING
             job.start()
@@ -122,69 +216,133 @@ class ScanService:
             # Determine scanner type from connection_config
             scanner_type = self._determine_scanner_type(source_type, connection_config)
             
-            # Create scanner using ScannerManager (Step 6)
-            scanner = self.scanner_manager.create_scanner(
-                scanner_type=scanner_type,
-                connection_config=connection_config
-            )
+            if ScanManagerConfig.ENABLE_SCAN_CHECKPOINTS:
+                # Credentials are not saved; resume_scan() checks the source identity
+                checkpoint = await asyncio.to_thread(
+                    get_checkpoint_store().open,
+                    scan_job_id,
+                    {
+                        'tenant_id': str(tenant_id),
+                        'source_type': source_type,
+                        'source_id': watermark_source_id(scanner_type, connection_config),
+                        'column_filter': column_filter,
+                        'veri_business_context': veri_business_context,
+                        'incremental': incremental,
+                        'priority': priority
+                    }
+                )
+                if checkpoint.resumed:
+                    self._restore_job(job, checkpoint.state)
+            
+            await self._open_result_writer(job)
             
-            # Connect to data source
-            if not scanner.connect():
-                raise RuntimeError(f"Failed to connect to {scanner_type}")
+            # Create scanner using ScannerManager (Step 6) and connect to data source
+            scanner = await self._open_scanner(source_type, scanner_type, connection_config, cancel_token)
             
             # Update progress
             job.update_progress(20)
             
+            # Incremental mode: previous watermarks of this source (column filter
+            # changes invalidate stored classifications)
+            delta = None
+            if incremental and checkpoint is not None and checkpoint.state.get('delta'):
+                # Continue the interrupted scan's delta (same scan number and counts)
+                delta = get_watermark_store().resume(checkpoint.state['delta'])
+            elif incremental:
+                delta = await asyncio.to_thread(
+                    get_watermark_store().begin,
+                    watermark_source_id(scanner_type, connection_config),
+                    json.dumps(column_filter, sort_keys=True, default=str)
+                )
+            
             # Execute discovery based on source type
             if source_type == "database":
                 results = await self._scan_database(
                     scanner=scanner,
                     connection_config=connection_config,
                     column_filter=column_filter,
-                    job=job
+                    job=job,
+                    cancel_token=cancel_token,
+                    delta=delta,
+                    checkpoint=checkpoint
                 )
             elif source_type == "cloud":
                 results = await self._scan_cloud_storage(
                     scanner=scanner,
                     connection_config=connection_config,
-                    job=job
+                    job=job,
+                    cancel_token=cancel_token,
+                    delta=delta,
+                    checkpoint=checkpoint
                 )
             elif source_type == "filesystem":
                 results = await self._scan_filesystem(
                     scanner=scanner,
                     connection_config=connection_config,
-                    job=job
+                    job=job,
+                    cancel_token=cancel_token,
+                    delta=delta,
+                    checkpoint=checkpoint
                 )
             else:
                 raise ValueError(f"Unsupported source type: {source_type}")
             
-            # Process and normalize results
-            discovered_assets = self._process_results(results, veri_business_context)
+            # Assets were streamed into the job state during discovery
             filter_statistics = results.get('filter_statistics')
+            partial = bool(results.get('partial')) or cancel_token.is_cancelled
             
-            # Mark job as completed - uses APIConfig.STATUS_COMPLETED
-            job.complete(
-                discovered_assets=discovered_assets,
-                filter_statistics=filter_statistics
-            )
+            if delta is not None:
+                # Removed assets are only known after a complete scan
+                job.delta = await asyncio.to_thread(delta.finish, not partial)
+            
+            if checkpoint is not None:
+                # Finished (or cancelled): nothing left to resume
+                await asyncio.to_thread(checkpoint.clear)
+            
+            await self._close_result_writer(job)
+            
+            if cancel_token.reason == REASON_CANCELLED:
+                # Keep what was discovered before the user cancelled
+                job.cancel()
+            else:
+                # Mark job as completed - uses APIConfig.STATUS_COMPLETED
+                job.complete(
+                    filter_statistics=filter_statistics,
+                    partial=partial,
+                    cancel_reason=cancel_token.reason if partial else None
+                )
             
             logger.info(
-                f"[OK] Scan job {scan_job_id} completed successfully: "
-                f"{len(discovered_assets)} assets discovered"
+                f"[OK] Scan job {scan_job_id} completed"
+                f"{f' early ({cancel_token.reason})' if partial else ' successfully'}: "
+                f"{job.total_assets} assets discovered"
             )
             
         except Exception as e:
+            if cancel_token.reason == REASON_CANCELLED:
+                # Interrupted by cancel_scan() - the job is already cancelled
+                logger.info(f"[OK] Scan job {scan_job_id} stopped after cancellation: {str(e)}")
+                if checkpoint is not None:
+                    await asyncio.to_thread(checkpoint.clear)
+                await self._close_result_writer(job)
+                return
             error_msg = str(e)[:APIConfig.MAX_ERROR_MESSAGE_LENGTH]  # Use config limit
             job.fail(error_msg)
             logger.error(f"[ERROR] Scan job {scan_job_id} failed: {error_msg}")
+            if checkpoint is not None and checkpoint.saves:
+                logger.info(f"[OK] Scan job {scan_job_id} can resume from its checkpoint")
         
         finally:
             # Ensure scanner is closed
-            try:
-                if 'scanner' in locals():
-                    scanner.close()
-            except Exception as e:
-                logger.warning(f"[WARNING] Error closing scanner: {str(e)}")
+            if 'scanner' in locals():
+                await self._close_scanner(source_type, scanner)
+            if job.result_writer is not None:
+                # Failed scan: its result file is incomplete
+                await asyncio.to_thread(job.result_writer.discard)
+                job.result_writer = None
+            cancel_token.close()
+            self.cancel_tokens.pop(scan_job_id, None)
+            self.scheduler.release(scan_job_id)
     
     async def get_scan_status(self, scan_job_id: UUID) -> Optional[Dict[str, Any]]:
         """
@@ -194,25 +352,148 @@ class ScanService:
             scan_job_id: Job identifier
         
         Returns:
-            Job state dictionary or None if not found
+            Job state dictionary or None if not found; scans waiting for the
+            scheduler include queue_position, estimated_start and priority
         """
-        job = self.job_state_manager.get_job(scan_job_id)
+        job = await self._find_job(scan_job_id)
         if not job:
             return None
         
-        return job.to_dict()
+        status = job.to_dict()
+        status.update(self.scheduler.get_queue_info(scan_job_id) or {})
+        return status
+    
+    async def get_scan_results(
+        self,
+        scan_job_id: UUID,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: int = 0,
+        limit: int = ResultStoreConfig.DEFAULT_PAGE_SIZE
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Page through a scan's discovered assets
+        
+        Finished scans are read from their result file with the filters pushed
+        down; running scans (and scans without a result file) page through the
+        job state preview.
+        
+        Args:
+            scan_job_id: Job identifier
+            filters: Result filters (extensions, vietnamese_name, min_size, max_size,
+                     pii_category, asset_type)
+            cursor: next_cursor of the previous page (0 = first page)
+            limit: Maximum assets in the page
+        
+        Returns:
+            {'assets', 'next_cursor', 'source', 'status', 'total_assets', 'result_summary'}
+            or None if the job is not found
+        """
+        job = await self._find_job(scan_job_id)
+        if not job:
+            return None
+        
+        if job.result_file is not None and os.path.exists(job.result_file['path']):
+            assets, next_cursor = await asyncio.to_thread(read_results, job.result_file, filters, cursor, limit)
+            source = 'result_file'
+        else:
+            filters = normalize_filters(filters)
+            rows = [
+                row for row in (
+                    result_row(asset, index)
+                    for index, asset in enumerate(job.discovered_assets[cursor:], start=cursor)
+                )
+                if row_matches(row, filters)
+            ][:limit + 1]
+            next_cursor = rows[limit]['row'] if len(rows) > limit else None
+            assets = [row_asset(row) for row in rows[:limit]]
+            source = 'preview'
+        
+        return {
+            'scan_job_id': str(job.scan_job_id),
+            'status': job.status,
+            'total_assets': job.total_assets,
+            'result_summary': job.result_summary,
+            'source': source,
+            'assets': assets,
+            'next_cursor': next_cursor
+        }
+    
+    async def open_progress_stream(
+        self,
+        scan_job_id: UUID
+    ) -> Optional[AsyncIterator[Optional[Dict[str, Any]]]]:
+        """
+        Subscribe to the progress events of a scan job
+        
+        The stream starts with the current snapshot, then yields each published
+        event (coalesced to ProgressStreamConfig.MAX_UPDATES_PER_SECOND) and ends
+        after the terminal status. None items mark ProgressStreamConfig.KEEPALIVE_SECONDS
+        without events. With the redis bus, scans run by another API worker are
+        streamed from its events.
+        
+        Args:
+            scan_job_id: Job identifier
+        
+        Returns:
+            Async iterator of progress events, or None if the job is unknown
+        """
+        bus = self.progress_publisher.bus
+        # Subscribe before reading the snapshot so no later event is missed
+        subscription = await bus.subscribe(str(scan_job_id))
+        job = await self._find_job(scan_job_id)
+        if job is not None:
+            snapshot = job.progress_event()
+        else:
+            snapshot = await asyncio.to_thread(bus.latest, str(scan_job_id))
+        if snapshot is None:
+            await subscription.close()
+            return None
+        return self._progress_events(scan_job_id, snapshot, subscription)
+    
+    async def _progress_events(
+        self,
+        scan_job_id: UUID,
+        snapshot: Dict[str, Any],
+        subscription: Any
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield progress events until the job reaches a terminal status"""
+        terminal = (APIConfig.STATUS_COMPLETED, APIConfig.STATUS_FAILED, APIConfig.STATUS_CANCELLED)
+        sync_interval = 1.0 / ProgressStreamConfig.MAX_UPDATES_PER_SECOND
+        try:
+            event = snapshot
+            yield event
+            last_sent = time.monotonic()
+            while event['status'] not in terminal:
+                queued = scan_job_id in self.queued_jobs
+                received = await subscription.get(sync_interval if queued else ProgressStreamConfig.KEEPALIVE_SECONDS)
+                if received is not None:
+                    event = received
+                    yield event
+                    last_sent = time.monotonic()
+                    continue
+                if queued:
+                    # Worker results reach the job state (and the bus) when it is synchronized
+                    await self._find_job(scan_job_id)
+                if time.monotonic() - last_sent >= ProgressStreamConfig.KEEPALIVE_SECONDS:
+                    yield None
+                    last_sent = time.monotonic()
+        finally:
+            await subscription.close()
     
     async def cancel_scan(self, scan_job_id: UUID) -> bool:
         """
         Cancel running scan job
         
+        The job is marked cancelled at once; the running scanner stops at its
+        next checkpoint and releases its connection.
+        
         Args:
             scan_job_id: Job identifier
         
         Returns:
             True if cancelled, False if not found
         """
-        job = self.job_state_manager.get_job(scan_job_id)
+        job = await self._find_job(scan_job_id)
         if not job:
             return False
         
@@ -224,9 +505,100 @@ class ScanService:
             )
             return False
         
+        token = self.cancel_tokens.get(scan_job_id)
+        if token is not None:
+            token.cancel(REASON_CANCELLED)
+        self.scheduler.withdraw(scan_job_id)
+        if scan_job_id in self.queued_jobs:
+            # Pending units are dropped; workers stop running units at their next heartbeat
+            await asyncio.to_thread(get_work_queue().cancel_job, str(scan_job_id))
+            self.queued_jobs.pop(scan_job_id, None)
         job.cancel()
         return True
     
+    async def resume_scan(
+        self,
+        scan_job_id: UUID,
+        connection_config: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Prepare an interrupted scan job to resume from its checkpoint
+        
+        The job state is recreated from the checkpoint if this worker does not
+        hold it (e.g. after a restart). connection_config is supplied again
+        because checkpoints never store credentials; it must identify the same
+        source as the original scan.
+        
+        Args:
+            scan_job_id: Job identifier
+            connection_config: Connection configuration of the original source
+        
+        Returns:
+            Keyword arguments for execute_scan(), or None if the job has no checkpoint
+        
+        Raises:
+            ValueError: If the job is still running or the source differs
+        """
+        state = await asyncio.to_thread(get_checkpoint_store().load, scan_job_id)
+        if state is None:
+            return None
+        if scan_job_id in self.cancel_tokens:
+            raise ValueError(f"Scan job {scan_job_id} is still running")
+        
+        info = state['job']
+        scanner_type = self._determine_scanner_type(info['source_type'], connection_config)
+        if watermark_source_id(scanner_type, connection_config) != info['source_id']:
+            raise ValueError("connection_config does not match the checkpointed source")
+        
+        # A fresh job; execute_scan() restores its assets from the checkpoint
+        self.job_state_manager.delete_job(scan_job_id)
+        await self.create_scan_job(
+            scan_job_id=scan_job_id,
+            tenant_id=UUID(info['tenant_id']),
+            source_type=info['source_type'],
+            connection_config=connection_config,
+            column_filter=info['column_filter'],
+            veri_business_context=info['veri_business_context']
+        )
+        
+        return {
+            'scan_job_id': scan_job_id,
+            'tenant_id': UUID(info['tenant_id']),
+            'source_type': info['source_type'],
+            'connection_config': connection_config,
+            'column_filter': info['column_filter'],
+            'veri_business_context': info['veri_business_context'],
+            'incremental': info['incremental'],
+            'priority': info.get('priority')
+        }
+    
+    async def list_resumable_scans(self) -> List[Dict[str, Any]]:
+        """
+        List scan jobs with a saved checkpoint
+        
+        Returns:
+            [{'scan_job_id', 'items_emitted', 'updated_at'}] oldest first
+        """
+        return await asyncio.to_thread(get_checkpoint_store().list_checkpoints)
+    
+    def get_connection_pool_statistics(self) -> Optional[Dict[str, Any]]:
+        """
+        Get statistics of the connection pool shared by database scans
+        
+        Returns:
+            Per-source idle/in-use counts and reuse counters, or None if pooling is disabled
+        """
+        return self.scanner_manager.get_pool_statistics()
+    
+    def get_content_scan_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics of the content scanner shared by file scans
+        
+        Returns:
+            Files and bytes scanned, outcomes, PII counts and throughput
+        """
+        return get_content_scanner().get_statistics()
+    
     def _determine_scanner_type(
         self,
         source_type: str,
@@ -245,124 +617,522 @@ class ScanService:
         else:
             raise ValueError(f"Unsupported source type: {source_type}")
     
+    def _scheduling_key(self, source_type: str, connection_config: Dict[str, Any]) -> str:
+        """Physical source identity for the scheduler's per-source limit"""
+        try:
+            scanner_type = self._determine_scanner_type(source_type, connection_config)
+        except ValueError:
+            # Unsupported source: execute_scan() fails the job once admitted
+            return source_type
+        return source_fingerprint(scanner_type, connection_config)
+    
+    async def _open_scanner(
+        self,
+        source_type: str,
+        scanner_type: str,
+        connection_config: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Any:
+        """
+        Create a scanner with ScannerManager and connect it to its data source
+        
+        Database scanners are async-native; other scanners run in worker threads.
+        Transient connection errors are retried with backoff (without blocking
+        the event loop); a source whose circuit breaker is open fails at once.
+        
+        Raises:
+            CircuitOpenError: If the source failed repeatedly and its circuit is open
+            RuntimeError: If the scanner cannot be created
+            ConnectionError: If the scanner cannot be connected
+        """
+        # Fail fast (before taking a pool slot) while the source's circuit is open
+        source_key = source_fingerprint(scanner_type, connection_config)
+        get_circuit_breaker(source_key).check()
+        
+        if source_type == "database":
+            scanner = self.scanner_manager.create_async_scanner(
+                scanner_type=scanner_type,
+                connection_config=connection_config
+            )
+        else:
+            scanner = await asyncio.to_thread(
+                self.scanner_manager.create_scanner,
+                scanner_type=scanner_type,
+                connection_config=connection_config
+            )
+        if scanner is None:
+            raise RuntimeError(f"Failed to create scanner: {scanner_type}")
+        if cancel_token is not None:
+            # Abort in-flight queries on cancellation (drivers that support it)
+            self.scanner_manager.interrupt_on_cancel(scanner, cancel_token)
+        
+        async def connect() -> None:
+            if source_type == "database":
+                connected = await scanner.connect()
+            else:
+                connected = await asyncio.to_thread(scanner.connect)
+            if not connected:
+                raise ConnectionError(f"Failed to connect to {scanner_type}")
+        
+        try:
+            await self.scanner_manager.error_handler.retry_async(
+                connect,
+                source_key=source_key,
+                cancel_token=cancel_token
+            )
+        except BaseException:
+            await self._close_scanner(source_type, scanner)
+            raise
+        return scanner
+    
+    async def _close_scanner(self, source_type: str, scanner: Any) -> None:
+        """Close a scanner, logging (not raising) close errors"""
+        try:
+            if scanner is not None:
+                if source_type == "database":
+                    await scanner.close()
+                else:
+                    await asyncio.to_thread(scanner.close)
+        except Exception as e:
+            logger.warning(f"[WARNING] Error closing scanner: {str(e)}")
+    
     async def _scan_database(
         self,
         scanner: Any,
         connection_config: Dict[str, Any],
         column_filter: Optional[Dict[str, Any]],
-        job: JobState
+        job: JobState,
+        cancel_token: Optional[CancellationToken] = None,
+        delta: Optional[DeltaScan] = None,
+        checkpoint: Optional[ScanCheckpoint] = None
     ) -> Dict[str, Any]:
-        """Scan database source with column filtering"""
+        """
+        Scan database source with column filtering
+        
+        The async scanner streams discovered tables in batches of
+        ScanConfig.DISCOVERY_TABLE_BATCH_SIZE; each batch is filtered and then sampled
+        concurrently, so the raw catalog of a 10k+ table database is never held at once
+        and sampling overlaps network waits without blocking the event loop.
+        Each processed batch is published to the job state as discovered assets;
+        the returned summary carries the table count, not the tables.
+        When cancel_token is cancelled, discovery stops between batches and the
+        tables found so far are kept with 'partial': True.
+        In incremental mode (delta), tables whose DDL hash and row estimate are
+        unchanged skip filtering and sampling; filter statistics cover the
+        rescanned tables only.
+        With a checkpoint, the last published table name is the cursor; a resumed
+        scan restarts the catalog query after it.
+        """
         # Get schema/database name
         schema = connection_config.get('schema', 'public')
-        database = connection_config.get('database', '')
         
-        # Discover schema
-        job.update_progress(40)
-        schema_info = scanner.discover()
-        
-        job.update_progress(60)
-        
-        # Apply column filtering if provided
+        # Parse filter configuration once for all batches
+        filter_config = None
+        filter_stats = None
         if column_filter:
             try:
-                # Import column filtering services
-                from ..services.column_filter_service import ColumnFilterService
-                from ..models.column_filter import ColumnFilterConfig
-                
-                # Parse filter configuration
                 filter_config = ColumnFilterConfig(**column_filter)
-                
-                # Apply filtering to each table
                 filter_stats = {
                     'total_tables': 0,
                     'total_columns_discovered': 0,
                     'total_columns_scanned': 0,
                     'columns_filtered_out': 0
                 }
-                
-                for table in schema_info.get('tables', []):
-                    all_columns = [col['column_name'] for col in table.get('columns', [])]
-                    
-                    # Filter columns
-                    filtered_columns = ColumnFilterService.filter_columns(
-                        all_columns,
-                        filter_config
-                    )
-                    
-                    # Update statistics
-                    filter_stats['total_tables'] += 1
-                    filter_stats['total_columns_discovered'] += len(all_columns)
-                    filter_stats['total_columns_scanned'] += len(filtered_columns)
-                    filter_stats['columns_filtered_out'] += len(all_columns) - len(filtered_columns)
-                    
-                    # Keep only filtered columns in results
-                    table['columns'] = [
-                        col for col in table.get('columns', [])
-                        if col['column_name'] in filtered_columns
-                    ]
-                    table['all_columns_count'] = len(all_columns)
-                    table['scanned_columns_count'] = len(filtered_columns)
-                
-                # Calculate reduction percentage
-                if filter_stats['total_columns_discovered'] > 0:
-                    reduction = (
-                        filter_stats['columns_filtered_out'] /
-                        filter_stats['total_columns_discovered']
-                    ) * 100
-                    filter_stats['reduction_percentage'] = round(reduction, 2)
-                else:
-                    filter_stats['reduction_percentage'] = 0.0
-                
-                # Add filter statistics to results
-                schema_info['filter_statistics'] = filter_stats
-                
-                logger.info(
-                    f"[OK] Column filtering applied: {filter_stats['total_columns_scanned']}/"
-                    f"{filter_stats['total_columns_discovered']} columns selected "
-                    f"({filter_stats['reduction_percentage']}% reduction)"
-                )
-                
             except Exception as e:
                 logger.error(f"[ERROR] Column filtering failed: {str(e)}")
                 # Continue with unfiltered results on error
-                pass
+        
+        # Discover schema
+        job.update_progress(40)
+        schema_info = {'status': 'success', 'schema': schema}
+        
+        table_count = 0
+        resume = {}
+        if checkpoint is not None and checkpoint.cursor:
+            resume = {'after_table': checkpoint.cursor['table_name']}
+            table_count = checkpoint.items_emitted
+            if filter_stats is not None and checkpoint.state.get('filter_statistics'):
+                filter_stats.update(checkpoint.state['filter_statistics'])
+        try:
+            async for batch in scanner.iter_table_batches(
+                ScanConfig.DISCOVERY_TABLE_BATCH_SIZE,
+                cancel_token=cancel_token,
+                **resume
+            ):
+                # Tables stream in name order; taken before the delta split drops any
+                cursor = {'table_name': batch[-1]['table_name']} if batch else None
+                carried = []
+                if delta is not None:
+                    # Watermarks use the full column list, so split before filtering
+                    batch, carried = delta.split('tables', batch)
+                if filter_config is not None:
+                    try:
+                        self._filter_table_batch(batch, filter_config, filter_stats)
+                    except Exception as e:
+                        logger.error(f"[ERROR] Column filtering failed: {str(e)}")
+                        # Continue with unfiltered results on error
+                        filter_config = None
+                        filter_stats = None
+                if ScanConfig.SAMPLE_TABLES_DURING_SCAN and batch:
+                    await self._profile_table_batch(scanner, batch, cancel_token)
+                await self._publish_assets(job, 'tables', batch, delta, carried)
+                table_count += len(batch) + len(carried)
+                await self._update_checkpoint(checkpoint, cursor, table_count, job, filter_stats, delta)
+                if cancel_token is not None and cancel_token.is_cancelled:
+                    break
+        except Exception:
+            # An interrupted query surfaces as a driver error; keep the tables found so far
+            if cancel_token is None or not cancel_token.is_cancelled:
+                raise
+        
+        schema_info['partial'] = cancel_token is not None and cancel_token.is_cancelled
+        schema_info['cancel_reason'] = cancel_token.reason if schema_info['partial'] else None
+        if schema_info['partial']:
+            logger.warning(
+                f"[WARNING] Database scan stopped early ({cancel_token.reason}): "
+                f"{table_count} tables discovered"
+            )
+        
+        schema_info['count'] = table_count
+        
+        job.update_progress(60)
+        
+        if filter_stats is not None:
+            # Calculate reduction percentage
+            if filter_stats['total_columns_discovered'] > 0:
+                reduction = (
+                    filter_stats['columns_filtered_out'] /
+                    filter_stats['total_columns_discovered']
+                ) * 100
+                filter_stats['reduction_percentage'] = round(reduction, 2)
+            else:
+                filter_stats['reduction_percentage'] = 0.0
+            
+            # Add filter statistics to results
+            schema_info['filter_statistics'] = filter_stats
+            
+            logger.info(
+                f"[OK] Column filtering applied: {filter_stats['total_columns_scanned']}/"
+                f"{filter_stats['total_columns_discovered']} columns selected "
+                f"({filter_stats['reduction_percentage']}% reduction)"
+            )
         
         job.update_progress(80)
         
         return schema_info
     
-    async def _scan_cloud_storage(
+    @staticmethod
+    def _filter_table_batch(
+        tables: List[Dict[str, Any]],
+        filter_config: ColumnFilterConfig,
+        filter_stats: Dict[str, Any]
+    ) -> None:
+        """
+        Apply column filter to a batch of discovered tables in place
+        
+        Args:
+            tables: Table dicts with 'columns' as [{'column_name': ...}]
+            filter_config: Parsed column filter configuration
+            filter_stats: Running totals updated for each table
+        """
+        for table in tables:
+            all_columns = [col['column_name'] for col in table.get('columns', [])]
+            
+            # Filter columns
+            filtered_columns = ColumnFilterService.filter_columns(
+                all_columns,
+                filter_config
+            )
+            
+            # Update statistics
+            filter_stats['total_tables'] += 1
+            filter_stats['total_columns_discovered'] += len(all_columns)
+            filter_stats['total_columns_scanned'] += len(filtered_columns)
+            filter_stats['columns_filtered_out'] += len(all_columns) - len(filtered_columns)
+            
+            # Keep only filtered columns in results
+            selected = set(filtered_columns)
+            table['columns'] = [
+                col for col in table.get('columns', [])
+                if col['column_name'] in selected
+            ]
+            table['all_columns_count'] = len(all_columns)
+            table['scanned_columns_count'] = len(filtered_columns)
+    
+    async def _scan_table_unit(
         self,
         scanner: Any,
-        connection_config: Dict[str, Any],
-        job: JobState
-    ) -> Dict[str, Any]:
-        """Scan cloud storage source"""
-        job.update_progress(40)
+        tables: List[Dict[str, Any]],
+        scan: Dict[str, Any],
+        job: JobState,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Filter, sample and publish a group of tables discovered by a plan unit
         
-        # Discover cloud objects
-        objects_info = scanner.discover()
+        Returns:
+            Column filter statistics of the group (None without a column filter)
+        """
+        filter_stats = None
+        if scan.get('column_filter'):
+            filter_stats = {
+                'total_tables': 0,
+                'total_columns_discovered': 0,
+                'total_columns_scanned': 0,
+                'columns_filtered_out': 0
+            }
+            try:
+                self._filter_table_batch(tables, ColumnFilterConfig(**scan['column_filter']), filter_stats)
+            except Exception as e:
+                logger.error(f"[ERROR] Column filtering failed: {str(e)}")
+                # Continue with unfiltered results on error
+                filter_stats = None
+        if ScanConfig.SAMPLE_TABLES_DURING_SCAN and tables:
+            await self._profile_table_batch(scanner, tables, cancel_token)
+        await self._publish_assets(job, 'tables', tables)
+        return filter_stats
+    
+    async def _profile_table_batch(
+        self,
+        scanner: Any,
+        tables: List[Dict[str, Any]],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> None:
+        """
+        Sample a batch of tables concurrently and profile their columns in place
         
-        job.update_progress(80)
+        All columns of a table are profiled together (profile_table). Samples
+        are discarded after inspection - only flags and per-column quality
+        (no sample values) are kept in results.
+        
+        Args:
+            scanner: Async scanner providing sample_tables()
+            tables: Table dicts with filtered 'columns'
+            cancel_token: Skips tables not yet sampled once cancelled (optional)
+        """
+        samples = await scanner.sample_tables(tables, ScanConfig.DEFAULT_SAMPLE_SIZE, cancel_token=cancel_token)
+        analyzer = VietnameseTextAnalyzer()
         
-        return objects_info
+        for table in tables:
+            table_sample = samples.get(table['table_name']) or {}
+            profiles = analyzer.profile_table(table_sample)
+            table['has_vietnamese_data'] = any(
+                result['profile']['vietnamese_ratio'] > 0 for result in profiles.values()
+            )
+            table['column_profiles'] = {
+                column_name: result['quality'] for column_name, result in profiles.items()
+            }
+            table['sampled_rows'] = len(next(iter(table_sample.values()), []))
+    
+    async def _scan_cloud_storage(
+        self,
+        scanner: Any,
+        connection_config: Dict[str, Any],
+        job: JobState,
+        cancel_token: Optional[CancellationToken] = None,
+        delta: Optional[DeltaScan] = None,
+        checkpoint: Optional[ScanCheckpoint] = None
+    ) -> Dict[str, Any]:
+        """Scan cloud storage source (objects stream in per listing page batch)"""
+        return await self._stream_discovered_items(scanner, job, cancel_token, delta, checkpoint)
     
     async def _scan_filesystem(
         self,
         scanner: Any,
         connection_config: Dict[str, Any],
-        job: JobState
+        job: JobState,
+        cancel_token: Optional[CancellationToken] = None,
+        delta: Optional[DeltaScan] = None,
+        checkpoint: Optional[ScanCheckpoint] = None
     ) -> Dict[str, Any]:
-        """Scan filesystem source"""
+        """Scan filesystem source (files stream in as directories are walked)"""
+        return await self._stream_discovered_items(scanner, job, cancel_token, delta, checkpoint)
+    
+    async def _stream_discovered_items(
+        self,
+        scanner: Any,
+        job: JobState,
+        cancel_token: Optional[CancellationToken] = None,
+        delta: Optional[DeltaScan] = None,
+        checkpoint: Optional[ScanCheckpoint] = None,
+        discovery_options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Publish item batches from a streaming scanner to the job state
+        
+        The blocking scanner generator is advanced in a worker thread one batch
+        at a time; discovery stops between pages or directories once cancelled.
+        The generator is paused right after the last item of a batch, so the
+        scanner's checkpoint cursor matches the published assets.
+        
+        Args:
+            scanner: Scanner implementing StreamingScannerInterface
+            job: Job receiving discovered assets
+            cancel_token: Token checked by the scanner (optional)
+            delta: Incremental scan state; unchanged items carry their stored assets (optional)
+            checkpoint: Saves the scanner cursor; a resumed scan continues after it (optional)
+            discovery_options: Scanner options, e.g. prefix or max_depth (optional)
+            
+        Returns:
+            Discovery summary (count, partial, cancel_reason)
+        """
         job.update_progress(40)
         
-        # Discover files
-        files_info = scanner.discover()
+        options = dict(discovery_options or {})
+        item_count = 0
+        if checkpoint is not None and checkpoint.cursor:
+            options['resume_from'] = checkpoint.cursor
+            item_count = checkpoint.items_emitted
+        get_cursor = getattr(scanner, 'get_checkpoint_cursor', None)
+        
+        batches = scanner.iter_discovery_batches(
+            ScanConfig.DISCOVERY_ITEM_BATCH_SIZE,
+            cancel_token=cancel_token,
+            **options
+        )
+        try:
+            while True:
+                batch = await asyncio.to_thread(next, batches, None)
+                if batch is None:
+                    break
+                carried = []
+                if delta is not None:
+                    batch, carried = await asyncio.to_thread(delta.split, scanner.ITEM_KEY, batch)
+                await self._publish_assets(job, scanner.ITEM_KEY, batch, delta, carried)
+                item_count += len(batch) + len(carried)
+                if get_cursor is not None:
+                    await self._update_checkpoint(checkpoint, get_cursor(), item_count, job, None, delta)
+        finally:
+            await asyncio.to_thread(batches.close)
         
         job.update_progress(80)
         
-        return files_info
+        partial = cancel_token is not None and cancel_token.is_cancelled
+        return {
+            'status': 'success',
+            'count': item_count,
+            'partial': partial,
+            'cancel_reason': cancel_token.reason if partial else None
+        }
+    
+    async def _publish_assets(
+        self,
+        job: JobState,
+        items_key: str,
+        items: List[Dict[str, Any]],
+        delta: Optional[DeltaScan] = None,
+        carried: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Normalize a batch of discovered items and add them to the job state
+        (and to the job's result file)
+        
+        With ContentDedupConfig.ENABLED files and objects are recorded in the
+        job's content dedup index (copies get 'duplicate_of'); with
+        ContentScanConfig.ENABLED the content of new files is then scanned for
+        PII (worker processes, once per unique content); unchanged files keep
+        their findings.
+        
+        Args:
+            job: Job receiving discovered assets
+            items_key: Scanner ITEM_KEY of the items
+            items: Newly processed items
+            delta: Incremental scan state recording the new assets (optional)
+            carried: Assets of unchanged items from the previous scan (optional)
+        """
+        assets = self._process_results({items_key: items}, job.veri_business_context)
+        blobs = None
+        if ContentDedupConfig.ENABLED and items_key in ContentDedupConfig.ITEM_KEYS:
+            if job.content_index is None:
+                job.content_index = ContentDedupIndex()
+            blobs = await asyncio.to_thread(job.content_index.add_assets, assets)
+            if carried:
+                # Unchanged copies still belong to duplicate clusters
+                await asyncio.to_thread(job.content_index.add_assets, carried)
+            job.duplicate_report = job.content_index.get_report()
+        if ContentScanConfig.ENABLED and items_key == 'files' and assets:
+            content_stats = await asyncio.to_thread(get_content_scanner().scan_assets, assets, blobs)
+            job.content_statistics = merge_content_statistics(job.content_statistics, content_stats)
+        if delta is not None:
+            delta.record(assets)
+        assets += carried or []
+        if job.result_writer is not None:
+            # Full row groups are written here
+            await asyncio.to_thread(job.result_writer.append, assets)
+        job.add_discovered_assets(assets)
+    
+    async def _open_result_writer(self, job: JobState) -> None:
+        """Create the job's result file (assets restored from a checkpoint are written first)"""
+        if not ResultStoreConfig.ENABLED:
+            return
+        try:
+            writer = await asyncio.to_thread(open_result_writer, job.scan_job_id)
+            if job.discovered_assets:
+                await asyncio.to_thread(writer.append, job.discovered_assets)
+        except Exception as e:
+            # The scan still runs; results are limited to the job state preview
+            logger.warning(f"[WARNING] Result file disabled for scan job {job.scan_job_id}: {str(e)}")
+            return
+        job.result_writer = writer
+    
+    async def _close_result_writer(self, job: JobState) -> None:
+        """Finish the job's result file and keep its pointer and summary in the job state"""
+        writer, job.result_writer = job.result_writer, None
+        if writer is None:
+            return
+        summary = await asyncio.to_thread(writer.close)
+        # A resumed scan only restores the capped asset preview of its checkpoint
+        summary['complete'] = summary['total_assets'] == job.total_assets
+        job.result_file = writer.result_file
+        job.result_summary = summary
+    
+    async def _update_checkpoint(
+        self,
+        checkpoint: Optional[ScanCheckpoint],
+        cursor: Optional[Dict[str, Any]],
+        item_count: int,
+        job: JobState,
+        filter_stats: Optional[Dict[str, Any]] = None,
+        delta: Optional[DeltaScan] = None
+    ) -> None:
+        """
+        Record scan progress after a published batch (saved at the configured interval)
+        
+        Args:
+            checkpoint: Checkpoint of the job (None: checkpoints disabled)
+            cursor: Scanner position after the last published item
+            item_count: Items published so far
+            job: Job whose assets are snapshotted for resume
+            filter_stats: Running column filter totals (optional)
+            delta: Incremental scan state (optional)
+        """
+        if checkpoint is None:
+            return
+        
+        def snapshot() -> Dict[str, Any]:
+            return {
+                'assets': job.discovered_assets[:ScanManagerConfig.CHECKPOINT_MAX_ASSETS],
+                'total_assets': job.total_assets,
+                'progress': job.progress,
+                'filter_statistics': dict(filter_stats) if filter_stats else None,
+                'delta': delta.snapshot() if delta is not None else None
+            }
+        
+        await asyncio.to_thread(checkpoint.update, cursor, item_count, snapshot)
+    
+    @staticmethod
+    def _restore_job(job: JobState, state: Dict[str, Any]) -> None:
+        """Restore assets published before the checkpoint into a resumed job"""
+        job.discovered_assets = list(state.get('assets', []))
+        job.total_assets = state.get('total_assets', len(job.discovered_assets))
+        job.update_progress(state.get('progress', 0))
+    
+    async def _find_job(self, scan_job_id: UUID) -> Optional[JobState]:
+        """Job state, synchronized with the work queue for queued scans"""
+        job = self.job_state_manager.get_job(scan_job_id)
+        if scan_job_id in self.queued_jobs or (job is None and WorkQueueConfig.EXECUTION_MODE == 'queue'):
+            job = await self._sync_queued_job(scan_job_id, job)
+        return job
     
     def _process_results(
         self,
@@ -390,19 +1160,25 @@ class ScanService:
                     'has_vietnamese_data': table.get('has_vietnamese_data', False),
                     'pdpl_sensitive': self._is_pdpl_sensitive(table)
                 }
+                if table.get('column_profiles'):
+                    asset['column_profiles'] = table['column_profiles']
                 discovered_assets.append(asset)
         
-        elif 'objects' in results:
-            # Cloud storage results
-            for obj in results.get('objects', []):
+        elif 'objects' in results or 'blobs' in results:
+            # Cloud storage results (S3 objects have 'key', GCS objects and Azure blobs 'name')
+            for obj in results.get('objects', results.get('blobs', [])):
+                object_name = obj.get('key') or obj.get('name', '')
                 asset = {
                     'asset_type': 'object',
-                    'asset_name': obj.get('key', ''),
-                    'asset_path': obj.get('key', ''),
+                    'asset_name': object_name,
+                    'asset_path': object_name,
                     'size_bytes': obj.get('size', 0),
                     'has_vietnamese_data': False,  # Would need content analysis
                     'pdpl_sensitive': False
                 }
+                if obj.get('content_checksum'):
+                    # Provider content hash (duplicate detection)
+                    asset['content_checksum'] = obj['content_checksum']
                 discovered_assets.append(asset)
         
         elif 'files' in results:
@@ -410,7 +1186,7 @@ class ScanService:
             for file_info in results.get('files', []):
                 asset = {
                     'asset_type': 'file',
-                    'asset_name': file_info.get('filename', ''),
+                    'asset_name': file_info.get('name') or file_info.get('filename', ''),
                     'asset_path': file_info.get('path', ''),
                     'size_bytes': file_info.get('size', 0),
                     'has_vietnamese_data': False,  # Would need content analysis
@@ -418,8 +1194,8 @@ class ScanService:
                 }
                 discovered_assets.append(asset)
         
-        # Limit results using config
-        return discovered_assets[:APIConfig.MAX_ASSETS_PER_RESPONSE]
+        # JobState caps stored assets at APIConfig.MAX_ASSETS_PER_RESPONSE
+        return discovered_assets
     
     def _is_pdpl_sensitive(self, table_info: Dict[str, Any]) -> bool:
         """Determine if table contains PDPL-sensitive data"""
@@ -431,7 +1207,10 @@ class ScanService:
         
         columns = table_info.get('columns', [])
         if isinstance(columns, list):
-            column_names = [str(col).lower() for col in columns]
+            column_names = [
+                str(col.get('column_name', '') if isinstance(col, dict) else col).lower()
+                for col in columns
+            ]
             return any(pattern in ' '.join(column_names) for pattern in pdpl_patterns)
         
         return False
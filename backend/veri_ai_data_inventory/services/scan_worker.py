@@ -0,0 +1,201 @@
+"""
+VeriSyntra Scan Worker
+
+Worker process executing queued scan work units (see scanner_manager.work_queue).
+Start any number of workers on any number of nodes sharing the queue backend;
+scan throughput grows with the number of workers:
+
+    python -m services.scan_worker --concurrency 4 --backend redis
+
+Each worker leases units, runs them with ScanService.execute_work_unit() and
+acks the result. While a unit runs its lease is extended every
+WorkQueueConfig.HEARTBEAT_INTERVAL_SECONDS; a worker that dies stops extending,
+so the unit is handed to another worker after the visibility timeout.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+from typing import Any, Dict, Optional
+
+# Import dynamic configuration
+try:
+    from ..config.constants import APIConfig, ScanManagerConfig, WorkQueueConfig
+    from ..scanner_manager.work_queue import WorkQueue, create_work_queue, get_work_queue
+    from ..services.scan_service import ScanService, get_scan_service
+    from ..utils.cancellation import CancellationToken, REASON_CANCELLED
+except ImportError:
+    from config.constants import APIConfig, ScanManagerConfig, WorkQueueConfig
+    from scanner_manager.work_queue import WorkQueue, create_work_queue, get_work_queue
+    from services.scan_service import ScanService, get_scan_service
+    from utils.cancellation import CancellationToken, REASON_CANCELLED
+
+logger = logging.getLogger(__name__)
+
+
+class ScanWorker:
+    """
+    Leases and executes scan work units
+
+    Runs WorkQueueConfig.WORKER_CONCURRENCY units at a time in one process.
+    """
+
+    def __init__(
+        self,
+        work_queue: Optional[WorkQueue] = None,
+        scan_service: Optional[ScanService] = None,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None
+    ):
+        """
+        Initialize scan worker
+
+        Args:
+            work_queue: Queue to lease from (default: shared queue)
+            scan_service: Service executing units (default: shared service)
+            worker_id: Worker identifier (default: host name and process ID)
+            concurrency: Units run at the same time (default: WorkQueueConfig.WORKER_CONCURRENCY)
+        """
+        self.work_queue = work_queue or get_work_queue()
+        self.scan_service = scan_service or get_scan_service()
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.concurrency = concurrency or WorkQueueConfig.WORKER_CONCURRENCY
+        self.units_processed = 0
+        self.units_failed = 0
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """
+        Process units until stop_event is set (running units are finished first)
+
+        Args:
+            stop_event: Event requesting shutdown (default: run forever)
+        """
+        stop_event = stop_event or asyncio.Event()
+        logger.info(f"[OK] Scan worker {self.worker_id} started (concurrency: {self.concurrency})")
+        await asyncio.gather(*(self._run_slot(stop_event) for _ in range(self.concurrency)))
+        logger.info(
+            f"[OK] Scan worker {self.worker_id} stopped: "
+            f"{self.units_processed} units processed, {self.units_failed} failed"
+        )
+
+    async def _run_slot(self, stop_event: asyncio.Event) -> None:
+        """Lease and execute units one after another; poll while the queue is empty"""
+        while not stop_event.is_set():
+            if await self.process_one():
+                continue
+            try:
+                await asyncio.wait_for(stop_event.wait(), WorkQueueConfig.POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def process_one(self) -> bool:
+        """
+        Lease, execute and ack (or fail) one unit
+
+        Returns:
+            True if a unit was leased, False if none was available
+        """
+        lease = await asyncio.to_thread(self.work_queue.lease, self.worker_id)
+        if lease is None:
+            return False
+
+        cancel_token = CancellationToken(ScanManagerConfig.SCANNER_TIMEOUT_SECONDS)
+        heartbeat = asyncio.create_task(self._heartbeat(lease, cancel_token))
+        try:
+            result = await self.scan_service.execute_work_unit(lease, cancel_token)
+        except Exception as e:
+            if cancel_token.reason == REASON_CANCELLED:
+                # Job cancelled or lease lost: nothing to retry
+                await asyncio.to_thread(self.work_queue.ack, lease)
+                return True
+            error_msg = str(e)[:APIConfig.MAX_ERROR_MESSAGE_LENGTH]  # Use config limit
+            state = await asyncio.to_thread(self.work_queue.fail, lease, error_msg)
+            self.units_failed += 1
+            logger.warning(
+                f"[WARNING] Work unit {lease['unit_id']} ({lease['kind']}) of job {lease['scan_job_id']} "
+                f"failed on attempt {lease['attempts']}: {error_msg} (now {state})"
+            )
+            return True
+        finally:
+            heartbeat.cancel()
+            cancel_token.close()
+
+        await self._ack(lease, result)
+        return True
+
+    async def _ack(self, lease: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Ack a unit with its result (plan units enqueue their child units instead)"""
+        new_units = result.pop('units', None)
+        acked = await asyncio.to_thread(
+            self.work_queue.ack,
+            lease,
+            result if new_units is None else None,
+            new_units
+        )
+        if not acked:
+            # Lease expired and the unit went to another worker; its result is discarded
+            logger.warning(f"[WARNING] Lost lease of work unit {lease['unit_id']}; result discarded")
+            return
+        self.units_processed += 1
+        logger.info(
+            f"[OK] Work unit {lease['unit_id']} ({lease['kind']}) of job {lease['scan_job_id']} done"
+            f"{f': {len(new_units)} units planned' if new_units is not None else ''}"
+        )
+
+    async def _heartbeat(self, lease: Dict[str, Any], cancel_token: CancellationToken) -> None:
+        """Extend the lease while the unit runs; stop the unit if the lease is lost or the job cancelled"""
+        while True:
+            await asyncio.sleep(WorkQueueConfig.HEARTBEAT_INTERVAL_SECONDS)
+            extended = await asyncio.to_thread(self.work_queue.extend, lease)
+            cancelled = await asyncio.to_thread(self.work_queue.is_cancelled, lease['scan_job_id'])
+            if not extended or cancelled:
+                cancel_token.cancel(REASON_CANCELLED)
+                return
+
+
+async def _serve(worker: ScanWorker) -> None:
+    """Run a worker until SIGINT/SIGTERM"""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop_event.set)
+        except NotImplementedError:
+            pass  # Windows: KeyboardInterrupt stops the worker
+    await worker.run(stop_event)
+
+
+def main() -> int:
+    """Scan worker entry point"""
+    parser = argparse.ArgumentParser(description="VeriSyntra scan worker")
+    parser.add_argument('--worker-id', default=None, help="Worker identifier (default: host-pid)")
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=WorkQueueConfig.WORKER_CONCURRENCY,
+        help="Units run at the same time"
+    )
+    parser.add_argument(
+        '--backend',
+        choices=WorkQueueConfig.BACKENDS,
+        default=WorkQueueConfig.BACKEND,
+        help="Work queue backend"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    work_queue = create_work_queue(args.backend)
+    worker = ScanWorker(work_queue, get_scan_service(), args.worker_id, args.concurrency)
+    try:
+        asyncio.run(_serve(worker))
+    finally:
+        work_queue.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Benchmark: table column profiling before and after the single-pass profiler
+
+Times the per-column path the scan used before (profile_text_samples plus
+analyze_column_quality for every column, each re-profiling the samples in
+several passes) against VietnameseTextAnalyzer.profile_table on generated
+Vietnamese customer tables of ScanConfig.DEFAULT_SAMPLE_SIZE rows.
+
+Usage (from backend/veri_ai_data_inventory):
+    python tests/bench_column_profiling.py [table_count]
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.constants import ScanConfig  # noqa: E402
+from utils.utf8_validator import UTF8Validator  # noqa: E402
+from utils.vietnamese_text_analyzer import VietnameseTextAnalyzer  # noqa: E402
+
+NAMES = ['Nguyễn Văn An', 'Trần Thị Bình', 'Lê Hoàng Nam', 'Phạm Minh Châu', 'Nguyen Van Binh']
+PROVINCES = ['Hà Nội', 'Hồ Chí Minh', 'Đà Nẵng', 'Cần Thơ']
+
+
+class LegacyColumnProfiler:
+    """Per-column profiling as it was before profile_table (reference only)"""
+
+    def __init__(self):
+        self.top_values_count = ScanConfig.TOP_VALUES_COUNT
+
+    def profile_text_samples(self, samples: List[Any], max_samples: int = ScanConfig.DEFAULT_SAMPLE_SIZE) -> Dict[str, Any]:
+        working_samples = [s for s in samples[:max_samples] if s is not None]
+        null_count = len([s for s in samples[:max_samples] if s is None])
+        if not working_samples:
+            return {'total_count': len(samples[:max_samples]), 'null_count': null_count,
+                    'vietnamese_ratio': 0.0, 'numeric_ratio': 0.0, 'alphanumeric_ratio': 0.0,
+                    'diversity_score': 0.0, 'top_values': []}
+        str_samples = [str(s) for s in working_samples]
+        lengths = [len(s) for s in str_samples]
+        return {
+            'total_count': len(samples[:max_samples]),
+            'null_count': null_count,
+            'min_length': min(lengths),
+            'max_length': max(lengths),
+            'avg_length': round(sum(lengths) / len(lengths), 2),
+            'numeric_ratio': round(sum(1 for s in str_samples if s.isdigit()) / len(str_samples), 3),
+            'alphanumeric_ratio': round(sum(1 for s in str_samples if s.isalnum()) / len(str_samples), 3),
+            'vietnamese_ratio': round(
+                sum(1 for s in str_samples if UTF8Validator.contains_vietnamese(s)) / len(str_samples), 3
+            ),
+            'diversity_score': round(len(set(str_samples)) / len(str_samples), 3),
+            'top_values': Counter(str_samples).most_common(self.top_values_count)
+        }
+
+    def suggest_data_type(self, samples: List[str]) -> str:
+        if not samples:
+            return 'unknown'
+        profile = self.profile_text_samples(samples)
+        if profile['vietnamese_ratio'] > 0.3:
+            return 'vietnamese_text'
+        if profile['numeric_ratio'] > 0.8:
+            return 'numeric'
+        if sum(1 for s in samples if isinstance(s, str) and '@' in s) / len(samples) > 0.7:
+            return 'email'
+        phone_count = sum(
+            1 for s in samples
+            if isinstance(s, str) and (s.startswith('0') or s.startswith('84')) and s.replace('+', '').isdigit()
+        )
+        if phone_count / len(samples) > 0.7:
+            return 'phone'
+        return 'mixed' if profile['alphanumeric_ratio'] > 0.5 else 'unknown'
+
+    def analyze_column_quality(self, column_name: str, samples: List[Any]) -> Dict[str, Any]:
+        str_samples = [str(s) for s in samples if s is not None]
+        null_count = len([s for s in samples if s is None])
+        completeness = (len(samples) - null_count) / len(samples) if samples else 0
+        profile = self.profile_text_samples(str_samples)
+        return {
+            'column_name': column_name,
+            'completeness': round(completeness, 3),
+            'uniqueness': profile['diversity_score'],
+            'vietnamese_content': profile['vietnamese_ratio'],
+            'suggested_type': self.suggest_data_type(str_samples)
+        }
+
+    def profile_table(self, columns: Dict[str, List[Any]]) -> Dict[str, Dict[str, Any]]:
+        return {
+            column_name: {
+                'profile': self.profile_text_samples(samples),
+                'quality': self.analyze_column_quality(column_name, samples)
+            }
+            for column_name, samples in columns.items()
+        }
+
+
+def generate_tables(table_count: int, rows: int = ScanConfig.DEFAULT_SAMPLE_SIZE, seed: int = 0) -> List[Dict[str, List[Any]]]:
+    """Columnar samples of Vietnamese customer tables (IDs, names, phones, emails, amounts, nulls)"""
+    rng = random.Random(seed)
+    return [
+        {
+            'ma_khach_hang': list(range(rows)),
+            'ho_ten': [f"{rng.choice(NAMES)} {rng.randrange(50)}" for _ in range(rows)],
+            'so_dien_thoai': [f"09{rng.randrange(10 ** 8):08d}" for _ in range(rows)],
+            'email': [f"kh{rng.randrange(10 ** 6)}@example.vn" for _ in range(rows)],
+            'tinh_thanh': [rng.choice(PROVINCES) for _ in range(rows)],
+            'trang_thai': [rng.choice(['active', 'inactive', None]) for _ in range(rows)],
+            'so_tien': [rng.randrange(10 ** 7) for _ in range(rows)],
+            'ghi_chu': [None] * rows
+        }
+        for _ in range(table_count)
+    ]
+
+
+def best_seconds(profile: Callable[[Dict[str, List[Any]]], Any], tables: List[Dict[str, List[Any]]], repeat: int = 5) -> float:
+    """Best wall time of profiling every table, over `repeat` runs"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for table in tables:
+            profile(table)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run_benchmark(table_count: int = 200, repeat: int = 5) -> Dict[str, float]:
+    """
+    Time the legacy per-column path against profile_table
+
+    Returns:
+        {'columns', 'legacy_seconds', 'profile_table_seconds', 'speedup'}
+    """
+    tables = generate_tables(table_count)
+    logging.disable(logging.INFO)
+    try:
+        legacy_seconds = best_seconds(LegacyColumnProfiler().profile_table, tables, repeat)
+        table_seconds = best_seconds(VietnameseTextAnalyzer().profile_table, tables, repeat)
+    finally:
+        logging.disable(logging.NOTSET)
+    return {
+        'columns': sum(len(table) for table in tables),
+        'legacy_seconds': legacy_seconds,
+        'profile_table_seconds': table_seconds,
+        'speedup': legacy_seconds / table_seconds
+    }
+
+
+if __name__ == '__main__':
+    result = run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
+    print(f"Columns profiled:       {result['columns']}")
+    print(f"Per-column (legacy):    {result['legacy_seconds'] * 1000:.1f} ms")
+    print(f"profile_table:          {result['profile_table_seconds'] * 1000:.1f} ms")
+    print(f"Speedup:                {result['speedup']:.1f}x")
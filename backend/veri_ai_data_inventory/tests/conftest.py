@@ -0,0 +1,37 @@
+"""
+VeriSyntra AI Data Inventory Test Configuration
+
+Puts the veri_ai_data_inventory directory first on the Python path so its
+top-level modules (config, scanner_manager, services, ...) are imported
+rather than the backend packages of the same name, and keeps the
+SQLite stores opened by scans out of the working directory.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add veri_ai_data_inventory directory to Python path
+package_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(package_dir))
+
+
+@pytest.fixture(autouse=True)
+def isolated_stores(tmp_path_factory, monkeypatch):
+    """Open checkpoint, watermark, work queue and result stores in a per-test temporary directory"""
+    from config.constants import StorageConfig
+    from scanner_manager import checkpoint_store, watermark_store, work_queue
+
+    monkeypatch.setattr(StorageConfig, 'DATA_DIRECTORY', str(tmp_path_factory.mktemp('data')))
+    monkeypatch.setattr(checkpoint_store, '_checkpoint_store_instance', None)
+    monkeypatch.setattr(watermark_store, '_watermark_store_instance', None)
+    monkeypatch.setattr(work_queue, '_work_queue_instance', None)
+    yield
+    for store in (
+        checkpoint_store._checkpoint_store_instance,
+        watermark_store._watermark_store_instance,
+        work_queue._work_queue_instance
+    ):
+        if store is not None and hasattr(store, 'close'):
+            store.close()
@@ -0,0 +1,111 @@
+"""
+Shared test doubles for the scanner unit tests.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+
+def catalog_rows(table_count, columns=("id", "ho_ten", "email")):
+    """Catalog rows ordered by table name and ordinal position"""
+    for t in range(table_count):
+        for position, column in enumerate(columns, start=1):
+            yield (f"bang_{t:05d}", column, "text", position != 1, position, 1000 + t, 8192, position == 1)
+
+
+class FakeNamedCursor:
+    """Server-side cursor stand-in that records how it was opened"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+        self.itersize = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeConnection:
+    """Connection returning a single FakeNamedCursor"""
+
+    def __init__(self, rows):
+        self.cursor_obj = FakeNamedCursor(rows)
+        self.cursor_names = []
+
+    def cursor(self, name=None):
+        self.cursor_names.append(name)
+        return self.cursor_obj
+
+
+class ScriptedCursor:
+    """DB-API cursor answering each execute() with the next scripted result rows"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.executed = []
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        self.rows = self.results.pop(0)
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class ScriptedConnection:
+    """Connection whose cursors share one ScriptedCursor"""
+
+    def __init__(self, results):
+        self.cursor_obj = ScriptedCursor(results)
+
+    def cursor(self, *args, **kwargs):
+        return self.cursor_obj
+
+
+class FakeJob:
+    """JobState stand-in recording progress and streamed assets"""
+
+    def __init__(self):
+        self.progress = []
+        self.assets = []
+        self.veri_business_context = {}
+        self.result_writer = None
+        self.content_statistics = None
+        self.content_index = None
+        self.duplicate_report = None
+
+    def update_progress(self, value):
+        self.progress.append(value)
+
+    def add_discovered_assets(self, assets):
+        self.assets.extend(assets)
+
+
+def build_tree(root):
+    """Nested share with files before, between and after subdirectories"""
+    for relative in (
+        'a.txt', 'b.txt',
+        'bao_cao/2024/q1.csv', 'bao_cao/2024/q2.csv', 'bao_cao/tong_hop.csv',
+        'ho_so/nhan_vien.docx', 'ho_so/z/cu.txt', 'z.txt'
+    ):
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('du lieu', encoding='utf-8')
@@ -0,0 +1,188 @@
+"""
+Unit Tests for Async Database Scanning
+Tests the bounded sampling fan-out, the threaded async facade and ScanService profiling.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import time
+
+from scanner_manager.async_scanner import ThreadedAsyncScanner, sample_tables_concurrently
+from scanner_manager.connection_pool import ScannerConnectionPool
+from scanner_manager.scanner_manager import ScannerManager
+from services.scan_service import ScanService
+from utils.catalog_discovery import iter_batches
+
+from fixtures import FakeJob
+
+NETWORK_WAIT = 0.05
+
+
+def discovered_tables(count):
+    """Discovered table dicts with two columns"""
+    return [
+        {
+            'table_name': f"bang_{i:03d}",
+            'full_name': f"public.bang_{i:03d}",
+            'columns': [{'column_name': 'ho_ten'}, {'column_name': 'ma'}],
+            'row_estimate': 100
+        }
+        for i in range(count)
+    ]
+
+
+class FakeSyncScanner:
+    """Blocking sync scanner: every query waits NETWORK_WAIT seconds"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    @staticmethod
+    def open_connection(connection_config):
+        return object()
+
+    @classmethod
+    def from_connection(cls, connection, connection_config):
+        return cls(connection)
+
+    def connect(self):
+        return True
+
+    def iter_table_batches(self, batch_size, cancel_token=None):
+        return iter_batches(discovered_tables(12), batch_size)
+
+    def extract_table_sample(self, table_name, column_names, limit):
+        time.sleep(NETWORK_WAIT)
+        names = ['Nguyễn Văn An'] if table_name.endswith('1') else ['Nguyen Van An']
+        return {'ho_ten': names, 'ma': [1]}
+
+    def close(self):
+        self.connection.close()
+
+
+def threaded_scanner(monkeypatch, max_per_source=4):
+    """ThreadedAsyncScanner over FakeSyncScanner with a pooled ScannerManager"""
+    manager = ScannerManager(connection_pool=ScannerConnectionPool(max_per_source=max_per_source))
+    monkeypatch.setattr(manager.registry, 'get_scanner_class', lambda scanner_type: FakeSyncScanner)
+    return ThreadedAsyncScanner(manager, 'mysql', {'host': 'db.local', 'database': 'erp'})
+
+
+class TestSampleTablesConcurrently:
+    """Test semaphore-bounded fan-out"""
+
+    def test_bounded_and_overlapping(self):
+        """At most `concurrency` samples in flight; waits overlap"""
+        class SlowScanner:
+            in_flight = 0
+            peak = 0
+
+            async def sample_table(self, table, limit):
+                SlowScanner.in_flight += 1
+                SlowScanner.peak = max(SlowScanner.peak, SlowScanner.in_flight)
+                await asyncio.sleep(NETWORK_WAIT)
+                SlowScanner.in_flight -= 1
+                return {'ho_ten': [table['table_name']]}
+
+        started = time.perf_counter()
+        samples = asyncio.run(sample_tables_concurrently(SlowScanner(), discovered_tables(20), concurrency=5))
+        elapsed = time.perf_counter() - started
+
+        assert SlowScanner.peak == 5
+        assert elapsed < 20 * NETWORK_WAIT / 2
+        assert samples['bang_007'] == {'ho_ten': ['bang_007']}
+
+    def test_failed_table_returns_empty_sample(self):
+        """One failing table does not fail the batch"""
+        class FlakyScanner:
+            async def sample_table(self, table, limit):
+                if table['table_name'] == 'bang_001':
+                    raise RuntimeError("permission denied")
+                return {'ma': [1]}
+
+        samples = asyncio.run(sample_tables_concurrently(FlakyScanner(), discovered_tables(3)))
+        assert samples['bang_001'] == {}
+        assert samples['bang_002'] == {'ma': [1]}
+
+
+class TestThreadedAsyncScanner:
+    """Test the async facade over sync scanners"""
+
+    def test_concurrency_capped_by_pool(self, monkeypatch):
+        """Sampling leaves one pooled connection for discovery"""
+        assert threaded_scanner(monkeypatch, max_per_source=4).concurrency == 3
+
+    def test_event_loop_stays_responsive(self, monkeypatch):
+        """Blocking driver calls run in threads and overlap"""
+        scanner = threaded_scanner(monkeypatch)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(NETWORK_WAIT / 5)
+                    ticks += 1
+
+            ticker_task = asyncio.create_task(ticker())
+            assert await scanner.connect()
+            tables = [table async for batch in scanner.iter_table_batches(5) for table in batch]
+            started = time.perf_counter()
+            samples = await scanner.sample_tables(tables)
+            elapsed = time.perf_counter() - started
+            await scanner.close()
+            ticker_task.cancel()
+            return tables, samples, elapsed, ticks
+
+        tables, samples, elapsed, ticks = asyncio.run(run())
+
+        assert len(tables) == 12
+        assert len(samples) == 12
+        assert elapsed < 12 * NETWORK_WAIT * 0.75
+        assert ticks > 5
+        assert scanner.scanner_manager.get_pool_statistics()['total_in_use'] == 0
+
+
+class TestScanServiceProfiling:
+    """Test ScanService samples discovered tables"""
+
+    def test_vietnamese_flag_from_samples(self, monkeypatch):
+        """Tables whose sample contains diacritics are flagged"""
+        job = FakeJob()
+        scanner = threaded_scanner(monkeypatch)
+        service = object.__new__(ScanService)
+
+        async def run():
+            await scanner.connect()
+            try:
+                return await service._scan_database(scanner, {'schema': 'public'}, None, job)
+            finally:
+                await scanner.close()
+
+        results = asyncio.run(run())
+        flagged = [asset['asset_name'] for asset in job.assets if asset['has_vietnamese_data']]
+
+        assert results['count'] == 12
+        assert flagged == ['bang_001', 'bang_011']
+
+    def test_column_profiles_from_samples(self, monkeypatch):
+        """Each table asset carries the quality of its sampled columns (no sample values)"""
+        job = FakeJob()
+        scanner = threaded_scanner(monkeypatch)
+        service = object.__new__(ScanService)
+
+        async def run():
+            await scanner.connect()
+            try:
+                return await service._scan_database(scanner, {'schema': 'public'}, None, job)
+            finally:
+                await scanner.close()
+
+        asyncio.run(run())
+        profiles = {asset['asset_name']: asset['column_profiles'] for asset in job.assets}
+
+        assert profiles['bang_001']['ho_ten']['suggested_type'] == 'vietnamese_text'
+        assert profiles['bang_002']['ma']['suggested_type'] == 'numeric'
+        assert profiles['bang_002']['ma']['completeness'] == 1.0
+        assert 'Nguyen Van An' not in str(profiles['bang_002'])
@@ -0,0 +1,215 @@
+"""
+Unit Tests for Scan Cancellation
+Tests cancellation tokens, cooperative stops in scanners and partial results.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import threading
+import time
+
+from config.constants import ScanManagerConfig
+from filesystem_scanners.local_filesystem_scanner import LocalFilesystemScanner
+from postgresql_scanner import PostgreSQLScanner
+from scanner_manager.progress_tracker import ScanStatus
+from scanner_manager.scanner_manager import ScannerManager
+from services.scan_service import ScanService
+from utils.cancellation import CancellationToken
+
+from fixtures import FakeConnection, FakeJob, catalog_rows
+
+
+class FakeScanner:
+    """Sync scanner whose discover() walks tables until the token is cancelled"""
+
+    instances = []
+
+    def __init__(self, connection_config):
+        self.connection_config = connection_config
+        self.closed = False
+        self.interrupted = False
+        FakeScanner.instances.append(self)
+
+    def connect(self):
+        return True
+
+    def interrupt(self):
+        self.interrupted = True
+
+    def discover(self, cancel_token=None, **kwargs):
+        tables = []
+        for i in range(1000):
+            if cancel_token is not None and cancel_token.is_cancelled:
+                break
+            tables.append({'table_name': f"bang_{i:03d}"})
+            time.sleep(0.005)
+        partial = cancel_token is not None and cancel_token.is_cancelled
+        return {'tables': tables, 'count': len(tables), 'partial': partial}
+
+    def close(self):
+        self.closed = True
+
+
+class StubbornScanner(FakeScanner):
+    """Scanner that ignores cancellation (blocks in a driver call)"""
+
+    def discover(self, cancel_token=None, **kwargs):
+        time.sleep(0.5)
+        return {'tables': [], 'count': 0}
+
+
+def fake_manager(monkeypatch, scanner_class=FakeScanner, scan_timeout=ScanManagerConfig.SCANNER_TIMEOUT_SECONDS):
+    """ScannerManager creating scanner_class for every scanner type"""
+    manager = ScannerManager(scan_timeout=scan_timeout)
+    monkeypatch.setattr(manager.registry, 'get_scanner_class', lambda scanner_type: scanner_class)
+    return manager
+
+
+class TestCancellationToken:
+    """Test token state, deadline and callbacks"""
+
+    def test_cancel_runs_callbacks_once(self):
+        """First cancel wins; late callbacks run immediately"""
+        token = CancellationToken()
+        calls = []
+        token.add_callback(lambda: calls.append('a'))
+
+        assert token.cancel() is True
+        assert token.cancel('timeout') is False
+        assert token.is_cancelled and token.reason == 'cancelled'
+
+        token.add_callback(lambda: calls.append('b'))
+        assert calls == ['a', 'b']
+
+    def test_deadline_cancels_with_timeout(self):
+        """The deadline timer cancels the token and fires callbacks"""
+        token = CancellationToken(timeout_seconds=0.02)
+        fired = threading.Event()
+        token.add_callback(fired.set)
+
+        assert not token.is_cancelled
+        assert fired.wait(1.0)
+        assert token.reason == 'timeout'
+        assert token.remaining() == 0.0
+
+    def test_failing_callback_does_not_raise(self):
+        """Callback errors are logged, not propagated"""
+        token = CancellationToken()
+        token.add_callback(lambda: 1 / 0)
+        assert token.cancel() is True
+
+
+class TestScannerCheckpoints:
+    """Test scanners stop between tables and directories"""
+
+    def test_postgresql_discovery_stops_between_tables(self):
+        """Discovery returns the tables seen before cancellation, marked partial"""
+        token = CancellationToken()
+
+        def rows():
+            for index, row in enumerate(catalog_rows(50)):
+                if index == 3 * 10:
+                    token.cancel()
+                yield row
+
+        scanner = object.__new__(PostgreSQLScanner)
+        scanner.schema = "public"
+        scanner.connection = FakeConnection(rows())
+
+        result = scanner.discover(cancel_token=token)
+
+        assert result['count'] == 9
+        assert result['partial'] is True
+        assert result['cancel_reason'] == 'cancelled'
+
+    def test_filesystem_walk_stops(self, tmp_path):
+        """A cancelled token stops the walk before the next directory"""
+        for folder in ('a', 'b'):
+            (tmp_path / folder).mkdir()
+            (tmp_path / folder / 'ho_so.txt').write_text('Nguyễn Văn An', encoding='utf-8')
+        scanner = LocalFilesystemScanner(str(tmp_path))
+
+        token = CancellationToken()
+        token.cancel('timeout')
+        result = scanner.discover_files(cancel_token=token)
+
+        assert result['total_count'] == 0
+        assert result['partial'] is True
+        assert result['cancel_reason'] == 'timeout'
+
+
+class TestScannerManagerCancellation:
+    """Test ScannerManager stops and releases cancelled scans"""
+
+    def test_cancel_scan_returns_partial_results(self, monkeypatch):
+        """cancel_scan() stops discovery, interrupts and closes the scanner"""
+        manager = fake_manager(monkeypatch)
+        scan_id = 'quet-1'
+        threading.Timer(0.05, manager.cancel_scan, args=(scan_id,)).start()
+
+        result = manager.execute_scan('mysql', {'host': 'db.local'}, scan_id=scan_id)
+
+        scanner = FakeScanner.instances[-1]
+        assert result['status'] == 'success'
+        assert result['partial'] is True and result['cancel_reason'] == 'cancelled'
+        assert 0 < result['count'] < 1000
+        assert scanner.interrupted and scanner.closed
+        assert manager.get_scan_status(scan_id)['status'] == ScanStatus.CANCELLED
+        assert manager.cancel_tokens == {}
+
+    def test_deadline_returns_partial_results(self, monkeypatch):
+        """A scan past its timeout returns what it found, marked partial"""
+        manager = fake_manager(monkeypatch, scan_timeout=0.05)
+
+        result = manager.execute_scan('mysql', {'host': 'db.local'})
+
+        assert result['partial'] is True and result['cancel_reason'] == 'timeout'
+        assert 0 < result['count'] < 1000
+
+    def test_parallel_scans_do_not_wait_past_deadline(self, monkeypatch):
+        """Scans ignoring their token are abandoned after timeout plus grace"""
+        monkeypatch.setattr(ScanManagerConfig, 'CANCEL_GRACE_SECONDS', 0)
+        manager = fake_manager(monkeypatch, scanner_class=StubbornScanner, scan_timeout=0.05)
+        requests = [{'scanner_type': 'mysql', 'connection_config': {'host': 'db.local'}}] * 2
+
+        started = time.perf_counter()
+        results = manager._execute_parallel_scans(requests)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.4
+        assert len(results) == 2
+        assert all(result['cancel_reason'] == 'timeout' for result in results)
+
+
+class TestScanServiceCancellation:
+    """Test ScanService keeps partial database results"""
+
+    def test_database_scan_stops_between_batches(self):
+        """Batches after cancellation are not fetched; results are marked partial"""
+        token = CancellationToken()
+
+        class BatchScanner:
+            fetched = 0
+
+            async def iter_table_batches(self, batch_size, cancel_token=None):
+                for batch in [[{'table_name': f"bang_{b}_{i}", 'columns': []} for i in range(5)] for b in range(4)]:
+                    BatchScanner.fetched += 1
+                    yield batch
+
+            async def sample_tables(self, tables, limit, cancel_token=None):
+                cancel_token.cancel()
+                return {}
+
+        service = object.__new__(ScanService)
+        results = asyncio.run(service._scan_database(
+            scanner=BatchScanner(),
+            connection_config={'schema': 'public'},
+            column_filter=None,
+            job=FakeJob(),
+            cancel_token=token
+        ))
+
+        assert results['count'] == 5
+        assert BatchScanner.fetched == 1
+        assert results['partial'] is True and results['cancel_reason'] == 'cancelled'
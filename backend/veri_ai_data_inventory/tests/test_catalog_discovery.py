@@ -0,0 +1,112 @@
+"""
+Unit Tests for Streaming Catalog Discovery
+Tests grouping of bulk catalog rows, table batching and the batched filter stage.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+
+import pytest
+
+from postgresql_scanner import PostgreSQLScanner
+from services.scan_service import ScanService
+from utils.catalog_discovery import group_catalog_rows, iter_batches
+
+from fixtures import FakeConnection, FakeJob, catalog_rows
+
+
+class TestGroupCatalogRows:
+    """Test on-the-fly grouping of catalog rows"""
+
+    def test_groups_rows_into_tables(self):
+        """Each table gets its ordered columns, estimates and primary key"""
+        tables = list(group_catalog_rows(catalog_rows(3), "public"))
+
+        assert [table['table_name'] for table in tables] == ["bang_00000", "bang_00001", "bang_00002"]
+        first = tables[0]
+        assert first['full_name'] == "public.bang_00000"
+        assert [col['column_name'] for col in first['columns']] == ["id", "ho_ten", "email"]
+        assert first['column_count'] == 3
+        assert first['row_count'] == 1000
+        assert first['primary_key'] == ["id"]
+
+    def test_unanalyzed_estimate_reports_zero_rows(self):
+        """Negative or missing estimates keep row_count non-negative"""
+        rows = [("bang", "id", "int", False, 1, None, None, True)]
+        table = next(group_catalog_rows(rows, "public"))
+        assert table['row_count'] == 0
+        assert table['row_estimate'] == -1
+
+    def test_iter_batches(self):
+        """Batches are bounded and cover every item"""
+        batches = list(iter_batches(range(7), 3))
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+        with pytest.raises(ValueError):
+            list(iter_batches([], 0))
+
+
+class TestScannerDiscovery:
+    """Test bulk discovery through a server-side cursor"""
+
+    def test_postgresql_uses_one_named_cursor(self):
+        """All tables come from one named-cursor query with the configured fetch size"""
+        scanner = object.__new__(PostgreSQLScanner)
+        scanner.schema = "public"
+        scanner.connection = FakeConnection(list(catalog_rows(25)))
+
+        batches = list(scanner.iter_table_batches(batch_size=10, fetch_size=100))
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert len(scanner.connection.cursor_names) == 1
+        assert scanner.connection.cursor_names[0] is not None
+        assert scanner.connection.cursor_obj.itersize == 100
+        assert len(scanner.connection.cursor_obj.executed) == 1
+
+
+class TestScanServiceBatches:
+    """Test the batched filter stage in ScanService"""
+
+    def test_filter_applied_per_batch(self):
+        """Filter statistics accumulate across streamed batches"""
+        streamed = []
+
+        class BatchScanner:
+            async def iter_table_batches(self, batch_size, cancel_token=None):
+                for batch in iter_batches(group_catalog_rows(catalog_rows(12), "public"), 5):
+                    streamed.append(batch)
+                    yield batch
+
+            async def sample_tables(self, tables, limit, cancel_token=None):
+                return {}
+
+        service = object.__new__(ScanService)
+        job = FakeJob()
+        results = asyncio.run(service._scan_database(
+            scanner=BatchScanner(),
+            connection_config={'schema': 'public'},
+            column_filter={'mode': 'include', 'column_patterns': ['ho_ten', 'email']},
+            job=job
+        ))
+
+        assert results['count'] == 12
+        assert 'tables' not in results
+        assert len(job.assets) == 12
+        assert all(
+            [col['column_name'] for col in table['columns']] == ['ho_ten', 'email']
+            for batch in streamed for table in batch
+        )
+        stats = results['filter_statistics']
+        assert stats['total_tables'] == 12
+        assert stats['total_columns_discovered'] == 36
+        assert stats['columns_filtered_out'] == 12
+        assert stats['reduction_percentage'] == 33.33
+
+    def test_pdpl_check_uses_column_names(self):
+        """Discovered column dicts are matched on column_name, not their keys"""
+        service = object.__new__(ScanService)
+        tables = list(group_catalog_rows(catalog_rows(2, columns=("id", "ma_don")), "public"))
+        tables[1]['columns'].append({'column_name': 'so_dien_thoai'})
+
+        assert service._is_pdpl_sensitive(tables[0]) is False
+        assert service._is_pdpl_sensitive(tables[1]) is True
@@ -0,0 +1,182 @@
+"""
+Unit Tests for Scanner Connection Pool
+Tests reuse by source fingerprint, per-source limits, health checks and idle expiry.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import threading
+import time
+
+import pytest
+
+from scanner_manager.connection_pool import ScannerConnectionPool, source_fingerprint
+from scanner_manager.scanner_manager import ScannerManager
+
+
+class FakeConnection:
+    """Driver connection stand-in"""
+
+    opened = 0
+
+    def __init__(self):
+        FakeConnection.opened += 1
+        self.closed = False
+        self.healthy = True
+        self.rollbacks = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeScanner:
+    """Scanner class exposing the pool hooks"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    @staticmethod
+    def open_connection(connection_config):
+        return FakeConnection()
+
+    @staticmethod
+    def check_connection(connection):
+        return connection.healthy
+
+    @staticmethod
+    def reset_connection(connection):
+        connection.rollback()
+
+    @classmethod
+    def from_connection(cls, connection, connection_config):
+        return cls(connection)
+
+    def close(self):
+        self.connection.close()
+
+
+@pytest.fixture
+def pool():
+    """Small pool with immediate health checks"""
+    return ScannerConnectionPool(max_per_source=2, idle_timeout=60, health_check_interval=0, acquire_timeout=0.2)
+
+
+def lease(pool, key="nguon-a"):
+    """Acquire with FakeScanner hooks"""
+    return pool.acquire(
+        key,
+        factory=FakeConnection,
+        health_check=FakeScanner.check_connection,
+        reset=FakeScanner.reset_connection,
+        scanner_type="postgresql"
+    )
+
+
+class TestSourceFingerprint:
+    """Test source keys"""
+
+    def test_schema_does_not_change_fingerprint(self):
+        """Scans of different schemas on one server share a key"""
+        config = {'host': 'db.local', 'database': 'erp', 'username': 'scanner', 'password': 'x'}
+        assert source_fingerprint('postgresql', {**config, 'schema': 'public'}) == \
+            source_fingerprint('postgresql', {**config, 'schema': 'ke_toan'})
+
+    def test_credentials_and_type_change_fingerprint(self):
+        """Different users or drivers never share connections"""
+        config = {'host': 'db.local', 'database': 'erp', 'username': 'scanner'}
+        assert source_fingerprint('postgresql', config) != source_fingerprint('mysql', config)
+        assert source_fingerprint('postgresql', config) != \
+            source_fingerprint('postgresql', {**config, 'username': 'admin'})
+
+
+class TestScannerConnectionPool:
+    """Test leasing and reuse"""
+
+    def test_released_connection_is_reused(self, pool):
+        """Closing the proxy returns the connection for the next scan"""
+        first = lease(pool)
+        raw = first.raw_connection
+        first.close()
+        first.close()
+
+        second = lease(pool)
+        assert second.raw_connection is raw
+        assert raw.rollbacks == 1
+        stats = pool.get_statistics()
+        assert stats['total_in_use'] == 1
+        source = next(iter(stats['sources'].values()))
+        assert source['created'] == 1 and source['reused'] == 1
+
+    def test_limit_per_source_waits_then_times_out(self, pool):
+        """A third lease waits for a release and times out otherwise"""
+        first, second = lease(pool), lease(pool)
+        with pytest.raises(TimeoutError):
+            lease(pool)
+
+        threading.Timer(0.05, first.close).start()
+        third = lease(pool)
+        assert third.raw_connection is first.raw_connection
+        assert lease(pool, key="nguon-b") is not None
+
+    def test_unhealthy_connection_is_replaced(self, pool):
+        """Failed health check closes the idle connection and opens a new one"""
+        first = lease(pool)
+        raw = first.raw_connection
+        first.close()
+        raw.healthy = False
+
+        second = lease(pool)
+        assert second.raw_connection is not raw
+        assert raw.closed
+        assert next(iter(pool.get_statistics()['sources'].values()))['health_check_failures'] == 1
+
+    def test_idle_connections_expire(self):
+        """Connections idle past the timeout are closed"""
+        pool = ScannerConnectionPool(max_per_source=2, idle_timeout=0.01)
+        connection = pool.acquire("nguon-a", factory=FakeConnection)
+        raw = connection.raw_connection
+        connection.close()
+        time.sleep(0.02)
+
+        assert pool.reap_idle() == 1
+        assert raw.closed
+        assert pool.get_statistics()['total_idle'] == 0
+
+    def test_reaper_closes_idle_connections_without_pool_calls(self):
+        """The background reaper closes expired connections of sources not used again"""
+        pool = ScannerConnectionPool(max_per_source=2, idle_timeout=0.01, health_check_interval=0.02)
+        connection = pool.acquire("nguon-a", factory=FakeConnection)
+        raw = connection.raw_connection
+        connection.close()
+        reaper = pool._reaper
+        assert reaper is not None and reaper.daemon
+
+        deadline = time.monotonic() + 2
+        while not raw.closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert raw.closed
+
+        pool.close_all()
+        assert not reaper.is_alive()
+        assert pool._reaper is None
+
+
+class TestScannerManagerPooling:
+    """Test ScannerManager leases pooled connections"""
+
+    def test_scanners_share_pooled_connection(self, pool, monkeypatch):
+        """Sequential scanners of one source reuse a single connection"""
+        manager = ScannerManager(connection_pool=pool)
+        monkeypatch.setattr(manager.registry, 'get_scanner_class', lambda scanner_type: FakeScanner)
+        config = {'host': 'db.local', 'database': 'erp', 'username': 'scanner', 'password': 'x'}
+
+        opened = FakeConnection.opened
+        for _ in range(3):
+            scanner = manager.create_scanner('postgresql', config)
+            scanner.close()
+
+        assert FakeConnection.opened - opened == 1
+        assert manager.get_statistics()['connection_pool']['total_idle'] == 1
@@ -0,0 +1,163 @@
+"""
+Unit Tests for Content Deduplication
+Tests the staged fingerprint, duplicate clusters and content scans reused across copies.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from config.constants import ContentDedupConfig, ContentScanConfig, ResultStoreConfig
+from scanner_manager.content_dedup import ContentDedupIndex, get_full_hasher
+from scanner_manager.content_scanner import ContentScanner
+from services.scan_service import ScanService
+
+EXPORT = 'ho_ten,dien_thoai,cccd\n' + 'Nguyễn Văn An,0912345678,012345678901\n' * 200
+
+
+def file_asset(path):
+    return {'asset_type': 'file', 'asset_path': str(path), 'size_bytes': path.stat().st_size}
+
+
+class TestStagedFingerprint:
+    """Test that each stage only runs on collisions"""
+
+    def test_unique_sizes_are_not_read(self, tmp_path):
+        """Files of different sizes are unique without hashing"""
+        index = ContentDedupIndex()
+        for size in (10, 20, 30):
+            (tmp_path / f'{size}.bin').write_bytes(b'x' * size)
+            index.add(str(tmp_path / f'{size}.bin'), size)
+
+        report = index.get_report()
+
+        assert (report['unique'], report['clusters']) == (3, 0)
+        assert report['head_tail_hashes'] == report['full_hashes'] == report['bytes_hashed'] == 0
+
+    def test_stages_escalate_on_collision(self, tmp_path):
+        """Different first blocks stop at stage 2; equal ends but different middles need a full hash"""
+        index = ContentDedupIndex(block_bytes=4)
+        (tmp_path / 'a').write_bytes(b'AAAA-middle-1-ZZZZ')
+        (tmp_path / 'b').write_bytes(b'BBBB-middle-1-ZZZZ')
+        (tmp_path / 'c').write_bytes(b'AAAA-middle-2-ZZZZ')
+        (tmp_path / 'd').write_bytes(b'AAAA-middle-2-ZZZZ')
+
+        first, _ = index.add(str(tmp_path / 'a'), 18)
+        _, b_duplicate = index.add(str(tmp_path / 'b'), 18)
+        assert not b_duplicate and index.full_hashes == 0 and index.head_tail_hashes == 2
+
+        _, c_duplicate = index.add(str(tmp_path / 'c'), 18)
+        assert not c_duplicate and index.full_hashes == 2
+
+        blob, d_duplicate = index.add(str(tmp_path / 'd'), 18)
+        assert d_duplicate and blob.path == str(tmp_path / 'c') and blob is not first
+        assert blob.fingerprint.startswith(f'{index.algorithm}:')
+
+    def test_clusters_are_reported_by_wasted_bytes(self, tmp_path):
+        """Copies across folders form clusters; the report lists the costliest first"""
+        for folder in ('hr', 'ke_toan', 'tam', 'sao_luu'):
+            (tmp_path / folder).mkdir()
+            (tmp_path / folder / 'nhan_vien.csv').write_text(EXPORT, encoding='utf-8')
+        for folder in ('hr', 'tam'):
+            (tmp_path / folder / 'ghi_chu.txt').write_text('ghi chú ngắn', encoding='utf-8')
+        (tmp_path / 'hr' / 'khac.csv').write_text(EXPORT.replace('An', 'Anh'), encoding='utf-8')
+        index = ContentDedupIndex()
+
+        assets = [file_asset(path) for path in sorted(tmp_path.rglob('*.*'))]
+        blobs = index.add_assets(assets)
+        report = index.get_report()
+
+        assert report['indexed'] == 7 and report['unique'] == 3
+        assert (report['clusters'], report['duplicate_files']) == (2, 4)
+        top = report['top_clusters'][0]
+        assert top['copies'] == 4 and top['wasted_bytes'] == 3 * len(EXPORT.encode('utf-8'))
+        assert sorted(top['paths']) == sorted(str(path) for path in tmp_path.rglob('nhan_vien.csv'))
+        assert sum('duplicate_of' in asset for asset in assets) == 4
+        assert len({id(blob) for blob in blobs}) == 3
+
+    def test_objects_compare_provider_checksums(self):
+        """Cloud objects are deduplicated by size and checksum without reading content"""
+        index = ContentDedupIndex()
+        assets = [
+            {'asset_type': 'object', 'asset_path': 'a/xuat.csv', 'size_bytes': 500, 'content_checksum': 'md5-1'},
+            {'asset_type': 'object', 'asset_path': 'b/xuat.csv', 'size_bytes': 500, 'content_checksum': 'md5-1'},
+            {'asset_type': 'object', 'asset_path': 'c/khac.csv', 'size_bytes': 500, 'content_checksum': 'md5-2'},
+            {'asset_type': 'object', 'asset_path': 'd/khong_ro.csv', 'size_bytes': 500},
+        ]
+
+        blobs = index.add_assets(assets)
+
+        assert assets[1]['duplicate_of'] == 'a/xuat.csv' and 'duplicate_of' not in assets[2]
+        assert blobs[3] is None
+        assert index.get_report()['top_clusters'][0]['fingerprint'] == 'md5-1'
+        assert index.bytes_hashed == 0
+
+    def test_hash_algorithm_selection(self):
+        """Missing optional hash packages fall back to blake2b under 'auto' only"""
+        try:
+            import xxhash  # noqa: F401
+        except ImportError:
+            with pytest.raises(RuntimeError):
+                get_full_hasher('xxhash')
+        with pytest.raises(ValueError):
+            get_full_hasher('md5')
+        name, new_hasher = get_full_hasher('blake2b')
+        assert name == 'blake2b' and len(new_hasher().hexdigest()) == 64
+        assert get_full_hasher('auto')[0] in ('xxh3_128', 'blake3', 'blake2b')
+
+
+class TestDeduplicatedContentScan:
+    """Test content scans shared by copies"""
+
+    def test_copies_reuse_findings(self, tmp_path, monkeypatch):
+        """Each unique content is scanned once, across batches"""
+        monkeypatch.setattr(ContentScanConfig, 'PARALLEL_THRESHOLD', 1000)
+        for name in ('a.csv', 'b.csv', 'c.csv'):
+            (tmp_path / name).write_text(EXPORT, encoding='utf-8')
+        index = ContentDedupIndex()
+        scanner = ContentScanner(max_workers=1)
+        first = [file_asset(tmp_path / 'a.csv'), file_asset(tmp_path / 'b.csv')]
+        second = [file_asset(tmp_path / 'c.csv')]
+
+        first_stats = scanner.scan_assets(first, index.add_assets(first))
+        second_stats = scanner.scan_assets(second, index.add_assets(second))
+
+        assert (first_stats['files_scanned'], first_stats['files_deduplicated']) == (1, 1)
+        assert (second_stats['files_scanned'], second_stats['files_deduplicated']) == (0, 1)
+        assert first[1]['pii_counts'] == second[0]['pii_counts'] == first[0]['pii_counts']
+        assert second[0]['pdpl_sensitive'] is True and second[0]['duplicate_of'] == str(tmp_path / 'a.csv')
+        assert scanner.get_statistics()['files_deduplicated'] == 2
+
+    def test_scan_reports_duplicate_clusters(self, tmp_path, monkeypatch):
+        """A filesystem scan reports clusters and scans one copy of each content"""
+        monkeypatch.setattr(ResultStoreConfig, 'FORMAT', 'sqlite')
+        monkeypatch.setattr(ResultStoreConfig, 'DIRECTORY', str(tmp_path / 'results'))
+        monkeypatch.setattr(ContentScanConfig, 'PARALLEL_THRESHOLD', 1000)
+        monkeypatch.setattr(ContentDedupConfig, 'REPORT_PATHS', 2)
+        root = tmp_path / 'chia_se'
+        for folder in ('hr', 'ke_toan', 'tam'):
+            (root / folder).mkdir(parents=True)
+            (root / folder / 'nhan_vien.csv').write_text(EXPORT, encoding='utf-8')
+        (root / 'doc_lap.txt').write_text('không trùng', encoding='utf-8')
+        service = ScanService()
+        scan_job_id, tenant_id = uuid4(), uuid4()
+        config = {'filesystem_type': 'local_filesystem', 'root_path': str(root)}
+
+        async def run():
+            await service.create_scan_job(scan_job_id, tenant_id, 'filesystem', config)
+            await service.execute_scan(scan_job_id, tenant_id, 'filesystem', config)
+            return await service.get_scan_status(scan_job_id)
+
+        status = asyncio.run(run())
+
+        report = status['duplicate_report']
+        assert (report['indexed'], report['unique'], report['clusters'], report['duplicate_files']) == (4, 2, 1, 2)
+        assert report['top_clusters'][0]['copies'] == 3 and len(report['top_clusters'][0]['paths']) == 2
+        assert status['content_statistics']['files_scanned'] == 2
+        assert status['content_statistics']['files_deduplicated'] == 2
+        copies = [asset for asset in status['discovered_assets'] if asset['asset_name'] == 'nhan_vien.csv']
+        assert all(asset['pdpl_sensitive'] for asset in copies)
+        assert sum('duplicate_of' in asset for asset in copies) == 2
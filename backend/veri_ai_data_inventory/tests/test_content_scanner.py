@@ -0,0 +1,178 @@
+"""
+Unit Tests for the Content Scanner
+Tests text extraction, per-file budgets, worker-pool scanning and scan integration.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import json
+import zipfile
+from uuid import uuid4
+
+import pytest
+
+from config.constants import ContentScanConfig, ResultStoreConfig
+from scanner_manager.content_scanner import ContentScanner, merge_content_statistics, scan_file_content
+from services.scan_service import ScanService
+
+PII_TEXT = 'Khách hàng Nguyễn Văn An, điện thoại 0912345678, CCCD 012345678901, email an.nguyen@congty.vn\n'
+
+WORD_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+SHEET_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+
+
+def write_docx(path, paragraphs):
+    body = ''.join(
+        f'<w:p>{"".join(f"<w:r><w:t>{run}</w:t></w:r>" for run in runs)}</w:p>' for runs in paragraphs
+    )
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('word/document.xml', f'<w:document xmlns:w="{WORD_NS}"><w:body>{body}</w:body></w:document>')
+
+
+def write_xlsx(path, shared_strings, rows):
+    strings = ''.join(f'<si><t>{text}</t></si>' for text in shared_strings)
+    cells = ''.join(
+        '<row>' + ''.join(
+            f'<c t="s"><v>{value}</v></c>' if isinstance(value, int) else f'<c><v>{value}</v></c>' for value in row
+        ) + '</row>' for row in rows
+    )
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('xl/sharedStrings.xml', f'<sst xmlns="{SHEET_NS}">{strings}</sst>')
+        archive.writestr('xl/worksheets/sheet1.xml', f'<worksheet xmlns="{SHEET_NS}"><sheetData>{cells}</sheetData></worksheet>')
+
+
+def build_documents(root):
+    """One file per supported format, each with a phone number and an email"""
+    (root / 'khach_hang.txt').write_text(PII_TEXT, encoding='utf-8')
+    (root / 'khach_hang.csv').write_text('ho_ten,dien_thoai,cccd,email\n' + PII_TEXT.replace(', ', ','), encoding='utf-8')
+    (root / 'khach_hang.json').write_text(json.dumps(
+        {'khach_hang': [{'ten': 'Nguyễn Văn An', 'dien_thoai': '0912345678', 'cccd': 12345678901,
+                         'email': 'an.nguyen@congty.vn'}]}, ensure_ascii=False
+    ), encoding='utf-8')
+    # Words split across runs are joined within a paragraph
+    write_docx(root / 'hop_dong.docx', [['Điện thoại: 09123', '45678'], ['CCCD 012345678901'], ['an.nguyen@congty.vn']])
+    write_xlsx(root / 'bang_luong.xlsx', ['Nguyễn Văn An', 'an.nguyen@congty.vn', '012345678901'], [[0, '0912345678', 1, 2]])
+
+
+class TestScanFileContent:
+    """Test per-file content scanning"""
+
+    @pytest.mark.parametrize('name', ['khach_hang.txt', 'khach_hang.csv', 'hop_dong.docx', 'bang_luong.xlsx'])
+    def test_formats_yield_pii_counts(self, tmp_path, name):
+        """Text, CSV, Word and Excel files are scanned through their extracted text"""
+        build_documents(tmp_path)
+
+        result = scan_file_content(str(tmp_path / name))
+
+        assert result['status'] == 'scanned' and result['error'] is None
+        assert result['pii_counts'].get('vietnamese_phone') == 1
+        assert result['pii_counts'].get('email') == 1
+        assert result['bytes_read'] == (tmp_path / name).stat().st_size
+
+    def test_json_values_are_scanned(self, tmp_path):
+        """JSON keys and values are scanned, including unquoted numbers"""
+        build_documents(tmp_path)
+
+        result = scan_file_content(str(tmp_path / 'khach_hang.json'))
+
+        assert result['status'] == 'scanned'
+        assert result['pii_counts'].get('vietnamese_phone') == 1 and result['pii_counts'].get('email') == 1
+        assert result['has_vietnamese_data'] is True
+
+    def test_byte_budget_truncates(self, tmp_path):
+        """Only max_bytes of a large file are read; counts cover that part"""
+        path = tmp_path / 'nhat_ky.txt'
+        path.write_text(PII_TEXT * 1000, encoding='utf-8')
+
+        result = scan_file_content(str(path), max_bytes=10 * len(PII_TEXT.encode('utf-8')))
+
+        assert result['status'] == 'truncated'
+        assert result['bytes_read'] == 10 * len(PII_TEXT.encode('utf-8'))
+        assert result['pii_counts']['vietnamese_phone'] == 10
+
+    def test_corrupt_and_unsupported_files(self, tmp_path):
+        """Corrupt documents report an error; a missing format library reports unsupported"""
+        (tmp_path / 'hong.docx').write_text('khong phai zip')
+        (tmp_path / 'tai_lieu.pdf').write_bytes(b'%PDF-1.4\n')
+
+        corrupt = scan_file_content(str(tmp_path / 'hong.docx'))
+
+        assert corrupt['status'] == 'error' and corrupt['pii_counts'] == {}
+        try:
+            import fitz  # noqa: F401
+        except ImportError:
+            assert scan_file_content(str(tmp_path / 'tai_lieu.pdf'))['status'] == 'unsupported'
+
+
+class TestContentScanner:
+    """Test batch scanning and statistics"""
+
+    def test_pool_and_in_process_scans_agree(self, tmp_path, monkeypatch):
+        """Worker processes return the same findings as the in-process fallback"""
+        build_documents(tmp_path)
+        paths = sorted(str(path) for path in tmp_path.iterdir()) + [str(tmp_path / 'anh.png')]
+        monkeypatch.setattr(ContentScanConfig, 'PARALLEL_THRESHOLD', 2)
+        pooled = ContentScanner(max_workers=2)
+        in_process = ContentScanner(max_workers=1)
+        try:
+            pooled_results, stats = pooled.scan_files(paths)
+            local_results, _ = in_process.scan_files(paths)
+        finally:
+            pooled.shutdown()
+
+        assert sorted(pooled_results) == sorted(local_results) == paths[:-1]
+        assert all(pooled_results[path]['pii_counts'] == local_results[path]['pii_counts'] for path in paths[:-1])
+        assert stats['files_scanned'] == 5 and stats['files_with_pii'] == 5
+        assert stats['statuses'] == {'scanned': 5}
+        assert stats['pii_counts']['vietnamese_phone'] == 5
+        assert pooled.get_statistics()['files_scanned'] == 5 and pooled.get_statistics()['max_workers'] == 2
+
+    def test_merge_statistics_recomputes_throughput(self):
+        """Totals add up and throughput covers the summed scan time"""
+        batch = {'files_scanned': 10, 'bytes_scanned': 4 * 1024 ** 2, 'files_with_pii': 2, 'seconds': 2.0,
+                 'statuses': {'scanned': 9, 'error': 1}, 'pii_counts': {'vietnamese_phone': 3}}
+
+        total = merge_content_statistics(merge_content_statistics(None, batch), batch)
+
+        assert total['files_scanned'] == 20 and total['files_with_pii'] == 4
+        assert total['statuses'] == {'scanned': 18, 'error': 2} and total['pii_counts'] == {'vietnamese_phone': 6}
+        assert total['mb_per_second'] == 2.0 and total['files_per_second'] == 5.0
+        assert merge_content_statistics(total, None) is total
+
+
+class TestScanServiceContent:
+    """Test content findings of filesystem scans"""
+
+    def test_scan_marks_sensitive_files(self, tmp_path, monkeypatch):
+        """Files with PII in their content get categories and are PDPL-sensitive"""
+        monkeypatch.setattr(ResultStoreConfig, 'FORMAT', 'sqlite')
+        monkeypatch.setattr(ResultStoreConfig, 'DIRECTORY', str(tmp_path / 'results'))
+        monkeypatch.setattr(ContentScanConfig, 'PARALLEL_THRESHOLD', 1000)
+        monkeypatch.chdir(tmp_path)
+        root = tmp_path / 'chia_se'
+        root.mkdir()
+        build_documents(root)
+        (root / 'ghi_chu.txt').write_text('Không có dữ liệu cá nhân', encoding='utf-8')
+        service = ScanService()
+        scan_job_id, tenant_id = uuid4(), uuid4()
+        config = {'filesystem_type': 'local_filesystem', 'root_path': str(root)}
+
+        async def run():
+            await service.create_scan_job(scan_job_id, tenant_id, 'filesystem', config)
+            await service.execute_scan(scan_job_id, tenant_id, 'filesystem', config)
+            status = await service.get_scan_status(scan_job_id)
+            phone = await service.get_scan_results(scan_job_id, {'pii_category': 'vietnamese_phone'})
+            return status, phone
+
+        status, phone = asyncio.run(run())
+
+        assets = {asset['asset_name']: asset for asset in status['discovered_assets']}
+        assert assets['hop_dong.docx']['pdpl_sensitive'] is True
+        assert assets['hop_dong.docx']['pii_counts']['cccd'] == 1
+        assert assets['ghi_chu.txt']['pdpl_sensitive'] is False and assets['ghi_chu.txt']['content_scan'] == 'scanned'
+        assert status['content_statistics']['files_scanned'] == 6
+        assert status['content_statistics']['files_with_pii'] == 5
+        assert len(phone['assets']) == 5
+        # Checkpoint and watermark stores stay out of the working directory
+        assert not list(tmp_path.glob('*.sqlite'))
@@ -0,0 +1,131 @@
+"""
+Unit Tests for Dedup Stores
+Tests exact, scalable Bloom and SQLite seen-item stores and their aggregator statistics.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import os
+
+import pytest
+
+from scanner_manager.dedup_store import (
+    ExactDedupStore,
+    ScalableBloomDedupStore,
+    SQLiteDedupStore,
+    create_dedup_store
+)
+from scanner_manager.result_aggregator import ResultAggregator
+
+
+def object_keys(count, prefix="kho-du-lieu/ho_so"):
+    """Distinct S3-style keys"""
+    return [f"{prefix}/khach_hang_{i:07d}.csv" for i in range(count)]
+
+
+class TestDedupStores:
+    """Test add/contains semantics of every backend"""
+
+    @pytest.mark.parametrize('backend', ['exact', 'bloom', 'sqlite'])
+    def test_duplicates_are_detected(self, backend):
+        """A repeated key is reported as seen; counters and rate follow"""
+        store = create_dedup_store(backend)
+        try:
+            assert store.add_many(['a', 'b', 'a', 'c', 'b']) == [True, True, False, True, False]
+            assert 'a' in store and 'z' not in store
+            statistics = store.get_statistics()
+            assert statistics['backend'] == backend
+            assert statistics['unique_keys'] == 3
+            assert statistics['duplicate_keys'] == 2
+            assert statistics['duplicate_rate'] == 40.0
+            assert statistics['memory_bytes'] > 0
+
+            store.clear()
+            assert len(store) == 0 and store.add('a') is True
+        finally:
+            store.close()
+
+    def test_unknown_backend(self):
+        """Backends outside ScanManagerConfig.DEDUP_BACKENDS are rejected"""
+        with pytest.raises(ValueError):
+            create_dedup_store('lmdb-cluster')
+
+
+class TestScalableBloom:
+    """Test growth and false-positive bound of the scalable Bloom filter"""
+
+    def test_grows_without_false_negatives(self):
+        """Every added key stays present after the filter chain grows"""
+        store = ScalableBloomDedupStore(initial_capacity=1000, error_rate=0.01)
+        keys = object_keys(10000)
+        store.add_many(keys)
+
+        assert len(store.filters) > 1
+        assert all(key in store for key in keys)
+
+    def test_false_positive_rate_under_bound(self):
+        """Unseen keys are rarely reported as duplicates"""
+        store = ScalableBloomDedupStore(initial_capacity=2000, error_rate=0.01)
+        store.add_many(object_keys(20000))
+
+        unseen = object_keys(20000, prefix="kho-khac")
+        false_positives = sum(1 for key in unseen if key in store)
+
+        assert false_positives / len(unseen) < 0.01
+        assert store.estimated_error_rate() < 0.01
+
+    def test_uses_less_memory_than_exact_set(self):
+        """The Bloom filter needs far fewer bytes per key than a set"""
+        keys = object_keys(50000)
+        exact = ExactDedupStore()
+        bloom = ScalableBloomDedupStore(initial_capacity=50000, error_rate=0.001)
+        exact.add_many(keys)
+        bloom.add_many(keys)
+
+        assert bloom.memory_bytes() * 10 < exact.memory_bytes()
+
+
+class TestSQLiteStore:
+    """Test the disk-backed exact store"""
+
+    def test_temporary_database_removed_on_close(self):
+        """Without a path a temp database is used and deleted on close"""
+        store = SQLiteDedupStore()
+        path = store.path
+        store.add_many(object_keys(100))
+
+        assert os.path.exists(path)
+        assert store.get_statistics()['disk_bytes'] > 0
+        store.close()
+        assert not os.path.exists(path)
+
+    def test_explicit_path_is_kept(self, tmp_path):
+        """A caller-provided database survives close() and keeps its keys"""
+        path = str(tmp_path / 'dedup.sqlite')
+        store = SQLiteDedupStore(path)
+        store.add('ho_so/a.csv')
+        store.close()
+
+        reopened = SQLiteDedupStore(path)
+        assert 'ho_so/a.csv' in reopened
+        assert reopened.add('ho_so/a.csv') is False
+        reopened.close()
+
+
+class TestAggregatorDedup:
+    """Test ResultAggregator reports dedup backend statistics"""
+
+    def test_statistics_include_backend_and_rate(self):
+        """get_statistics() reports unique keys, duplicate rate and memory"""
+        aggregator = ResultAggregator(dedup_backend='bloom', initial_capacity=100)
+        aggregator.start_source('s3-1', 's3', 'cloud')
+        aggregator.add_item_batch('s3-1', [{'key': key} for key in object_keys(30)])
+        aggregator.add_item_batch('s3-1', [{'key': key} for key in object_keys(10)])
+
+        statistics = aggregator.get_statistics()
+        assert statistics['unique_items'] == 30
+        assert statistics['duplicate_items'] == 10
+        assert statistics['duplicate_rate'] == 25.0
+        assert statistics['dedup_backend'] == 'bloom'
+        assert statistics['dedup_memory_bytes'] > 0
+        aggregator.close()
@@ -0,0 +1,224 @@
+"""
+Unit Tests for the Scan Error Handler
+Tests backoff, error classification, async retries, circuit breakers and the bounded error log.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from config.constants import ScanManagerConfig
+from scanner_manager.error_handler import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    ScanErrorHandler,
+    backoff_delay,
+    get_circuit_breaker
+)
+from utils.cancellation import CancellationToken, ScanCancelledError
+
+
+class OperationalError(Exception):
+    """Stand-in for a DB-API driver error"""
+
+
+def flaky(failures, error=ConnectionResetError):
+    """Operation failing `failures` times before it returns 'ok'"""
+    calls = []
+
+    def operation():
+        calls.append(time.monotonic())
+        if len(calls) <= failures:
+            raise error("mat ket noi")
+        return 'ok'
+    operation.calls = calls
+    return operation
+
+
+class TestRetryPolicy:
+    """Test backoff delays, error classification and retries"""
+
+    def test_backoff_grows_with_jitter_and_cap(self, monkeypatch):
+        """Delays double per attempt, lose at most the jitter ratio and never exceed the cap"""
+        monkeypatch.setattr(ScanManagerConfig, 'RETRY_JITTER_RATIO', 0.5)
+        monkeypatch.setattr(ScanManagerConfig, 'RETRY_MAX_DELAY_SECONDS', 10.0)
+        for attempt, full in ((1, 1.0), (2, 2.0), (3, 4.0), (6, 10.0)):
+            delays = [backoff_delay(attempt, 1.0) for _ in range(50)]
+            assert all(full * 0.5 <= delay <= full for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_error_classification(self):
+        """Network errors, named driver errors and wrapped network errors are retryable"""
+        try:
+            try:
+                raise TimeoutError("het thoi gian")
+            except TimeoutError as e:
+                raise RuntimeError("discovery failed") from e
+        except RuntimeError as e:
+            wrapped = e
+
+        assert ScanErrorHandler.is_retryable_error(ConnectionRefusedError())
+        assert ScanErrorHandler.is_retryable_error(OperationalError())
+        assert ScanErrorHandler.is_retryable_error(wrapped)
+        assert not ScanErrorHandler.is_retryable_error(PermissionError("access denied"))
+        assert not ScanErrorHandler.is_retryable_error(ValueError("bad config"))
+        assert not ScanErrorHandler.is_retryable_error(CircuitOpenError('src', 5))
+
+    def test_only_transient_errors_are_retried(self):
+        """Transient failures are retried until success; other errors fail at the first attempt"""
+        handler = ScanErrorHandler(max_retries=3, retry_delay=0.01)
+        transient = flaky(2)
+        permanent = flaky(5, error=PermissionError)
+
+        assert handler.retry(transient) == 'ok' and len(transient.calls) == 3
+        with pytest.raises(PermissionError):
+            handler.retry(permanent)
+        assert len(permanent.calls) == 1
+        result = handler.retry_on_failure(flaky(5))
+        assert result['status'] == 'error' and result['error_type'] == 'ConnectionResetError'
+
+    def test_async_retry_does_not_block_event_loop(self):
+        """Other tasks run while an async retry waits out its backoff"""
+        handler = ScanErrorHandler(max_retries=3, retry_delay=0.05)
+
+        async def run():
+            ticks = []
+
+            async def ticker():
+                for _ in range(5):
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.01)
+
+            async def connect():
+                return flaky_connect()
+
+            flaky_connect = flaky(1)
+            result, _ = await asyncio.gather(handler.retry_async(connect), ticker())
+            return result, ticks, flaky_connect.calls
+
+        result, ticks, calls = asyncio.run(run())
+
+        assert result == 'ok' and len(calls) == 2
+        # The ticker kept running between the failed attempt and the retry
+        assert any(calls[0] < tick < calls[1] for tick in ticks[1:])
+
+    def test_cancellation_interrupts_backoff(self):
+        """A cancelled scan stops waiting for its next attempt"""
+        handler = ScanErrorHandler(max_retries=3, retry_delay=30)
+        token = CancellationToken()
+
+        async def run():
+            asyncio.get_running_loop().call_later(0.05, token.cancel)
+            await handler.retry_async(flaky(5), cancel_token=token)
+
+        started = time.monotonic()
+        with pytest.raises(ScanCancelledError):
+            asyncio.run(run())
+        assert time.monotonic() - started < 5
+
+    def test_error_log_is_bounded(self, monkeypatch):
+        """The error log keeps the most recent entries and counts all of them"""
+        monkeypatch.setattr(ScanManagerConfig, 'ERROR_LOG_SIZE', 3)
+        handler = ScanErrorHandler()
+        for index in range(10):
+            handler.record_error(ValueError(f"loi {index}"))
+
+        summary = handler.get_error_summary()
+        assert summary['total_errors'] == 10
+        assert [entry['error'] for entry in summary['errors']] == ['loi 7', 'loi 8', 'loi 9']
+
+
+class TestCircuitBreaker:
+    """Test circuit states of a failing source"""
+
+    def test_open_circuit_fails_fast_then_probes(self):
+        """Repeated failures open the circuit; after the reset time one trial call closes it"""
+        breaker = CircuitBreaker('source-a', failure_threshold=2, reset_seconds=0.05)
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+
+        assert breaker.state == CIRCUIT_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+        time.sleep(0.06)
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # Only one trial call while half-open
+        breaker.record_success()
+        assert breaker.get_status() == {'state': CIRCUIT_CLOSED, 'consecutive_failures': 0, 'rejected': 2}
+
+    def test_retries_stop_when_circuit_opens(self, monkeypatch):
+        """A source that keeps failing is rejected without calling it"""
+        monkeypatch.setattr(ScanManagerConfig, 'CIRCUIT_BREAKER_FAILURE_THRESHOLD', 2)
+        handler = ScanErrorHandler(max_retries=5, retry_delay=0.01)
+        dead_source = flaky(100)
+
+        with pytest.raises(CircuitOpenError):
+            handler.retry(dead_source, source_key='dead-source')
+        with pytest.raises(CircuitOpenError):
+            handler.retry(dead_source, source_key='dead-source')
+
+        assert len(dead_source.calls) == 2
+        assert get_circuit_breaker('dead-source').state == CIRCUIT_OPEN
+
+    @pytest.mark.parametrize('interruption', [ScanCancelledError, KeyboardInterrupt])
+    def test_cancelled_trial_releases_half_open_circuit(self, interruption):
+        """A trial ended by cancellation is neither success nor failure; the next call becomes the trial"""
+        breaker = get_circuit_breaker(f'cancelled-trial-{interruption.__name__}')
+        breaker.reset_seconds = 0.0
+        breaker.before_call()
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        handler = ScanErrorHandler(max_retries=1)
+
+        def cancelled():
+            raise interruption("huy quet")
+
+        with pytest.raises(interruption):
+            handler.retry(cancelled, source_key=breaker.source_key)
+
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert handler.retry(flaky(0), source_key=breaker.source_key) == 'ok'
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_async_cancelled_trial_releases_half_open_circuit(self):
+        """asyncio cancellation of the trial call does not leave the circuit stuck half-open"""
+        breaker = get_circuit_breaker('cancelled-async-trial')
+        breaker.reset_seconds = 0.0
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        handler = ScanErrorHandler(max_retries=1)
+
+        async def run():
+            trial = asyncio.create_task(handler.retry_async(asyncio.sleep, 10, source_key=breaker.source_key))
+            await asyncio.sleep(0.01)
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            return await handler.retry_async(flaky(0), source_key=breaker.source_key)
+
+        assert asyncio.run(run()) == 'ok'
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_release_only_ends_own_trial(self):
+        """Releasing a stale trial ID does not free a newer trial"""
+        breaker = CircuitBreaker('source-b', failure_threshold=1, reset_seconds=0.0)
+        breaker.record_failure()
+        first = breaker.before_call()
+        breaker.record_failure()
+        second = breaker.before_call()
+
+        breaker.release_trial(first)
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.release_trial(second)
+        assert breaker.before_call() is not None
@@ -0,0 +1,174 @@
+"""
+Unit Tests for Incremental Delta Scanning
+Tests asset watermarks, the watermark store and delta scans in ScanService.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import os
+
+from filesystem_scanners.local_filesystem_scanner import LocalFilesystemScanner
+from scanner_manager.watermark_store import (
+    WatermarkStore,
+    asset_watermark,
+    watermark_source_id
+)
+from services.scan_service import ScanService
+from utils.catalog_discovery import group_catalog_rows
+
+from fixtures import FakeJob, catalog_rows
+
+
+def table_assets(tables):
+    """Assets as ScanService publishes them"""
+    return [{'asset_path': table['full_name'], 'asset_name': table['table_name'], 'pdpl_sensitive': True} for table in tables]
+
+
+class TestWatermarks:
+    """Test change markers and source identity"""
+
+    def test_table_watermark_tracks_ddl_and_rows(self):
+        """Column type changes and row estimate changes alter the watermark"""
+        table = next(group_catalog_rows(catalog_rows(1), "public"))
+        original = asset_watermark('tables', table)
+
+        table['row_estimate'] += 1
+        assert asset_watermark('tables', table) != original
+        table['row_estimate'] -= 1
+        table['columns'][1]['data_type'] = 'varchar'
+        assert asset_watermark('tables', table) != original
+
+    def test_object_watermark(self):
+        """S3 ETag and GCS generation are part of the object watermark"""
+        s3_object = {'key': 'ho_so/a.csv', 'etag': 'abc', 'last_modified': '2025-01-01', 'size': 10}
+        gcs_object = {'name': 'ho_so/a.csv', 'generation': 1, 'metageneration': 1, 'size': 10}
+
+        assert asset_watermark('objects', s3_object) != asset_watermark('objects', dict(s3_object, etag='abd'))
+        assert asset_watermark('objects', gcs_object) != asset_watermark('objects', dict(gcs_object, generation=2))
+
+    def test_source_id_ignores_credentials(self):
+        """Rotating the password keeps the source identity"""
+        config = {'host': 'db.local', 'database': 'crm', 'password': 'cu'}
+        assert watermark_source_id('postgresql', config) == watermark_source_id('postgresql', dict(config, password='moi'))
+        assert watermark_source_id('postgresql', config) != watermark_source_id('mysql', config)
+        assert watermark_source_id('s3', {'source_identifier': 'kho-s3'}) == 'kho-s3'
+
+
+class TestDeltaScan:
+    """Test added/changed/unchanged/removed classification"""
+
+    def test_second_scan_reports_delta(self, tmp_path):
+        """Only new and changed tables are processed; unchanged assets are carried"""
+        store = WatermarkStore(str(tmp_path / 'watermarks.sqlite'))
+        tables = list(group_catalog_rows(catalog_rows(4), "public"))
+
+        first = store.begin('crm')
+        to_process, carried = first.split('tables', tables[:3])
+        first.record(table_assets(to_process))
+        report = first.finish()
+        assert report['baseline'] is True and report['added'] == 3 and carried == []
+
+        tables[1]['row_estimate'] += 10
+        second = store.begin('crm')
+        to_process, carried = second.split('tables', tables[1:])
+        second.record(table_assets(to_process))
+        report = second.finish()
+
+        assert [table['table_name'] for table in to_process] == ['bang_00001', 'bang_00003']
+        assert [asset['asset_name'] for asset in carried] == ['bang_00002']
+        assert (report['added'], report['changed'], report['unchanged'], report['removed']) == (1, 1, 1, 1)
+        assert report['removed_assets'] == ['public.bang_00000']
+        store.close()
+
+    def test_partial_scan_keeps_unseen_assets(self, tmp_path):
+        """A cancelled scan does not report unreached assets as removed"""
+        store = WatermarkStore(str(tmp_path / 'watermarks.sqlite'))
+        tables = list(group_catalog_rows(catalog_rows(3), "public"))
+        first = store.begin('crm')
+        first.record(table_assets(first.split('tables', tables)[0]))
+        first.finish()
+
+        partial = store.begin('crm')
+        partial.split('tables', tables[:1])
+        assert partial.finish(complete=False)['removed'] == 0
+
+        complete = store.begin('crm')
+        complete.split('tables', tables)
+        assert complete.finish()['removed'] == 0
+        store.close()
+
+    def test_context_change_reprocesses_everything(self, tmp_path):
+        """A different column filter invalidates carried classifications"""
+        store = WatermarkStore(str(tmp_path / 'watermarks.sqlite'))
+        tables = list(group_catalog_rows(catalog_rows(2), "public"))
+        first = store.begin('crm', context='{"mode": "all"}')
+        first.record(table_assets(first.split('tables', tables)[0]))
+        first.finish()
+
+        second = store.begin('crm', context='{"mode": "include"}')
+        to_process, carried = second.split('tables', tables)
+
+        assert len(to_process) == 2 and carried == []
+        assert second.finish()['changed'] == 2
+        store.close()
+
+
+class TestIncrementalScanService:
+    """Test ScanService skips unchanged assets"""
+
+    def test_unchanged_tables_are_not_sampled(self, tmp_path):
+        """Only changed tables reach sample_tables(); all tables are published"""
+        store = WatermarkStore(str(tmp_path / 'watermarks.sqlite'))
+        tables = list(group_catalog_rows(catalog_rows(4), "public"))
+        sampled = []
+
+        class BatchScanner:
+            async def iter_table_batches(self, batch_size, cancel_token=None):
+                yield [dict(table, columns=[dict(col) for col in table['columns']]) for table in tables]
+
+            async def sample_tables(self, batch, limit, cancel_token=None):
+                sampled.append([table['table_name'] for table in batch])
+                return {}
+
+        service = object.__new__(ScanService)
+
+        def scan():
+            job = FakeJob()
+            delta = store.begin('crm')
+            asyncio.run(service._scan_database(BatchScanner(), {'schema': 'public'}, None, job, delta=delta))
+            return job, delta.finish()
+
+        scan()
+        tables[2]['row_estimate'] += 5
+        job, report = scan()
+
+        assert sampled[-1] == ['bang_00002']
+        assert len(job.assets) == 4
+        assert (report['changed'], report['unchanged']) == (1, 3)
+        store.close()
+
+    def test_filesystem_delta(self, tmp_path):
+        """Modified files are rescanned, deleted files reported as removed"""
+        root = tmp_path / 'chia_se'
+        root.mkdir()
+        for name in ('a.txt', 'b.txt', 'c.txt'):
+            (root / name).write_text('du lieu', encoding='utf-8')
+        store = WatermarkStore(str(tmp_path / 'watermarks.sqlite'))
+        service = object.__new__(ScanService)
+
+        def scan():
+            job = FakeJob()
+            delta = store.begin('chia-se')
+            asyncio.run(service._scan_filesystem(LocalFilesystemScanner(str(root)), {}, job, delta=delta))
+            return job, delta.finish()
+
+        scan()
+        (root / 'a.txt').write_text('du lieu moi, dai hon', encoding='utf-8')
+        os.remove(root / 'c.txt')
+        job, report = scan()
+
+        assert sorted(asset['asset_name'] for asset in job.assets) == ['a.txt', 'b.txt']
+        assert (report['added'], report['changed'], report['unchanged'], report['removed']) == (0, 1, 1, 1)
+        assert report['removed_assets'] == [str(root / 'c.txt')]
+        store.close()
@@ -0,0 +1,118 @@
+"""
+Unit Tests for the Job Store
+Tests job indexes, retention expiry, write throttling and job records.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from config.constants import APIConfig, JobStoreConfig
+from services.job_state_manager import JobState, JobStateManager
+from services.job_store import MemoryJobStore, create_job_store
+
+
+class CountingStore(MemoryJobStore):
+    """Memory store counting writes"""
+
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save(self, job):
+        self.saves += 1
+        super().save(job)
+
+
+def create(manager, tenant_id):
+    return manager.create_job(uuid4(), tenant_id, 'database', {'password': 'bi-mat'})
+
+
+class TestJobIndexes:
+    """Test listing and counting through the store indexes"""
+
+    def test_list_by_tenant_and_status(self):
+        """Filters use the tenant, status and combined indexes; newest updates come first"""
+        manager = JobStateManager(MemoryJobStore())
+        tenant_a, tenant_b = uuid4(), uuid4()
+        first, second = create(manager, tenant_a), create(manager, tenant_a)
+        other = create(manager, tenant_b)
+        first.start()
+        second.start()
+        second.complete([])
+
+        assert manager.list_jobs(tenant_id=tenant_a) == [second, first]
+        assert manager.list_jobs(status=APIConfig.STATUS_RUNNING) == [first]
+        assert manager.list_jobs(tenant_id=tenant_b, status=APIConfig.STATUS_PENDING) == [other]
+        assert manager.list_jobs(tenant_id=tenant_b, status=APIConfig.STATUS_RUNNING) == []
+        assert manager.list_jobs(limit=1) == [second]
+
+        stats = manager.get_statistics()
+        assert stats['total_jobs'] == 3 and stats['live_jobs'] == 2
+        assert stats['status_counts'][APIConfig.STATUS_COMPLETED] == 1
+        assert stats['status_counts'][APIConfig.STATUS_RUNNING] == 1
+        assert stats['status_counts'][APIConfig.STATUS_PENDING] == 1
+
+    def test_delete_removes_index_entries(self):
+        """Deleted jobs disappear from lookups, lists and counts"""
+        manager = JobStateManager(MemoryJobStore())
+        job = create(manager, uuid4())
+
+        assert manager.delete_job(job.scan_job_id)
+        assert manager.get_job(job.scan_job_id) is None
+        assert manager.list_jobs(tenant_id=job.tenant_id) == []
+        assert manager.get_statistics()['total_jobs'] == 0
+        assert not manager.delete_job(job.scan_job_id)
+
+    def test_finished_jobs_expire(self, monkeypatch):
+        """Finished jobs are swept once their retention ends; running jobs are kept"""
+        monkeypatch.setattr(APIConfig, 'TASK_RETENTION_HOURS', 0)
+        manager = JobStateManager(MemoryJobStore())
+        tenant_id = uuid4()
+        running, finished = create(manager, tenant_id), create(manager, tenant_id)
+        running.start()
+        finished.fail("ket noi that bai")
+
+        assert manager.get_job(finished.scan_job_id) is None
+        assert manager.list_jobs(tenant_id=tenant_id) == [running]
+        assert manager.cleanup_expired_jobs() == 0
+
+    def test_unknown_backend(self):
+        """Unsupported backends are rejected"""
+        with pytest.raises(ValueError):
+            create_job_store('memcached')
+
+
+class TestJobPersistence:
+    """Test write throttling and job records"""
+
+    def test_progress_writes_are_throttled(self, monkeypatch):
+        """Status changes are written at once, progress at most once per interval"""
+        monkeypatch.setattr(JobStoreConfig, 'PERSIST_INTERVAL_SECONDS', 60.0)
+        store = CountingStore()
+        manager = JobStateManager(store)
+        job = create(manager, uuid4())
+        job.start()
+        for progress in range(1, 50):
+            job.update_progress(progress)
+            job.add_discovered_assets([{'asset_path': f'bang_{progress}'}])
+        job.complete()
+
+        # create, start, complete
+        assert store.saves == 3
+        assert manager.get_statistics()['live_jobs'] == 0
+
+    def test_record_round_trip_drops_credentials(self):
+        """Stored records rebuild the job without its connection config"""
+        job = JobState(uuid4(), uuid4(), 'database', {'password': 'bi-mat'}, {'mode': 'include'})
+        job.start()
+        job.add_discovered_assets([{'asset_path': 'khach_hang'}])
+        job.complete(partial=True, cancel_reason='timeout')
+
+        restored = JobState.from_record(job.to_record())
+
+        assert 'bi-mat' not in str(job.to_record())
+        assert restored.connection_config == {}
+        assert restored.to_dict() == job.to_dict()
@@ -0,0 +1,170 @@
+"""
+Unit Tests for the Large File Scanner
+Tests line-aligned chunking, chunk-parallel scanning, offset samples and flat memory use.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import re
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from config.constants import ContentScanConfig
+from config.reporting_constants import ReportingConfig
+from scanner_manager.content_scanner import ContentScanner
+from scanner_manager.large_file_scanner import merge_chunk_results, plan_chunks, scan_chunk, scan_large_file
+
+LOG_LINES = [
+    '2025-11-04 10:30:00 INFO dang nhap thanh cong user=an.nguyen@congty.vn\n',
+    '2025-11-04 10:30:01 INFO cập nhật hồ sơ khách hàng sdt=0912345678 cccd=012345678901\n',
+    '2025-11-04 10:30:02 DEBUG health check ok\n',
+]
+
+
+def write_log(path, repeat):
+    with open(path, 'w', encoding='utf-8') as f:
+        for index in range(repeat):
+            f.write(LOG_LINES[index % len(LOG_LINES)])
+
+
+def expected_counts(path):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    counts = {}
+    for pii_type, pattern in ReportingConfig.REDACTION_PATTERNS.items():
+        found = len(re.findall(pattern, text))
+        if found:
+            counts[pii_type] = found
+    return counts
+
+
+class TestChunking:
+    """Test line-aligned chunk planning"""
+
+    def test_chunks_cover_file_on_line_boundaries(self, tmp_path):
+        """Chunks are contiguous and every chunk ends after a newline"""
+        path = tmp_path / 'app.log'
+        write_log(path, 3000)
+        data = path.read_bytes()
+
+        chunks = plan_chunks(str(path), chunk_bytes=10000)
+
+        assert chunks[0][0] == 0 and chunks[-1][1] == len(data)
+        assert all(end == next_start for (_, end), (next_start, _) in zip(chunks, chunks[1:]))
+        assert all(data[end - 1:end] == b'\n' for _, end in chunks)
+        assert len(chunks) == len(data) // 10000 + 1
+        (tmp_path / 'trong.log').touch()
+        assert plan_chunks(str(tmp_path / 'trong.log')) == []
+
+    def test_line_without_newline_is_cut_on_character_boundary(self, tmp_path):
+        """A huge single line is split without breaking UTF-8 characters"""
+        path = tmp_path / 'mot_dong.txt'
+        path.write_text('Nguyễn Văn An ' * 5000, encoding='utf-8')
+        data = path.read_bytes()
+
+        chunks = plan_chunks(str(path), chunk_bytes=4096)
+
+        assert len(chunks) > 10
+        for start, end in chunks:
+            data[start:end].decode('utf-8')
+
+
+class TestLargeFileScan:
+    """Test chunk-parallel scanning"""
+
+    def test_counts_match_whole_file_regex(self, tmp_path, monkeypatch):
+        """Chunked counts equal a single pass over the whole text, in-process and in workers"""
+        monkeypatch.setattr(ContentScanConfig, 'LARGE_FILE_CHUNK_BYTES', 20000)
+        monkeypatch.setattr(ContentScanConfig, 'LARGE_FILE_WINDOW_BYTES', 4096)
+        path = tmp_path / 'app.log'
+        write_log(path, 3000)
+
+        in_process = scan_large_file(str(path))
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = scan_large_file(str(path), executor=executor)
+
+        assert in_process['status'] == 'scanned' and in_process['chunks'] > 5
+        assert in_process['pii_counts'] == expected_counts(path) == pooled['pii_counts']
+        assert in_process['pii_offsets'] == pooled['pii_offsets']
+        assert in_process['bytes_read'] == path.stat().st_size
+        assert in_process['has_vietnamese_data'] is True
+
+    def test_sampled_offsets_point_at_matches(self, tmp_path, monkeypatch):
+        """Offsets are file byte offsets of matches, sampled across the whole file"""
+        monkeypatch.setattr(ContentScanConfig, 'LARGE_FILE_CHUNK_BYTES', 20000)
+        monkeypatch.setattr(ContentScanConfig, 'LARGE_FILE_WINDOW_BYTES', 4096)
+        path = tmp_path / 'app.log'
+        write_log(path, 3000)
+        data = path.read_bytes()
+
+        offsets = scan_large_file(str(path))['pii_offsets']
+
+        assert len(offsets['vietnamese_phone']) == ContentScanConfig.LARGE_FILE_SAMPLE_OFFSETS
+        assert all(data[offset:offset + 10] == b'0912345678' for offset in offsets['vietnamese_phone'])
+        assert all(data[offset:offset + 19] == b'an.nguyen@congty.vn' for offset in offsets['email'])
+        # Uniform over the file, not the first matches only
+        assert offsets['vietnamese_phone'][-1] > len(data) // 2
+
+    def test_merge_weights_chunks_by_match_count(self):
+        """A chunk with more matches contributes more sampled offsets"""
+        dense = {'pii_counts': {'email': 1000}, 'pii_offsets': {'email': list(range(0, 100))},
+                 'has_vietnamese_data': False, 'bytes_read': 10, 'timed_out': False}
+        sparse = {'pii_counts': {'email': 10}, 'pii_offsets': {'email': list(range(1000, 1010))},
+                  'has_vietnamese_data': True, 'bytes_read': 5, 'timed_out': False}
+
+        merged = merge_chunk_results([dense, sparse], sample_size=50)
+
+        assert merged['pii_counts'] == {'email': 1010} and merged['bytes_read'] == 15
+        assert len(merged['pii_offsets']['email']) == 50
+        assert sum(offset >= 1000 for offset in merged['pii_offsets']['email']) < 10
+        assert merged['has_vietnamese_data'] is True
+
+    def test_expired_deadline_times_out(self, tmp_path):
+        """A chunk past its deadline stops before scanning"""
+        path = tmp_path / 'app.log'
+        write_log(path, 30)
+
+        result = scan_chunk(str(path), 0, path.stat().st_size, deadline=0.0)
+
+        assert result['timed_out'] is True and result['bytes_read'] == 0
+
+    def test_heap_stays_flat(self, tmp_path, monkeypatch):
+        """Peak Python allocations depend on the window size, not the file size"""
+        monkeypatch.setattr(ContentScanConfig, 'LARGE_FILE_WINDOW_BYTES', 64 * 1024)
+        path = tmp_path / 'lon.log'
+        write_log(path, 80000)
+        size = path.stat().st_size
+        scan_chunk(str(path), 0, 1000)  # Compile the patterns before measuring
+
+        tracemalloc.start()
+        try:
+            result = scan_chunk(str(path), 0, size)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert size > 5 * 1024 * 1024 and result['bytes_read'] == size
+        assert peak < 1024 * 1024
+
+
+class TestContentScannerRouting:
+    """Test large files routed from the content scanner"""
+
+    def test_files_over_budget_are_scanned_in_full(self, tmp_path, monkeypatch):
+        """Text files over MAX_BYTES_PER_FILE are scanned whole instead of truncated"""
+        monkeypatch.setattr(ContentScanConfig, 'MAX_BYTES_PER_FILE', 16 * 1024)
+        monkeypatch.setattr(ContentScanConfig, 'LARGE_FILE_CHUNK_BYTES', 32 * 1024)
+        monkeypatch.setattr(ContentScanConfig, 'LARGE_FILE_WINDOW_BYTES', 4096)
+        large, small = tmp_path / 'app.log', tmp_path / 'nho.txt'
+        write_log(large, 3000)
+        write_log(small, 3)
+        scanner = ContentScanner(max_workers=2)
+        assets = [{'asset_type': 'file', 'asset_path': str(large)}, {'asset_type': 'file', 'asset_path': str(small)}]
+        try:
+            stats = scanner.scan_assets(assets)
+        finally:
+            scanner.shutdown()
+
+        assert assets[0]['content_scan'] == 'scanned' and assets[0]['pii_counts'] == expected_counts(large)
+        assert assets[0]['pii_offsets']['email'] and 'pii_offsets' not in assets[1]
+        assert stats['bytes_scanned'] == large.stat().st_size + small.stat().st_size
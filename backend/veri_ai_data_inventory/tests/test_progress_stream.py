@@ -0,0 +1,148 @@
+"""
+Unit Tests for the Scan Progress Stream
+Tests rate-limited publishing, the local progress bus and streamed scan progress.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from config.constants import APIConfig
+from scanner_manager.progress_stream import LocalProgressBus, ProgressPublisher, create_progress_bus
+from services.scan_service import ScanService
+
+from fixtures import build_tree
+
+
+class RecordingBus(LocalProgressBus):
+    """Local bus remembering every published event"""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def publish(self, scan_job_id, event):
+        self.events.append(event)
+        super().publish(scan_job_id, event)
+
+
+class TestProgressPublisher:
+    """Test coalescing of frequent progress updates"""
+
+    def test_updates_are_coalesced(self):
+        """A burst of updates publishes once, then the timer flushes the latest"""
+        bus = RecordingBus()
+        publisher = ProgressPublisher(bus, max_updates_per_second=20)
+        for progress in range(50):
+            publisher.update('job', {'progress': progress})
+
+        assert publisher.wait_idle(1.0)
+        assert [event['progress'] for event in bus.events] == [0]
+        time.sleep(0.2)
+        assert [event['progress'] for event in bus.events] == [0, 49]
+        assert publisher.get_statistics()['coalesced'] == 48
+
+    def test_transitions_are_immediate(self):
+        """Status transitions and final events skip the rate limit"""
+        bus = RecordingBus()
+        publisher = ProgressPublisher(bus, max_updates_per_second=1)
+        publisher.update('job', {'status': 'running'}, transition=True)
+        publisher.update('job', {'status': 'running', 'progress': 50})
+        publisher.update('job', {'status': 'completed'}, transition=True, final=True)
+
+        assert publisher.wait_idle(1.0)
+        assert [event['status'] for event in bus.events] == ['running', 'completed']
+        assert publisher.get_statistics()['active_scans'] == 0
+        time.sleep(0.05)
+        assert len(bus.events) == 2
+
+    def test_unknown_backend(self):
+        """Unsupported backends are rejected"""
+        with pytest.raises(ValueError):
+            create_progress_bus('kafka')
+
+
+    def test_update_does_not_wait_for_the_bus(self):
+        """A slow bus (network round trip) delays publishing, not the caller"""
+        class SlowBus(RecordingBus):
+            def publish(self, scan_job_id, event):
+                time.sleep(0.2)
+                super().publish(scan_job_id, event)
+
+        bus = SlowBus()
+        publisher = ProgressPublisher(bus, max_updates_per_second=100)
+        started = time.monotonic()
+        for status in ('pending', 'running', 'completed'):
+            publisher.update('job', {'status': status}, transition=True, final=status == 'completed')
+
+        assert time.monotonic() - started < 0.1
+        assert publisher.wait_idle(2.0)
+        assert [event['status'] for event in bus.events] == ['pending', 'running', 'completed']
+
+    def test_one_thread_flushes_every_scan(self):
+        """Pending events of many scans are flushed without a timer thread per interval"""
+        bus = RecordingBus()
+        publisher = ProgressPublisher(bus, max_updates_per_second=20)
+        threads_before = threading.active_count()
+        for round_number in range(5):
+            for scan in range(20):
+                publisher.update(f'job-{scan}', {'progress': round_number})
+            time.sleep(0.06)
+
+        assert threading.active_count() <= threads_before + 1
+        time.sleep(0.1)
+        assert sum(event['progress'] == 4 for event in bus.events) == 20
+
+
+class TestProgressStream:
+    """Test subscriptions and streamed scan progress"""
+
+    def test_local_bus_delivers_to_subscribers(self):
+        """Subscribers of a scan receive its events, and nothing after closing"""
+        async def run():
+            bus = LocalProgressBus()
+            subscription = await bus.subscribe('job')
+            bus.publish('job', {'progress': 10})
+            bus.publish('other', {'progress': 99})
+            received = await subscription.get(1.0)
+            empty = await subscription.get(0.01)
+            await subscription.close()
+            return received, empty, bus.subscriber_count()
+
+        assert asyncio.run(run()) == ({'progress': 10}, None, 0)
+
+    def test_stream_follows_scan_to_completion(self, tmp_path):
+        """A stream opened before the scan starts ends with its completed event"""
+        build_tree(tmp_path)
+        service = ScanService()
+        service.progress_publisher = ProgressPublisher(LocalProgressBus(), max_updates_per_second=50)
+        scan_job_id, tenant_id = uuid4(), uuid4()
+        config = {'filesystem_type': 'local_filesystem', 'root_path': str(tmp_path)}
+
+        async def run():
+            await service.create_scan_job(scan_job_id, tenant_id, 'filesystem', config)
+            events = await service.open_progress_stream(scan_job_id)
+            scan = asyncio.create_task(service.execute_scan(scan_job_id, tenant_id, 'filesystem', config))
+            received = [event async for event in events]
+            await scan
+            return received
+
+        received = asyncio.run(run())
+
+        statuses = [event['status'] for event in received]
+        assert statuses[0] == APIConfig.STATUS_PENDING
+        assert APIConfig.STATUS_RUNNING in statuses
+        assert statuses[-1] == APIConfig.STATUS_COMPLETED
+        assert received[-1]['progress'] == 100 and received[-1]['total_assets'] == 8
+
+    def test_unknown_job_has_no_stream(self):
+        """Streams are only opened for known scans"""
+        service = ScanService()
+        service.progress_publisher = ProgressPublisher(LocalProgressBus())
+
+        assert asyncio.run(service.open_progress_stream(uuid4())) is None
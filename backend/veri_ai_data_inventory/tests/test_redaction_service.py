@@ -0,0 +1,217 @@
+"""
+Unit Tests for Vietnamese PII Redaction Service
+Tests the shared compiled engine and chunked streaming redaction.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import io
+import random
+
+import pytest
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from config.reporting_constants import ReportingConfig
+from services.redaction_service import (
+    RedactionEngine,
+    StreamingRedactor,
+    get_redaction_engine,
+    iter_decoded_chunks,
+    redact_batch,
+    redact_file,
+    shutdown_batch_executor,
+)
+
+
+@pytest.fixture
+def sample_csv_text():
+    """Vietnamese customer CSV with phone, email, CCCD and address PII"""
+    rows = [
+        f"{i},Nguyễn Văn An,0912345{i:03d},khach{i}@example.com,0790{i:08d},"
+        f"ghi chú: số 12 đường Lê Lợi quận 1: ok"
+        for i in range(200)
+    ]
+    return "\n".join(rows) + "\n"
+
+
+FUZZ_TOKENS = [
+    "0912345678", "+84912345678", "012345678901", "079012345678901", "1234567890123",
+    "an.nguyen@congty.vn", "x@y.com.vn", "số 12", "đường Lê Lợi", "phường 5", "quận 1",
+    "thành phố Hồ Chí Minh", "tỉnh Bình Dương", "Nguyễn Văn An", "Trần Thị Bích Ngọc",
+    "CCCD", "SĐT:", "email", "ghi chú", ",", ".", "-", ":", "@", "\n", " ", "abc", "Xyz"
+]
+
+
+def fuzz_document(rng, glued):
+    """Random mix of PII and filler tokens, optionally with no separators"""
+    tokens = [rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(5, 300))]
+    if glued:
+        return "".join(tokens)
+    return "".join(token + rng.choice([" ", ", ", "\n", ": "]) for token in tokens)
+
+
+class TestRedactionEngine:
+    """Test compiled redaction engine"""
+
+    def test_engine_is_cached_per_type_selection(self):
+        """Same PII type selection reuses the compiled engine"""
+        assert get_redaction_engine(["cccd", "email"]) is get_redaction_engine(["cccd", "email"])
+        assert get_redaction_engine() is not get_redaction_engine(["cccd"])
+
+    def test_unknown_types_are_ignored(self):
+        """Unknown PII types do not compile patterns"""
+        engine = RedactionEngine(["cccd", "not_a_type"])
+        assert [pii_type for pii_type, _, _ in engine.compiled] == ["cccd"]
+
+    def test_redact_masks_with_config_labels(self):
+        """Redaction uses ReportingConfig masks"""
+        engine = RedactionEngine(["email", "cccd"])
+        redacted, redactions = engine.redact("CCCD: 079012345678, email: an@example.com")
+
+        assert ReportingConfig.REDACTION_MASKS["cccd"] in redacted
+        assert ReportingConfig.REDACTION_MASKS["email"] in redacted
+        assert "079012345678" not in redacted
+        assert len(redactions) == 2
+
+    def test_preview_does_not_modify_text(self):
+        """Preview strategy reports matches without redacting"""
+        text = "email: an@example.com"
+        redacted, redactions = RedactionEngine(["email"]).redact(text, "preview")
+        assert redacted == text
+        assert redactions[0]["original_value"] == "an@example.com"
+
+
+class TestStreamingRedactor:
+    """Test chunked streaming redaction with carry-over"""
+
+    @pytest.mark.parametrize("chunk_size", [64, 257, 4096])
+    def test_stream_matches_whole_text_redaction(self, sample_csv_text, chunk_size):
+        """Chunked output equals whole-text redaction for any chunk size"""
+        engine = get_redaction_engine()
+        expected, _ = engine.redact(sample_csv_text, "full_mask")
+
+        redactor = StreamingRedactor(engine, chunk_size=chunk_size, carry_over=128)
+        pieces = [sample_csv_text[i:i + 31] for i in range(0, len(sample_csv_text), 31)]
+        output = "".join(redactor.redact_stream(pieces))
+
+        assert output == expected
+        assert redactor.get_summary()["chars_processed"] == len(sample_csv_text)
+
+    @pytest.mark.parametrize("glued", [False, True])
+    def test_randomized_stream_matches_whole_text(self, glued):
+        """Any chunking of random documents yields exactly the whole-text redaction"""
+        engine = get_redaction_engine()
+        rng = random.Random(2025)
+
+        for _ in range(300):
+            text = fuzz_document(rng, glued)
+            expected, redactions = engine.redact(text, "full_mask")
+            redactor = StreamingRedactor(engine, chunk_size=rng.randint(1, 200))
+            step = rng.randint(1, 97)
+
+            output = "".join(redactor.redact_stream(text[i:i + step] for i in range(0, len(text), step)))
+
+            assert output == expected
+            assert redactor.get_summary()["redaction_count"] == len(redactions)
+
+    def test_match_at_chunk_start_is_not_split(self):
+        """A match longer than the chunk is emitted whole, not clipped"""
+        text = "số 12 đường Lê Lợi phường Bến Nghé quận 1" + "@" + "x" * 50
+        redactor = StreamingRedactor(RedactionEngine(["address"]), chunk_size=8, carry_over=16)
+
+        output = "".join(redactor.redact_stream([text[i:i + 5] for i in range(0, len(text), 5)]))
+
+        assert output == RedactionEngine(["address"]).redact(text, "full_mask")[0]
+        assert redactor.get_summary()["redaction_counts"] == {"address": 1}
+
+    def test_patterns_fit_carry_over(self):
+        """No configured pattern can match more than the carry-over window"""
+        for pii_type, pattern in ReportingConfig.REDACTION_PATTERNS.items():
+            max_width = sre_parse.parse(pattern).getwidth()[1]
+            assert max_width < ReportingConfig.REDACTION_STREAM_CARRY_OVER, pii_type
+
+    def test_pii_spanning_chunk_boundary_is_redacted(self):
+        """A CCCD split across two fed pieces is still redacted"""
+        redactor = StreamingRedactor(RedactionEngine(["cccd"]), chunk_size=16, carry_over=32)
+        text = "x" * 10 + " 079012345678 " + "y" * 40
+
+        output = "".join(redactor.redact_stream([text[:16], text[16:]]))
+
+        assert "079012345678" not in output
+        assert redactor.get_summary()["redaction_counts"] == {"cccd": 1}
+
+    def test_summary_counts_per_type(self, sample_csv_text):
+        """Summary reports per-type counts at the end of the stream"""
+        redactor = StreamingRedactor(get_redaction_engine(["email", "vietnamese_phone"]), chunk_size=512)
+        list(redactor.redact_stream([sample_csv_text]))
+
+        summary = redactor.get_summary()
+        assert summary["redaction_counts"] == {"email": 200, "vietnamese_phone": 200}
+        assert summary["redaction_count"] == 400
+
+    def test_invalid_chunk_size_rejected(self):
+        """Non-positive chunk size raises ValueError"""
+        with pytest.raises(ValueError):
+            StreamingRedactor(chunk_size=0)
+
+
+class TestFileRedaction:
+    """Test binary stream helpers used by the CLI and upload endpoint"""
+
+    def test_multibyte_characters_split_across_reads(self):
+        """Vietnamese diacritics split across read blocks decode correctly"""
+        text = "Địa chỉ: Hồ Chí Minh"
+        chunks = list(iter_decoded_chunks(io.BytesIO(text.encode("utf-8")), read_bytes=3))
+        assert "".join(chunks) == text
+
+    def test_redact_file_roundtrip(self, sample_csv_text):
+        """redact_file writes the same output as whole-text redaction"""
+        expected, _ = get_redaction_engine().redact(sample_csv_text, "full_mask")
+        output = io.BytesIO()
+
+        summary = redact_file(io.BytesIO(sample_csv_text.encode("utf-8")), output, chunk_size=1000)
+
+        assert output.getvalue().decode("utf-8") == expected
+        assert summary["redaction_count"] > 0
+
+
+class TestBatchRedaction:
+    """Test batch redaction across the worker pool"""
+
+    @pytest.fixture
+    def records(self):
+        """Mixed records, some without PII"""
+        return [
+            f"Khách hàng {i}: SĐT 0912345{i:03d}" if i % 3 else f"Ghi chú nội bộ số {i}"
+            for i in range(90)
+        ]
+
+    def test_parallel_results_in_input_order(self, records):
+        """Process pool results match in-process redaction, in input order"""
+        engine = get_redaction_engine(["vietnamese_phone"])
+        try:
+            batch = redact_batch(
+                records,
+                pii_types=["vietnamese_phone"],
+                max_workers=2,
+                records_per_task=7,
+                parallel_threshold=0
+            )
+        finally:
+            shutdown_batch_executor()
+
+        assert [text for text, _ in batch["results"]] == [engine.redact(r, "full_mask")[0] for r in records]
+        assert batch["statistics"]["workers_used"] == 2
+
+    def test_aggregate_statistics(self, records):
+        """Statistics aggregate counts across all records"""
+        stats = redact_batch(records, pii_types=["vietnamese_phone"], parallel_threshold=len(records) + 1)["statistics"]
+
+        assert stats["records_processed"] == 90
+        assert stats["records_with_pii"] == 60
+        assert stats["redaction_counts"] == {"vietnamese_phone": 60}
+        assert stats["workers_used"] == 1
@@ -0,0 +1,147 @@
+"""
+Unit Tests for the Scan Result Store
+Tests result files, summary statistics, filtered pagination and scan integration.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+
+from config.constants import APIConfig, ResultStoreConfig
+from scanner_manager.result_store import open_result_writer, read_results
+from services.scan_service import ScanService
+
+ASSETS = [
+    {'asset_type': 'file', 'asset_name': 'hợp_đồng_lao_động.pdf', 'asset_path': '/hr/hợp_đồng_lao_động.pdf',
+     'size_bytes': 52000, 'pii_categories': ['cccd', 'phone']},
+    {'asset_type': 'file', 'asset_name': 'report.PDF', 'asset_path': '/hr/report.PDF', 'size_bytes': 900},
+    {'asset_type': 'file', 'asset_name': 'bảng_lương.xlsx', 'asset_path': '/ke_toan/bảng_lương.xlsx',
+     'size_bytes': 18000, 'pii_categories': ['bank_account'], 'pdpl_sensitive': True},
+    {'asset_type': 'table', 'asset_name': 'khach_hang', 'asset_path': 'public.khach_hang',
+     'row_count': 15430, 'column_count': 12, 'has_vietnamese_data': True, 'pii_categories': ['phone']},
+    {'asset_type': 'file', 'asset_name': 'notes.txt', 'asset_path': '/tmp/notes.txt', 'size_bytes': 10,
+     'modified': '2025-11-04T10:30:00'},
+]
+
+
+@pytest.fixture(params=['sqlite', 'parquet', 'arrow'])
+def result_format(request, tmp_path, monkeypatch):
+    """Each result format, writing to a temporary directory"""
+    if request.param != 'sqlite':
+        pytest.importorskip('pyarrow')
+    monkeypatch.setattr(ResultStoreConfig, 'DIRECTORY', str(tmp_path / 'results'))
+    monkeypatch.setattr(ResultStoreConfig, 'ROW_GROUP_SIZE', 2)
+    return request.param
+
+
+def write(result_format, assets=ASSETS):
+    writer = open_result_writer(uuid4(), result_format)
+    for start in range(0, len(assets), 2):
+        writer.append(assets[start:start + 2])
+    return writer.result_file, writer.close()
+
+
+class TestResultFile:
+    """Test writing and reading result files"""
+
+    def test_summary(self, result_format):
+        """The summary counts every written asset"""
+        result_file, summary = write(result_format)
+
+        assert os.path.exists(result_file['path']) and result_file['format'] == result_format
+        assert summary['total_assets'] == 5
+        assert summary['total_bytes'] == 70910
+        assert summary['asset_types'] == {'file': 4, 'table': 1}
+        assert summary['extensions'] == {'.pdf': 2, '.xlsx': 1, '.txt': 1}
+        assert summary['pii_categories'] == {'cccd': 1, 'phone': 2, 'bank_account': 1}
+        assert summary['vietnamese_names'] == 2
+        assert summary['pdpl_sensitive'] == 1
+
+    def test_filters(self, result_format):
+        """Extension, Vietnamese name, size and PII category filters combine"""
+        result_file, _ = write(result_format)
+
+        def names(**filters):
+            assets, _ = read_results(result_file, filters)
+            return [asset['asset_name'] for asset in assets]
+
+        assert names(extensions=['pdf']) == ['hợp_đồng_lao_động.pdf', 'report.PDF']
+        assert names(vietnamese_name=True) == ['hợp_đồng_lao_động.pdf', 'bảng_lương.xlsx']
+        assert names(min_size=1000, max_size=20000) == ['bảng_lương.xlsx']
+        assert names(pii_category='phone') == ['hợp_đồng_lao_động.pdf', 'khach_hang']
+        assert names(pii_category='phone', asset_type='table') == ['khach_hang']
+        assert names(extensions=['.pdf'], vietnamese_name=False) == ['report.PDF']
+
+    def test_pagination(self, result_format):
+        """Pages continue from the cursor and rebuild the assets"""
+        result_file, _ = write(result_format)
+
+        first, cursor = read_results(result_file, limit=2)
+        second, cursor = read_results(result_file, cursor=cursor, limit=2)
+        third, last = read_results(result_file, cursor=cursor, limit=2)
+
+        assert [asset['asset_name'] for asset in first + second + third] == [a['asset_name'] for a in ASSETS]
+        assert last is None
+        assert second[1]['row_count'] == 15430 and second[1]['pii_categories'] == ['phone']
+        assert third[0]['modified'] == '2025-11-04T10:30:00'
+        filtered, cursor = read_results(result_file, {'pii_category': 'phone'}, limit=1)
+        assert [asset['asset_name'] for asset in filtered] == ['hợp_đồng_lao_động.pdf'] and cursor == 3
+
+
+class TestScanResults:
+    """Test result files written by scans"""
+
+    def test_scan_spills_all_assets(self, tmp_path, monkeypatch):
+        """The job keeps a capped preview; the results API pages through every asset"""
+        monkeypatch.setattr(ResultStoreConfig, 'FORMAT', 'sqlite')
+        monkeypatch.setattr(ResultStoreConfig, 'DIRECTORY', str(tmp_path / 'results'))
+        monkeypatch.setattr(APIConfig, 'MAX_ASSETS_PER_RESPONSE', 3)
+        root = tmp_path / 'chia_se'
+        root.mkdir()
+        for name in ('hồ_sơ_1.docx', 'hồ_sơ_2.docx', 'data.csv', 'a.csv', 'b.csv', 'c.txt'):
+            (root / name).write_text('nội dung')
+        service = ScanService()
+        scan_job_id, tenant_id = uuid4(), uuid4()
+        config = {'filesystem_type': 'local_filesystem', 'root_path': str(root)}
+
+        async def run():
+            await service.create_scan_job(scan_job_id, tenant_id, 'filesystem', config)
+            await service.execute_scan(scan_job_id, tenant_id, 'filesystem', config)
+            status = await service.get_scan_status(scan_job_id)
+            page = await service.get_scan_results(scan_job_id, {'extensions': ['.csv']}, limit=2)
+            rest = await service.get_scan_results(scan_job_id, {'extensions': ['.csv']}, page['next_cursor'], 2)
+            vietnamese = await service.get_scan_results(scan_job_id, {'vietnamese_name': True})
+            return status, page, rest, vietnamese
+
+        status, page, rest, vietnamese = asyncio.run(run())
+
+        assert status['status'] == APIConfig.STATUS_COMPLETED
+        assert len(status['discovered_assets']) == 3 and status['total_assets'] == 6
+        assert status['result_summary']['total_assets'] == 6 and status['result_summary']['complete']
+        assert page['source'] == 'result_file' and len(page['assets']) == 2
+        assert len(rest['assets']) == 1 and rest['next_cursor'] is None
+        assert sorted(asset['asset_name'] for asset in vietnamese['assets']) == ['hồ_sơ_1.docx', 'hồ_sơ_2.docx']
+
+    def test_failed_scan_discards_file(self, tmp_path, monkeypatch):
+        """A failed scan leaves no result file and serves its preview"""
+        monkeypatch.setattr(ResultStoreConfig, 'FORMAT', 'sqlite')
+        monkeypatch.setattr(ResultStoreConfig, 'DIRECTORY', str(tmp_path / 'results'))
+        service = ScanService()
+        service.scanner_manager.error_handler.retry_delay = 0
+        scan_job_id, tenant_id = uuid4(), uuid4()
+        config = {'filesystem_type': 'local_filesystem', 'root_path': str(tmp_path / 'khong_ton_tai')}
+
+        async def run():
+            await service.create_scan_job(scan_job_id, tenant_id, 'filesystem', config)
+            await service.execute_scan(scan_job_id, tenant_id, 'filesystem', config)
+            return await service.get_scan_results(scan_job_id), await service.get_scan_results(uuid4())
+
+        results, unknown = asyncio.run(run())
+
+        assert results['status'] == APIConfig.STATUS_FAILED and results['source'] == 'preview'
+        assert os.listdir(tmp_path / 'results') == []
+        assert unknown is None
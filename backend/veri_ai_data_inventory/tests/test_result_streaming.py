@@ -0,0 +1,165 @@
+"""
+Unit Tests for Streaming Scan Results
+Tests incremental aggregation, request-ordered multi-source results and item streaming.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import time
+
+from filesystem_scanners.local_filesystem_scanner import LocalFilesystemScanner
+from scanner_manager.result_aggregator import ResultAggregator
+from scanner_manager.scanner_manager import ScannerManager
+from services.scan_service import ScanService
+
+from fixtures import FakeJob
+
+
+class StreamingScanner:
+    """Scanner yielding 'tables' batches after a per-source delay"""
+
+    ITEM_KEY = 'tables'
+
+    def __init__(self, connection_config):
+        self.connection_config = connection_config
+
+    def connect(self):
+        return True
+
+    def iter_discovery_batches(self, batch_size=2, cancel_token=None, **options):
+        time.sleep(self.connection_config['delay'])
+        name = self.connection_config['host']
+        tables = [{'full_name': f"{name}.bang_{i}"} for i in range(self.connection_config['tables'])]
+        # The last table is reported twice (e.g. catalog row repeated across pages)
+        tables.append(dict(tables[-1]))
+        for start in range(0, len(tables), batch_size):
+            yield tables[start:start + batch_size]
+
+    def close(self):
+        pass
+
+
+def streaming_manager(monkeypatch):
+    """ScannerManager creating StreamingScanner for every scanner type"""
+    manager = ScannerManager(enable_parallel=True)
+    monkeypatch.setattr(manager.registry, 'get_scanner_class', lambda scanner_type: StreamingScanner)
+    return manager
+
+
+class TestResultAggregator:
+    """Test incremental, source-keyed aggregation"""
+
+    def test_batches_are_deduplicated_per_source(self):
+        """Repeated items are dropped within a source, not across sources"""
+        aggregator = ResultAggregator()
+        received = []
+        aggregator.add_sink(lambda source, items: received.append((source, len(items))))
+        aggregator.start_source('db-a', 'postgresql', 'database')
+        aggregator.start_source('db-b', 'postgresql', 'database')
+
+        unique = aggregator.add_item_batch('db-a', [{'full_name': 'public.khach_hang'}] * 2)
+        aggregator.add_item_batch('db-b', [{'full_name': 'public.khach_hang'}])
+        aggregator.add_item_batch('db-a', [{'full_name': 'public.khach_hang'}, {'full_name': 'public.don_hang'}])
+
+        assert len(unique) == 1
+        assert received == [('db-a', 1), ('db-b', 1), ('db-a', 1)]
+        results = aggregator.get_aggregated_results()
+        assert [source['item_count'] for source in results['sources']] == [2, 1]
+        assert results['total_items'] == 3
+        assert results['duplicate_items'] == 2
+
+    def test_finished_source_ignores_late_batches(self):
+        """Batches from an abandoned scan do not change a finished source"""
+        aggregator = ResultAggregator()
+        aggregator.start_source('s3-1', 's3', 'cloud')
+        aggregator.finish_source('s3-1', {'status': 'error', 'message': 'timed out', 'partial': True})
+
+        assert aggregator.add_item_batch('s3-1', [{'key': 'ho_so/a.csv'}]) == []
+        statistics = aggregator.get_statistics()
+        assert statistics['total_items_discovered'] == 0
+        assert statistics['failed_sources'] == 1
+        assert statistics['partial_sources'] == 1
+
+    def test_legacy_results_are_counted(self):
+        """add_scanner_results() still accepts complete scanner responses"""
+        aggregator = ResultAggregator()
+        aggregator.add_scanner_results('s3', 'cloud', {'status': 'success', 'data': {'objects': [{}, {}]}})
+        aggregator.add_scanner_results('s3', 'cloud', {'status': 'success', 'count': 3})
+
+        results = aggregator.get_aggregated_results()
+        assert results['total_items'] == 5
+        assert [source['source_identifier'] for source in results['sources']] == ['s3-1', 's3-2']
+
+
+class TestMultiSourceStreaming:
+    """Test ScannerManager streams multi-source scans into the aggregator"""
+
+    def test_parallel_results_follow_request_order(self, monkeypatch):
+        """The slow first source completes last but keeps its place and counts"""
+        manager = streaming_manager(monkeypatch)
+        requests = [
+            {'scanner_type': 'postgresql', 'connection_config': {'host': 'cham', 'delay': 0.1, 'tables': 5}},
+            {'scanner_type': 'mysql', 'connection_config': {'host': 'nhanh', 'delay': 0.0, 'tables': 2},
+             'source_identifier': 'crm'}
+        ]
+        received = []
+
+        response = manager.execute_multi_source_scan(
+            requests,
+            item_sink=lambda source, items: received.append(source)
+        )
+
+        sources = response['results']['sources']
+        assert [source['source_identifier'] for source in sources] == ['postgresql-1', 'crm']
+        assert [source['item_count'] for source in sources] == [5, 2]
+        assert [source['duplicate_count'] for source in sources] == [1, 1]
+        assert received[0] == 'crm'
+        assert manager.result_aggregator.sinks == []
+
+    def test_streamed_scan_returns_summary_only(self, monkeypatch):
+        """With on_batch the response carries the count, not the items"""
+        manager = streaming_manager(monkeypatch)
+        batches = []
+
+        result = manager.execute_scan(
+            'postgresql',
+            {'host': 'db', 'delay': 0.0, 'tables': 3},
+            on_batch=batches.append
+        )
+
+        assert [len(batch) for batch in batches] == [2, 2]
+        assert result['count'] == 4
+        assert 'tables' not in result['data']
+
+
+class TestFilesystemStreaming:
+    """Test filesystem scanners yield bounded batches"""
+
+    def test_iter_discovery_batches(self, tmp_path):
+        """Files arrive in batches of the requested size"""
+        for name in ('hợp_đồng.txt', 'a.txt', 'b.txt', 'c.txt', 'd.txt'):
+            (tmp_path / name).write_text('Nguyễn Văn An', encoding='utf-8')
+        scanner = LocalFilesystemScanner(str(tmp_path))
+
+        batches = list(scanner.iter_discovery_batches(batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        files = [item for batch in batches for item in batch]
+        assert [item['name'] for item in files if item['is_vietnamese_filename']] == ['hợp_đồng.txt']
+
+    def test_scan_service_publishes_assets(self, tmp_path):
+        """ScanService adds file assets to the job while walking"""
+        for name in ('a.txt', 'b.txt', 'c.txt'):
+            (tmp_path / name).write_text('du lieu', encoding='utf-8')
+        service = object.__new__(ScanService)
+        job = FakeJob()
+
+        results = asyncio.run(service._scan_filesystem(
+            scanner=LocalFilesystemScanner(str(tmp_path)),
+            connection_config={},
+            job=job
+        ))
+
+        assert results['count'] == 3 and results['partial'] is False
+        assert sorted(asset['asset_name'] for asset in job.assets) == ['a.txt', 'b.txt', 'c.txt']
@@ -0,0 +1,69 @@
+"""
+Unit Tests for the Parallel Resumable Directory Walk
+Tests walk order, depth pruning and the walk shared by the filesystem scanners.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import os
+
+import utils.resumable_walk as resumable_walk
+from filesystem_scanners.local_filesystem_scanner import LocalFilesystemScanner
+from filesystem_scanners.network_share_scanner import NetworkShareScanner
+from utils.resumable_walk import scandir_walk
+
+from fixtures import build_tree
+
+
+def walked_files(root, **options):
+    return ['/'.join(parts + [entry.name]) for _, parts, entries in scandir_walk(root, **options) for entry in entries]
+
+
+class TestScandirWalk:
+    """Test the order and pruning of the walk"""
+
+    def test_parallel_walk_keeps_sorted_order(self, tmp_path):
+        """Files come before subdirectories, sorted, whatever the number of workers"""
+        build_tree(tmp_path)
+
+        expected = [
+            'a.txt', 'b.txt', 'z.txt', 'bao_cao/tong_hop.csv', 'bao_cao/2024/q1.csv', 'bao_cao/2024/q2.csv',
+            'ho_so/nhan_vien.docx', 'ho_so/z/cu.txt'
+        ]
+        assert walked_files(tmp_path, workers=1) == expected
+        assert walked_files(tmp_path, workers=8) == expected
+
+    def test_directories_below_max_depth_are_not_listed(self, tmp_path, monkeypatch):
+        """Pruning happens before listing, not after"""
+        build_tree(tmp_path)
+        listed = []
+        list_directory = resumable_walk._list_directory
+
+        def recording(path, follow_symlinks):
+            listed.append(os.path.relpath(path, tmp_path))
+            return list_directory(path, follow_symlinks)
+
+        monkeypatch.setattr(resumable_walk, '_list_directory', recording)
+
+        files = walked_files(tmp_path, max_depth=1)
+
+        assert files == ['a.txt', 'b.txt', 'z.txt', 'bao_cao/tong_hop.csv', 'ho_so/nhan_vien.docx']
+        assert sorted(listed) == ['.', 'bao_cao', 'ho_so']
+
+
+class TestScannerWalk:
+    """Test the scanners built on the walk"""
+
+    def test_network_share_resumes_like_local_scanner(self, tmp_path):
+        """Both scanners stream the same files and cursors"""
+        build_tree(tmp_path)
+        local = LocalFilesystemScanner(str(tmp_path))
+        share = NetworkShareScanner({'share_path': str(tmp_path)})
+        assert share.connect()
+
+        local_files = [(item['path'], item['size'], local.get_checkpoint_cursor()) for item in local.iter_files()]
+        share_files = [(item['path'], item['size'], share.get_checkpoint_cursor()) for item in share.iter_files()]
+        resumed = [item['path'] for item in share.iter_files(resume_from=share_files[3][2])]
+
+        assert share_files == local_files and len(share_files) == 8
+        assert resumed == [path for path, _, _ in share_files[4:]]
@@ -0,0 +1,226 @@
+"""
+Unit Tests for Checkpointed, Resumable Scans
+Tests scanner resume cursors, the checkpoint store and resumed scans in ScanService.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from cloud_scanners.azure_blob_scanner import AzureBlobScanner
+from config.constants import ScanConfig, ScanManagerConfig, StorageConfig, resolve_data_path
+from filesystem_scanners.local_filesystem_scanner import LocalFilesystemScanner
+from postgresql_scanner import PostgreSQLScanner
+from scanner_manager.checkpoint_store import CheckpointStore
+from scanner_manager.watermark_store import WatermarkStore
+from services.job_state_manager import JobState
+from services.scan_service import ScanService
+
+from fixtures import FakeConnection, build_tree, catalog_rows
+
+
+def files_with_cursors(scanner, **options):
+    """(path, cursor after that file) for every streamed file"""
+    result = []
+    for item in scanner.iter_files(**options):
+        result.append((item['path'], scanner.get_checkpoint_cursor()))
+    return result
+
+
+class TestFilesystemResume:
+    """Test resuming a directory walk after any file"""
+
+    def test_resume_after_every_file(self, tmp_path):
+        """Resuming after file k yields exactly the files after k"""
+        build_tree(tmp_path)
+        scanner = LocalFilesystemScanner(str(tmp_path))
+        full = files_with_cursors(scanner)
+        paths = [path for path, _ in full]
+        assert len(paths) == 8 and len(set(paths)) == 8
+
+        for k, (_, cursor) in enumerate(full):
+            resumed = [item['path'] for item in scanner.iter_files(resume_from=cursor)]
+            assert resumed == paths[k + 1:]
+
+    def test_max_files_counts_emitted_before_resume(self, tmp_path):
+        """The max_files limit covers files emitted before the checkpoint"""
+        build_tree(tmp_path)
+        scanner = LocalFilesystemScanner(str(tmp_path))
+        cursor = files_with_cursors(scanner, max_files=5)[2][1]
+
+        assert len(list(scanner.iter_files(max_files=5, resume_from=cursor))) == 2
+
+
+class FakeBlob:
+    def __init__(self, name):
+        self.name = name
+        self.size = 1
+        self.last_modified = None
+        self.etag = name
+        self.content_settings = None
+
+
+class FakePager:
+    """ItemPaged.by_page() stand-in: pages addressed by continuation token"""
+
+    def __init__(self, pages, continuation_token=None):
+        self.pages = pages
+        self.continuation_token = continuation_token
+
+    def __iter__(self):
+        index = int(self.continuation_token or 0)
+        while index < len(self.pages):
+            page = self.pages[index]
+            index += 1
+            self.continuation_token = str(index) if index < len(self.pages) else None
+            yield iter(page)
+
+
+class FakeContainer:
+    def __init__(self, pages):
+        self.pages = pages
+        self.tokens = []
+
+    def list_blobs(self, name_starts_with=''):
+        container = self
+
+        class Listing:
+            def by_page(self, continuation_token=None):
+                container.tokens.append(continuation_token)
+                return FakePager(container.pages, continuation_token)
+
+        return Listing()
+
+
+class TestCloudResume:
+    """Test cloud listing cursors"""
+
+    def test_azure_resumes_from_page_token(self):
+        """A resumed listing starts at the cursor's page and skips its emitted blobs"""
+        pages = [[FakeBlob('a'), FakeBlob('b')], [FakeBlob('c'), FakeBlob('d')], [FakeBlob('e')]]
+        scanner = object.__new__(AzureBlobScanner)
+        scanner.utf8_validator = AzureBlobScanner.__init__.__globals__['UTF8Validator']()
+        scanner.container_client = FakeContainer(pages)
+
+        stream = scanner.iter_blobs()
+        emitted = [next(stream)['name'] for _ in range(3)]
+        cursor = scanner.get_checkpoint_cursor()
+        stream.close()
+
+        resumed = [blob['name'] for blob in scanner.iter_blobs(resume_from=cursor)]
+
+        assert emitted == ['a', 'b', 'c']
+        assert cursor == {'continuation_token': '1', 'name': 'c', 'count': 3}
+        assert resumed == ['d', 'e']
+        assert scanner.container_client.tokens[-1] == '1'
+
+
+class TestDatabaseResume:
+    """Test table-name cursors of catalog discovery"""
+
+    def test_postgresql_passes_after_table(self):
+        """The catalog query restarts after the checkpointed table"""
+        scanner = object.__new__(PostgreSQLScanner)
+        scanner.schema = "public"
+        scanner.connection = FakeConnection(list(catalog_rows(3)))
+
+        list(scanner.iter_discovery_batches(2, resume_from={'table_name': 'bang_00001'}))
+        query, params = scanner.connection.cursor_obj.executed[0]
+
+        assert 'c.table_name > %s' in query
+        assert params == ('public', 'public', 'bang_00001')
+        assert scanner.get_checkpoint_cursor() == {'table_name': 'bang_00002'}
+
+
+class TestCheckpointStore:
+    """Test checkpoint intervals and lifecycle"""
+
+    def test_saves_on_item_interval(self, tmp_path, monkeypatch):
+        """Checkpoints are written once the item interval is reached"""
+        monkeypatch.setattr(ScanManagerConfig, 'CHECKPOINT_INTERVAL_ITEMS', 10)
+        store = CheckpointStore(str(tmp_path / 'checkpoints.sqlite'))
+        checkpoint = store.open('job-1', {'source_type': 'filesystem'})
+
+        assert checkpoint.update({'path': ['a']}, 5, dict) is False
+        assert checkpoint.update({'path': ['b']}, 12, lambda: {'total_assets': 12}) is True
+        assert store.list_checkpoints()[0]['items_emitted'] == 12
+
+        resumed = store.open('job-1')
+        assert resumed.resumed and resumed.cursor == {'path': ['b']}
+        assert resumed.job_info == {'source_type': 'filesystem'}
+
+        resumed.clear()
+        assert store.load('job-1') is None
+        store.close()
+
+    def test_watermark_delta_resumes_scan_number(self, tmp_path):
+        """A resumed delta keeps its scan number and counts"""
+        store = WatermarkStore(str(tmp_path / 'watermarks.sqlite'))
+        delta = store.begin('crm')
+        delta.counts['added'] = 4
+
+        resumed = store.resume(delta.snapshot())
+
+        assert resumed.scan_number == delta.scan_number == 1
+        assert resumed.counts['added'] == 4
+        store.close()
+
+    def test_relative_paths_resolve_under_data_directory(self, tmp_path, monkeypatch):
+        """Default store paths land in the data directory, not the working directory"""
+        monkeypatch.setattr(StorageConfig, 'DATA_DIRECTORY', str(tmp_path / 'du_lieu'))
+        monkeypatch.chdir(tmp_path)
+
+        store = CheckpointStore()
+        store.close()
+
+        assert store.path == str(tmp_path / 'du_lieu' / ScanManagerConfig.CHECKPOINT_DB_PATH)
+        assert (tmp_path / 'du_lieu' / ScanManagerConfig.CHECKPOINT_DB_PATH).exists()
+        assert not (tmp_path / ScanManagerConfig.CHECKPOINT_DB_PATH).exists()
+        assert resolve_data_path(str(tmp_path / 'khac.sqlite')) == str(tmp_path / 'khac.sqlite')
+        assert resolve_data_path(':memory:') == ':memory:'
+
+
+class TestResumedScanService:
+    """Test a scan interrupted mid-stream and resumed from its checkpoint"""
+
+    def test_crash_and_resume_emits_each_file_once(self, tmp_path, monkeypatch):
+        """Files published before the crash are restored, not emitted again"""
+        monkeypatch.setattr(ScanConfig, 'DISCOVERY_ITEM_BATCH_SIZE', 2)
+        monkeypatch.setattr(ScanManagerConfig, 'CHECKPOINT_INTERVAL_ITEMS', 1)
+        root = tmp_path / 'chia_se'
+        root.mkdir()
+        build_tree(root)
+        store = CheckpointStore(str(tmp_path / 'checkpoints.sqlite'))
+        service = object.__new__(ScanService)
+
+        class CrashingScanner(LocalFilesystemScanner):
+            def iter_files(self, **options):
+                for index, item in enumerate(super().iter_files(**options)):
+                    if index == 5:
+                        raise RuntimeError("worker lost")
+                    yield item
+
+        def new_job():
+            return JobState(uuid4(), uuid4(), 'filesystem', {'path': str(root)})
+
+        first_job = new_job()
+        with pytest.raises(RuntimeError):
+            asyncio.run(service._stream_discovered_items(
+                CrashingScanner(str(root)), first_job, checkpoint=store.open('job-1')
+            ))
+        assert first_job.total_assets == 4
+
+        checkpoint = store.open('job-1')
+        resumed_job = new_job()
+        ScanService._restore_job(resumed_job, checkpoint.state)
+        result = asyncio.run(service._stream_discovered_items(
+            LocalFilesystemScanner(str(root)), resumed_job, checkpoint=checkpoint
+        ))
+
+        paths = [asset['asset_path'] for asset in resumed_job.discovered_assets]
+        assert result['count'] == resumed_job.total_assets == 8
+        assert len(paths) == len(set(paths)) == 8
+        store.close()
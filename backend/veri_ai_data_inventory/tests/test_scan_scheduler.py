@@ -0,0 +1,133 @@
+"""
+Unit Tests for the Scan Scheduler
+Tests fair sharing between tenants, priorities, concurrency limits and queue status.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+from uuid import uuid4
+
+from config.constants import APIConfig, ScanConfig, ScanManagerConfig
+from scanner_manager.scan_scheduler import ScanScheduler
+from services.scan_service import ScanService
+
+
+async def start_order(scheduler, submissions):
+    """Submit scans in order; release each as soon as it starts; return start order"""
+    started = []
+
+    async def scan(job_id, tenant, source, priority):
+        if await scheduler.acquire(job_id, tenant, source, priority):
+            started.append(job_id)
+            await asyncio.sleep(0)
+            scheduler.release(job_id)
+
+    # The first scan holds the only slot until everything is queued
+    assert await scheduler.acquire('blocker', 'other', 'blocker-source')
+    tasks = [asyncio.create_task(scan(*submission)) for submission in submissions]
+    await asyncio.sleep(0)
+    scheduler.release('blocker')
+    await asyncio.gather(*tasks)
+    return started
+
+
+class TestFairScheduling:
+    """Test the order in which waiting scans start"""
+
+    def test_tenants_share_slots(self, monkeypatch):
+        """A tenant queuing many scans does not starve a tenant arriving later"""
+        monkeypatch.setattr(ScanManagerConfig, 'MAX_CONCURRENT_SCANS_PER_TENANT', 5)
+        scheduler = ScanScheduler(max_concurrent=1)
+        submissions = [(f'a{i}', 'tenant-a', f'bucket-a{i}', None) for i in range(4)]
+        submissions += [(f'b{i}', 'tenant-b', f'bucket-b{i}', None) for i in range(2)]
+
+        order = asyncio.run(start_order(scheduler, submissions))
+
+        assert order == ['a0', 'b0', 'a1', 'b1', 'a2', 'a3']
+
+    def test_weights_and_priorities(self, monkeypatch):
+        """Heavier tenants get more starts; on-demand scans start before scheduled ones"""
+        monkeypatch.setattr(ScanManagerConfig, 'TENANT_SCHEDULING_WEIGHTS', {'tenant-a': 2.0})
+        monkeypatch.setattr(ScanManagerConfig, 'MAX_CONCURRENT_SCANS_PER_TENANT', 5)
+        scheduler = ScanScheduler(max_concurrent=1)
+        submissions = [('nightly', 'tenant-c', 'crm', 'scheduled')]
+        submissions += [(f'a{i}', 'tenant-a', f'bucket-a{i}', None) for i in range(4)]
+        submissions += [(f'b{i}', 'tenant-b', f'bucket-b{i}', 'on_demand') for i in range(2)]
+
+        order = asyncio.run(start_order(scheduler, submissions))
+
+        assert order == ['a0', 'b0', 'a1', 'a2', 'b1', 'a3', 'nightly']
+
+    def test_limits_pass_over_blocked_scans(self, monkeypatch):
+        """Scans over their tenant or source limit wait while others start"""
+        monkeypatch.setattr(ScanManagerConfig, 'MAX_CONCURRENT_SCANS_PER_TENANT', 1)
+        monkeypatch.setattr(ScanManagerConfig, 'TENANT_SCAN_QUOTAS', {'tenant-big': 3})
+
+        async def run():
+            scheduler = ScanScheduler(max_concurrent=4)
+            assert await scheduler.acquire('a1', 'tenant-a', 'crm')
+            waiting = asyncio.create_task(scheduler.acquire('a2', 'tenant-a', 'erp'))
+            assert await scheduler.acquire('big1', 'tenant-big', 'hr')
+            same_source = asyncio.create_task(scheduler.acquire('big2', 'tenant-big', 'crm'))
+            assert await scheduler.acquire('big3', 'tenant-big', 'kho')
+            await asyncio.sleep(0)
+            assert not waiting.done() and not same_source.done()
+
+            scheduler.release('a1')
+            assert await waiting and await same_source
+            return scheduler.get_statistics()
+
+        stats = asyncio.run(run())
+        assert stats['tenants']['tenant-big'] == {'running': 3, 'waiting': 0}
+
+
+class TestQueueStatus:
+    """Test queue position, estimates and cancellation of waiting scans"""
+
+    def test_position_and_estimated_start(self, monkeypatch):
+        """Waiting scans report their position and a start estimate one wave apart"""
+        monkeypatch.setattr(ScanManagerConfig, 'MAX_CONCURRENT_SCANS_PER_TENANT', 5)
+
+        async def run():
+            scheduler = ScanScheduler(max_concurrent=2)
+            for job_id in ('r1', 'r2'):
+                assert await scheduler.acquire(job_id, 'tenant-a', job_id)
+            tasks = [asyncio.create_task(scheduler.acquire(f'w{i}', 'tenant-a', f'w{i}')) for i in range(3)]
+            await asyncio.sleep(0)
+            info = [scheduler.get_queue_info(f'w{i}') for i in range(3)]
+            assert scheduler.withdraw('w2') and await tasks[2] is False
+            for task in tasks[:2]:
+                task.cancel()
+            return info
+
+        info = asyncio.run(run())
+
+        assert [item['queue_position'] for item in info] == [1, 2, 3]
+        assert info[0]['priority'] == 'on_demand'
+        # Two slots: the third waiting scan starts one average scan duration after the first
+        wave = info[2]['estimated_start'] - info[0]['estimated_start']
+        assert abs(wave.total_seconds() - ScanConfig.ESTIMATED_SCAN_TIME_SECONDS) < 1
+
+    def test_cancel_waiting_scan(self):
+        """A scan cancelled while queued never starts and reports its queue position before"""
+        async def run():
+            service = ScanService()
+            service.scheduler = ScanScheduler(max_concurrent=1)
+            assert await service.scheduler.acquire('busy', 'tenant-x', 'other')
+            scan_job_id, tenant_id = uuid4(), uuid4()
+            config = {'filesystem_type': 'local_filesystem', 'root_path': '/khong-ton-tai'}
+            await service.create_scan_job(scan_job_id, tenant_id, 'filesystem', config)
+
+            task = asyncio.create_task(service.execute_scan(scan_job_id, tenant_id, 'filesystem', config))
+            await asyncio.sleep(0)
+            queued = await service.get_scan_status(scan_job_id)
+            assert await service.cancel_scan(scan_job_id)
+            await task
+            return queued, await service.get_scan_status(scan_job_id)
+
+        queued, final = asyncio.run(run())
+
+        assert queued['status'] == APIConfig.STATUS_PENDING and queued['queue_position'] == 1
+        assert final['status'] == APIConfig.STATUS_CANCELLED and final['started_at'] is None
+        assert 'queue_position' not in final
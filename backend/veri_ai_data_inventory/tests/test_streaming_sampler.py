@@ -0,0 +1,173 @@
+"""
+Unit Tests for Streaming Sketch-based Column Sampler
+Tests reservoir sampling, HyperLogLog, Space-Saving top-k and the combined sampler.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from utils.streaming_sampler import (
+    HyperLogLog,
+    ReservoirSampler,
+    SpaceSavingTopK,
+    StreamingColumnSampler,
+)
+from utils.vietnamese_text_analyzer import VietnameseTextAnalyzer
+from config.constants import ScanConfig
+from postgresql_scanner import PostgreSQLScanner
+
+from fixtures import FakeConnection
+
+
+class FakeCursor:
+    """Minimal DB-API cursor exposing fetchmany()"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.position = 0
+
+    def fetchmany(self, size):
+        batch = self.rows[self.position:self.position + size]
+        self.position += size
+        return batch
+
+
+class TestSketches:
+    """Test individual sketches"""
+
+    def test_reservoir_is_uniform_across_batches(self):
+        """Every stream position is sampled with equal probability"""
+        hits = Counter()
+        for seed in range(2000):
+            reservoir = ReservoirSampler(5, random.Random(seed))
+            reservoir.add_many(list(range(20)))
+            reservoir.add_many(list(range(20, 50)))
+            hits.update(reservoir.samples)
+
+        assert len(hits) == 50
+        assert min(hits.values()) > 140 and max(hits.values()) < 260
+
+    @pytest.mark.parametrize("values", [
+        range(100000),
+        [f"KH{i:08d}" for i in range(100000)],
+        range(50),
+    ])
+    def test_hyperloglog_estimate_within_error(self, values):
+        """Distinct-count estimate within 3% (precision 14)"""
+        sketch = HyperLogLog()
+        sketch.add_many(values)
+        assert abs(sketch.count() - len(values)) <= max(1, 0.03 * len(values))
+
+    def test_hyperloglog_merge(self):
+        """Merged sketch estimates the union"""
+        left, right = HyperLogLog(), HyperLogLog()
+        left.add_many(range(0, 60000))
+        right.add_many(range(40000, 100000))
+        left.merge(right)
+        assert abs(left.count() - 100000) <= 3000
+
+    def test_space_saving_finds_heavy_hitters(self):
+        """Top values of a skewed stream are found in bounded counters"""
+        rng = random.Random(7)
+        values = [int(rng.paretovariate(1.2)) for _ in range(200000)]
+        top_k = SpaceSavingTopK(capacity=200)
+        for start in range(0, len(values), 5000):
+            top_k.add_counts(Counter(values[start:start + 5000]))
+
+        assert len(top_k.counts) <= 200
+        expected = [value for value, _ in Counter(values).most_common(5)]
+        assert [value for value, _, _ in top_k.top(5)] == expected
+
+
+class TestStreamingColumnSampler:
+    """Test combined sampler result shape"""
+
+    def test_low_diversity_uses_top_k(self):
+        """Low-diversity column returns most common values"""
+        values = (["Hà Nội", "Hồ Chí Minh", None, "Đà Nẵng", "Hà Nội"] * 20000)
+        result = VietnameseTextAnalyzer().extract_streaming_sample(iter(values))
+
+        assert result['sampling_strategy'] == 'most_common'
+        assert result['samples'][0] == "Hà Nội"
+        assert result['total_count'] == 100000
+        assert result['null_count'] == 20000
+        assert result['unique_count'] == 3
+        assert result['estimated'] is True
+
+    def test_high_diversity_uses_reservoir(self):
+        """High-diversity column returns a unique reservoir sample"""
+        sampler = StreamingColumnSampler(target_size=50, rng=random.Random(1))
+        result = sampler.update(f"0912{i:06d}" for i in range(100000)).result()
+
+        assert result['sampling_strategy'] == 'random_unique'
+        assert len(result['samples']) == 50
+        assert len(set(result['samples'])) == 50
+        assert result['diversity_score'] > 0.95
+
+    def test_cursor_and_unhashable_values(self):
+        """Cursor rows are consumed in batches; unhashable values are keyed by text"""
+        rows = [({"tinh": "Huế"},), (None,), ({"tinh": "Huế"},)] * 10
+        result = StreamingColumnSampler().update_from_cursor(FakeCursor(rows), batch_size=4).result()
+
+        assert result['total_count'] == 30
+        assert result['null_count'] == 10
+        assert result['unique_count'] == 1
+
+    def test_empty_stream(self):
+        """Empty or all-null streams return the empty result"""
+        result = StreamingColumnSampler().update([None, None]).result()
+        assert result['sampling_strategy'] == 'none'
+        assert result['samples'] == []
+
+
+class TestSampleForEstimate:
+    """Test choosing exact or streaming sampling from the row estimate"""
+
+    def test_small_table_sampled_exactly(self, monkeypatch):
+        """Tables within the threshold use extract_smart_sample"""
+        monkeypatch.setattr(ScanConfig, 'SMALL_TABLE_ROW_THRESHOLD', 100)
+        result = VietnameseTextAnalyzer().extract_sample_for_estimate(['Huế', 'Huế', None], 3)
+
+        assert 'estimated' not in result
+        assert result['unique_count'] == 1
+        assert result['null_count'] == 1
+
+    @pytest.mark.parametrize('row_estimate', [-1, 0, 5000])
+    def test_large_or_unknown_tables_stream(self, monkeypatch, row_estimate):
+        """Large and unknown-size tables go through the sketch sampler"""
+        monkeypatch.setattr(ScanConfig, 'SMALL_TABLE_ROW_THRESHOLD', 100)
+        result = VietnameseTextAnalyzer().extract_sample_for_estimate(range(5000), row_estimate, 10)
+
+        assert result['estimated'] is True
+        assert result['total_count'] == 5000
+        assert len(result['samples']) == 10
+
+    def test_stale_estimate_switches_to_streaming(self, monkeypatch):
+        """More values than the threshold stream on without losing the ones already read"""
+        monkeypatch.setattr(ScanConfig, 'SMALL_TABLE_ROW_THRESHOLD', 100)
+        result = VietnameseTextAnalyzer().extract_sample_for_estimate(range(1000), 50)
+
+        assert result['estimated'] is True
+        assert result['total_count'] == 1000
+
+    def test_postgresql_streams_from_named_cursor(self, monkeypatch):
+        """Large tables are read through one server-side cursor and sampled in bounded memory"""
+        monkeypatch.setattr(ScanConfig, 'SMALL_TABLE_ROW_THRESHOLD', 100)
+        scanner = object.__new__(PostgreSQLScanner)
+        scanner.schema = "public"
+        scanner.connection = FakeConnection([(f"0912{i:06d}",) for i in range(2000)])
+        scanner.estimate_row_count = lambda table_name: 2000
+
+        result = scanner.extract_column_sample('khach_hang', 'so_dien_thoai', limit=20)
+
+        assert result['estimated'] is True
+        assert result['total_count'] == 2000
+        assert result['row_estimate'] == 2000
+        assert len(result['samples']) == 20
+        assert scanner.connection.cursor_names == ['veri_column_values']
+        assert scanner.connection.cursor_obj.itersize == ScanConfig.STREAM_FETCH_BATCH_SIZE
+        assert scanner.connection.cursor_obj.executed == [("SELECT so_dien_thoai FROM public.khach_hang", None)]
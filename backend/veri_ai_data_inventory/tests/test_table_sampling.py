@@ -0,0 +1,296 @@
+"""
+Unit Tests for Database Table Sampling
+Tests sampling plans, TABLESAMPLE widening, multi-column extraction, MySQL primary-key
+range subsets and MongoDB $sample.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+
+import pytest
+
+from config.constants import ScanConfig
+from models.column_filter import ColumnFilterConfig, FilterMode
+from postgresql_scanner import PostgreSQLScanner, plan_sampling
+
+from fixtures import ScriptedConnection
+
+TABLESAMPLE_SQL = (
+    "SELECT * FROM (SELECT id, ho_ten FROM public.khach_hang TABLESAMPLE {method} (%s)) sample_rows "
+    "ORDER BY random() LIMIT %s"
+)
+
+
+def postgresql_scanner(results):
+    """PostgreSQLScanner on a scripted connection (no database)"""
+    scanner = object.__new__(PostgreSQLScanner)
+    scanner.schema = 'public'
+    scanner.connection = ScriptedConnection(results)
+    return scanner
+
+
+def rows(count):
+    """Sample rows (id, ho_ten)"""
+    return [(i, f"Nguyễn Văn {i}") for i in range(count)]
+
+
+# Requested columns: a duplicate and a filtered-out column
+REQUESTED_COLUMNS = ['id', 'ho_ten', 'mat_khau', 'ho_ten']
+EXCLUDE_PASSWORDS = ColumnFilterConfig(mode=FilterMode.EXCLUDE, column_patterns=['mat_khau'])
+
+
+class TestPlanSampling:
+    """Test strategy thresholds and TABLESAMPLE percentage"""
+
+    @pytest.mark.parametrize("row_estimate,strategy", [
+        (-1, 'limit'),
+        (0, 'limit'),
+        (1, 'random'),
+        (ScanConfig.SMALL_TABLE_ROW_THRESHOLD, 'random'),
+        (ScanConfig.SMALL_TABLE_ROW_THRESHOLD + 1, 'bernoulli'),
+        (ScanConfig.BERNOULLI_MAX_ROWS, 'bernoulli'),
+        (ScanConfig.BERNOULLI_MAX_ROWS + 1, 'system'),
+    ])
+    def test_strategy_thresholds(self, row_estimate, strategy):
+        """Strategy follows the catalog estimate"""
+        plan = plan_sampling(row_estimate, 100)
+
+        assert plan['strategy'] == strategy
+        assert plan['row_estimate'] == row_estimate
+
+    def test_sample_percent_oversamples_limit(self):
+        """Percentage targets TABLESAMPLE_OVERSAMPLE_FACTOR times the limit, capped at 100"""
+        expected = 100 * ScanConfig.TABLESAMPLE_OVERSAMPLE_FACTOR * 100.0 / 10000000
+
+        assert plan_sampling(10000000, 100)['sample_percent'] == pytest.approx(expected)
+        assert plan_sampling(50, 100)['sample_percent'] == 100.0
+        assert plan_sampling(-1, 100)['sample_percent'] == 100.0
+
+
+class TestTablesampleRetry:
+    """Test PostgreSQL TABLESAMPLE widening"""
+
+    def test_widens_until_enough_rows(self):
+        """Percentage doubles on short samples; the query shuffles before LIMIT"""
+        scanner = postgresql_scanner([rows(1), rows(2), rows(5)])
+        plan = {'strategy': 'bernoulli', 'row_estimate': 100000, 'sample_percent': 1.0}
+
+        sampled = scanner._fetch_sample_rows('khach_hang', ['id', 'ho_ten'], 3, plan)
+
+        executed = scanner.connection.cursor_obj.executed
+        assert sampled == rows(5)
+        assert [params for _, params in executed] == [(1.0, 3), (2.0, 3), (4.0, 3)]
+        assert {query for query, _ in executed} == {TABLESAMPLE_SQL.format(method='BERNOULLI')}
+        assert plan['sample_percent'] == 4.0
+
+    def test_stops_at_full_table(self):
+        """No retry once the percentage reaches 100"""
+        scanner = postgresql_scanner([rows(1), rows(2)])
+        plan = {'strategy': 'system', 'row_estimate': 2000000, 'sample_percent': 60.0}
+
+        sampled = scanner._fetch_sample_rows('khach_hang', ['id', 'ho_ten'], 3, plan)
+
+        executed = scanner.connection.cursor_obj.executed
+        assert sampled == rows(2)
+        assert [params for _, params in executed] == [(60.0, 3), (100.0, 3)]
+        assert executed[0][0] == TABLESAMPLE_SQL.format(method='SYSTEM')
+        assert plan['sample_percent'] == 100.0
+
+    def test_retries_are_bounded(self):
+        """At most TABLESAMPLE_MAX_RETRIES retries, then the short sample is returned"""
+        attempts = ScanConfig.TABLESAMPLE_MAX_RETRIES + 1
+        scanner = postgresql_scanner([rows(1)] * attempts)
+        plan = {'strategy': 'bernoulli', 'row_estimate': 100000, 'sample_percent': 0.5}
+
+        sampled = scanner._fetch_sample_rows('khach_hang', ['id', 'ho_ten'], 3, plan)
+
+        assert sampled == rows(1)
+        assert len(scanner.connection.cursor_obj.executed) == attempts
+
+    def test_async_scanner_widens_with_positional_parameters(self):
+        """AsyncPostgreSQLScanner runs the same query with $1/$2 placeholders"""
+        pytest.importorskip('asyncpg')
+        from async_postgresql_scanner import AsyncPostgreSQLScanner
+
+        class FakePool:
+            def __init__(self, results):
+                self.results = list(results)
+                self.fetched = []
+
+            async def fetch(self, query, *args):
+                self.fetched.append((query, args))
+                return self.results.pop(0)
+
+        scanner = object.__new__(AsyncPostgreSQLScanner)
+        scanner.schema = 'public'
+        scanner.pool = FakePool([rows(1), rows(3)])
+        plan = {'strategy': 'bernoulli', 'row_estimate': 100000, 'sample_percent': 1.0}
+
+        sampled = asyncio.run(scanner._fetch_sample_rows('khach_hang', ['id', 'ho_ten'], 3, plan))
+
+        expected_query = TABLESAMPLE_SQL.format(method='BERNOULLI').replace('(%s)', '($1)').replace('LIMIT %s', 'LIMIT $2')
+        assert sampled == rows(3)
+        assert scanner.pool.fetched == [(expected_query, (1.0, 3)), (expected_query, (2.0, 3))]
+
+
+class TestExtractTableSample:
+    """Test multi-column sampling: filtering, de-duplication and row alignment"""
+
+    def test_postgresql_filters_and_aligns_columns(self):
+        """Filtered, de-duplicated columns are queried once and split row by row"""
+        scanner = postgresql_scanner([[(50,)], rows(3)])
+
+        sample = scanner.extract_table_sample('khach_hang', REQUESTED_COLUMNS, 3, filter_config=EXCLUDE_PASSWORDS)
+
+        query, params = scanner.connection.cursor_obj.executed[-1]
+        assert query == "SELECT id, ho_ten FROM public.khach_hang ORDER BY random() LIMIT %s"
+        assert params == (3,)
+        assert sample == {'id': [0, 1, 2], 'ho_ten': ['Nguyễn Văn 0', 'Nguyễn Văn 1', 'Nguyễn Văn 2']}
+        assert scanner.last_sampling_plan['strategy'] == 'random'
+
+    def test_postgresql_empty_result(self):
+        """An empty table gives an empty list per column"""
+        scanner = postgresql_scanner([[(0,)], []])
+
+        sample = scanner.extract_table_sample('khach_hang', REQUESTED_COLUMNS, 3, filter_config=EXCLUDE_PASSWORDS)
+
+        assert sample == {'id': [], 'ho_ten': []}
+
+    def test_postgresql_all_columns_filtered(self):
+        """No query runs when the filter removes every column"""
+        scanner = postgresql_scanner([])
+        only_missing_column = ColumnFilterConfig(mode=FilterMode.INCLUDE, column_patterns=['mat_khau_cu'])
+
+        assert scanner.extract_table_sample('khach_hang', REQUESTED_COLUMNS, 3, filter_config=only_missing_column) == {}
+        assert scanner.connection.cursor_obj.executed == []
+
+    def test_mysql_filters_and_aligns_columns(self):
+        """MySQL samples the same way; an empty table gives empty lists"""
+        pytest.importorskip('pymysql')
+        from mysql_scanner import MySQLScanner
+
+        scanner = object.__new__(MySQLScanner)
+        scanner.connection = ScriptedConnection([[(50,)], rows(2), [(0,)], []])
+
+        sample = scanner.extract_table_sample('khach_hang', REQUESTED_COLUMNS, 2, filter_config=EXCLUDE_PASSWORDS)
+        empty = scanner.extract_table_sample('khach_hang', REQUESTED_COLUMNS, 2, filter_config=EXCLUDE_PASSWORDS)
+
+        executed = scanner.connection.cursor_obj.executed
+        assert executed[1] == ("SELECT id, ho_ten FROM khach_hang ORDER BY RAND() LIMIT %s", [2])
+        assert executed[3] == ("SELECT id, ho_ten FROM khach_hang LIMIT %s", [2])
+        assert sample == {'id': [0, 1], 'ho_ten': ['Nguyễn Văn 0', 'Nguyễn Văn 1']}
+        assert empty == {'id': [], 'ho_ten': []}
+
+    def test_mongodb_filters_and_aligns_fields(self):
+        """MongoDB projects the filtered fields once; missing fields are None; empty gives empty lists"""
+        pytest.importorskip('pymongo')
+        from mongodb_scanner import MongoDBScanner
+
+        documents = [{'id': 1, 'ho_ten': 'Nguyễn Văn An'}, {'id': 2}]
+        scanner = object.__new__(MongoDBScanner)
+        scanner.db = {'khach_hang': FakeCollection(documents), 'trong': FakeCollection([])}
+
+        sample = scanner.extract_collection_sample('khach_hang', REQUESTED_COLUMNS, 10, filter_config=EXCLUDE_PASSWORDS)
+        empty = scanner.extract_collection_sample('trong', REQUESTED_COLUMNS, 10, filter_config=EXCLUDE_PASSWORDS)
+
+        assert scanner.db['khach_hang'].pipelines[0][1] == {"$project": {'id': 1, 'ho_ten': 1}}
+        assert sample == {'id': [1, 2], 'ho_ten': ['Nguyễn Văn An', None]}
+        assert scanner.db['trong'].found == ({}, {'id': 1, 'ho_ten': 1})
+        assert empty == {'id': [], 'ho_ten': []}
+
+
+class TestMySQLPrimaryKeyRange:
+    """Test MySQL primary-key range sampling"""
+
+    @pytest.fixture
+    def mysql_scanner_class(self):
+        pytest.importorskip('pymysql')
+        from mysql_scanner import MySQLScanner
+        return MySQLScanner
+
+    def scanner(self, scanner_class, results):
+        scanner = object.__new__(scanner_class)
+        scanner.connection = ScriptedConnection(results)
+        return scanner
+
+    def test_overlapping_ranges_are_deduplicated(self, mysql_scanner_class):
+        """Rows repeated by overlapping ranges are kept once, without the key column"""
+        keyed_rows = [(1, 'An'), (2, 'Binh'), (2, 'Binh'), (3, 'Chau'), (3, 'Chau'), (4, 'Dung'), (5, 'Em')]
+        scanner = self.scanner(mysql_scanner_class, [[(1, 1000)], keyed_rows])
+        plan = {'strategy': 'pk_range', 'row_estimate': 50000, 'primary_key': 'id'}
+
+        sampled = scanner._fetch_sample_rows('khach_hang', ['ho_ten'], 4, plan)
+
+        assert sampled == [('An',), ('Binh',), ('Chau',), ('Dung',)]
+        query, params = scanner.connection.cursor_obj.executed[1]
+        assert query.count(' UNION ALL ') == 3
+        assert query.startswith("(SELECT id AS sample_key, ho_ten FROM khach_hang WHERE id >= %s ORDER BY id LIMIT %s)")
+        starts = params[::2]
+        assert starts == sorted(starts) and all(1 <= start <= 1000 for start in starts)
+        assert params[1::2] == [1] * 4
+
+    def test_distinct_subset_uses_union(self, mysql_scanner_class):
+        """distinct=True drops repeated rows on the server"""
+        scanner = self.scanner(mysql_scanner_class, [[(1, 1000)]])
+        plan = {'strategy': 'pk_range', 'row_estimate': 50000, 'primary_key': 'id'}
+
+        query, _ = scanner._sample_subset_query(
+            scanner.connection.cursor_obj, 'khach_hang', ['ho_ten'], 100, plan, distinct=True
+        )
+
+        assert ' UNION ALL ' not in query
+        assert query.count(' UNION ') == ScanConfig.PK_RANGE_SAMPLE_SEGMENTS - 1
+
+    def test_empty_table_returns_no_rows(self, mysql_scanner_class):
+        """MIN/MAX of an empty table yields no subset and no sampling query"""
+        scanner = self.scanner(mysql_scanner_class, [[(None, None)]])
+        plan = {'strategy': 'pk_range', 'row_estimate': 50000, 'primary_key': 'id'}
+
+        cursor = scanner.connection.cursor_obj
+        assert scanner._sample_subset_query(cursor, 'khach_hang', ['ho_ten'], 4, plan) is None
+
+        scanner = self.scanner(mysql_scanner_class, [[(None, None)]])
+        assert scanner._fetch_sample_rows('khach_hang', ['ho_ten'], 4, plan) == []
+        assert len(scanner.connection.cursor_obj.executed) == 1
+
+
+class FakeCollection:
+    """pymongo collection stand-in recording aggregate pipelines"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.pipelines = []
+
+    def estimated_document_count(self):
+        return len(self.documents)
+
+    def find(self, query, projection):
+        self.found = (query, projection)
+        return self
+
+    def limit(self, limit):
+        return iter(self.documents[:limit])
+
+    def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        return iter(self.documents)
+
+
+class TestMongoDBSample:
+    """Test MongoDB $sample sampling"""
+
+    def test_sample_pipeline(self):
+        """Non-empty collections are sampled with $sample then projected"""
+        pytest.importorskip('pymongo')
+        from mongodb_scanner import MongoDBScanner
+
+        collection = FakeCollection([{'ho_ten': 'Nguyễn Văn An', 'email': 'an@example.vn'}, {'ho_ten': 'Lê Nam'}])
+        scanner = object.__new__(MongoDBScanner)
+        scanner.db = {'khach_hang': collection}
+
+        sample = scanner.extract_collection_sample('khach_hang', ['ho_ten', 'email'], 50)
+
+        assert collection.pipelines == [[{"$sample": {"size": 50}}, {"$project": {'ho_ten': 1, 'email': 1}}]]
+        assert sample == {'ho_ten': ['Nguyễn Văn An', 'Lê Nam'], 'email': ['an@example.vn', None]}
+        assert scanner.last_sampling_plan == {'strategy': 'random', 'row_estimate': 2}
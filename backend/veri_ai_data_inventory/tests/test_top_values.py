@@ -0,0 +1,165 @@
+"""
+Unit Tests for Top Value Statistics
+Tests catalog statistics fast paths (pg_stats, MySQL histograms) and their GROUP BY fallbacks.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from config.constants import ScanConfig
+from postgresql_scanner import PostgreSQLScanner
+
+from fixtures import ScriptedConnection
+
+FRESH_SECONDS = 3600.0
+STALE_SECONDS = (ScanConfig.STATS_MAX_AGE_HOURS + 1) * 3600.0
+
+
+def postgresql_scanner(results):
+    """PostgreSQLScanner on a scripted connection (no database)"""
+    scanner = object.__new__(PostgreSQLScanner)
+    scanner.schema = 'public'
+    scanner.connection = ScriptedConnection(results)
+    return scanner
+
+
+def pg_stats_row(modified=10, analyzed_seconds_ago=FRESH_SECONDS):
+    """pg_stats/pg_stat_user_tables row for a 1000-row table"""
+    return (['Hà Nội', 'Đà Nẵng'], [0.5, 0.25], 1000, modified, 1000, analyzed_seconds_ago)
+
+
+class TestPostgreSQLTopValues:
+    """Test pg_stats top values and the GROUP BY fallback"""
+
+    def test_fresh_statistics(self):
+        """Fresh most_common_vals are scaled to the row estimate without scanning"""
+        scanner = postgresql_scanner([[pg_stats_row()]])
+
+        statistics = scanner.get_top_value_statistics('khach_hang', 'tinh_thanh', 5)
+
+        assert statistics == {
+            'top_values': [('Hà Nội', 500), ('Đà Nẵng', 250)],
+            'method': 'pg_stats',
+            'estimated': True,
+            'row_estimate': 1000
+        }
+        assert len(scanner.connection.cursor_obj.executed) == 1
+
+    def test_top_n_truncates_statistics(self):
+        """Only the top_n most common values are returned"""
+        scanner = postgresql_scanner([[pg_stats_row()]])
+
+        assert scanner.get_top_values('khach_hang', 'tinh_thanh', 1) == [('Hà Nội', 500)]
+
+    @pytest.mark.parametrize("stats_rows", [
+        [],
+        [pg_stats_row(modified=int(ScanConfig.STATS_MAX_MODIFIED_RATIO * 1000) + 1)],
+        [pg_stats_row(analyzed_seconds_ago=STALE_SECONDS)],
+    ], ids=['never_analyzed', 'too_many_changes', 'too_old'])
+    def test_stale_statistics_fall_back_to_group_by(self, stats_rows):
+        """Missing or stale statistics are rejected; small tables are counted exactly"""
+        scanner = postgresql_scanner([stats_rows, [(500,)], [('Hà Nội', 300), ('Huế', 200)]])
+
+        statistics = scanner.get_top_value_statistics('khach_hang', 'tinh_thanh', 5)
+
+        query, params = scanner.connection.cursor_obj.executed[-1]
+        assert statistics['method'] == 'full_group_by'
+        assert statistics['estimated'] is False
+        assert statistics['top_values'] == [('Hà Nội', 300), ('Huế', 200)]
+        assert query.startswith("SELECT tinh_thanh::text, COUNT(*)")
+        assert params == (5,)
+
+    def test_sampled_group_by_scales_counts(self):
+        """Large tables aggregate a TABLESAMPLE subset, scaled to the row estimate"""
+        row_estimate = 5000000
+        scanner = postgresql_scanner([[], [(row_estimate,)], [('Hà Nội', 40, 100), ('Huế', 10, 100)]])
+
+        statistics = scanner.get_top_value_statistics('khach_hang', 'tinh_thanh', 5)
+
+        query, params = scanner.connection.cursor_obj.executed[-1]
+        assert statistics['method'] == 'sampled_group_by'
+        assert statistics['top_values'] == [('Hà Nội', 2000000), ('Huế', 500000)]
+        assert "TABLESAMPLE SYSTEM (%s)) sample_rows ORDER BY random() LIMIT %s" in query
+        assert query.startswith("SELECT tinh_thanh::text, COUNT(*)")
+        assert params[1:] == (ScanConfig.TOP_VALUES_SAMPLE_ROWS, 5)
+
+
+def histogram(histogram_type='singleton', age=timedelta(hours=1)):
+    """MySQL 8.0 COLUMN_STATISTICS histogram JSON with base64-encoded string values"""
+    def encode(value):
+        return 'base64:type254:' + base64.b64encode(value.encode('utf-8')).decode('ascii')
+
+    return json.dumps({
+        'histogram-type': histogram_type,
+        'last-updated': (datetime.utcnow() - age).strftime('%Y-%m-%d %H:%M:%S.%f'),
+        'buckets': [[encode('Hà Nội'), 0.6], [encode('Huế'), 1.0]]
+    })
+
+
+class TestMySQLTopValues:
+    """Test MySQL histogram top values and the GROUP BY fallback"""
+
+    @pytest.fixture
+    def scanner_for(self):
+        pytest.importorskip('pymysql')
+        from mysql_scanner import MySQLScanner
+
+        def build(results):
+            scanner = object.__new__(MySQLScanner)
+            scanner.connection = ScriptedConnection(results)
+            return scanner
+        return build
+
+    def test_fresh_histogram(self, scanner_for):
+        """Singleton bucket frequencies are decoded and scaled to the row estimate"""
+        scanner = scanner_for([[(histogram(),)], [(1000,)]])
+
+        statistics = scanner.get_top_value_statistics('khach_hang', 'tinh_thanh', 5)
+
+        assert statistics == {
+            'top_values': [('Hà Nội', 600), ('Huế', 400)],
+            'method': 'histogram',
+            'estimated': True,
+            'row_estimate': 1000
+        }
+
+    @pytest.mark.parametrize("histogram_rows", [
+        [],
+        [(histogram(histogram_type='equi-height'),)],
+        [(histogram(age=timedelta(hours=ScanConfig.STATS_MAX_AGE_HOURS + 1)),)],
+    ], ids=['no_histogram', 'equi_height', 'too_old'])
+    def test_unusable_histogram_falls_back_to_group_by(self, scanner_for, histogram_rows):
+        """Missing, equi-height or stale histograms are rejected; small tables are counted exactly"""
+        scanner = scanner_for([histogram_rows, [(500,)], [('Hà Nội', 300)]])
+
+        statistics = scanner.get_top_value_statistics('khach_hang', 'tinh_thanh', 5)
+
+        query, params = scanner.connection.cursor_obj.executed[-1]
+        assert statistics['method'] == 'full_group_by'
+        assert statistics['top_values'] == [('Hà Nội', 300)]
+        assert query.startswith("SELECT tinh_thanh, COUNT(*)")
+        assert params == (5,)
+
+    def test_sampled_group_by_over_primary_key_ranges(self, scanner_for):
+        """Large tables count a distinct primary-key range subset on the server, scaled to the estimate"""
+        row_estimate = 5000000
+        scanner = scanner_for([
+            [],
+            [(row_estimate,)],
+            [('id', 'bigint')],
+            [(1, row_estimate)],
+            [('Hà Nội', 40, 100)]
+        ])
+
+        statistics = scanner.get_top_value_statistics('khach_hang', 'tinh_thanh', 5)
+
+        query, params = scanner.connection.cursor_obj.executed[-1]
+        assert statistics['method'] == 'sampled_group_by'
+        assert statistics['top_values'] == [('Hà Nội', 2000000)]
+        assert ' UNION ALL ' not in query and ' UNION ' in query
+        assert params[-1] == 5
@@ -0,0 +1,103 @@
+"""
+Unit Tests for VietnameseTextAnalyzer column profiling
+Tests the single-pass profile against known values and the multi-column path.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import pytest
+
+from utils.vietnamese_text_analyzer import VietnameseTextAnalyzer
+
+from bench_column_profiling import LegacyColumnProfiler, generate_tables, run_benchmark
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer with default ScanConfig values"""
+    return VietnameseTextAnalyzer()
+
+
+@pytest.fixture
+def table_columns():
+    """Columnar sample of a Vietnamese customer table"""
+    return {
+        'ho_ten': ['Nguyễn Văn An', 'Trần Thị Bình', None, 'Nguyễn Văn An'] * 40,
+        'so_dien_thoai': ['0912345678', '84987654321', '0912345678', None] * 40,
+        'email': ['an@example.com', 'binh@example.vn', 'an@example.com'] * 50,
+        'ma_khach_hang': list(range(150)),
+        'trang_thai': [None] * 20,
+        'rong': []
+    }
+
+
+class TestProfileTextSamples:
+    """Test single-column profile statistics"""
+
+    def test_profile_statistics(self, analyzer):
+        """Profile counts nulls, lengths and character ratios"""
+        profile = analyzer.profile_text_samples(['123', 'abc', 'Hà Nội', None, '123'])
+
+        assert profile['total_count'] == 5
+        assert profile['null_count'] == 1
+        assert profile['unique_count'] == 3
+        assert profile['min_length'] == 3
+        assert profile['max_length'] == 6
+        assert profile['avg_length'] == 3.75
+        assert profile['numeric_ratio'] == 0.5
+        assert profile['alphanumeric_ratio'] == 0.75
+        assert profile['vietnamese_ratio'] == 0.25
+        assert profile['top_values'][0] == ('123', 2)
+
+    def test_suggest_data_type(self, analyzer):
+        """Type suggestion uses the shared profile counts"""
+        assert analyzer.suggest_data_type(['Nguyễn Văn An', 'Lê Thị Hoa']) == 'vietnamese_text'
+        assert analyzer.suggest_data_type(['an@example.com', 'x@y.vn']) == 'email'
+        assert analyzer.suggest_data_type(['0912+345678', '84912345678']) == 'phone'
+        assert analyzer.suggest_data_type([]) == 'unknown'
+
+
+class TestProfileTable:
+    """Test multi-column profiling"""
+
+    def test_matches_single_column_methods(self, analyzer, table_columns):
+        """Table profile produces the same dicts as per-column calls"""
+        results = analyzer.profile_table(table_columns)
+
+        assert list(results) == list(table_columns)
+        for column_name, samples in table_columns.items():
+            assert results[column_name]['profile'] == analyzer.profile_text_samples(samples)
+            assert results[column_name]['quality'] == analyzer.analyze_column_quality(column_name, samples)
+
+    def test_suggested_types(self, analyzer, table_columns):
+        """Suggested types per column"""
+        results = analyzer.profile_table(table_columns)
+        suggested = {name: result['quality']['suggested_type'] for name, result in results.items()}
+
+        assert suggested['ho_ten'] == 'vietnamese_text'
+        assert suggested['so_dien_thoai'] == 'numeric'
+        assert suggested['email'] == 'email'
+        assert suggested['trang_thai'] == 'unknown'
+
+
+class TestProfilingBenchmark:
+    """Test profile_table against the legacy per-column path (bench_column_profiling)"""
+
+    def test_matches_legacy_results(self, analyzer):
+        """Single-pass profiles agree with the legacy per-column statistics"""
+        for table in generate_tables(5):
+            legacy = LegacyColumnProfiler().profile_table(table)
+            results = analyzer.profile_table(table)
+            for column_name, expected in legacy.items():
+                profile = results[column_name]['profile']
+                quality = results[column_name]['quality']
+                for key, value in expected['profile'].items():
+                    assert profile[key] == value, (column_name, key)
+                for key, value in expected['quality'].items():
+                    assert quality[key] == value, (column_name, key)
+
+    def test_faster_than_legacy(self):
+        """profile_table profiles a table several times faster than per-column calls"""
+        result = run_benchmark(table_count=30, repeat=3)
+
+        assert result['speedup'] > 2
@@ -0,0 +1,161 @@
+"""
+Unit Tests for the Distributed Scan Work Queue
+Tests leases, visibility timeouts, retries and scan workers on the SQLite queue.
+
+Author: VeriSyntra AI Data Inventory Team
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+import scanner_manager.work_queue as work_queue_module
+from config.constants import APIConfig, WorkQueueConfig
+from scanner_manager.work_queue import (
+    UNIT_ITEMS,
+    UNIT_PLAN,
+    SQLiteWorkQueue,
+    create_work_queue,
+    new_unit
+)
+from services.scan_service import ScanService
+from services.scan_worker import ScanWorker
+
+from fixtures import build_tree
+
+
+@pytest.fixture
+def queue(tmp_path):
+    work_queue = SQLiteWorkQueue(str(tmp_path / 'queue.sqlite'))
+    yield work_queue
+    work_queue.close()
+
+
+def submit_plan(queue, job_id='job-1'):
+    queue.submit_job(job_id, {'tenant_id': str(uuid4())}, [new_unit(UNIT_PLAN, {'scan': {}})])
+
+
+class TestLeases:
+    """Test lease, ack and visibility timeouts"""
+
+    def test_plan_fans_out_and_completes_job(self, queue):
+        """A plan ack enqueues its units; the job completes when all are acked"""
+        submit_plan(queue)
+        plan = queue.lease('w1')
+        assert queue.lease('w2') is None
+
+        assert queue.ack(plan, new_units=[new_unit(UNIT_ITEMS, {'prefix': p}) for p in ('a/', 'b/')])
+        assert queue.get_job('job-1')['status'] == APIConfig.STATUS_RUNNING
+
+        first, second = queue.lease('w1'), queue.lease('w2')
+        assert {first['payload']['prefix'], second['payload']['prefix']} == {'a/', 'b/'}
+        queue.ack(first, {'assets': [], 'count': 3})
+        queue.ack(second, {'assets': [], 'count': 4})
+
+        job = queue.get_job('job-1')
+        assert job['status'] == APIConfig.STATUS_COMPLETED
+        assert (job['units_total'], job['units_done'], job['units_pending']) == (3, 3, 0)
+        assert [result['count'] for _, result in queue.read_results('job-1')] == [3, 4]
+        assert queue.read_results('job-1', after=queue.read_results('job-1')[0][0])[0][1]['count'] == 4
+
+    def test_expired_lease_is_reclaimed(self, queue):
+        """A unit whose lease expires goes to another worker; the old holder's ack is rejected"""
+        submit_plan(queue)
+        stale = queue.lease('w1', visibility_timeout=0.01)
+        time.sleep(0.02)
+
+        reclaimed = queue.lease('w2')
+        assert reclaimed['unit_id'] == stale['unit_id'] and reclaimed['attempts'] == 2
+        assert queue.extend(stale) is False
+        assert queue.ack(stale) is False
+        assert queue.ack(reclaimed) is True
+
+    def test_failed_unit_retries_then_dead_letters(self, queue, monkeypatch):
+        """Failures back off and retry; the last attempt dead-letters the unit"""
+        monkeypatch.setattr(WorkQueueConfig, 'RETRY_DELAY_SECONDS', 0.0)
+        submit_plan(queue)
+        plan = queue.lease('w1')
+        queue.ack(plan, new_units=[new_unit(UNIT_ITEMS, {}), new_unit(UNIT_ITEMS, {})])
+
+        states = []
+        lease = queue.lease('w1')
+        ok = queue.lease('w1')
+        queue.ack(ok, {'assets': [], 'count': 1})
+        while lease is not None:
+            states.append(queue.fail(lease, 'khong doc duoc'))
+            lease = queue.lease('w1')
+
+        job = queue.get_job('job-1')
+        assert states == ['pending'] * (WorkQueueConfig.MAX_ATTEMPTS - 1) + ['dead']
+        assert job['status'] == APIConfig.STATUS_COMPLETED and job['units_failed'] == 1
+        assert job['errors'] == ['khong doc duoc']
+        assert queue.get_statistics()['dead'] == 1
+
+    def test_retry_waits_for_backoff(self, queue, monkeypatch):
+        """A failed unit is not leased again before its retry delay"""
+        monkeypatch.setattr(WorkQueueConfig, 'RETRY_DELAY_SECONDS', 60.0)
+        submit_plan(queue)
+        queue.fail(queue.lease('w1'), 'tam thoi')
+
+        assert queue.lease('w1') is None
+        assert queue.get_statistics()['pending'] == 1
+
+    def test_failed_plan_fails_job(self, queue, monkeypatch):
+        """A job whose plan unit is dead-lettered fails"""
+        monkeypatch.setattr(WorkQueueConfig, 'MAX_ATTEMPTS', 1)
+        submit_plan(queue)
+        assert queue.fail(queue.lease('w1'), 'ket noi that bai') == 'dead'
+        assert queue.get_job('job-1')['status'] == APIConfig.STATUS_FAILED
+
+    def test_cancel_drops_pending_units(self, queue):
+        """Cancelled jobs lose pending units and get no new ones"""
+        submit_plan(queue)
+        plan = queue.lease('w1')
+        assert queue.cancel_job('job-1') and queue.is_cancelled('job-1')
+
+        queue.ack(plan, new_units=[new_unit(UNIT_ITEMS, {})])
+        assert queue.lease('w1') is None
+        assert queue.get_job('job-1')['status'] == APIConfig.STATUS_CANCELLED
+
+    def test_unknown_backend(self):
+        """Unsupported backends are rejected"""
+        with pytest.raises(ValueError):
+            create_work_queue('rabbitmq')
+
+
+class TestScanWorkers:
+    """Test a queued filesystem scan run by workers and read back by the API"""
+
+    def test_queued_scan_survives_api_restart(self, tmp_path, queue, monkeypatch):
+        """Workers scan each subtree once; a fresh API node rebuilds the job from the queue"""
+        root = tmp_path / 'chia_se'
+        root.mkdir()
+        build_tree(root)
+        monkeypatch.setattr(work_queue_module, '_work_queue_instance', queue)
+        monkeypatch.setattr(WorkQueueConfig, 'EXECUTION_MODE', 'queue')
+        api = ScanService()
+        scan_job_id, tenant_id = uuid4(), uuid4()
+
+        async def run():
+            config = {'filesystem_type': 'local_filesystem', 'root_path': str(root)}
+            await api.create_scan_job(scan_job_id, tenant_id, 'filesystem', config)
+            await api.enqueue_scan(scan_job_id, tenant_id, 'filesystem', config)
+
+            workers = [ScanWorker(queue, ScanService(), f'w{index}', 1) for index in range(2)]
+            while any([await worker.process_one() for worker in workers]):
+                pass
+
+            # API restart: job state lost, queue kept
+            api.job_state_manager.delete_job(scan_job_id)
+            return await ScanService().get_scan_status(scan_job_id)
+
+        status = asyncio.run(run())
+
+        paths = [asset['asset_path'] for asset in status['discovered_assets']]
+        assert status['status'] == APIConfig.STATUS_COMPLETED
+        assert status['total_assets'] == len(paths) == len(set(paths)) == 8
+        assert status['tenant_id'] == str(tenant_id)
+        # Plan unit plus root files and two subdirectories
+        assert queue.get_job(str(scan_job_id))['units_total'] == 4
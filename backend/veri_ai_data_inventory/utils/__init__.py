@@ -5,9 +5,31 @@ UTF-8 validation, pattern detection, and text analysis
 from .utf8_validator import UTF8Validator
 from .enhanced_pattern_detector import EnhancedPatternDetector
 from .vietnamese_text_analyzer import VietnameseTextAnalyzer
+from .streaming_sampler import (
+    ReservoirSampler,
+    HyperLogLog,
+    SpaceSavingTopK,
+    StreamingColumnSampler
+)
+from .catalog_discovery import group_catalog_rows, iter_batches
+from .cancellation import CancellationToken, ScanCancelledError
+from .resumable_walk import relative_parts, scandir_walk
+from .text_extraction import ExtractorUnavailableError, iter_file_text
 
 __all__ = [
     'UTF8Validator',
     'EnhancedPatternDetector',
-    'VietnameseTextAnalyzer'
+    'VietnameseTextAnalyzer',
+    'ReservoirSampler',
+    'HyperLogLog',
+    'SpaceSavingTopK',
+    'StreamingColumnSampler',
+    'group_catalog_rows',
+    'iter_batches',
+    'CancellationToken',
+    'ScanCancelledError',
+    'relative_parts',
+    'scandir_walk',
+    'ExtractorUnavailableError',
+    'iter_file_text'
 ]
@@ -0,0 +1,130 @@
+"""
+VeriSyntra Scan Cancellation
+
+Cooperative cancellation token with an optional deadline.
+Scanners check the token between tables, pages or directories and stop early,
+returning partial results; callbacks interrupt in-flight driver calls.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Cancellation reasons reported with partial results
+REASON_CANCELLED = 'cancelled'
+REASON_TIMEOUT = 'timeout'
+
+
+class ScanCancelledError(Exception):
+    """Raised by raise_if_cancelled() when a scan was cancelled or hit its deadline"""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Scan stopped: {reason}")
+        self.reason = reason
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag with an optional deadline.
+
+    When the deadline passes the token cancels itself with reason 'timeout'.
+    Callbacks run once, on the cancelling thread, e.g. to abort a running query.
+    """
+
+    def __init__(self, timeout_seconds: Optional[float] = None):
+        """
+        Initialize token.
+
+        Args:
+            timeout_seconds: Deadline relative to now (None for no deadline)
+        """
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.reason: Optional[str] = None
+        self.deadline: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+
+        if timeout_seconds is not None:
+            self.deadline = time.monotonic() + timeout_seconds
+            self._timer = threading.Timer(timeout_seconds, self.cancel, args=(REASON_TIMEOUT,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True once cancelled or past the deadline"""
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel(REASON_TIMEOUT)
+            return True
+        return False
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None without a deadline)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def cancel(self, reason: str = REASON_CANCELLED) -> bool:
+        """
+        Cancel the token and run callbacks (first call wins).
+
+        Args:
+            reason: 'cancelled' or 'timeout'
+
+        Returns:
+            True if this call cancelled the token
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        if self._timer is not None:
+            self._timer.cancel()
+
+        logger.info(f"[OK] Scan cancellation requested ({reason})")
+        for callback in callbacks:
+            self._run_callback(callback)
+        return True
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Run callback on cancellation (immediately if already cancelled)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        self._run_callback(callback)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise ScanCancelledError if the token is cancelled"""
+        if self.is_cancelled:
+            raise ScanCancelledError(self.reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or timeout; returns is_cancelled"""
+        self._event.wait(timeout)
+        return self.is_cancelled
+
+    def close(self) -> None:
+        """Stop the deadline timer and drop callbacks once the scan has finished"""
+        if self._timer is not None:
+            self._timer.cancel()
+        with self._lock:
+            self._callbacks = []
+
+    @staticmethod
+    def _run_callback(callback: Callable[[], None]) -> None:
+        """Run a callback, logging failures (cancellation must not raise)"""
+        try:
+            callback()
+        except Exception as e:
+            logger.warning(f"[WARNING] Cancellation callback failed: {str(e)}")
+
@@ -0,0 +1,116 @@
+"""
+Streaming catalog discovery helpers for veri-ai-data-inventory
+Groups ordered information_schema column rows into table dicts on the fly
+and batches tables, files and objects so discovery memory stays bounded on large sources
+"""
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Row layout produced by the scanners' bulk catalog queries
+CATALOG_ROW_FIELDS = (
+    'table_name', 'column_name', 'data_type', 'is_nullable',
+    'ordinal_position', 'row_estimate', 'size_bytes', 'is_primary_key'
+)
+
+
+def build_catalog_table(table_name: str, rows: Iterable[Sequence[Any]], schema: str) -> Dict[str, Any]:
+    """
+    Builds one table dict from its catalog rows.
+
+    Args:
+        table_name: Table the rows belong to
+        rows: Rows in CATALOG_ROW_FIELDS order, sorted by ordinal position
+        schema: Schema/database the table belongs to
+
+    Returns:
+        {'table_name', 'full_name', 'columns': [{'column_name', ...}], 'column_count',
+         'row_count', 'row_estimate', 'size_bytes', 'primary_key'}
+    """
+    columns = []
+    row_estimate = -1
+    size_bytes = None
+    for _, column_name, data_type, is_nullable, ordinal, estimate, size, is_pk in rows:
+        columns.append({
+            'column_name': column_name,
+            'data_type': data_type,
+            'is_nullable': bool(is_nullable),
+            'ordinal_position': ordinal,
+            'is_primary_key': bool(is_pk)
+        })
+        row_estimate = -1 if estimate is None else int(estimate)
+        size_bytes = size
+
+    return {
+        'table_name': table_name,
+        'full_name': f"{schema}.{table_name}",
+        'columns': columns,
+        'column_count': len(columns),
+        'row_count': max(row_estimate, 0),
+        'row_estimate': row_estimate,
+        'size_bytes': size_bytes,
+        'primary_key': [col['column_name'] for col in columns if col['is_primary_key']]
+    }
+
+
+def group_catalog_rows(rows: Iterable[Sequence[Any]], schema: str) -> Iterator[Dict[str, Any]]:
+    """
+    Groups catalog rows ordered by (table_name, ordinal_position) into table dicts.
+
+    Only one table's columns are held in memory at a time.
+
+    Args:
+        rows: Rows in CATALOG_ROW_FIELDS order, sorted by table name
+        schema: Schema/database the rows belong to
+
+    Returns:
+        Iterator of table dicts in the shape ScanService expects (see build_catalog_table)
+    """
+    for table_name, table_rows in groupby(rows, key=itemgetter(0)):
+        yield build_catalog_table(table_name, table_rows, schema)
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Splits an iterable into lists of at most batch_size items.
+
+    Args:
+        items: Any iterable (consumed lazily)
+        batch_size: Maximum items per batch (must be positive)
+
+    Returns:
+        Iterator of non-empty lists
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def summarize_discovered_items(items_key: str, items: Iterable[Dict[str, Any]], cancel_token: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    Materializes streamed files/objects into the discover_*() result shape.
+
+    Args:
+        items_key: Result key for the items ('files', 'objects' or 'blobs')
+        items: Item dicts with 'size' and 'is_vietnamese_filename'
+        cancel_token: CancellationToken the stream was checked against (optional)
+
+    Returns:
+        {items_key: [...], 'total_size', 'total_count', 'vietnamese_filename_count',
+         'partial', 'cancel_reason'}
+    """
+    items = list(items)
+    partial = cancel_token is not None and cancel_token.is_cancelled
+    return {
+        items_key: items,
+        'total_size': sum(item.get('size') or 0 for item in items),
+        'total_count': len(items),
+        'vietnamese_filename_count': sum(1 for item in items if item.get('is_vietnamese_filename')),
+        'partial': partial,
+        'cancel_reason': cancel_token.reason if partial else None
+    }
@@ -0,0 +1,134 @@
+"""
+Resumable Directory Walk
+
+Deterministic os.scandir walk (sorted directories and files) that can restart
+after a file cursor. Completed subtrees are pruned without being listed again:
+only the directories on the cursor's path are re-read.
+
+Directories ahead of the walk are listed in parallel by a bounded thread pool
+(network shares spend most of a listing waiting on round trips), while entries
+are still emitted in the deterministic order the cursor relies on. File stat
+results come from the listing's DirEntry objects, so a file costs no extra
+stat call where the platform returns them with the listing (Windows, SMB).
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# Flexible import pattern for package and standalone execution
+try:
+    from ..config import FilesystemConfig
+except ImportError:
+    from config import FilesystemConfig
+
+logger = logging.getLogger(__name__)
+
+
+def relative_parts(root: Path, path: Path) -> List[str]:
+    """Path components of path relative to root (the walk cursor format)"""
+    return list(path.relative_to(root).parts)
+
+
+def _list_directory(path: str, follow_symlinks: bool) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+    """
+    List a directory: (files, subdirectories), both sorted by name.
+
+    File stat results are fetched here (in the worker thread) and cached on
+    the DirEntry. Unreadable directories are skipped like os.walk does.
+    """
+    files: List[os.DirEntry] = []
+    directories: List[os.DirEntry] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_directory = entry.is_dir()
+                except OSError:
+                    is_directory = False
+                if is_directory:
+                    # Like os.walk: symlinked directories are only entered when following links
+                    if follow_symlinks or not entry.is_symlink():
+                        directories.append(entry)
+                    continue
+                try:
+                    entry.stat()
+                except OSError:
+                    # Reported by the caller when it reads the entry
+                    pass
+                files.append(entry)
+    except OSError as e:
+        logger.warning(f"[WARNING] Cannot list directory {path}: {str(e)}")
+    files.sort(key=lambda entry: entry.name)
+    directories.sort(key=lambda entry: entry.name)
+    return files, directories
+
+
+def scandir_walk(
+    root: Path,
+    after: Optional[Sequence[str]] = None,
+    max_depth: Optional[int] = None,
+    follow_symlinks: bool = False,
+    workers: Optional[int] = None
+) -> Iterator[Tuple[str, List[str], List[os.DirEntry]]]:
+    """
+    Walk root top-down in sorted order, skipping everything up to a cursor.
+
+    Files of a directory are emitted before its subdirectories, so for a cursor
+    (d1, ..., dk, filename): directories on the cursor path drop their files
+    (already emitted) and subdirectories sorting before the next path component;
+    the cursor directory drops files up to and including filename.
+
+    Directories at max_depth are not descended into; deeper directories are
+    never listed.
+
+    Args:
+        root: Walk root
+        after: Relative path parts of the last emitted file (None: full walk)
+        max_depth: Deepest directory level whose files are emitted (root = 0; None: unlimited)
+        follow_symlinks: Follow symbolic links to directories
+        workers: Threads listing directories ahead of the walk (default: FilesystemConfig.WALK_WORKERS)
+
+    Returns:
+        Iterator of (dirpath, relative path parts of dirpath, file DirEntry objects);
+        closing the iterator stops pending listings
+    """
+    after = list(after) if after else None
+    cursor_dirs = after[:-1] if after else None
+    workers = workers or FilesystemConfig.WALK_WORKERS
+    # Listings kept ahead of the walk (bounds memory of prefetched directories)
+    prefetch = max(FilesystemConfig.WALK_PREFETCH_DIRECTORIES, workers)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scandir-walk')
+    # Directories still to emit, next one last: [path, parts, listing future]
+    stack: List[list] = [[os.fspath(root), [], None]]
+    try:
+        while stack:
+            # List the next directories in walk order while this one is processed
+            pending = 0
+            for item in reversed(stack):
+                if item[2] is None:
+                    item[2] = executor.submit(_list_directory, item[0], follow_symlinks)
+                pending += 1
+                if pending >= prefetch:
+                    break
+
+            dirpath, parts, listing = stack.pop()
+            files, directories = listing.result()
+            depth = len(parts)
+
+            if cursor_dirs is not None and depth < len(cursor_dirs) and parts == cursor_dirs[:depth]:
+                # Ancestor of the cursor directory: files done, earlier subtrees done
+                files = []
+                directories = [entry for entry in directories if entry.name >= cursor_dirs[depth]]
+            elif cursor_dirs is not None and parts == cursor_dirs:
+                files = [entry for entry in files if entry.name > after[-1]]
+
+            if max_depth is None or depth < max_depth:
+                stack.extend([entry.path, parts + [entry.name], None] for entry in reversed(directories))
+
+            yield dirpath, parts, files
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
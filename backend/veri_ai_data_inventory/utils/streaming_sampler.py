@@ -0,0 +1,451 @@
+"""
+Streaming sketch-based column sampler for very large columns
+Uses dynamic configuration from ScanConfig
+Zero hard-coding - all operational values from centralized config
+
+Consumes column values from an iterator or DB-API cursor in bounded memory:
+- ReservoirSampler: uniform random sample (Algorithm L, skips most values)
+- HyperLogLog: distinct-count estimate
+- SpaceSavingTopK: heavy hitters with bounded counters
+- Null count
+
+Hashes use Python's hash() of the value text (salted per process), so
+HyperLogLog sketches are only mergeable within the same process.
+"""
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
+import heapq
+import logging
+import math
+import random
+
+# Flexible import pattern for package and standalone execution
+try:
+    from ..config import ScanConfig
+except ImportError:
+    from config import ScanConfig
+
+logger = logging.getLogger(__name__)
+
+_MASK64 = (1 << 64) - 1
+
+
+def _hash64(value: Hashable) -> int:
+    """
+    Well-mixed 64-bit hash of a value
+
+    str hashes are SipHash; other types (ints hash to themselves) are hashed
+    through their repr so HyperLogLog registers are evenly spread.
+    """
+    return hash(value if type(value) is str else repr(value)) & _MASK64
+
+
+def _hashable_key(value: Any) -> Hashable:
+    """Value itself if hashable, otherwise its text form"""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return str(value)
+
+
+class ReservoirSampler:
+    """Uniform reservoir sample of a stream (Li's Algorithm L)"""
+
+    def __init__(self, size: int, rng: Optional[random.Random] = None):
+        """
+        Initialize reservoir
+
+        Args:
+            size: Reservoir capacity
+            rng: Random generator (seedable for tests)
+        """
+        if size < 0:
+            raise ValueError("Reservoir size must not be negative")
+
+        self.size = size
+        self.samples: List[Any] = []
+        self.seen = 0
+        self._rng = rng or random.Random()
+        self._weight = 0.0
+        self._next_index = 0
+
+    def add(self, value: Any) -> None:
+        """
+        Offer one value to the reservoir
+
+        Args:
+            value: Stream value
+        """
+        self.seen += 1
+
+        if len(self.samples) < self.size:
+            self.samples.append(value)
+            if len(self.samples) == self.size:
+                self._weight = math.exp(math.log(self._random()) / self.size)
+                self._schedule_next()
+        elif self.size and self.seen == self._next_index:
+            self.samples[self._rng.randrange(self.size)] = value
+            self._weight *= math.exp(math.log(self._random()) / self.size)
+            self._schedule_next()
+
+    def add_many(self, values: List[Any]) -> None:
+        """
+        Offer a batch of values, jumping straight to scheduled replacements
+
+        Args:
+            values: Stream values in order
+        """
+        offset = self.seen
+        end = offset + len(values)
+        fill = min(max(self.size - len(self.samples), 0), len(values))
+
+        for value in values[:fill]:
+            self.add(value)
+
+        if self.size and len(self.samples) == self.size:
+            while self._next_index <= end:
+                self.seen = self._next_index
+                self.samples[self._rng.randrange(self.size)] = values[self.seen - offset - 1]
+                self._weight *= math.exp(math.log(self._random()) / self.size)
+                self._schedule_next()
+
+        self.seen = end
+
+    def _random(self) -> float:
+        """Random float in (0, 1] (log-safe)"""
+        return 1.0 - self._rng.random()
+
+    def _schedule_next(self) -> None:
+        """Compute the stream index of the next replacement"""
+        if self._weight >= 1.0:
+            self._next_index = self.seen + 1
+            return
+        self._next_index = self.seen + math.floor(math.log(self._random()) / math.log(1.0 - self._weight)) + 1
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count estimator over 64-bit hashes"""
+
+    def __init__(self, precision: int = ScanConfig.HLL_PRECISION):  # Dynamic config
+        """
+        Initialize HyperLogLog registers
+
+        Args:
+            precision: Register index bits, 4-18 (from ScanConfig)
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+
+        self.precision = precision
+        self.register_count = 1 << precision
+        self.registers = bytearray(self.register_count)
+        self._rank_bits = 64 - precision
+        self._rank_mask = (1 << self._rank_bits) - 1
+        self._alpha = 0.7213 / (1.0 + 1.079 / self.register_count)
+
+    def add_hash(self, hash_value: int) -> None:
+        """
+        Add a 64-bit hash to the sketch
+
+        Args:
+            hash_value: Well-mixed 64-bit hash (see _hash64)
+        """
+        index = hash_value >> self._rank_bits
+        rank = self._rank_bits - (hash_value & self._rank_mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def add(self, value: Hashable) -> None:
+        """
+        Add a hashable value to the sketch
+
+        Args:
+            value: Hashable value
+        """
+        self.add_hash(_hash64(value))
+
+    def add_many(self, values: Iterable[Hashable]) -> None:
+        """
+        Add many hashable values (inlined hashing and register update)
+
+        Args:
+            values: Hashable values (e.g. distinct keys of a batch)
+        """
+        registers = self.registers
+        rank_bits = self._rank_bits
+        rank_mask = self._rank_mask
+
+        for value in values:
+            # Inlined _hash64
+            hash_value = hash(value if type(value) is str else repr(value)) & _MASK64
+            index = hash_value >> rank_bits
+            rank = rank_bits - (hash_value & rank_mask).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """
+        Merge another sketch into this one (register-wise max)
+
+        Args:
+            other: Sketch with the same precision
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        """
+        Estimate the number of distinct values added
+
+        Returns:
+            Distinct-count estimate (linear counting for small cardinalities)
+        """
+        m = self.register_count
+        estimate = self._alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+
+class SpaceSavingTopK:
+    """
+    Space-Saving heavy hitters with a fixed number of counters
+
+    Updates are applied in weighted batches (mergeable Space-Saving): values
+    not yet tracked enter at the current minimum count, then the summary is
+    trimmed back to capacity. Each estimate overcounts by at most its error,
+    which is bounded by total_count / capacity.
+    """
+
+    def __init__(self, capacity: int = ScanConfig.TOP_K_SKETCH_CAPACITY):  # Dynamic config
+        """
+        Initialize counters
+
+        Args:
+            capacity: Maximum tracked values (from ScanConfig)
+        """
+        if capacity <= 0:
+            raise ValueError("Space-Saving capacity must be positive")
+
+        self.capacity = capacity
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+
+    def add(self, value: Hashable, weight: int = 1) -> None:
+        """
+        Count occurrences of one value (prefer add_counts for streams)
+
+        Args:
+            value: Hashable value
+            weight: Occurrence count to add
+        """
+        self.add_counts({value: weight})
+
+    def add_counts(self, value_counts: Dict[Hashable, int]) -> None:
+        """
+        Merge a batch of exact value counts into the summary
+
+        Args:
+            value_counts: Value -> occurrences in the batch (e.g. Counter)
+        """
+        counts = self.counts
+        errors = self.errors
+        floor = min(counts.values()) if len(counts) >= self.capacity else 0
+
+        for value, weight in value_counts.items():
+            if value in counts:
+                counts[value] += weight
+            else:
+                counts[value] = floor + weight
+                errors[value] = floor
+
+        if len(counts) > self.capacity:
+            kept = heapq.nlargest(self.capacity, counts.items(), key=itemgetter(1))
+            self.counts = dict(kept)
+            self.errors = {value: errors[value] for value in self.counts}
+
+    def top(self, n: int) -> List[Tuple[Hashable, int, int]]:
+        """
+        Get the n most frequent values
+
+        Args:
+            n: Number of values
+
+        Returns:
+            List of (value, estimated_count, max_overestimate)
+        """
+        ranked = heapq.nlargest(n, self.counts.items(), key=itemgetter(1))
+        return [(value, count, self.errors[value]) for value, count in ranked]
+
+
+class StreamingColumnSampler:
+    """Bounded-memory column sampler combining reservoir, HyperLogLog and top-k sketches"""
+
+    def __init__(
+        self,
+        target_size: int = ScanConfig.DEFAULT_SAMPLE_SIZE,  # Dynamic config
+        min_unique_threshold: float = ScanConfig.MIN_UNIQUE_THRESHOLD,  # Dynamic config
+        top_k_capacity: int = ScanConfig.TOP_K_SKETCH_CAPACITY,  # Dynamic config
+        hll_precision: int = ScanConfig.HLL_PRECISION,  # Dynamic config
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize streaming sampler with dynamic configuration
+
+        Args:
+            target_size: Desired sample size (from ScanConfig)
+            min_unique_threshold: Diversity threshold for random sampling (from ScanConfig)
+            top_k_capacity: Space-Saving counters (from ScanConfig)
+            hll_precision: HyperLogLog precision (from ScanConfig)
+            rng: Random generator for the reservoir (seedable for tests)
+        """
+        self.target_size = target_size
+        self.min_unique_threshold = min_unique_threshold
+        self.reservoir = ReservoirSampler(target_size, rng)
+        self.distinct = HyperLogLog(hll_precision)
+        self.top_k = SpaceSavingTopK(max(top_k_capacity, target_size, 1))
+        self.null_count = 0
+        self.total_count = 0
+
+    def update(
+        self,
+        values: Iterable[Any],
+        batch_size: int = ScanConfig.STREAM_FETCH_BATCH_SIZE  # Dynamic config
+    ) -> 'StreamingColumnSampler':
+        """
+        Consume column values
+
+        Args:
+            values: Iterable of column values (None counts as null)
+            batch_size: Values aggregated per sketch update (from ScanConfig)
+
+        Returns:
+            self (for chaining)
+        """
+        iterator = iter(values)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return self
+            self.update_batch(batch)
+
+    def update_from_cursor(
+        self,
+        cursor: Any,
+        batch_size: int = ScanConfig.STREAM_FETCH_BATCH_SIZE,  # Dynamic config
+        column_index: int = 0
+    ) -> 'StreamingColumnSampler':
+        """
+        Consume values from an executed DB-API cursor with fetchmany()
+
+        Args:
+            cursor: Executed DB-API cursor (server-side cursor for huge tables)
+            batch_size: Rows per fetchmany() call (from ScanConfig)
+            column_index: Column position in each row
+
+        Returns:
+            self (for chaining)
+        """
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return self
+            self.update_batch([row[column_index] for row in rows])
+
+    def update_batch(self, batch: List[Any]) -> None:
+        """
+        Consume one batch of column values
+
+        Values are counted per batch first, so HyperLogLog and Space-Saving
+        are updated once per distinct value (weighted) instead of per row.
+
+        Args:
+            batch: Column values (None counts as null)
+        """
+        non_null = [value for value in batch if value is not None]
+        self.total_count += len(batch)
+        self.null_count += len(batch) - len(non_null)
+
+        self.reservoir.add_many(non_null)
+
+        try:
+            batch_counts = Counter(non_null)
+        except TypeError:
+            # Unhashable values (e.g. MongoDB sub-documents) are keyed by text
+            batch_counts = Counter(map(_hashable_key, non_null))
+
+        self.distinct.add_many(batch_counts)
+        self.top_k.add_counts(batch_counts)
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Build sample result from the sketches
+
+        Returns:
+            {
+                'samples': List[Any],
+                'total_count': int,
+                'unique_count': int,     # HyperLogLog estimate
+                'null_count': int,
+                'diversity_score': float,
+                'sampling_strategy': str,
+                'estimated': bool        # Always True (sketch-based)
+            }
+        """
+        non_null_count = self.total_count - self.null_count
+
+        if not non_null_count:
+            return {
+                'samples': [],
+                'total_count': self.total_count,
+                'unique_count': 0,
+                'null_count': self.null_count,
+                'diversity_score': 0.0,
+                'sampling_strategy': 'none',
+                'estimated': True
+            }
+
+        # Estimate cannot exceed non-null values or undercount tracked heavy hitters
+        unique_count = min(
+            max(self.distinct.count(), min(len(self.top_k.counts), non_null_count), 1),
+            non_null_count
+        )
+        diversity_score = unique_count / non_null_count
+
+        if diversity_score >= self.min_unique_threshold:
+            # High diversity: uniform reservoir sample, duplicates removed
+            samples = self._unique_samples(self.reservoir.samples)
+            strategy = 'random_unique'
+        else:
+            # Low diversity: heavy hitters from the Space-Saving sketch
+            samples = [value for value, _, _ in self.top_k.top(self.target_size)]
+            strategy = 'most_common'
+
+        return {
+            'samples': samples,
+            'total_count': self.total_count,
+            'unique_count': unique_count,
+            'null_count': self.null_count,
+            'diversity_score': round(diversity_score, 3),
+            'sampling_strategy': strategy,
+            'estimated': True
+        }
+
+    @staticmethod
+    def _unique_samples(samples: List[Any]) -> List[Any]:
+        """Drop duplicate reservoir values, keeping order"""
+        unique = []
+        seen = set()
+        for value in samples:
+            key = _hashable_key(value)
+            if key not in seen:
+                seen.add(key)
+                unique.append(value)
+        return unique
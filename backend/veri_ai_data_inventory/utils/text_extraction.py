@@ -0,0 +1,226 @@
+"""
+Text Extraction for Content Scanning
+
+Streams the text of discovered files in pieces so PII detection never holds a
+whole document in memory:
+
+- .txt / .log / .csv: incremental UTF-8 decoding of fixed-size reads
+- .json: string keys and values (\\uXXXX escapes decoded), raw text if the
+  file is larger than the budget or not valid JSON
+- .docx / .xlsx: text runs and cell values parsed from the Office Open XML
+  parts with the standard library (no python-docx / openpyxl needed)
+- .pdf: page text through PyMuPDF
+
+Every extractor stops after max_bytes: bytes read for plain text, characters
+extracted for documents (a compressed document can expand far beyond its size).
+"""
+
+import codecs
+import json
+import logging
+import os
+import zipfile
+from typing import Any, Dict, Iterator, List
+from xml.etree import ElementTree
+
+# Flexible import pattern for package and standalone execution
+try:
+    from ..config import ContentScanConfig
+except ImportError:
+    from config import ContentScanConfig
+
+logger = logging.getLogger(__name__)
+
+# Office Open XML namespaces
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+SHEET_NAMESPACE = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+
+class ExtractorUnavailableError(RuntimeError):
+    """The library needed for a file format is not installed"""
+
+
+def _read_decoded(path: str, max_bytes: int, stats: Dict[str, Any]) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    with open(path, 'rb') as f:
+        while stats['bytes_read'] < max_bytes:
+            block = f.read(min(ContentScanConfig.READ_BYTES, max_bytes - stats['bytes_read']))
+            if not block:
+                break
+            stats['bytes_read'] += len(block)
+            text = decoder.decode(block)
+            if text:
+                yield text
+        else:
+            stats['truncated'] = bool(f.read(1))
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def _json_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield key
+            yield from _json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _json_strings(item)
+    elif value is not None and not isinstance(value, bool):
+        # Numbers (phone, CCCD and account numbers are often stored unquoted)
+        yield str(value)
+
+
+def _extract_plain_text(path: str, max_bytes: int, stats: Dict[str, Any]) -> Iterator[str]:
+    yield from _read_decoded(path, max_bytes, stats)
+
+
+def _extract_json(path: str, max_bytes: int, stats: Dict[str, Any]) -> Iterator[str]:
+    if os.path.getsize(path) > max_bytes:
+        # Too large to parse within the budget: scan the raw text
+        yield from _read_decoded(path, max_bytes, stats)
+        return
+    with open(path, 'rb') as f:
+        raw = f.read()
+    stats['bytes_read'] = len(raw)
+    text = raw.decode('utf-8', errors='replace')
+    try:
+        document = json.loads(text)
+    except ValueError:
+        yield text
+        return
+    lines: List[str] = []
+    size = 0
+    for value in _json_strings(document):
+        lines.append(value)
+        size += len(value) + 1
+        if size >= ContentScanConfig.READ_BYTES:
+            yield '\n'.join(lines) + '\n'
+            lines, size = [], 0
+    if lines:
+        yield '\n'.join(lines)
+
+
+def _iter_xml_text(archive: zipfile.ZipFile, member: str, text_tags: set, line_tags: set) -> Iterator[str]:
+    """Text of the given elements of one archive member, a line per line element"""
+    line: List[str] = []
+    with archive.open(member) as stream:
+        for _, element in ElementTree.iterparse(stream, events=('end',)):
+            if element.tag in text_tags and element.text:
+                line.append(element.text)
+            elif element.tag in line_tags:
+                if line:
+                    # Runs of one paragraph or string split words at formatting changes
+                    yield ''.join(line) + '\n'
+                    line = []
+                # Parsed elements are not needed again
+                element.clear()
+    if line:
+        yield ''.join(line) + '\n'
+
+
+def _extract_docx(path: str, max_bytes: int, stats: Dict[str, Any]) -> Iterator[str]:
+    stats['bytes_read'] = os.path.getsize(path)
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        members = ['word/document.xml'] + sorted(
+            name for name in names
+            if name.startswith(('word/header', 'word/footer', 'word/footnotes')) and name.endswith('.xml')
+        )
+        for member in members:
+            if member in names:
+                yield from _iter_xml_text(archive, member, {f'{WORD_NAMESPACE}t'}, {f'{WORD_NAMESPACE}p'})
+
+
+def _extract_xlsx(path: str, max_bytes: int, stats: Dict[str, Any]) -> Iterator[str]:
+    stats['bytes_read'] = os.path.getsize(path)
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        if 'xl/sharedStrings.xml' in names:
+            # Text cells of every sheet
+            yield from _iter_xml_text(
+                archive, 'xl/sharedStrings.xml', {f'{SHEET_NAMESPACE}t'}, {f'{SHEET_NAMESPACE}si'}
+            )
+        # Number and inline string cells (shared string indexes are skipped)
+        for member in sorted(name for name in names if name.startswith('xl/worksheets/') and name.endswith('.xml')):
+            line: List[str] = []
+            with archive.open(member) as stream:
+                for _, element in ElementTree.iterparse(stream, events=('end',)):
+                    if element.tag == f'{SHEET_NAMESPACE}c':
+                        if element.get('t') != 's':
+                            line.extend(
+                                node.text for node in element.iter()
+                                if node.tag in (f'{SHEET_NAMESPACE}v', f'{SHEET_NAMESPACE}t') and node.text
+                            )
+                        element.clear()
+                    elif element.tag == f'{SHEET_NAMESPACE}row':
+                        if line:
+                            yield ' '.join(line) + '\n'
+                            line = []
+                        element.clear()
+            if line:
+                yield ' '.join(line) + '\n'
+
+
+def _extract_pdf(path: str, max_bytes: int, stats: Dict[str, Any]) -> Iterator[str]:
+    try:
+        import fitz
+    except ImportError:
+        raise ExtractorUnavailableError("PyMuPDF package not installed. Install: pip install PyMuPDF")
+    stats['bytes_read'] = os.path.getsize(path)
+    with fitz.open(path) as document:
+        for page in document:
+            yield page.get_text() + '\n'
+
+
+EXTRACTORS = {
+    '.txt': _extract_plain_text,
+    '.log': _extract_plain_text,
+    '.csv': _extract_plain_text,
+    '.json': _extract_json,
+    '.docx': _extract_docx,
+    '.xlsx': _extract_xlsx,
+    '.pdf': _extract_pdf
+}
+
+
+def iter_file_text(path: str, max_bytes: int, stats: Dict[str, Any]) -> Iterator[str]:
+    """
+    Stream the text of a file in pieces.
+
+    Args:
+        path: File path
+        max_bytes: Budget (bytes read for plain text, characters extracted for documents)
+        stats: Updated in place: 'bytes_read' (input bytes consumed) and
+               'truncated' (True if the budget cut the text short)
+
+    Returns:
+        Iterator of text pieces
+
+    Raises:
+        ValueError: If the extension is not supported
+        ExtractorUnavailableError: If the format's library is not installed
+    """
+    extension = os.path.splitext(path)[1].lower()
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise ValueError(f"Unsupported file type for text extraction: {extension}")
+    stats.setdefault('bytes_read', 0)
+    stats.setdefault('truncated', False)
+
+    extracted = 0
+    pieces = extractor(path, max_bytes, stats)
+    try:
+        for text in pieces:
+            if extractor is not _extract_plain_text and extracted + len(text) > max_bytes:
+                stats['truncated'] = True
+                text = text[:max_bytes - extracted]
+            extracted += len(text)
+            if text:
+                yield text
+            if stats['truncated'] and extracted >= max_bytes:
+                return
+    finally:
+        pieces.close()
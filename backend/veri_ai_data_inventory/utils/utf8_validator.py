@@ -5,6 +5,7 @@ Zero hard-coding - all operational values from centralized config
 """
 from typing import List, Dict, Any, Optional
 import logging
+import re
 
 # Flexible import pattern for package and standalone execution
 try:
@@ -36,6 +37,9 @@ class UTF8Validator:
         'Ộ', 'Ơ', 'Ờ', 'Ớ', 'Ở', 'Ỡ', 'Ợ', 'Ù', 'Ú', 'Ủ', 'Ũ',
         'Ụ', 'Ư', 'Ừ', 'Ứ', 'Ử', 'Ữ', 'Ự', 'Ỳ', 'Ý', 'Ỷ', 'Ỹ', 'Ỵ'
     ])
+
+    # Compiled character class over VIETNAMESE_CHARS (C-speed membership scan)
+    VIETNAMESE_CHAR_PATTERN = re.compile('[' + ''.join(sorted(VIETNAMESE_CHARS)) + ']')
     
     def __init__(
         self,
@@ -138,7 +142,11 @@ class UTF8Validator:
         if not isinstance(text, str):
             return False
         
-        return any(char in cls.VIETNAMESE_CHARS for char in text)
+        # ASCII-only text cannot contain Vietnamese diacritics
+        if text.isascii():
+            return False
+        
+        return cls.VIETNAMESE_CHAR_PATTERN.search(text) is not None
     
     def sanitize(self, text: str, replacement: str = '?') -> str:
         """
@@ -3,8 +3,9 @@ VietnameseTextAnalyzer for text profiling and analysis
 Uses dynamic configuration from ScanConfig
 Zero hard-coding - all operational values from centralized config
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
 from collections import Counter
+from itertools import chain, islice
 import logging
 
 # Flexible import pattern for package and standalone execution
@@ -71,13 +72,60 @@ class VietnameseTextAnalyzer:
                 'top_values': List[tuple]
             }
         """
-        # Use dynamic sample size
-        working_samples = [s for s in samples[:max_samples] if s is not None]
-        null_count = len([s for s in samples[:max_samples] if s is None])
+        value_counts, null_count, total_count = self._count_values(samples, max_samples)
+        profile = self._build_profile(value_counts, null_count, total_count)
         
-        if not working_samples:
+        if value_counts:
+            logger.info(
+                f"[OK] Text profile: {profile['unique_count']} unique values, "
+                f"{profile['vietnamese_ratio']:.1%} Vietnamese, diversity: {profile['diversity_score']:.1%}"
+            )
+        
+        return profile
+    
+    def _count_values(
+        self,
+        samples: List[Any],
+        max_samples: int
+    ) -> Tuple[Counter, int, int]:
+        """
+        Count string values in the sample window in a single pass
+        
+        Args:
+            samples: Sample values (None counts as null)
+            max_samples: Maximum samples to analyze
+            
+        Returns:
+            (value_counts, null_count, total_count)
+        """
+        window = samples[:max_samples]
+        non_null = [s for s in window if s is not None]
+        
+        return Counter(map(str, non_null)), len(window) - len(non_null), len(window)
+    
+    def _build_profile(
+        self,
+        value_counts: Counter,
+        null_count: int,
+        total_count: int
+    ) -> Dict[str, Any]:
+        """
+        Build profile dict from value counts
+        
+        Every statistic is computed once per distinct value and weighted by
+        its count, so repeated values (low-diversity columns) cost nothing.
+        
+        Args:
+            value_counts: Counter of string values
+            null_count: Number of None samples
+            total_count: Number of samples in the window
+            
+        Returns:
+            Profile dict (see profile_text_samples)
+        """
+        if not value_counts:
             return {
-                'total_count': len(samples[:max_samples]),
+                'total_count': total_count,
                 'unique_count': 0,
                 'null_count': null_count,
                 'min_length': 0,
@@ -90,56 +138,54 @@ class VietnameseTextAnalyzer:
                 'top_values': []
             }
         
-        # Convert all to strings
-        str_samples = [str(s) for s in working_samples]
-        
-        # Calculate length statistics
-        lengths = [len(s) for s in str_samples]
-        min_length = min(lengths)
-        max_length = max(lengths)
-        avg_length = sum(lengths) / len(lengths)
-        
-        # Calculate character type ratios
-        numeric_count = sum(1 for s in str_samples if s.isdigit())
-        alphanumeric_count = sum(1 for s in str_samples if s.isalnum())
-        vietnamese_count = sum(
-            1 for s in str_samples
-            if self.utf8_validator.contains_vietnamese(s)
-        )
-        
-        numeric_ratio = numeric_count / len(str_samples)
-        alphanumeric_ratio = alphanumeric_count / len(str_samples)
-        vietnamese_ratio = vietnamese_count / len(str_samples)
+        sample_count = sum(value_counts.values())
+        min_length = min(map(len, value_counts))
+        max_length = max(map(len, value_counts))
+        total_length = len(''.join(value_counts.elements()))
         
-        # Calculate diversity score
-        unique_values = set(str_samples)
-        unique_count = len(unique_values)
-        diversity_score = unique_count / len(str_samples)
-        
-        # Get top values using dynamic config
-        value_counts = Counter(str_samples)
-        top_values = value_counts.most_common(self.top_values_count)
-        
-        profile = {
-            'total_count': len(samples[:max_samples]),
+        # Column-level checks first: one str call over all distinct values
+        # settles ID, amount and code columns without a per-value loop
+        joined = ''.join(value_counts)
+        if min_length > 0 and joined.isdigit():
+            numeric_count = alphanumeric_count = sample_count
+        else:
+            numeric_count = 0
+            alphanumeric_count = 0
+            for value, count in value_counts.items():
+                if value.isalnum():
+                    alphanumeric_count += count
+                    # Digit strings are a subset of alphanumeric strings
+                    if value.isdigit():
+                        numeric_count += count
+        
+        # Only non-ASCII values can contain Vietnamese diacritics
+        vietnamese_count = 0
+        if not joined.isascii():
+            vietnamese_pattern = self.utf8_validator.VIETNAMESE_CHAR_PATTERN
+            for value, count in value_counts.items():
+                if not value.isascii() and vietnamese_pattern.search(value):
+                    vietnamese_count += count
+        
+        unique_count = len(value_counts)
+        numeric_ratio = numeric_count / sample_count
+        alphanumeric_ratio = alphanumeric_count / sample_count
+        vietnamese_ratio = vietnamese_count / sample_count
+        diversity_score = unique_count / sample_count
+        
+        return {
+            'total_count': total_count,
             'unique_count': unique_count,
             'null_count': null_count,
             'min_length': min_length,
             'max_length': max_length,
-            'avg_length': round(avg_length, 2),
+            'avg_length': round(total_length / sample_count, 2),
             'numeric_ratio': round(numeric_ratio, 3),
             'alphanumeric_ratio': round(alphanumeric_ratio, 3),
             'vietnamese_ratio': round(vietnamese_ratio, 3),
             'diversity_score': round(diversity_score, 3),
-            'top_values': top_values
+            # Get top values using dynamic config
+            'top_values': value_counts.most_common(self.top_values_count)
         }
-        
-        logger.info(
-            f"[OK] Text profile: {unique_count} unique values, "
-            f"{vietnamese_ratio:.1%} Vietnamese, diversity: {diversity_score:.1%}"
-        )
-        
-        return profile
     
     def is_high_diversity(self, samples: List[str]) -> bool:
         """
@@ -173,6 +219,29 @@ class VietnameseTextAnalyzer:
             return 'unknown'
         
         profile = self.profile_text_samples(samples)
+        str_counts = Counter(s for s in samples if isinstance(s, str))
+        
+        return self._suggest_from_profile(profile, str_counts, len(samples))
+    
+    def _suggest_from_profile(
+        self,
+        profile: Dict[str, Any],
+        str_counts: Counter,
+        sample_count: int
+    ) -> str:
+        """
+        Suggest data type from a computed profile and string value counts
+        
+        Args:
+            profile: Profile dict from _build_profile
+            str_counts: Counter of string samples (email/phone checks)
+            sample_count: Number of samples (ratio denominator)
+            
+        Returns:
+            Suggested data type (see suggest_data_type)
+        """
+        if not sample_count:
+            return 'unknown'
         
         # Vietnamese text if high Vietnamese character ratio
         if profile['vietnamese_ratio'] > 0.3:
@@ -182,17 +251,21 @@ class VietnameseTextAnalyzer:
         if profile['numeric_ratio'] > 0.8:
             return 'numeric'
         
+        email_count = 0
+        phone_count = 0
+        for value, count in str_counts.items():
+            if '@' in value:
+                email_count += count
+            # Vietnamese phone format: 0 or 84 prefix, digits (optional '+')
+            elif value.startswith(('0', '84')) and value.replace('+', '').isdigit():
+                phone_count += count
+        
         # Check for email pattern
-        email_count = sum(1 for s in samples if isinstance(s, str) and '@' in s)
-        if email_count / len(samples) > 0.7:
+        if email_count / sample_count > 0.7:
             return 'email'
         
         # Check for phone pattern (Vietnamese format detection)
-        phone_count = sum(
-            1 for s in samples
-            if isinstance(s, str) and (s.startswith('0') or s.startswith('84')) and s.replace('+', '').isdigit()
-        )
-        if phone_count / len(samples) > 0.7:
+        if phone_count / sample_count > 0.7:
             return 'phone'
         
         # Mixed if high alphanumeric ratio
@@ -224,15 +297,88 @@ class VietnameseTextAnalyzer:
                 'sample_count': int
             }
         """
+        result, _ = self._column_quality(column_name, samples)
+        
+        logger.info(
+            f"[OK] Quality analysis for '{column_name}': "
+            f"quality={result['quality_score']:.1%}, type={result['suggested_type']}"
+        )
+        
+        return result
+    
+    def profile_table(
+        self,
+        columns: Dict[str, List[Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Profile and quality-check many columns of a table together
+        
+        Each column is counted once and the profile, type suggestion and
+        quality score are derived from the same counts.
+        
+        Args:
+            columns: Column name -> sample values (columnar table sample)
+            
+        Returns:
+            {
+                column_name: {
+                    'profile': Dict,  # Same as profile_text_samples(samples)
+                    'quality': Dict   # Same as analyze_column_quality(column_name, samples)
+                }
+            }
+        """
+        results = {}
+        
+        for column_name, samples in columns.items():
+            quality, window_profile = self._column_quality(column_name, samples)
+            
+            # The profile window holds the same non-null values as the quality
+            # window unless nulls push values past the window end
+            window = samples[:ScanConfig.DEFAULT_SAMPLE_SIZE]
+            null_count = window.count(None)
+            if null_count == 0 or len(samples) == len(window):
+                profile = dict(window_profile, total_count=len(window), null_count=null_count)
+            else:
+                profile = self._build_profile(*self._count_values(samples, ScanConfig.DEFAULT_SAMPLE_SIZE))
+            
+            results[column_name] = {'profile': profile, 'quality': quality}
+        
+        logger.info(f"[OK] Profiled {len(results)} columns")
+        
+        return results
+    
+    def _column_quality(
+        self,
+        column_name: str,
+        samples: List[Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Compute column quality with one value count per column
+        
+        The profile and the type suggestion share the same counts instead of
+        re-profiling the samples.
+        
+        Args:
+            column_name: Column name
+            samples: Sample values
+            
+        Returns:
+            (quality dict (see analyze_column_quality), profile of the non-null window)
+        """
         str_samples = [str(s) for s in samples if s is not None]
-        null_count = len([s for s in samples if s is None])
+        null_count = len(samples) - len(str_samples)
         
         completeness = (len(samples) - null_count) / len(samples) if samples else 0
         
-        profile = self.profile_text_samples(str_samples)
+        # Samples are already strings without nulls - count the profile window directly
+        window = str_samples[:ScanConfig.DEFAULT_SAMPLE_SIZE]  # Dynamic config
+        window_counts = Counter(window)
+        profile = self._build_profile(window_counts, 0, len(window))
+        full_counts = window_counts if len(window) == len(str_samples) else Counter(str_samples)
+        
         uniqueness = profile['diversity_score']
         vietnamese_content = profile['vietnamese_ratio']
-        suggested_type = self.suggest_data_type(str_samples)
+        suggested_type = self._suggest_from_profile(profile, full_counts, len(str_samples))
         
         # Calculate quality score (weighted average)
         quality_score = (
@@ -241,7 +387,7 @@ class VietnameseTextAnalyzer:
             (1.0 if vietnamese_content > 0 else 0.5) * 0.3
         )
         
-        result = {
+        quality = {
             'column_name': column_name,
             'completeness': round(completeness, 3),
             'uniqueness': round(uniqueness, 3),
@@ -251,12 +397,7 @@ class VietnameseTextAnalyzer:
             'sample_count': len(samples)
         }
         
-        logger.info(
-            f"[OK] Quality analysis for '{column_name}': "
-            f"quality={quality_score:.1%}, type={suggested_type}"
-        )
-        
-        return result
+        return quality, profile
     
     def extract_smart_sample(
         self,
@@ -333,3 +474,76 @@ class VietnameseTextAnalyzer:
         )
         
         return result
+    
+    def extract_streaming_sample(
+        self,
+        values: Iterable[Any],
+        target_size: int = ScanConfig.DEFAULT_SAMPLE_SIZE  # Dynamic config
+    ) -> Dict[str, Any]:
+        """
+        Extract sample from a value stream in bounded memory
+        
+        Streaming counterpart of extract_smart_sample for columns too large to
+        materialize. Uses a reservoir sample, HyperLogLog distinct estimate and
+        Space-Saving top-k instead of list/set/Counter.
+        
+        Args:
+            values: Iterable of column values (e.g. generator over a server-side cursor)
+            target_size: Desired sample size (from ScanConfig)
+            
+        Returns:
+            Same shape as extract_smart_sample, with estimated unique_count
+            and 'estimated': True
+        """
+        # Lazy import to avoid circular dependency during module loading
+        try:
+            from .streaming_sampler import StreamingColumnSampler
+        except ImportError:
+            from streaming_sampler import StreamingColumnSampler
+        
+        sampler = StreamingColumnSampler(
+            target_size=target_size,
+            min_unique_threshold=self.min_unique_threshold
+        )
+        result = sampler.update(values).result()
+        
+        logger.info(
+            f"[OK] Streamed {result['total_count']} values, extracted {len(result['samples'])} samples "
+            f"using '{result['sampling_strategy']}' strategy (diversity: {result['diversity_score']:.1%})"
+        )
+        
+        return result
+    
+    def extract_sample_for_estimate(
+        self,
+        values: Iterable[Any],
+        row_estimate: int,
+        target_size: int = ScanConfig.DEFAULT_SAMPLE_SIZE  # Dynamic config
+    ) -> Dict[str, Any]:
+        """
+        Extract sample from a column stream, materializing it only when small
+        
+        Columns of tables estimated at up to ScanConfig.SMALL_TABLE_ROW_THRESHOLD
+        rows are collected and sampled exactly with extract_smart_sample. Larger
+        tables, unknown estimates (0 or -1) and stale estimates (more values
+        arrive than the threshold) go through extract_streaming_sample.
+        
+        Args:
+            values: Iterable of column values (e.g. generator over a server-side cursor)
+            row_estimate: Catalog row estimate of the table
+            target_size: Desired sample size (from ScanConfig)
+            
+        Returns:
+            extract_smart_sample or extract_streaming_sample result
+        """
+        threshold = ScanConfig.SMALL_TABLE_ROW_THRESHOLD  # Dynamic config
+        iterator = iter(values)
+        
+        if 0 < row_estimate <= threshold:
+            head = list(islice(iterator, threshold + 1))
+            if len(head) <= threshold:
+                return self.extract_smart_sample(head, target_size)
+            # Stale estimate - keep the values read so far and stream the rest
+            iterator = chain(head, iterator)
+        
+        return self.extract_streaming_sample(iterator, target_size)